@@ -37,6 +37,10 @@ if "%~1"=="it" set ARGS=--lang it
 if "%~1"=="all" set ARGS=--lang all
 
 :run_python
+REM Bind computed values into the sections (writes build\sections_*)
+python .\tools\bind_values.py %ARGS%
+if errorlevel 1 exit /b 1
+
 REM Run the reconstruction script with processed arguments
 python .\tools\join_sections.py %ARGS%
 
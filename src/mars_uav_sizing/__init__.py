@@ -13,6 +13,7 @@ Package Structure:
     - section5/     : Constraint Analysis (§5)
     - visualization/: Plotting functions
     - verification/ : Manuscript verification
+    - instrumentation: Opt-in get_param counters and timing traces
 
 Usage:
     # Run full analysis
@@ -36,6 +37,7 @@ from .config import load_config, get_param
 
 # Import modules
 from . import config
+from . import instrumentation
 from . import core
 from . import section3
 from . import section4
@@ -51,6 +53,7 @@ __all__ = [
     "get_param",
     # Modules
     "config",
+    "instrumentation",
     "core",
     "section3",
     "section4",
@@ -13,6 +13,7 @@ Configuration Files:
     - aerodynamic_parameters.yaml  # Drag polar, CL_max (from §4.7)
     - geometry_parameters.yaml     # Disk loading, AR, etc (from §4.12)
     - mission_parameters.yaml      # Velocities, times (from §4.12)
+    - infrastructure_parameters.yaml  # Solar array, charging (from §8.1)
 
 Usage:
     from mars_uav_sizing.config import load_config, get_param
@@ -20,18 +21,50 @@ Usage:
     config = load_config()
     g_mars = get_param('physical.mars.g')
     rho = get_param('environment.arcadia_planitia.density_kg_m3')
+
+Scenarios (config/scenarios.py) overlay parameter deltas on the baseline
+files without modifying them; get_param reads the active scenario:
+
+    from mars_uav_sizing.config import load_scenario
+
+    with load_scenario('dusty_season').applied():
+        get_param('environment.solar.surface_aphelion_dusty')
+
+The active scenario is held in a context variable, so threads and asyncio
+tasks each see their own parameter set:
+
+    with parameters({'propulsion.rotor.figure_of_merit': 0.55}):
+        get_param('propulsion.rotor.figure_of_merit')
 """
 
 import yaml
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional, Set
+
+from .. import instrumentation
+from .scenarios import BASELINE, Scenario, list_scenarios, load_scenario
 
 # Configuration directory
 CONFIG_DIR = Path(__file__).parent
 
-# Cache for loaded configurations
+# Baseline configuration as loaded from the YAML files (never modified;
+# scenarios resolve onto it by path copying)
 _config_cache: Dict[str, Any] = {}
 
+# Hash of _config_cache contents (computed on demand)
+_baseline_hash: Optional[str] = None
+
+# Active scenario of the current thread / asyncio task (None = baseline).
+# New threads start at the baseline; use contextvars.copy_context().run to
+# carry the caller's scenario into a worker thread.
+_active_scenario: ContextVar = ContextVar('mars_uav_sizing_scenario', default=None)
+
+# Set of the paths read by get_param in the current context while a
+# track_params() block is open (None = not tracking)
+_param_log: ContextVar = ContextVar('mars_uav_sizing_param_log', default=None)
+
 # List of all configuration files
 CONFIG_FILES = {
     'physical': 'physical_constants.yaml',
@@ -42,8 +75,34 @@ CONFIG_FILES = {
     'geometry': 'geometry_parameters.yaml',
     'mission': 'mission_parameters.yaml',
     'design': 'design_decisions.yaml',  # Section 6 design selections
+    'infrastructure': 'infrastructure_parameters.yaml',  # Section 8 charging system
 }
 
+# Sections contributed by other packages: key -> (path, top-level key or None)
+_extra_files: Dict[str, Any] = {}
+
+
+def register_config_file(key: str, path: Path, section: Optional[str] = None) -> None:
+    """
+    Add a YAML file outside config/ to the configuration tree.
+
+    Parameters
+    ----------
+    key : str
+        Top-level key of the section (e.g. 'solver')
+    path : Path
+        YAML file
+    section : str, optional
+        Top-level key of the file to use (default: the whole file)
+    """
+    global _config_cache, _baseline_hash
+    if _extra_files.get(key) == (Path(path), section):
+        return
+    _extra_files[key] = (Path(path), section)
+    # Rebuild the baseline on next access
+    _config_cache = {}
+    _baseline_hash = None
+
 
 def _load_yaml(filename: str) -> Dict[str, Any]:
     """Load a YAML configuration file."""
@@ -55,9 +114,141 @@ def _load_yaml(filename: str) -> Dict[str, Any]:
         return yaml.safe_load(f)
 
 
+def load_baseline(reload: bool = False) -> Dict[str, Any]:
+    """
+    Load all configuration files into a unified dictionary (no scenario).
+
+    Parameters
+    ----------
+    reload : bool
+        If True, reload from files even if cached
+
+    Returns
+    -------
+    dict
+        Baseline configuration tree. Treat as read-only.
+    """
+    global _config_cache, _baseline_hash
+
+    if _config_cache and not reload:
+        return _config_cache
+
+    # Load all config files
+    config = {}
+    for key, filename in CONFIG_FILES.items():
+        try:
+            config[key] = _load_yaml(filename)
+        except FileNotFoundError:
+            print(f"Warning: Config file {filename} not found, skipping...")
+            config[key] = {}
+    for key, (path, section) in _extra_files.items():
+        blob = {}
+        if path.exists():
+            with open(path, 'r', encoding='utf-8-sig') as f:
+                blob = yaml.safe_load(f) or {}
+        config[key] = blob.get(section, {}) if section else blob
+
+    _config_cache = config
+    _baseline_hash = None
+    return _config_cache
+
+
+def baseline_hash() -> str:
+    """SHA-256 of the baseline configuration contents."""
+    global _baseline_hash
+    if _baseline_hash is None:
+        from .scenarios import _digest
+        _baseline_hash = _digest(load_baseline())
+    return _baseline_hash
+
+
+def active_scenario():
+    """The scenario applied in the current context, or None for the baseline."""
+    return _active_scenario.get()
+
+
+def scenario_hash() -> str:
+    """Hash of the configuration of the current context (see Scenario.hash)."""
+    return (_active_scenario.get() or BASELINE).hash
+
+
+def _activate(scenario) -> Token:
+    """Make scenario active in the current context; reset with the token."""
+    return _active_scenario.set(scenario)
+
+
+def _deactivate(token: Token) -> None:
+    _active_scenario.reset(token)
+
+
+@contextmanager
+def parameters(overrides: Dict[str, Any] = None, scenario: Scenario = None) -> Iterator[Scenario]:
+    """
+    Evaluate with parameter overrides in the current thread or task only.
+
+    Parameters
+    ----------
+    overrides : dict, optional
+        Mapping of YAML dot-path -> value. Every path must already exist.
+    scenario : Scenario, optional
+        Scenario applied below the overrides
+
+    Yields
+    ------
+    Scenario
+        The active scenario (stacked on the enclosing one)
+
+    Examples
+    --------
+    >>> with parameters({'mission.mass.payload_kg': 1.5}):
+    ...     get_param('mission.mass.payload_kg')
+    1.5
+    """
+    layers = scenario if scenario is not None else BASELINE
+    if overrides:
+        layers = layers + Scenario.from_overrides(overrides)
+    with layers.applied() as active:
+        yield active
+
+
+@contextmanager
+def track_params() -> Iterator[Set[str]]:
+    """
+    Record the configuration paths read by get_param in the current context.
+
+    Yields
+    ------
+    set of str
+        Filled with every path looked up inside the block (nested blocks
+        record their own reads only; use note_params to pass them up)
+
+    Examples
+    --------
+    >>> with track_params() as paths:
+    ...     get_param('physical.mars.g')
+    >>> paths
+    {'physical.mars.g'}
+    """
+    paths: Set[str] = set()
+    token = _param_log.set(paths)
+    try:
+        yield paths
+    finally:
+        _param_log.reset(token)
+
+
+def note_params(paths: Iterable[str]) -> None:
+    """Add paths to the enclosing track_params() block, if any (e.g. cached reads)."""
+    log = _param_log.get()
+    if log is not None:
+        log.update(paths)
+
+
 def load_config(reload: bool = False) -> Dict[str, Any]:
     """
     Load all configuration files into a unified dictionary.
+
+    Returns the baseline tree with the active scenario (if any) applied.
     
     Parameters
     ----------
@@ -76,21 +267,11 @@ def load_config(reload: bool = False) -> Dict[str, Any]:
         - geometry: Geometry parameters
         - mission: Mission parameters
     """
-    global _config_cache
-    
-    if _config_cache and not reload:
-        return _config_cache
-    
-    # Load all config files
-    _config_cache = {}
-    for key, filename in CONFIG_FILES.items():
-        try:
-            _config_cache[key] = _load_yaml(filename)
-        except FileNotFoundError:
-            print(f"Warning: Config file {filename} not found, skipping...")
-            _config_cache[key] = {}
-    
-    return _config_cache
+    base = load_baseline(reload)
+    scenario = _active_scenario.get()
+    if scenario is None:
+        return base
+    return scenario.resolve(base)
 
 
 def get_param(path: str, default: Any = None) -> Any:
@@ -118,6 +299,12 @@ def get_param(path: str, default: Any = None) -> Any:
     >>> get_param('mission.mass.mtow_kg')
     10.0
     """
+    if instrumentation.ACTIVE:
+        instrumentation.record_param_access(path)
+    log = _param_log.get()
+    if log is not None:
+        log.add(path)
+
     config = load_config()
     
     keys = path.split('.')
@@ -152,16 +339,31 @@ def get_mtow() -> float:
     return get_param('mission.mass.mtow_kg')
 
 
-def get_propulsion_efficiencies() -> Dict[str, float]:
-    """Get all propulsion efficiency values."""
+def get_propulsion_efficiencies(mtow_kg: float = None) -> Dict[str, float]:
+    """Get all propulsion efficiency values (BEMT values at mtow_kg if enabled)."""
     rotor = get_param('propulsion.rotor')
     elec = get_param('propulsion.electromechanical')
-    return {
+    efficiencies = {
         'figure_of_merit': rotor['figure_of_merit'],
         'eta_motor': elec['eta_motor'],
         'eta_esc': elec['eta_esc'],
         'eta_prop': elec['eta_prop'],
     }
+    if get_param('propulsion.bemt.use_in_sizing', False):
+        # FM and eta_prop from the BEMT maps at the design points (§6.3)
+        from ..section6.bemt import operating_efficiencies
+        bemt = operating_efficiencies(mtow_kg)
+        efficiencies['figure_of_merit'] = bemt['figure_of_merit']
+        efficiencies['eta_prop'] = bemt['eta_prop']
+    return efficiencies
+
+
+def get_disk_loading(mtow_kg: float = None) -> float:
+    """Get lift-rotor disk loading (N/m²), from the BEMT design rotor if enabled."""
+    if get_param('propulsion.bemt.use_in_sizing', False):
+        from ..section6.bemt import operating_efficiencies
+        return operating_efficiencies(mtow_kg)['disk_loading_N_m2']
+    return get_param('geometry.rotor.disk_loading_N_m2')
 
 
 def get_battery_params() -> Dict[str, float]:
@@ -175,19 +377,25 @@ def get_battery_params() -> Dict[str, float]:
     }
 
 
-def get_aerodynamic_params() -> Dict[str, float]:
-    """Get aerodynamic parameters."""
+def get_aerodynamic_params(mtow_kg: float = None, wing_loading: float = None) -> Dict[str, float]:
+    """Get aerodynamic parameters (CD0 from the drag buildup at mtow_kg and W/S if enabled)."""
     wing = get_param('aerodynamic.wing')
     polar = get_param('aerodynamic.drag_polar')
     airfoil = get_param('aerodynamic.airfoil')
     rotor = get_param('aerodynamic.rotorcraft')
-    return {
+    params = {
         'aspect_ratio': wing['aspect_ratio'],
         'oswald_e': wing['oswald_efficiency'],
         'cd0': polar['cd0'],
         'cl_max': airfoil['cl_max'],
         'ld_eff_rotorcraft': rotor['ld_effective'],
     }
+    if get_param('aerodynamic.drag_buildup.use_in_sizing', False):
+        # Reynolds-dependent component buildup (§4.7); defaults to the
+        # baseline MTOW and the stall-limited W/S
+        from ..section4.drag_buildup import zero_lift_drag
+        params['cd0'] = zero_lift_drag(mtow_kg, wing_loading)
+    return params
 
 
 def get_mission_params() -> Dict[str, float]:
@@ -0,0 +1,256 @@
+"""
+Scenario Overlays
+=================
+
+Scenarios declare parameter deltas against the baseline YAML configuration
+instead of editing the files in config/. A scenario is an immutable stack of
+override layers; applying it resolves the layers onto the baseline tree by
+path copying: only the dictionaries on the path of an overridden value are
+copied, every other subtree is shared with the baseline, which is never
+modified or deep-copied.
+
+    from mars_uav_sizing.config import load_scenario, get_param
+
+    dusty = load_scenario('dusty_season', 'high_fm_prop')
+    with dusty.applied():
+        get_param('environment.solar.surface_aphelion_dusty')
+
+Scenario files (config/scenarios/<name>.yaml):
+
+    description: Free text
+    extends: [other_scenario]        # optional, applied first
+    overrides:                       # nested mapping or dot-path keys
+      environment:
+        solar:
+          surface_aphelion_dusty: 250.0
+
+Each scenario has a stable hash (baseline file contents + merged overrides)
+for keying cached results.
+
+Last Updated: 2026-10-19
+"""
+
+import hashlib
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import yaml
+
+SCENARIO_DIR = Path(__file__).parent / 'scenarios'
+
+
+def _flatten(node: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+    """Flatten a nested override mapping to dot-paths (dotted keys allowed)."""
+    flat = {}
+    for key, value in node.items():
+        path = f'{prefix}.{key}' if prefix else str(key)
+        if isinstance(value, dict) and value:
+            flat.update(_flatten(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+def _digest(payload: Any) -> str:
+    text = json.dumps(payload, sort_keys=True, default=repr, separators=(',', ':'))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def overlay(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Resolve dot-path overrides onto a configuration tree by path copying.
+
+    Parameters
+    ----------
+    base : dict
+        Configuration tree (not modified)
+    overrides : dict
+        Mapping of YAML dot-path -> value. Every path must already exist.
+
+    Returns
+    -------
+    dict
+        New tree sharing all non-overridden subtrees with base
+
+    Raises
+    ------
+    KeyError
+        If a path does not exist in base
+    """
+    if not overrides:
+        return base
+    root = dict(base)
+    copied = {id(root)}
+    for path, value in overrides.items():
+        keys = path.split('.')
+        node = root
+        for key in keys[:-1]:
+            child = node.get(key) if isinstance(node, dict) else None
+            if not isinstance(child, dict):
+                raise KeyError(f'Configuration path not found: {path}')
+            if id(child) not in copied:
+                child = dict(child)
+                node[key] = child
+                copied.add(id(child))
+            node = child
+        if keys[-1] not in node:
+            raise KeyError(f'Configuration path not found: {path}')
+        node[keys[-1]] = value
+    return root
+
+
+class Scenario:
+    """
+    Immutable stack of parameter override layers.
+
+    Parameters
+    ----------
+    layers : sequence of (name, overrides)
+        Override layers, applied in order (later layers win). overrides
+        may be nested mappings or use dot-path keys.
+    """
+
+    __slots__ = ('layers', '_overrides', '_resolved', '_hash')
+
+    def __init__(self, layers=()):
+        self.layers: Tuple[Tuple[str, Dict[str, Any]], ...] = tuple(
+            (name, _flatten(overrides)) for name, overrides in layers
+        )
+        self._overrides: Optional[Dict[str, Any]] = None
+        self._resolved: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+        self._hash: Optional[Tuple[Dict[str, Any], str]] = None
+
+    @classmethod
+    def from_overrides(cls, overrides: Dict[str, Any], name: str = 'overrides') -> 'Scenario':
+        """Single-layer scenario from a mapping of dot-path -> value."""
+        return cls([(name, overrides)])
+
+    @property
+    def name(self) -> str:
+        """Layer names joined with '+' ('baseline' for the empty stack)."""
+        return '+'.join(name for name, _ in self.layers) or 'baseline'
+
+    @property
+    def overrides(self) -> Dict[str, Any]:
+        """Merged dot-path overrides of all layers."""
+        if self._overrides is None:
+            merged = {}
+            for _, layer in self.layers:
+                merged.update(layer)
+            self._overrides = merged
+        return self._overrides
+
+    def stack(self, *others: 'Scenario') -> 'Scenario':
+        """New scenario with the layers of others applied on top of this one."""
+        layers = list(self.layers)
+        for other in others:
+            layers.extend(other.layers)
+        return Scenario(layers)
+
+    def __add__(self, other: 'Scenario') -> 'Scenario':
+        return self.stack(other)
+
+    def resolve(self, base: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Configuration tree of this scenario (memoized per baseline tree).
+
+        Parameters
+        ----------
+        base : dict, optional
+            Baseline tree (default: the YAML files, see load_baseline)
+        """
+        if base is None:
+            from . import load_baseline
+            base = load_baseline()
+        if self._resolved is None or self._resolved[0] is not base:
+            self._resolved = (base, overlay(base, self.overrides))
+        return self._resolved[1]
+
+    @property
+    def hash(self) -> str:
+        """16-character hash of the baseline file contents and the overrides."""
+        from . import baseline_hash, load_baseline
+        base = load_baseline()
+        if self._hash is None or self._hash[0] is not base:
+            self._hash = (base, _digest([baseline_hash(), sorted(self.overrides.items())])[:16])
+        return self._hash[1]
+
+    @contextmanager
+    def applied(self) -> Iterator['Scenario']:
+        """
+        Make this scenario the active configuration for get_param.
+
+        Nested applications stack on the active scenario. The scenario is
+        active only in the current thread or asyncio task (contextvars).
+        Paths are checked on entry.
+
+        Yields
+        ------
+        Scenario
+            The active (stacked) scenario
+        """
+        from . import _activate, _deactivate, active_scenario
+
+        active = active_scenario()
+        stacked = active.stack(self) if active is not None else self
+        stacked.resolve()
+        token = _activate(stacked)
+        try:
+            yield stacked
+        finally:
+            _deactivate(token)
+
+    def __getstate__(self):
+        # Layers only: memoized trees are rebuilt where the scenario is used
+        return self.layers
+
+    def __setstate__(self, layers):
+        self.layers = layers
+        self._overrides = None
+        self._resolved = None
+        self._hash = None
+
+    def __repr__(self) -> str:
+        return f'Scenario({self.name!r}, {len(self.overrides)} overrides)'
+
+
+BASELINE = Scenario()
+
+
+def list_scenarios() -> List[str]:
+    """Names of the scenario files in config/scenarios/."""
+    return sorted(path.stem for path in SCENARIO_DIR.glob('*.yaml'))
+
+
+def _scenario_layers(name: str, seen: Tuple[str, ...] = ()) -> List[Tuple[str, Dict[str, Any]]]:
+    if name in seen:
+        raise ValueError(f"Scenario cycle: {' -> '.join(seen + (name,))}")
+    path = SCENARIO_DIR / f'{name}.yaml'
+    if not path.exists():
+        raise FileNotFoundError(
+            f'Scenario file not found: {path} (available: {", ".join(list_scenarios())})'
+        )
+    with open(path, 'r', encoding='utf-8') as f:
+        blob = yaml.safe_load(f) or {}
+    layers = []
+    for parent in blob.get('extends', []) or []:
+        layers.extend(_scenario_layers(parent, seen + (name,)))
+    layers.append((name, blob.get('overrides', {}) or {}))
+    return layers
+
+
+def load_scenario(*names: str) -> Scenario:
+    """
+    Stack scenario files in order, e.g. load_scenario('dusty_season', 'high_fm_prop').
+
+    Returns
+    -------
+    Scenario
+        The stacked scenario (BASELINE if no names are given)
+    """
+    layers = []
+    for name in names:
+        layers.extend(_scenario_layers(name))
+    return Scenario(layers)
@@ -7,6 +7,7 @@ Core utilities and shared functionality for Mars UAV sizing.
 Components:
     - config_loader: Configuration loading (re-export from config/)
     - atmosphere: Mars atmospheric model
+    - dual: Dual numbers (forward-mode automatic differentiation)
     - energy: Shared energy accounting helper
     - utils: Common utility functions
 """
@@ -15,6 +16,7 @@ Components:
 from ..config import load_config, get_param
 
 from . import atmosphere
+from . import dual
 from . import energy
 from . import utils
 
@@ -22,6 +24,7 @@ __all__ = [
     'load_config',
     'get_param',
     'atmosphere',
+    'dual',
     'energy',
     'utils',
 ]
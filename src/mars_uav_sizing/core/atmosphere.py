@@ -15,11 +15,11 @@ Reference:
 Last Updated: 2025-12-29
 """
 
-import math
 from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 
+from .dual import exp, sqrt
 from ..config import get_param
 
 
@@ -105,7 +105,7 @@ class MarsAtmosphere:
         h_m = altitude_km * 1000
         T = self.temperature(altitude_km)
         exponent = -self.g * h_m / (self.R * T)
-        return self.P0 * math.exp(exponent)
+        return self.P0 * exp(exponent)
     
     def density(self, altitude_km: float) -> float:
         """
@@ -165,7 +165,7 @@ class MarsAtmosphere:
             Speed of sound in m/s
         """
         T = self.temperature(altitude_km)
-        return math.sqrt(self.gamma * self.R * T)
+        return sqrt(self.gamma * self.R * T)
     
     def get_state(self, altitude_km: float) -> AtmosphericState:
         """
@@ -0,0 +1,198 @@
+"""
+Dual Numbers
+============
+
+Forward-mode automatic differentiation for the scalar sizing models.
+
+A Dual carries a value and the gradient of that value with respect to any
+number of seeded inputs. Arithmetic, powers and the elementary functions
+below propagate the gradient exactly (no step size), so one evaluation of a
+model with N seeded parameters yields all N partial derivatives.
+
+    from mars_uav_sizing.core.dual import Dual, seed
+
+    x, y = seed([2.0, 3.0])
+    f = x * y ** 2
+    f.value, f.grad        # 18.0, [9.0, 12.0]
+
+Comparisons use the value, so branches (limits, feasibility checks) follow
+the undifferentiated model. Converting a Dual with float() raises TypeError
+instead of silently dropping the derivatives: code paths that need plain
+floats (numpy float arrays, interpolation tables) must be differentiated by
+other means, e.g. finite differences.
+
+Models stay differentiable by using sqrt/exp/log from this module (or the
+** operator) in place of math.sqrt/math.exp/math.log; for floats these are
+the math functions.
+
+Last Updated: 2026-10-19
+"""
+
+import math
+from typing import Any, List, Sequence
+
+import numpy as np
+
+
+class Dual:
+    """
+    Number with a gradient.
+
+    Parameters
+    ----------
+    value : float
+        Function value
+    grad : array_like
+        Partial derivatives with respect to the seeded inputs
+    """
+
+    __slots__ = ('value', 'grad')
+
+    # Let numpy defer binary operators with arrays to Dual
+    __array_priority__ = 1000
+
+    def __init__(self, value: float, grad):
+        self.value = float(value)
+        self.grad = np.asarray(grad, dtype=float)
+
+    # -------------------------------------------------------------------------
+    # Arithmetic
+    # -------------------------------------------------------------------------
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, self.grad + other.grad)
+        return Dual(self.value + other, self.grad)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value - other.value, self.grad - other.grad)
+        return Dual(self.value - other, self.grad)
+
+    def __rsub__(self, other):
+        return Dual(other - self.value, -self.grad)
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value * other.value,
+                        self.grad * other.value + other.grad * self.value)
+        return Dual(self.value * other, self.grad * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value / other.value,
+                        (self.grad * other.value - other.grad * self.value) / other.value ** 2)
+        return Dual(self.value / other, self.grad / other)
+
+    def __rtruediv__(self, other):
+        return Dual(other / self.value, -other * self.grad / self.value ** 2)
+
+    def __pow__(self, other):
+        if isinstance(other, Dual):
+            # d(a^b) = a^b (b' ln a + b a'/a)
+            result = self.value ** other.value
+            return Dual(result, result * (other.grad * math.log(self.value)
+                                          + other.value * self.grad / self.value))
+        if other == 0:
+            return Dual(1.0, np.zeros_like(self.grad))
+        return Dual(self.value ** other, other * self.value ** (other - 1) * self.grad)
+
+    def __rpow__(self, other):
+        result = other ** self.value
+        return Dual(result, result * math.log(other) * self.grad)
+
+    def __neg__(self):
+        return Dual(-self.value, -self.grad)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self if self.value >= 0 else -self
+
+    # -------------------------------------------------------------------------
+    # Elementary functions (also used by numpy ufuncs on object arrays)
+    # -------------------------------------------------------------------------
+
+    def sqrt(self):
+        root = math.sqrt(self.value)
+        return Dual(root, self.grad / (2.0 * root))
+
+    def exp(self):
+        result = math.exp(self.value)
+        return Dual(result, result * self.grad)
+
+    def log(self):
+        return Dual(math.log(self.value), self.grad / self.value)
+
+    # -------------------------------------------------------------------------
+    # Comparisons and conversion
+    # -------------------------------------------------------------------------
+
+    def __lt__(self, other):
+        return self.value < _value(other)
+
+    def __le__(self, other):
+        return self.value <= _value(other)
+
+    def __gt__(self, other):
+        return self.value > _value(other)
+
+    def __ge__(self, other):
+        return self.value >= _value(other)
+
+    def __eq__(self, other):
+        return self.value == _value(other)
+
+    def __ne__(self, other):
+        return self.value != _value(other)
+
+    __hash__ = None
+
+    def __bool__(self):
+        return self.value != 0
+
+    def __float__(self):
+        raise TypeError('float() would drop the derivatives of a Dual; use dual.value()')
+
+    def __repr__(self) -> str:
+        return f'Dual({self.value!r}, {self.grad.tolist()!r})'
+
+
+def _value(x: Any) -> Any:
+    return x.value if isinstance(x, Dual) else x
+
+
+def value(x: Any) -> Any:
+    """Value of a Dual (other inputs are returned unchanged)."""
+    return _value(x)
+
+
+def gradient(x: Any, n: int) -> np.ndarray:
+    """Gradient of a Dual (zeros of length n for constants)."""
+    return x.grad.copy() if isinstance(x, Dual) else np.zeros(n)
+
+
+def seed(values: Sequence[float]) -> List[Dual]:
+    """Duals for independent inputs: the i-th has the i-th unit gradient."""
+    unit = np.eye(len(values))
+    return [Dual(v, unit[i]) for i, v in enumerate(values)]
+
+
+def sqrt(x):
+    """Square root of a float or Dual."""
+    return x.sqrt() if isinstance(x, Dual) else math.sqrt(x)
+
+
+def exp(x):
+    """Exponential of a float or Dual."""
+    return x.exp() if isinstance(x, Dual) else math.exp(x)
+
+
+def log(x):
+    """Natural logarithm of a float or Dual."""
+    return x.log() if isinstance(x, Dual) else math.log(x)
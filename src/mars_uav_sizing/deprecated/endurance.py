@@ -285,6 +285,8 @@ class EnduranceCalculator:
         """
         Calculate operational radius accounting for return flight.
 
+        Still air only; superseded by section5.wind_performance.
+
         Parameters
         ----------
         endurance_h : float
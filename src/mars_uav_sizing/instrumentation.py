@@ -0,0 +1,436 @@
+"""
+Instrumentation
+===============
+
+Opt-in profiling layer for the sizing analyses.
+
+Records three kinds of data while enabled:
+    - Configuration accesses: get_param() calls counted per key and per caller
+    - Timing spans: nested begin/end events around section analyses and
+      selected hot functions (e.g. section5 -> hybrid_vtol -> energy_budget)
+    - Counters: solver evaluation counts reported by the coupled solver
+
+Recorded data are written as Chrome trace-event JSON (loadable in
+chrome://tracing, Perfetto and speedscope) or as a native speedscope file.
+
+When disabled (the default), every hook reduces to a single module-attribute
+check, so instrumented code runs at essentially full speed.
+
+Usage:
+    python -m mars_uav_sizing.run_analysis --trace trace.json
+    python -m mars_uav_sizing.run_analysis --trace run.speedscope.json
+
+    from mars_uav_sizing import instrumentation
+    instrumentation.enable()
+    ...
+    instrumentation.write_trace('trace.json')
+
+Last Updated: 2026-10-19
+"""
+
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+# Global switch - checked inline by hooks (keep as a plain module attribute)
+ACTIVE: bool = False
+
+_lock = threading.Lock()
+_events: List[Dict[str, Any]] = []
+_param_counts: Counter = Counter()
+_caller_counts: Counter = Counter()
+_counters: Dict[str, float] = {}
+_t0_ns: int = 0
+
+# Shared no-op context returned by span() when disabled
+_NULL_SPAN = nullcontext()
+
+# Modules skipped when attributing a get_param() call to its caller
+_CONFIG_MODULES = ('mars_uav_sizing.config', 'mars_uav_sizing_coupled.config')
+
+
+# =============================================================================
+# STATE CONTROL
+# =============================================================================
+
+def enable(reset_data: bool = True) -> None:
+    """
+    Enable instrumentation.
+
+    Parameters
+    ----------
+    reset_data : bool
+        If True, discard any previously recorded data
+    """
+    global ACTIVE, _t0_ns
+    if reset_data:
+        reset()
+    if not _t0_ns:
+        _t0_ns = time.perf_counter_ns()
+    ACTIVE = True
+
+
+def disable() -> None:
+    """Disable instrumentation (recorded data are kept)."""
+    global ACTIVE
+    ACTIVE = False
+
+
+def is_enabled() -> bool:
+    """Return True if instrumentation is recording."""
+    return ACTIVE
+
+
+def reset() -> None:
+    """Discard all recorded events, access counts and counters."""
+    global _t0_ns
+    with _lock:
+        _events.clear()
+        _param_counts.clear()
+        _caller_counts.clear()
+        _counters.clear()
+        _t0_ns = time.perf_counter_ns() if ACTIVE else 0
+
+
+def _now_us() -> float:
+    """Microseconds since instrumentation was enabled."""
+    return (time.perf_counter_ns() - _t0_ns) / 1000.0
+
+
+# =============================================================================
+# CONFIGURATION ACCESS COUNTERS
+# =============================================================================
+
+def _caller_name(depth: int) -> str:
+    """Return 'module.function' of the first frame outside the config modules."""
+    frame = sys._getframe(depth)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '?')
+        if not module.startswith(_CONFIG_MODULES):
+            return f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return '?'
+
+
+def record_param_access(path: str) -> None:
+    """
+    Count one get_param() lookup of ``path``.
+
+    Called by the config loaders only when ACTIVE is True.
+
+    Parameters
+    ----------
+    path : str
+        Dot-separated configuration path that was requested
+    """
+    caller = _caller_name(2)
+    with _lock:
+        _param_counts[path] += 1
+        _caller_counts[(caller, path)] += 1
+
+
+def get_param_counts() -> Dict[str, int]:
+    """Return get_param() call counts per key, most frequent first."""
+    return dict(_param_counts.most_common())
+
+
+def get_caller_counts() -> Dict[str, Dict[str, int]]:
+    """Return get_param() call counts grouped by caller, then key."""
+    grouped: Dict[str, Dict[str, int]] = {}
+    for (caller, path), count in _caller_counts.most_common():
+        grouped.setdefault(caller, {})[path] = count
+    return grouped
+
+
+# =============================================================================
+# TIMING SPANS
+# =============================================================================
+
+def _emit(event: Dict[str, Any]) -> None:
+    event['pid'] = os.getpid()
+    event['tid'] = threading.get_ident()
+    with _lock:
+        _events.append(event)
+
+
+@contextmanager
+def _recording_span(name: str, category: str):
+    _emit({'name': name, 'cat': category, 'ph': 'B', 'ts': _now_us()})
+    try:
+        yield
+    finally:
+        _emit({'name': name, 'cat': category, 'ph': 'E', 'ts': _now_us()})
+
+
+def span(name: str, category: str = 'analysis'):
+    """
+    Context manager timing a named span.
+
+    Spans opened inside another span nest in the trace.
+
+    Parameters
+    ----------
+    name : str
+        Span label shown in the flame graph
+    category : str
+        Trace-event category
+
+    Returns
+    -------
+    context manager
+        Recording span if enabled, shared no-op context otherwise
+    """
+    if not ACTIVE:
+        return _NULL_SPAN
+    return _recording_span(name, category)
+
+
+def traced(name: Optional[str] = None, category: str = 'analysis') -> Callable:
+    """
+    Decorator wrapping every call of a function in a timing span.
+
+    Parameters
+    ----------
+    name : str, optional
+        Span label (default: '<module>.<function>', module without package)
+    category : str
+        Trace-event category
+
+    Returns
+    -------
+    callable
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        label = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ACTIVE:
+                return func(*args, **kwargs)
+            with _recording_span(label, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# =============================================================================
+# COUNTERS
+# =============================================================================
+
+def increment(name: str, amount: float = 1) -> None:
+    """
+    Increment a cumulative counter (no trace event emitted).
+
+    Parameters
+    ----------
+    name : str
+        Counter name
+    amount : float
+        Increment
+    """
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def record_counter(name: str, values: Dict[str, float]) -> None:
+    """
+    Record counter values as a trace counter event and accumulate totals.
+
+    Parameters
+    ----------
+    name : str
+        Counter group name (e.g. 'coupled_solver')
+    values : dict
+        Counter values for this sample (e.g. {'nfev': 23})
+    """
+    _emit({'name': name, 'cat': 'counter', 'ph': 'C', 'ts': _now_us(),
+           'args': dict(values)})
+    with _lock:
+        for key, value in values.items():
+            total_key = f"{name}.{key}"
+            _counters[total_key] = _counters.get(total_key, 0) + value
+
+
+def get_counters() -> Dict[str, float]:
+    """Return accumulated counter totals."""
+    return dict(_counters)
+
+
+# =============================================================================
+# TRACE OUTPUT
+# =============================================================================
+
+def _metadata() -> Dict[str, Any]:
+    return {
+        'param_access': get_param_counts(),
+        'param_access_by_caller': get_caller_counts(),
+        'param_access_total': sum(_param_counts.values()),
+        'counters': get_counters(),
+    }
+
+
+def chrome_trace() -> Dict[str, Any]:
+    """
+    Build a Chrome trace-event document from the recorded data.
+
+    Returns
+    -------
+    dict
+        JSON-serializable trace with 'traceEvents' and 'otherData'
+    """
+    with _lock:
+        events = list(_events)
+    return {
+        'traceEvents': events,
+        'displayTimeUnit': 'ms',
+        'otherData': _metadata(),
+    }
+
+
+def speedscope_profile(name: str = 'mars_uav_sizing') -> Dict[str, Any]:
+    """
+    Build a speedscope evented profile (one per thread) from recorded spans.
+
+    Parameters
+    ----------
+    name : str
+        Profile name
+
+    Returns
+    -------
+    dict
+        JSON-serializable speedscope document
+    """
+    with _lock:
+        events = [e for e in _events if e['ph'] in ('B', 'E')]
+
+    frames: List[Dict[str, str]] = []
+    frame_index: Dict[str, int] = {}
+    by_thread: Dict[int, List[Dict[str, Any]]] = {}
+    for event in events:
+        label = event['name']
+        if label not in frame_index:
+            frame_index[label] = len(frames)
+            frames.append({'name': label})
+        by_thread.setdefault(event['tid'], []).append({
+            'type': 'O' if event['ph'] == 'B' else 'C',
+            'frame': frame_index[label],
+            'at': event['ts'],
+        })
+
+    profiles = []
+    for tid, thread_events in by_thread.items():
+        profiles.append({
+            'type': 'evented',
+            'name': f"{name} (thread {tid})",
+            'unit': 'microseconds',
+            'startValue': thread_events[0]['at'],
+            'endValue': thread_events[-1]['at'],
+            'events': thread_events,
+        })
+
+    return {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'shared': {'frames': frames},
+        'profiles': profiles,
+        'name': name,
+        'exporter': 'mars_uav_sizing.instrumentation',
+    }
+
+
+def write_trace(path, fmt: Optional[str] = None) -> Path:
+    """
+    Write recorded data to a JSON trace file.
+
+    Parameters
+    ----------
+    path : str or Path
+        Output file
+    fmt : str, optional
+        'chrome' or 'speedscope'. Default: 'speedscope' if the file name
+        ends with '.speedscope.json', otherwise 'chrome'.
+
+    Returns
+    -------
+    Path
+        Path of the written file
+    """
+    path = Path(path)
+    if fmt is None:
+        fmt = 'speedscope' if path.name.endswith('.speedscope.json') else 'chrome'
+    if fmt == 'speedscope':
+        document = speedscope_profile()
+        document['otherData'] = _metadata()
+    elif fmt == 'chrome':
+        document = chrome_trace()
+    else:
+        raise ValueError(f"Unknown trace format: {fmt!r} (use 'chrome' or 'speedscope')")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=1)
+    return path
+
+
+def print_summary(top: int = 15) -> None:
+    """
+    Print a summary of configuration accesses, span totals and counters.
+
+    Parameters
+    ----------
+    top : int
+        Number of most frequent keys/callers to list
+    """
+    with _lock:
+        events = list(_events)
+
+    # Inclusive time per span label (matched per thread)
+    totals: Dict[str, float] = {}
+    calls: Dict[str, int] = {}
+    stacks: Dict[int, List[Dict[str, Any]]] = {}
+    for event in events:
+        if event['ph'] == 'B':
+            stacks.setdefault(event['tid'], []).append(event)
+        elif event['ph'] == 'E' and stacks.get(event['tid']):
+            begin = stacks[event['tid']].pop()
+            totals[begin['name']] = totals.get(begin['name'], 0.0) + event['ts'] - begin['ts']
+            calls[begin['name']] = calls.get(begin['name'], 0) + 1
+
+    print("=" * 80)
+    print("INSTRUMENTATION SUMMARY")
+    print("=" * 80)
+
+    print("\nTIMING SPANS (inclusive):")
+    print(f"  {'Span':<50} {'Calls':>7} {'Total [ms]':>12}")
+    for label, total_us in sorted(totals.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"  {label:<50} {calls[label]:>7} {total_us / 1000.0:>12.3f}")
+
+    print(f"\nCONFIG ACCESS: {sum(_param_counts.values())} get_param() calls, "
+          f"{len(_param_counts)} distinct keys")
+    for path, count in _param_counts.most_common(top):
+        print(f"  {path:<70} {count:>8}")
+
+    print("\nTOP CALLERS:")
+    per_caller: Counter = Counter()
+    for (caller, _path), count in _caller_counts.items():
+        per_caller[caller] += count
+    for caller, count in per_caller.most_common(top):
+        print(f"  {caller:<70} {count:>8}")
+
+    if _counters:
+        print("\nCOUNTERS:")
+        for key, value in sorted(_counters.items()):
+            print(f"  {key:<60} {value:>8g}")
+
+    print("=" * 80)
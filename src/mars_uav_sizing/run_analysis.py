@@ -13,6 +13,11 @@ Usage:
     python -m mars_uav_sizing.run_analysis --section 6
     python -m mars_uav_sizing.run_analysis --section 7
     python -m mars_uav_sizing.run_analysis --all
+    python -m mars_uav_sizing.run_analysis --trace trace.json
+    python -m mars_uav_sizing.run_analysis --no-archive
+
+Section runs are recorded in the run archive (run_archive: list, show,
+diff and query past runs).
 
 Sections:
     5 - Constraint Analysis (rotorcraft, fixed-wing, hybrid VTOL, matching chart)
@@ -23,6 +28,7 @@ Last Updated: 2026-01-01
 """
 
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -30,21 +36,28 @@ from pathlib import Path
 if __name__ == "__main__":
     sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from mars_uav_sizing.config import load_config, get_param
+from mars_uav_sizing import instrumentation, run_archive
+from mars_uav_sizing.config import active_scenario, load_config, get_param, load_scenario
 from mars_uav_sizing.section5 import (
     rotorcraft,
     fixed_wing,
     hybrid_vtol,
+    flight_envelope,
     matching_chart,
     comparative,
+    transition,
+    wind_performance,
 )
 from mars_uav_sizing.section6 import (
+    bemt,
     propeller_sizing,
     tail_sizing,
 )
 from mars_uav_sizing.section7 import (
+    catalog_selection,
     component_selection,
     mass_breakdown,
+    mass_closure,
 )
 
 
@@ -61,10 +74,14 @@ def print_header():
     print()
     print(f"  Analysis run: {timestamp}")
     print(f"  Configuration: All parameters from config/ YAML files")
+    scenario = active_scenario()
+    if scenario is not None and scenario.layers:
+        print(f"  Scenario:      {scenario.name} ({scenario.hash})")
     print(f"  Baseline MTOW: {get_param('mission.mass.mtow_kg')} kg")
     print()
 
 
+@instrumentation.traced('section5')
 def run_section5_analyses(verbose: bool = True) -> dict:
     """
     Run Section 5 constraint analyses.
@@ -129,7 +146,7 @@ def run_section5_analyses(verbose: bool = True) -> dict:
     print("\n" + "-" * 80)
     print(" 5.5  COMPARATIVE ANALYSIS")
     print("-" * 80 + "\n")
-    results['comparative'] = comparative.comparative_summary()
+    results['comparative'] = comparative.comparative_summary(results)
     if verbose:
         comparative.print_analysis(results['comparative'])
     else:
@@ -138,6 +155,7 @@ def run_section5_analyses(verbose: bool = True) -> dict:
     return results
 
 
+@instrumentation.traced('section6')
 def run_section6_analyses(verbose: bool = True) -> dict:
     """
     Run Section 6 design decision analyses.
@@ -182,6 +200,7 @@ def run_section6_analyses(verbose: bool = True) -> dict:
     return results
 
 
+@instrumentation.traced('section7')
 def run_section7_analyses(verbose: bool = True) -> dict:
     """
     Run Section 7 component selection and mass breakdown analyses.
@@ -324,15 +343,64 @@ def main():
     parser.add_argument(
         '--analysis', '-a',
         choices=['rotorcraft', 'fixed_wing', 'hybrid_vtol', 'matching_chart',
-                 'comparative', 'propeller', 'tail', 'mass'],
+                 'envelope', 'transition', 'wind', 'comparative', 'propeller', 'bemt', 'tail', 'mass', 'closure', 'catalog'],
         default=None,
         help='Run specific analysis only'
     )
+    parser.add_argument(
+        '--scenario',
+        nargs='+',
+        metavar='NAME',
+        default=[],
+        help='Apply scenario overlays from config/scenarios/ (stacked in order)'
+    )
+    parser.add_argument(
+        '--trace',
+        metavar='PATH',
+        default=None,
+        help='Record get_param accesses and timing spans to a Chrome trace JSON '
+             '(use a .speedscope.json suffix for speedscope format)'
+    )
+    parser.add_argument(
+        '--no-archive',
+        action='store_true',
+        help='Do not record this run in the run archive (see run_archive)'
+    )
+    parser.add_argument(
+        '--archive',
+        metavar='PATH',
+        default=None,
+        help='Run archive file (default: cache/run_archive.sqlite)'
+    )
 
     args = parser.parse_args()
 
     verbose = not args.brief
 
+    if args.trace:
+        instrumentation.enable()
+    try:
+        with load_scenario(*args.scenario).applied():
+            started = (time.perf_counter(), time.process_time())
+            results = _run_selected(args, verbose)
+            if not args.no_archive:
+                command = 'all' if args.section == 'all' else f'section{args.section}'
+                run_archive.archive_run(results, 'mars_uav_sizing', command, started,
+                                        path=args.archive)
+    finally:
+        if args.trace:
+            instrumentation.disable()
+            instrumentation.print_summary()
+            path = instrumentation.write_trace(args.trace)
+            print(f"Trace written to: {path}")
+
+
+def _run_selected(args, verbose: bool):
+    """
+    Dispatch the analysis or section selected on the command line.
+
+    Returns the results of section runs (single analyses only print).
+    """
     # Run specific analysis if requested
     if args.analysis:
         if args.analysis == 'rotorcraft':
@@ -343,28 +411,40 @@ def main():
             hybrid_vtol.print_analysis()
         elif args.analysis == 'matching_chart':
             matching_chart.print_analysis()
+        elif args.analysis == 'envelope':
+            flight_envelope.print_analysis()
+        elif args.analysis == 'transition':
+            transition.print_analysis()
+        elif args.analysis == 'wind':
+            wind_performance.print_analysis()
         elif args.analysis == 'comparative':
             comparative.print_analysis()
         elif args.analysis == 'propeller':
             propeller_sizing.print_analysis()
+        elif args.analysis == 'bemt':
+            bemt.print_analysis()
         elif args.analysis == 'tail':
             tail_sizing.print_analysis()
         elif args.analysis == 'mass':
             mass_breakdown.print_mass_breakdown()
+        elif args.analysis == 'closure':
+            mass_closure.print_analysis()
+        elif args.analysis == 'catalog':
+            catalog_selection.print_analysis()
         return
 
     # Run section or all
     if args.section == 'all':
-        run_all_analyses(verbose=verbose)
+        return run_all_analyses(verbose=verbose)
     elif args.section == '5':
         print_header()
-        run_section5_analyses(verbose=verbose)
+        return {'section5': run_section5_analyses(verbose=verbose)}
     elif args.section == '6':
         print_header()
-        run_section6_analyses(verbose=verbose)
+        return {'section6': run_section6_analyses(verbose=verbose)}
     elif args.section == '7':
         print_header()
-        run_section7_analyses(verbose=verbose)
+        return {'section7': run_section7_analyses(verbose=verbose)}
 
 
 if __name__ == "__main__":
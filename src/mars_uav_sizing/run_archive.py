@@ -0,0 +1,706 @@
+"""
+Run Archive
+===========
+
+Content-addressed local archive of analysis runs, replacing the comparison
+by eye of the text reports in reports/.
+
+Every run_analysis invocation (both packages) stores a compact structured
+record: the flattened configuration it ran with (inputs), the flattened
+numeric and text results (outputs), and its timings. A record is keyed by
+the SHA-256 of its content (configuration hash, code version, command and
+outputs), so repeated identical runs share one record and only add an
+invocation entry with their own timestamp and timings.
+
+Storage is a single SQLite file (WAL mode, as the coupled solution cache):
+    records      id, configuration, code version, package, command and the
+                 zlib-compressed JSON record
+    invocations  one row per run_analysis call (time, timings, argv)
+    vals         one row per flattened value, indexed by (path, value):
+                 inputs once per configuration hash, outputs once per record
+    paths        interned dot-paths (vals stores integer keys)
+Diffs and history queries are indexed SQL lookups rather than scans of
+the records, so they stay fast over thousands of runs.
+
+Runs are addressed by invocation number (12), from the newest (-1 is the
+latest run, -2 the one before) or by a record id prefix (3fa1c0).
+
+Usage:
+    python -m mars_uav_sizing.run_archive list
+    python -m mars_uav_sizing.run_archive show -1
+    python -m mars_uav_sizing.run_archive diff -2 -1 --rel-tol 1e-6
+    python -m mars_uav_sizing.run_archive query \\
+        --where "section5.hybrid_vtol.margin_percent<10" \\
+        --select section5.hybrid_vtol.mtow_kg
+
+Last Updated: 2026-10-19
+"""
+
+import hashlib
+import json
+import math
+import re
+import sqlite3
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Default archive location (git-ignored)
+ARCHIVE_DIR = Path(__file__).resolve().parent / 'cache'
+DEFAULT_PATH = ARCHIVE_DIR / 'run_archive.sqlite'
+
+# Bump when the record layout changes
+RECORD_VERSION = 1
+
+# Lists longer than this (plot data, sweeps) are left out of the records
+MAX_LIST_LENGTH = 16
+
+INPUT, OUTPUT = 0, 1
+_KINDS = {'inputs': INPUT, 'outputs': OUTPUT}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS paths (
+    pid INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS configs (
+    cid INTEGER PRIMARY KEY,
+    config_hash TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS records (
+    rid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    cid INTEGER NOT NULL REFERENCES configs (cid),
+    code_version TEXT NOT NULL,
+    package TEXT NOT NULL,
+    command TEXT NOT NULL,
+    n_outputs INTEGER NOT NULL,
+    record BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS invocations (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    rid INTEGER NOT NULL REFERENCES records (rid),
+    created REAL NOT NULL,
+    wall_s REAL,
+    cpu_s REAL,
+    argv TEXT
+);
+-- Inputs belong to a configuration (owner = cid), outputs to a record (owner = rid)
+CREATE TABLE IF NOT EXISTS vals (
+    kind INTEGER NOT NULL,
+    owner INTEGER NOT NULL,
+    pid INTEGER NOT NULL,
+    num REAL,
+    text TEXT,
+    PRIMARY KEY (kind, owner, pid)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS vals_lookup ON vals (kind, pid, num);
+CREATE INDEX IF NOT EXISTS invocations_rid ON invocations (rid);
+CREATE INDEX IF NOT EXISTS records_cid ON records (cid);
+"""
+
+# Column of records holding the owner of each kind of value
+_OWNER = {INPUT: 'r.cid', OUTPUT: 'r.rid'}
+
+_CONDITION = re.compile(r'^\s*([\w.\-\[\]/]+)\s*(<=|>=|==|!=|<|>|=)\s*(.+?)\s*$')
+
+
+# =============================================================================
+# FLATTENING
+# =============================================================================
+
+def flatten(node: Any, prefix: str = '') -> Iterator[Tuple[str, Any]]:
+    """
+    Flatten nested results into (dot-path, value) leaves.
+
+    Numbers (numpy scalars included) and booleans become floats/bools,
+    strings are kept, short lists become JSON text; arrays, long lists and
+    other objects are skipped.
+    """
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from flatten(value, f'{prefix}.{key}' if prefix else str(key))
+        return
+    if isinstance(node, np.generic):
+        node = node.item()
+    if isinstance(node, bool):
+        yield prefix, node
+    elif isinstance(node, (int, float)):
+        yield prefix, float(node)
+    elif isinstance(node, str):
+        yield prefix, node
+    elif isinstance(node, (list, tuple)) and len(node) <= MAX_LIST_LENGTH:
+        try:
+            yield prefix, json.dumps(node, default=lambda v: v.item())
+        except (TypeError, AttributeError):
+            return
+
+
+def _json_value(value: Any) -> Any:
+    """Non-finite floats are stored as strings so the JSON stays standard."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return repr(value)
+    return value
+
+
+# Sources do not change within a process; hash them once per package set
+_CODE_VERSIONS: Dict[tuple, str] = {}
+
+
+def code_version(packages: Sequence[str] = ('mars_uav_sizing',)) -> str:
+    """
+    Version and source fingerprint of the given packages.
+
+    Returns
+    -------
+    str
+        '<version>+<16 hex chars>' (SHA-256 of every .py file, by relative path)
+    """
+    import importlib
+
+    key = tuple(packages)
+    if key in _CODE_VERSIONS:
+        return _CODE_VERSIONS[key]
+    digest = hashlib.sha256()
+    versions = []
+    for name in packages:
+        module = importlib.import_module(name)
+        versions.append(getattr(module, '__version__', '0'))
+        root = Path(module.__file__).resolve().parent
+        for path in sorted(root.rglob('*.py')):
+            digest.update(f'{name}/{path.relative_to(root).as_posix()}'.encode('utf-8'))
+            digest.update(path.read_bytes())
+    _CODE_VERSIONS[key] = f"{'/'.join(versions)}+{digest.hexdigest()[:16]}"
+    return _CODE_VERSIONS[key]
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+def connect(path: Optional[Path] = None) -> sqlite3.Connection:
+    """Open (and create) the archive database."""
+    path = Path(path or DEFAULT_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(str(path), timeout=30.0, isolation_level=None)
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.execute('PRAGMA synchronous=NORMAL')
+    connection.executescript(_SCHEMA)
+    return connection
+
+
+def record_run(
+    results: Dict[str, Any],
+    package: str,
+    command: str,
+    timings: Optional[Dict[str, float]] = None,
+    argv: Optional[Sequence[str]] = None,
+    packages: Optional[Sequence[str]] = None,
+    path: Optional[Path] = None,
+) -> str:
+    """
+    Archive one analysis run.
+
+    Parameters
+    ----------
+    results : dict
+        Nested results of the run (flattened into outputs)
+    package : str
+        Package that produced the run, e.g. 'mars_uav_sizing'
+    command : str
+        What was run, e.g. 'all' or 'section5'
+    timings : dict, optional
+        'wall_s' and 'cpu_s' of the run (stored with the invocation, not hashed)
+    argv : sequence of str, optional
+        Command-line arguments
+    packages : sequence of str, optional
+        Packages fingerprinted for the code version (default: package)
+    path : Path, optional
+        Archive file (default: DEFAULT_PATH)
+
+    Returns
+    -------
+    str
+        Record id (content hash)
+    """
+    from .config import load_config, scenario_hash
+
+    timings = dict(timings or {})
+    outputs = dict(flatten(results))
+    inputs = dict(flatten(load_config()))
+    meta = {
+        'record_version': RECORD_VERSION,
+        'package': package,
+        'command': command,
+        'config_hash': scenario_hash(),
+        'code_version': code_version(packages or (package,)),
+    }
+    body = {'meta': meta,
+            'inputs': {k: _json_value(v) for k, v in inputs.items()},
+            'outputs': {k: _json_value(v) for k, v in outputs.items()}}
+    text = json.dumps(body, sort_keys=True, separators=(',', ':'))
+    run_id = hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    connection = connect(path)
+    try:
+        connection.execute('BEGIN IMMEDIATE')
+        cid, new_config = _intern_config(connection, meta['config_hash'])
+        if new_config:
+            _insert_values(connection, INPUT, cid, inputs)
+        row = connection.execute('SELECT rid FROM records WHERE id = ?', (run_id,)).fetchone()
+        if row is None:
+            rid = connection.execute(
+                'INSERT INTO records (id, cid, code_version, package, command, n_outputs, record) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (run_id, cid, meta['code_version'], package, command, len(outputs),
+                 zlib.compress(text.encode('utf-8'), 6)),
+            ).lastrowid
+            _insert_values(connection, OUTPUT, rid, outputs)
+        else:
+            rid = row[0]
+        connection.execute(
+            'INSERT INTO invocations (rid, created, wall_s, cpu_s, argv) VALUES (?, ?, ?, ?, ?)',
+            (rid, time.time(), timings.get('wall_s'), timings.get('cpu_s'),
+             json.dumps(list(argv) if argv is not None else sys.argv[1:])),
+        )
+        connection.execute('COMMIT')
+    except BaseException:
+        connection.execute('ROLLBACK')
+        raise
+    finally:
+        connection.close()
+    return run_id
+
+
+def _intern_config(connection: sqlite3.Connection, config_hash: str) -> Tuple[int, bool]:
+    """(cid, created) of a configuration hash."""
+    row = connection.execute('SELECT cid FROM configs WHERE config_hash = ?', (config_hash,)).fetchone()
+    if row is not None:
+        return row[0], False
+    cursor = connection.execute('INSERT INTO configs (config_hash) VALUES (?)', (config_hash,))
+    return cursor.lastrowid, True
+
+
+def _path_ids(connection: sqlite3.Connection, keys: Sequence[str]) -> Dict[str, int]:
+    connection.executemany('INSERT OR IGNORE INTO paths (path) VALUES (?)', [(k,) for k in keys])
+    return dict(connection.execute('SELECT path, pid FROM paths'))
+
+
+def _insert_values(connection: sqlite3.Connection, kind: int, owner: int,
+                   values: Dict[str, Any]) -> None:
+    pids = _path_ids(connection, list(values))
+    connection.executemany(
+        'INSERT INTO vals (kind, owner, pid, num, text) VALUES (?, ?, ?, ?, ?)',
+        [(kind, owner, pids[key], *_split(value)) for key, value in values.items()],
+    )
+
+
+def _split(value: Any) -> Tuple[Optional[float], Optional[str]]:
+    """(num, text) columns of a flattened value; booleans are 0/1 numbers."""
+    if isinstance(value, bool):
+        return float(value), 'bool'
+    if isinstance(value, float):
+        return (value, None) if math.isfinite(value) else (None, repr(value))
+    return None, value
+
+
+def _join(num: Optional[float], text: Optional[str]) -> Any:
+    if text == 'bool':
+        return bool(num)
+    return num if num is not None else (float(text) if text in ('nan', 'inf', '-inf') else text)
+
+
+def archive_run(
+    results: Any,
+    package: str,
+    command: str,
+    started: Tuple[float, float],
+    packages: Optional[Sequence[str]] = None,
+    path: Optional[Path] = None,
+) -> Optional[str]:
+    """
+    Archive a run_analysis invocation without ever failing it.
+
+    Parameters
+    ----------
+    results : dict or None
+        Results of the run (nothing is archived for None)
+    started : tuple
+        (time.perf_counter(), time.process_time()) at the start of the run
+
+    Returns
+    -------
+    str or None
+        Record id, or None when nothing was archived
+    """
+    if not isinstance(results, dict):
+        return None
+    timings = {'wall_s': time.perf_counter() - started[0],
+               'cpu_s': time.process_time() - started[1]}
+    try:
+        return record_run(results, package, command, timings, packages=packages, path=path)
+    except (sqlite3.Error, OSError, TypeError, ValueError) as exc:
+        print(f'Warning: run not archived ({exc})', file=sys.stderr)
+        return None
+
+
+# =============================================================================
+# LOOKUP
+# =============================================================================
+
+def resolve(connection: sqlite3.Connection, ref: Any) -> Tuple[int, int, str]:
+    """
+    Resolve a run reference to (invocation number, record key, record id).
+
+    Parameters
+    ----------
+    ref : int or str
+        Invocation number, negative index from the newest run, or record
+        id prefix (at least 4 hex characters)
+    """
+    select = 'SELECT i.seq, i.rid, r.id FROM invocations i JOIN records r ON r.rid = i.rid '
+    text = str(ref).strip()
+    if re.fullmatch(r'-?\d+', text):
+        n = int(text)
+        if n < 0:
+            row = connection.execute(select + 'ORDER BY i.seq DESC LIMIT 1 OFFSET ?',
+                                     (-n - 1,)).fetchone()
+        else:
+            row = connection.execute(select + 'WHERE i.seq = ?', (n,)).fetchone()
+        if row is not None:
+            return row
+        if n < 0 or len(text) < 4:
+            raise KeyError(f'No run {text} in the archive')
+    rows = connection.execute(
+        'SELECT MAX(i.seq), i.rid, r.id FROM invocations i JOIN records r ON r.rid = i.rid '
+        'WHERE r.id LIKE ? GROUP BY i.rid', (text.lower() + '%',)
+    ).fetchall()
+    if len(text) < 4 or len(rows) != 1:
+        raise KeyError(f"Run id prefix {text!r} matches {len(rows)} records")
+    return rows[0]
+
+
+def load_record(ref: Any, path: Optional[Path] = None) -> Dict[str, Any]:
+    """Full record of a run ('meta', 'inputs', 'outputs', plus 'invocation')."""
+    connection = connect(path)
+    try:
+        seq, rid, run_id = resolve(connection, ref)
+        blob, = connection.execute('SELECT record FROM records WHERE rid = ?', (rid,)).fetchone()
+        created, wall_s, cpu_s, argv = connection.execute(
+            'SELECT created, wall_s, cpu_s, argv FROM invocations WHERE seq = ?', (seq,)
+        ).fetchone()
+    finally:
+        connection.close()
+    record = json.loads(zlib.decompress(blob).decode('utf-8'))
+    record['id'] = run_id
+    record['invocation'] = {'seq': seq, 'created': created, 'wall_s': wall_s,
+                            'cpu_s': cpu_s, 'argv': json.loads(argv or '[]')}
+    return record
+
+
+def list_runs(limit: int = 20, path: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """Newest invocations first."""
+    connection = connect(path)
+    try:
+        rows = connection.execute(
+            'SELECT i.seq, r.id, i.created, i.wall_s, r.package, r.command, c.config_hash, '
+            'r.code_version, r.n_outputs FROM invocations i JOIN records r ON r.rid = i.rid '
+            'JOIN configs c ON c.cid = r.cid ORDER BY i.seq DESC LIMIT ?', (limit,)
+        ).fetchall()
+    finally:
+        connection.close()
+    keys = ('seq', 'id', 'created', 'wall_s', 'package', 'command', 'config_hash',
+            'code_version', 'n_outputs')
+    return [dict(zip(keys, row)) for row in rows]
+
+
+# =============================================================================
+# DIFF
+# =============================================================================
+
+def diff_runs(
+    a: Any,
+    b: Any,
+    kind: str = 'outputs',
+    rel_tol: float = 1.0e-9,
+    abs_tol: float = 1.0e-12,
+    prefix: str = '',
+    path: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """
+    Compare two archived runs value by value.
+
+    Parameters
+    ----------
+    a, b : int or str
+        Run references (see resolve)
+    kind : str
+        'outputs' or 'inputs'
+    rel_tol, abs_tol : float
+        Numbers within math.isclose(rel_tol, abs_tol) count as equal
+    prefix : str
+        Only compare paths starting with this prefix
+
+    Returns
+    -------
+    dict
+        'a', 'b' (record ids), 'changed' (path, a, b, delta, rel), 'added'
+        and 'removed' (paths only in b / only in a), 'n_compared'
+    """
+    if kind not in _KINDS:
+        raise ValueError(f"Unknown kind: {kind!r} (use 'outputs' or 'inputs')")
+    connection = connect(path)
+    try:
+        code = _KINDS[kind]
+        (_, rid_a, id_a), (_, rid_b, id_b) = resolve(connection, a), resolve(connection, b)
+        like = prefix.replace('%', r'\%').replace('_', r'\_') + '%'
+        query = (f"SELECT p.path, v.num, v.text FROM records r "
+                 f"JOIN vals v ON v.kind = ? AND v.owner = {_OWNER[code]} "
+                 f"JOIN paths p ON p.pid = v.pid "
+                 f"WHERE r.rid = ? AND p.path LIKE ? ESCAPE '\\'")
+        left = {p: (n, t) for p, n, t in connection.execute(query, (code, rid_a, like))}
+        right = {p: (n, t) for p, n, t in connection.execute(query, (code, rid_b, like))}
+    finally:
+        connection.close()
+
+    changed = []
+    for key in sorted(left.keys() & right.keys()):
+        (na, ta), (nb, tb) = left[key], right[key]
+        if na is not None and nb is not None and ta == tb:
+            if math.isclose(na, nb, rel_tol=rel_tol, abs_tol=abs_tol):
+                continue
+            changed.append({'path': key, 'a': _join(na, ta), 'b': _join(nb, tb),
+                            'delta': nb - na, 'rel': (nb - na) / abs(na) if na else None})
+        elif (na, ta) != (nb, tb):
+            changed.append({'path': key, 'a': _join(na, ta), 'b': _join(nb, tb),
+                            'delta': None, 'rel': None})
+    return {
+        'a': id_a, 'b': id_b, 'kind': kind,
+        'changed': changed,
+        'added': sorted(right.keys() - left.keys()),
+        'removed': sorted(left.keys() - right.keys()),
+        'n_compared': len(left.keys() & right.keys()),
+    }
+
+
+# =============================================================================
+# QUERY
+# =============================================================================
+
+def parse_condition(text: str) -> Tuple[str, str, Any]:
+    """'path<value' -> (path, operator, value); '=' is read as '=='."""
+    match = _CONDITION.match(text)
+    if match is None:
+        raise ValueError(f'Cannot parse condition {text!r} (expected path<op>value)')
+    key, op, raw = match.groups()
+    op = '==' if op == '=' else op
+    try:
+        value: Any = float(raw)
+    except ValueError:
+        lowered = raw.lower()
+        value = {'true': True, 'false': False}.get(lowered, raw.strip('\'"'))
+    return key, op, value
+
+
+def query_runs(
+    where: Sequence[Any] = (),
+    select: Sequence[str] = (),
+    kind: str = 'outputs',
+    package: Optional[str] = None,
+    since: Optional[float] = None,
+    limit: int = 50,
+    latest_only: bool = False,
+    path: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Find archived runs matching conditions on their values.
+
+    Parameters
+    ----------
+    where : sequence of str or (path, op, value)
+        Conditions, all required; e.g. 'section5.hybrid_vtol.margin_percent<10'.
+        Operators: < <= > >= == !=; booleans compare as true/false, strings
+        with == and != only
+    select : sequence of str
+        Paths whose values are returned with each run
+    kind : str
+        'outputs' or 'inputs' (the paths conditions and selections refer to)
+    package : str, optional
+        Only runs of this package
+    since : float, optional
+        Only runs after this UNIX time
+    limit : int
+        Maximum number of runs (newest first)
+    latest_only : bool
+        One row per record (its latest invocation) instead of per invocation
+
+    Returns
+    -------
+    list of dict
+        'seq', 'id', 'created', 'wall_s', 'package', 'command' and the
+        selected values per run
+    """
+    if kind not in _KINDS:
+        raise ValueError(f"Unknown kind: {kind!r} (use 'outputs' or 'inputs')")
+    code = _KINDS[kind]
+    owner = _OWNER[code]
+    clauses, params = [], []
+    for i, condition in enumerate(where):
+        key, op, value = parse_condition(condition) if isinstance(condition, str) else condition
+        if op not in ('<', '<=', '>', '>=', '==', '!='):
+            raise ValueError(f'Unknown operator {op!r}')
+        sql_op = '=' if op == '==' else op
+        if isinstance(value, bool):
+            column, value = 'num', float(value)
+        elif isinstance(value, (int, float)):
+            column = 'num'
+        else:
+            if op not in ('==', '!='):
+                raise ValueError(f'Strings only compare with == and != ({key})')
+            column = 'text'
+        clauses.append(
+            f'EXISTS (SELECT 1 FROM vals v{i} WHERE v{i}.kind = ? AND v{i}.owner = {owner} '
+            f'AND v{i}.pid = (SELECT pid FROM paths WHERE path = ?) AND v{i}.{column} {sql_op} ?)'
+        )
+        params += [code, key, value]
+    if package:
+        clauses.append('r.package = ?')
+        params.append(package)
+    if since is not None:
+        clauses.append('i.created >= ?')
+        params.append(float(since))
+    if latest_only:
+        clauses.append('i.seq = (SELECT MAX(seq) FROM invocations WHERE rid = r.rid)')
+
+    sql = (f'SELECT i.seq, r.id, i.created, i.wall_s, r.package, r.command, {owner} '
+           'FROM invocations i JOIN records r ON r.rid = i.rid')
+    if clauses:
+        sql += ' WHERE ' + ' AND '.join(clauses)
+    sql += ' ORDER BY i.seq DESC LIMIT ?'
+    params.append(int(limit))
+
+    connection = connect(path)
+    try:
+        rows = connection.execute(sql, params).fetchall()
+        keys = ('seq', 'id', 'created', 'wall_s', 'package', 'command')
+        runs = []
+        for row in rows:
+            run = dict(zip(keys, row))
+            for key in select:
+                value = connection.execute(
+                    'SELECT num, text FROM vals WHERE kind = ? AND owner = ? '
+                    'AND pid = (SELECT pid FROM paths WHERE path = ?)',
+                    (code, row[-1], key),
+                ).fetchone()
+                run[key] = _join(*value) if value else None
+            runs.append(run)
+    finally:
+        connection.close()
+    return runs
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def _format_time(created: float) -> str:
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(created))
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, float):
+        return f'{value:.6g}'
+    return str(value)
+
+
+def _print_runs(runs: List[Dict[str, Any]], select: Sequence[str] = ()) -> None:
+    print(f"  {'#':>5}  {'Time':19}  {'Record':12}  {'Package':24} {'Command':12} {'Wall s':>7}"
+          + ''.join(f'  {key}' for key in select))
+    for run in runs:
+        wall = f"{run['wall_s']:.2f}" if run.get('wall_s') is not None else '-'
+        print(f"  {run['seq']:>5}  {_format_time(run['created'])}  {run['id'][:12]}  "
+              f"{run['package']:24} {run['command']:12} {wall:>7}"
+              + ''.join(f'  {_format_value(run.get(key))}' for key in select))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command-line interface: list, show, diff and query."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Mars UAV sizing run archive')
+    parser.add_argument('--archive', metavar='PATH', default=None,
+                        help=f'Archive file (default: {DEFAULT_PATH})')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    p_list = commands.add_parser('list', help='Show the latest runs')
+    p_list.add_argument('-n', type=int, default=20, help='Number of runs')
+
+    p_show = commands.add_parser('show', help='Print the record of a run')
+    p_show.add_argument('run', help='Invocation number, -1 for the latest, or id prefix')
+    p_show.add_argument('--kind', choices=['outputs', 'inputs'], default='outputs')
+    p_show.add_argument('--prefix', default='', help='Only paths starting with this prefix')
+
+    p_diff = commands.add_parser('diff', help='Compare two runs value by value')
+    p_diff.add_argument('a')
+    p_diff.add_argument('b')
+    p_diff.add_argument('--kind', choices=['outputs', 'inputs'], default='outputs')
+    p_diff.add_argument('--rel-tol', type=float, default=1.0e-9)
+    p_diff.add_argument('--abs-tol', type=float, default=1.0e-12)
+    p_diff.add_argument('--prefix', default='', help='Only paths starting with this prefix')
+
+    p_query = commands.add_parser('query', help='Find runs by their values')
+    p_query.add_argument('--where', nargs='+', default=[], metavar='COND',
+                         help='Conditions such as section5.hybrid_vtol.feasible==true')
+    p_query.add_argument('--select', nargs='+', default=[], metavar='PATH')
+    p_query.add_argument('--kind', choices=['outputs', 'inputs'], default='outputs')
+    p_query.add_argument('--package', default=None)
+    p_query.add_argument('--unique', action='store_true', help='One row per distinct record')
+    p_query.add_argument('-n', type=int, default=50, help='Maximum number of runs')
+
+    args = parser.parse_args(argv)
+    path = Path(args.archive) if args.archive else None
+
+    if args.command == 'list':
+        _print_runs(list_runs(args.n, path))
+    elif args.command == 'show':
+        record = load_record(args.run, path)
+        meta, inv = record['meta'], record['invocation']
+        print(f"Run #{inv['seq']}  {record['id']}")
+        print(f"  Time:          {_format_time(inv['created'])}")
+        print(f"  Package:       {meta['package']} ({meta['command']})")
+        print(f"  Config hash:   {meta['config_hash']}")
+        print(f"  Code version:  {meta['code_version']}")
+        if inv['wall_s'] is not None:
+            print(f"  Timings:       {inv['wall_s']:.3f} s wall, {inv['cpu_s']:.3f} s CPU")
+        print(f"  Arguments:     {' '.join(inv['argv'])}")
+        print('-' * 50)
+        for key, value in record[args.kind].items():
+            if key.startswith(args.prefix):
+                print(f'  {key:60} {_format_value(value)}')
+    elif args.command == 'diff':
+        result = diff_runs(args.a, args.b, args.kind, args.rel_tol, args.abs_tol, args.prefix, path)
+        print(f"Diff {result['kind']}: {result['a'][:12]} -> {result['b'][:12]} "
+              f"({result['n_compared']} compared, {len(result['changed'])} changed)")
+        print('-' * 50)
+        for row in result['changed']:
+            rel = f"{100.0 * row['rel']:+.3g} %" if row['rel'] is not None else ''
+            print(f"  {row['path']:60} {_format_value(row['a']):>12} -> "
+                  f"{_format_value(row['b']):<12} {rel}")
+        for key in result['added']:
+            print(f'  + {key}')
+        for key in result['removed']:
+            print(f'  - {key}')
+    elif args.command == 'query':
+        runs = query_runs(args.where, args.select, args.kind, args.package,
+                          limit=args.n, latest_only=args.unique, path=path)
+        _print_runs(runs, args.select)
+        print(f'\n  {len(runs)} runs')
+
+
+if __name__ == '__main__':
+    main()
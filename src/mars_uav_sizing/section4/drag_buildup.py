@@ -0,0 +1,322 @@
+"""
+Component Drag Buildup
+======================
+
+Zero-lift drag coefficient of the clean airframe from the component
+buildup, with Reynolds-dependent skin friction. Component sizes follow the
+wing, so at Mars density chord, Reynolds number and CD0 are coupled through
+MTOW and W/S:
+
+    S = W / (W/S),  b = sqrt(AR × S),  c = S / b
+    Re_i = ρ × V × l_i / μ
+    CD0 = (1 + k_exc) × Σ Cf(Re_i) × FF_i × Q_i × S_wet,i / S
+
+Components:
+    - Wing: S_wet = S_exp × (1.977 + 0.52 t/c), l = c
+      FF = [1 + 0.6/(x/c)_m × t/c + 100 (t/c)^4] × 1.34 M^0.18 cos(Λ)^0.28
+    - Fuselage: L = (L/b) × b, D = L / f
+      S_wet = π D L (1 - 2/f)^(2/3) (1 + 1/f²),  FF = 1 + 60/f³ + f/400
+    - V-tail: area and mean chord from the tail volume coefficients
+      (section6/tail_sizing.vtail_sizing_batch), wing-type FF
+    - Cf = f_lam × 1.328/sqrt(Re) + (1 - f_lam) × 0.455/(log10 Re)^2.58
+      / (1 + 0.144 M²)^0.65
+
+The buildup is vectorized over the component list (leading axis) and over
+design batches: MTOW, W/S and every entry of buildup_parameters() may be
+numpy arrays that broadcast together.
+
+Reference:
+    - Raymer (2018), Aircraft Design: A Conceptual Approach, §12.5
+    - Torenbeek (1982), Synthesis of Subsonic Airplane Design, Appendix F
+
+Last Updated: 2026-10-19
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from ..config import get_param
+from ..instrumentation import traced
+
+COMPONENTS: Tuple[str, ...] = ('wing', 'fuselage', 'tail')
+
+
+# =============================================================================
+# MODEL PARAMETERS
+# =============================================================================
+
+def buildup_parameters() -> Dict[str, Any]:
+    """
+    Collect the inputs of the drag buildup from config.
+
+    Returns
+    -------
+    dict
+        Scalar model inputs. Any entry may be replaced by a numpy array to
+        evaluate a batch of designs.
+    """
+    site = 'environment.arcadia_planitia'
+    build = 'aerodynamic.drag_buildup'
+    return {
+        'g': get_param('physical.mars.g'),
+        'rho': get_param(f'{site}.density_kg_m3'),
+        'mu': get_param(f'{site}.viscosity_Pa_s'),
+        'speed_of_sound': get_param(f'{site}.speed_of_sound_m_s'),
+        'velocity': get_param('mission.velocity.v_cruise_m_s'),
+        'aspect_ratio': get_param('aerodynamic.wing.aspect_ratio'),
+        'thickness_ratio': get_param('geometry.wing.thickness_ratio'),
+        'sweep_deg': get_param('geometry.wing.sweep_angle_deg'),
+        'length_to_span': get_param('geometry.fuselage.length_to_span_ratio'),
+        'fineness_ratio': get_param('geometry.fuselage.fineness_ratio'),
+        'max_thickness_location': get_param(f'{build}.max_thickness_location'),
+        'tail_thickness_ratio': get_param(f'{build}.tail_thickness_ratio'),
+        'excrescence_fraction': get_param(f'{build}.excrescence_fraction'),
+        **{f'laminar_{name}': get_param(f'{build}.laminar_fraction.{name}') for name in COMPONENTS},
+        **{f'interference_{name}': get_param(f'{build}.interference.{name}') for name in COMPONENTS},
+    }
+
+
+# =============================================================================
+# CORRELATIONS
+# =============================================================================
+
+def skin_friction_coefficient(reynolds, mach=0.0, laminar_fraction=0.0):
+    """
+    Flat-plate skin friction for mixed laminar/turbulent flow (elementwise).
+
+    Cf = f_lam × 1.328/sqrt(Re) + (1 - f_lam) × 0.455/(log10 Re)^2.58
+         / (1 + 0.144 M²)^0.65
+
+    Parameters
+    ----------
+    reynolds : float or np.ndarray
+        Reynolds number based on the component reference length
+    mach : float or np.ndarray
+        Mach number
+    laminar_fraction : float or np.ndarray
+        Laminar fraction of the wetted area (0-1)
+
+    Returns
+    -------
+    float or np.ndarray
+        Skin friction coefficient
+    """
+    reynolds = np.maximum(np.asarray(reynolds, dtype=float), 1.0e3)
+    cf_laminar = 1.328 / np.sqrt(reynolds)
+    cf_turbulent = 0.455 / (np.log10(reynolds) ** 2.58 * (1.0 + 0.144 * np.asarray(mach) ** 2) ** 0.65)
+    return laminar_fraction * cf_laminar + (1.0 - laminar_fraction) * cf_turbulent
+
+
+def lifting_surface_form_factor(thickness_ratio, max_thickness_location, mach, sweep_deg=0.0):
+    """Raymer form factor of a wing or tail surface (elementwise)."""
+    return (
+        (1.0 + 0.6 / max_thickness_location * thickness_ratio + 100.0 * thickness_ratio ** 4)
+        * 1.34 * np.asarray(mach) ** 0.18 * np.cos(np.radians(sweep_deg)) ** 0.28
+    )
+
+
+def body_form_factor(fineness_ratio):
+    """Raymer form factor of a streamlined body (elementwise)."""
+    f = np.asarray(fineness_ratio, dtype=float)
+    return 1.0 + 60.0 / f ** 3 + f / 400.0
+
+
+# =============================================================================
+# BUILDUP
+# =============================================================================
+
+def component_geometry(mtow_kg, wing_loading, params: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """
+    Reference lengths, wetted-area ratios and form factors of the components.
+
+    Returns
+    -------
+    dict
+        'length_m', 'wetted_ratio' (S_wet / S), 'form_factor',
+        'interference' and 'laminar_fraction' with the component axis first
+        (order of COMPONENTS), plus the wing and fuselage geometry
+    """
+    from ..section6.tail_sizing import vtail_sizing_batch
+
+    p = params
+    mtow_kg = np.asarray(mtow_kg, dtype=float)
+    wing_area = mtow_kg * p['g'] / np.asarray(wing_loading, dtype=float)
+    wingspan = np.sqrt(p['aspect_ratio'] * wing_area)
+    chord = wing_area / wingspan
+    mach = p['velocity'] / p['speed_of_sound']
+
+    fuselage_length = p['length_to_span'] * wingspan
+    f = np.asarray(p['fineness_ratio'], dtype=float)
+    diameter = fuselage_length / f
+    fuselage_wetted = (np.pi * diameter * fuselage_length
+                       * (1.0 - 2.0 / f) ** (2.0 / 3.0) * (1.0 + 1.0 / f ** 2))
+
+    # Exposed wing: planform minus the part covered by the fuselage
+    wing_exposed = np.maximum(wing_area - diameter * chord, 0.0)
+    wing_wetted = wing_exposed * (1.977 + 0.52 * p['thickness_ratio'])
+
+    tail = vtail_sizing_batch(wing_area, wingspan, chord, fuselage_length)
+    tail_wetted = tail['S_vtail_total_m2'] * (1.977 + 0.52 * p['tail_thickness_ratio'])
+
+    wing_ff = lifting_surface_form_factor(p['thickness_ratio'], p['max_thickness_location'],
+                                          mach, p['sweep_deg'])
+    tail_ff = lifting_surface_form_factor(p['tail_thickness_ratio'], p['max_thickness_location'], mach)
+    per_component = {
+        'length_m': (chord, fuselage_length, tail['c_vtail_m']),
+        'wetted_ratio': (wing_wetted / wing_area, fuselage_wetted / wing_area,
+                         tail_wetted / wing_area),
+        'form_factor': (wing_ff, body_form_factor(f), tail_ff),
+        'interference': tuple(p[f'interference_{name}'] for name in COMPONENTS),
+        'laminar_fraction': tuple(p[f'laminar_{name}'] for name in COMPONENTS),
+    }
+    # Batch shape shared by every component array (component axis first)
+    shape = np.broadcast_shapes(*[np.shape(v) for values in per_component.values() for v in values])
+    return {
+        **{key: np.stack([np.broadcast_to(np.asarray(v, dtype=float), shape) for v in values])
+           for key, values in per_component.items()},
+        'mach': mach,
+        'wing_area_m2': wing_area,
+        'wingspan_m': wingspan,
+        'chord_m': chord,
+        'fuselage_length_m': fuselage_length,
+        'tail_area_m2': tail['S_vtail_total_m2'],
+    }
+
+
+def drag_buildup(mtow_kg, wing_loading, params: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    Zero-lift drag coefficient from the component buildup.
+
+    Parameters
+    ----------
+    mtow_kg : float or np.ndarray
+        Maximum takeoff mass in kg
+    wing_loading : float or np.ndarray
+        Wing loading W/S in N/m²
+    params : dict, optional
+        Model inputs (default: buildup_parameters())
+
+    Returns
+    -------
+    dict
+        'cd0' (float for scalar inputs), per-component 'cd0_components',
+        'reynolds' and 'cf' (component axis first) and the geometry
+    """
+    p = params if params is not None else buildup_parameters()
+    geom = component_geometry(mtow_kg, wing_loading, p)
+
+    reynolds = p['rho'] * p['velocity'] * geom['length_m'] / p['mu']
+    cf = skin_friction_coefficient(reynolds, geom['mach'], geom['laminar_fraction'])
+    components = cf * geom['form_factor'] * geom['interference'] * geom['wetted_ratio']
+    cd0 = (1.0 + p['excrescence_fraction']) * components.sum(axis=0)
+
+    return {
+        'cd0': float(cd0) if np.ndim(cd0) == 0 else cd0,
+        'cd0_components': components,
+        'reynolds': reynolds,
+        'cf': cf,
+        **geom,
+    }
+
+
+def baseline_wing_loading() -> float:
+    """Stall-limited design wing loading W/S = ½ ρ V_min² C_L,max (N/m²)."""
+    v_min = (get_param('mission.velocity.v_stall_m_s')
+             * get_param('mission.velocity.v_min_factor'))
+    return (0.5 * get_param('environment.arcadia_planitia.density_kg_m3') * v_min ** 2
+            * get_param('aerodynamic.airfoil.cl_max'))
+
+
+def zero_lift_drag(mtow_kg=None, wing_loading=None):
+    """
+    CD0 from the buildup (defaults: baseline MTOW, stall-limited W/S).
+
+    Returns
+    -------
+    float or np.ndarray
+        Zero-lift drag coefficient
+    """
+    if mtow_kg is None:
+        mtow_kg = get_param('mission.mass.mtow_kg')
+    if wing_loading is None:
+        wing_loading = baseline_wing_loading()
+    return drag_buildup(mtow_kg, wing_loading)['cd0']
+
+
+# =============================================================================
+# FULL ANALYSIS
+# =============================================================================
+
+@traced('drag_buildup')
+def drag_buildup_analysis() -> Dict[str, Any]:
+    """
+    Drag buildup at the baseline design point and over an MTOW sweep.
+
+    Returns
+    -------
+    dict
+        Buildup at the baseline, the YAML cd0 for comparison and the MTOW sweep
+    """
+    mtow = get_param('mission.mass.mtow_kg')
+    ws = baseline_wing_loading()
+    sweep_mtow = np.linspace(0.5 * mtow, 1.5 * mtow, 5)
+    return {
+        'mtow_kg': mtow,
+        'wing_loading': ws,
+        'buildup': drag_buildup(mtow, ws),
+        'cd0_yaml': get_param('aerodynamic.drag_polar.cd0'),
+        'use_in_sizing': get_param('aerodynamic.drag_buildup.use_in_sizing', False),
+        'sweep_mtow_kg': sweep_mtow,
+        'sweep': drag_buildup(sweep_mtow, ws),
+    }
+
+
+def print_analysis(results: Dict[str, Any] = None) -> None:
+    """Print formatted drag buildup results."""
+    if results is None:
+        results = drag_buildup_analysis()
+
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    b = results['buildup']
+
+    print('=' * 80)
+    print('COMPONENT DRAG BUILDUP (Reynolds-dependent CD0)')
+    print('=' * 80)
+    print(f'Computed: {timestamp}')
+    print('Config:   All values loaded from config/ YAML files')
+    print()
+
+    print('DESIGN POINT')
+    print('-' * 50)
+    print(f"  MTOW:                  {results['mtow_kg']:.2f} kg")
+    print(f"  Wing loading:          {results['wing_loading']:.2f} N/m² (stall limit)")
+    print(f"  Wing area / chord:     {b['wing_area_m2']:.3f} m² / {b['chord_m']:.3f} m")
+    print(f"  Fuselage length:       {b['fuselage_length_m']:.3f} m")
+    print(f"  V-tail area:           {b['tail_area_m2']:.3f} m²")
+    print(f"  Mach:                  {b['mach']:.3f}")
+    print()
+
+    print('COMPONENTS')
+    print('-' * 50)
+    print(f"  {'Component':<10} {'l (m)':>7} {'Re':>9} {'Cf':>8} {'FF':>6} {'Swet/S':>7} {'CD0':>8}")
+    for i, name in enumerate(COMPONENTS):
+        print(f"  {name:<10} {b['length_m'][i]:7.3f} {b['reynolds'][i]:9.0f} {b['cf'][i]:8.5f} "
+              f"{b['form_factor'][i]:6.3f} {b['wetted_ratio'][i]:7.3f} {b['cd0_components'][i]:8.5f}")
+    print()
+    print(f"  CD0 (buildup):         {b['cd0']:.4f}")
+    print(f"  CD0 (YAML constant):   {results['cd0_yaml']:.4f}")
+    print(f"  Used in sizing:        {'yes' if results['use_in_sizing'] else 'no'}")
+    print()
+
+    print('MTOW SWEEP (same W/S)')
+    print('-' * 50)
+    s = results['sweep']
+    for m, c, re in zip(results['sweep_mtow_kg'], s['cd0'], s['reynolds'][0]):
+        print(f"  MTOW {m:6.2f} kg: chord Re = {re:7.0f}, CD0 = {c:.4f}")
+    print('=' * 80)
+
+
+if __name__ == '__main__':
+    print_analysis()
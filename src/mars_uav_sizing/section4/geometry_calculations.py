@@ -10,17 +10,22 @@ Equations:
     @eq:vtail-projection      - V-tail area decomposition
     @eq:rotor-diameter        - D = sqrt(4×A/π)
 
+All geometry functions accept numpy arrays; geometry_batch() evaluates
+a batch of wing/fuselage/tail inputs at once and returns a
+structure-of-arrays with the active tail-constraint mask.
+
 Reference: 
     - Manuscript: sections_en/04_05_tail-geometry.md
     - Roskam (2004), Airplane Design Part I-VIII
 
-Last Updated: 2025-12-29
+Last Updated: 2026-10-19
 """
 
-import math
 from datetime import datetime
 from typing import Dict, Tuple, Any
 
+import numpy as np
+
 from ..config import get_param
 
 
@@ -126,28 +131,29 @@ def vtail_geometry(
 
     Parameters
     ----------
-    sh_required : float
+    sh_required : float or np.ndarray
         Required horizontal projection area in m²
-    sv_required : float
+    sv_required : float or np.ndarray
         Required vertical projection area in m²
-    dihedral_deg : float, optional
+    dihedral_deg : float or np.ndarray, optional
         V-tail dihedral angle in degrees (default: from config)
-    aspect_ratio : float, optional
+    aspect_ratio : float or np.ndarray, optional
         V-tail aspect ratio (default: from config)
 
     Returns
     -------
     dict
-        V-tail geometry parameters
+        V-tail geometry parameters; 'pitch_limited' is True where the
+        horizontal (pitch) requirement sizes the tail
     """
     if dihedral_deg is None:
         dihedral_deg = get_param('geometry.tail.vtail_dihedral_deg')
     if aspect_ratio is None:
         aspect_ratio = get_param('geometry.tail.vtail_aspect_ratio')
     
-    dihedral_rad = math.radians(dihedral_deg)
-    cos2_gamma = math.cos(dihedral_rad) ** 2
-    sin2_gamma = math.sin(dihedral_rad) ** 2
+    dihedral_rad = np.radians(dihedral_deg)
+    cos2_gamma = np.cos(dihedral_rad) ** 2
+    sin2_gamma = np.sin(dihedral_rad) ** 2
     
     # Calculate total V-tail area from horizontal requirement
     s_vtail_from_h = sh_required / cos2_gamma
@@ -155,11 +161,11 @@ def vtail_geometry(
     s_vtail_from_v = sv_required / sin2_gamma
     
     # Use the larger to satisfy both requirements
-    s_vtail_total = max(s_vtail_from_h, s_vtail_from_v)
+    s_vtail_total = np.maximum(s_vtail_from_h, s_vtail_from_v)
     s_per_surface = s_vtail_total / 2
     
     # Calculate dimensions
-    span_per_surface = math.sqrt(aspect_ratio * s_per_surface)
+    span_per_surface = np.sqrt(aspect_ratio * s_per_surface)
     chord = s_per_surface / span_per_surface
     
     return {
@@ -171,6 +177,7 @@ def vtail_geometry(
         'aspect_ratio': aspect_ratio,
         'actual_sh': s_vtail_total * cos2_gamma,
         'actual_sv': s_vtail_total * sin2_gamma,
+        'pitch_limited': s_vtail_from_h >= s_vtail_from_v,
     }
 
 
@@ -229,7 +236,7 @@ def rotor_diameter(
         disk_loading = get_param('geometry.rotor.disk_loading_N_m2')
     
     area_per_rotor = (total_thrust / n_rotors) / disk_loading
-    return math.sqrt(4 * area_per_rotor / math.pi)
+    return np.sqrt(4 * area_per_rotor / np.pi)
 
 
 def total_disk_area(thrust: float, disk_loading: float = None) -> float:
@@ -256,65 +263,136 @@ def total_disk_area(thrust: float, disk_loading: float = None) -> float:
     return thrust / disk_loading
 
 
-def geometry_analysis() -> Dict[str, Any]:
+# =============================================================================
+# BATCH GEOMETRY
+# =============================================================================
+
+# Batch inputs and their configuration defaults
+GEOMETRY_INPUTS = {
+    'mtow_kg': 'mission.mass.mtow_kg',
+    'wing_loading': None,  # stall-limited maximum (derived_requirements)
+    'aspect_ratio': 'aerodynamic.wing.aspect_ratio',
+    'length_to_span': 'geometry.fuselage.length_to_span_ratio',
+    'moment_arm_ratio': 'geometry.tail.moment_arm_ratio',
+    'v_h': 'geometry.tail.v_h',
+    'v_v': 'geometry.tail.v_v',
+    'dihedral_deg': 'geometry.tail.vtail_dihedral_deg',
+    'tail_aspect_ratio': 'geometry.tail.vtail_aspect_ratio',
+    'n_rotors': 'geometry.propulsion_config.lift.n_rotors',
+    'disk_loading': 'geometry.rotor.disk_loading_N_m2',
+}
+
+
+def geometry_batch(**inputs: Any) -> Dict[str, np.ndarray]:
     """
-    Complete geometry analysis for the baseline design.
+    Wing, fuselage, tail and rotor geometry for a batch of designs.
 
-    Uses stall-constrained wing loading from derived requirements
-    and configuration parameters for all geometry constants.
+    Parameters
+    ----------
+    **inputs : float or np.ndarray
+        Any of GEOMETRY_INPUTS; omitted inputs are read from config once.
+        Arrays must broadcast together.
 
     Returns
     -------
     dict
-        All geometry parameters
+        Structure-of-arrays, every entry with the broadcast batch shape.
+        'pitch_limited' is the active tail-constraint mask (True: the
+        horizontal requirement sizes the V-tail, False: the vertical one).
     """
-    g = get_param('physical.mars.g')
-    mtow = get_param('mission.mass.mtow_kg')
-    weight_n = mtow * g
-    ar = get_param('aerodynamic.wing.aspect_ratio')
-
-    # Wing geometry from stall-constrained derived requirements
-    from .derived_requirements import (
-        maximum_wing_loading,
-        wing_area_from_loading,
-        wingspan_from_area,
-        mean_chord,
-    )
-
-    # Use stall constraint to determine wing loading (V_min-based)
-    ws = maximum_wing_loading()
-    s = wing_area_from_loading(mtow, ws)
-    b = wingspan_from_area(s, ar)
-    c = mean_chord(s, b)
-
-    # Fuselage length
-    l_fus = fuselage_length(b)
-
-    # Tail geometry (moment arm from config ratio)
-    moment_arm_ratio = get_param('geometry.tail.moment_arm_ratio')
-    moment_arm = moment_arm_ratio * l_fus
-    sh = horizontal_tail_area(s, c, moment_arm)
-    sv = vertical_tail_area(s, b, moment_arm)
-    vtail = vtail_geometry(sh, sv)
-
-    # Rotor configuration from config
-    n_rotors = get_param('geometry.rotor.n_rotors')
-    d_rotor = rotor_diameter(weight_n, n_rotors)
+    unknown = set(inputs) - set(GEOMETRY_INPUTS)
+    if unknown:
+        raise ValueError(f"Unknown geometry inputs: {sorted(unknown)}")
+
+    values = {}
+    for name, path in GEOMETRY_INPUTS.items():
+        if inputs.get(name) is not None:
+            values[name] = inputs[name]
+        elif path is None:
+            from .derived_requirements import maximum_wing_loading
+            values[name] = maximum_wing_loading()
+        else:
+            values[name] = get_param(path)
+    arrays = dict(zip(values, np.broadcast_arrays(
+        *[np.asarray(v, dtype=float) for v in values.values()])))
+    v = arrays
+
+    weight_n = v['mtow_kg'] * get_param('physical.mars.g')
+
+    # Wing geometry
+    s = weight_n / v['wing_loading']
+    b = np.sqrt(v['aspect_ratio'] * s)
+    c = s / b
+
+    # Fuselage and tail
+    l_fus = fuselage_length(b, v['length_to_span'])
+    moment_arm = v['moment_arm_ratio'] * l_fus
+    sh = horizontal_tail_area(s, c, moment_arm, v['v_h'])
+    sv = vertical_tail_area(s, b, moment_arm, v['v_v'])
+    vtail = vtail_geometry(sh, sv, v['dihedral_deg'], v['tail_aspect_ratio'])
+
+    # Rotors
+    d_rotor = rotor_diameter(weight_n, v['n_rotors'], v['disk_loading'])
 
     return {
-        'wing_loading_n_m2': ws,
+        **{name: arrays[name] for name in GEOMETRY_INPUTS},
         'wing_area_m2': s,
         'wingspan_m': b,
         'mean_chord_m': c,
         'fuselage_length_m': l_fus,
-        'moment_arm_ratio': moment_arm_ratio,
         'moment_arm_m': moment_arm,
         'sh_required_m2': sh,
         'sv_required_m2': sv,
-        'vtail': vtail,
-        'n_rotors': n_rotors,
+        's_vtail_total_m2': vtail['s_vtail_total'],
+        's_per_surface_m2': vtail['s_per_surface'],
+        'span_per_surface_m': vtail['span_per_surface'],
+        'vtail_chord_m': vtail['chord'],
+        'actual_sh_m2': vtail['actual_sh'],
+        'actual_sv_m2': vtail['actual_sv'],
+        'pitch_limited': vtail['pitch_limited'],
         'rotor_diameter_m': d_rotor,
-        'total_disk_area_m2': total_disk_area(weight_n),
+        'total_disk_area_m2': total_disk_area(weight_n, v['disk_loading']),
+    }
+
+
+def geometry_analysis() -> Dict[str, Any]:
+    """
+    Complete geometry analysis for the baseline design.
+
+    Uses stall-constrained wing loading from derived requirements
+    and configuration parameters for all geometry constants.
+
+    Returns
+    -------
+    dict
+        All geometry parameters
+    """
+    g = {key: value.item() for key, value in geometry_batch().items()}
+
+    return {
+        'wing_loading_n_m2': g['wing_loading'],
+        'wing_area_m2': g['wing_area_m2'],
+        'wingspan_m': g['wingspan_m'],
+        'mean_chord_m': g['mean_chord_m'],
+        'fuselage_length_m': g['fuselage_length_m'],
+        'moment_arm_ratio': g['moment_arm_ratio'],
+        'moment_arm_m': g['moment_arm_m'],
+        'sh_required_m2': g['sh_required_m2'],
+        'sv_required_m2': g['sv_required_m2'],
+        'vtail': {
+            's_vtail_total': g['s_vtail_total_m2'],
+            's_per_surface': g['s_per_surface_m2'],
+            'dihedral_deg': g['dihedral_deg'],
+            'span_per_surface': g['span_per_surface_m'],
+            'chord': g['vtail_chord_m'],
+            'aspect_ratio': g['tail_aspect_ratio'],
+            'actual_sh': g['actual_sh_m2'],
+            'actual_sv': g['actual_sv_m2'],
+            'pitch_limited': g['pitch_limited'],
+        },
+        'n_rotors': int(g['n_rotors']),
+        'rotor_diameter_m': g['rotor_diameter_m'],
+        'total_disk_area_m2': g['total_disk_area_m2'],
     }
 
 
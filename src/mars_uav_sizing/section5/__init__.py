@@ -10,6 +10,9 @@ Modules:
     - fixed_wing: Pure fixed-wing (§5.2) 
     - hybrid_vtol: Hybrid VTOL / QuadPlane (§5.3)
     - matching_chart: Constraint diagram (§5.4)
+    - flight_envelope: Maneuver and gust V-n diagram
+    - transition: Point-mass transition simulation (§5.3.2b)
+    - wind_performance: Wind-aware operational radius and endurance maps
     - comparative: Configuration comparison (§5.4)
 
 All modules load parameters from config/ YAML files - no hardcoded values.
@@ -18,6 +21,9 @@ All modules load parameters from config/ YAML files - no hardcoded values.
 from . import rotorcraft
 from . import fixed_wing
 from . import hybrid_vtol
+from . import flight_envelope
+from . import transition
+from . import wind_performance
 from . import matching_chart
 from . import comparative
 
@@ -25,6 +31,9 @@ __all__ = [
     'rotorcraft',
     'fixed_wing', 
     'hybrid_vtol',
+    'flight_envelope',
+    'transition',
+    'wind_performance',
     'matching_chart',
     'comparative',
 ]
@@ -23,6 +23,7 @@ from datetime import datetime
 
 # Import configuration loader
 from ..config import get_param
+from ..instrumentation import traced
 
 # Import analysis modules
 from . import rotorcraft
@@ -232,16 +233,26 @@ def elimination_rationale(results: Dict[str, Dict[str, Any]] = None) -> Dict[str
 # SUMMARY
 # =============================================================================
 
-def comparative_summary() -> Dict[str, Any]:
+@traced('comparative')
+def comparative_summary(results: Dict[str, Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Generate complete comparative summary.
     
+    Parameters
+    ----------
+    results : dict, optional
+        Configuration analyses already evaluated ('rotorcraft',
+        'fixed_wing', 'hybrid_vtol'); run here if not given
+    
     Returns
     -------
     dict
         Complete analysis summary
     """
-    results = run_all_analyses()
+    if results is None:
+        results = run_all_analyses()
+    else:
+        results = {name: results[name] for name in ('rotorcraft', 'fixed_wing', 'hybrid_vtol')}
     comparison = create_comparison_table(results)
     ranking = configuration_ranking(results)
     rationale = elimination_rationale(results)
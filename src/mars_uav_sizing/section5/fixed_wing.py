@@ -28,6 +28,8 @@ import math
 from typing import Dict, Any, Tuple
 from datetime import datetime
 
+from ..core.dual import sqrt
+
 # Import configuration loader
 from ..config import (
     get_mars_gravity,
@@ -39,6 +41,7 @@ from ..config import (
     get_aerodynamic_params,
     get_param,
 )
+from ..instrumentation import traced
 
 
 # =============================================================================
@@ -206,8 +209,8 @@ def maximum_ld(
     if e is None:
         e = aero['oswald_e']
     
-    cl_opt = math.sqrt(math.pi * ar * e * c_d0)
-    ld_max = 0.5 * math.sqrt(math.pi * ar * e / c_d0)
+    cl_opt = sqrt(math.pi * ar * e * c_d0)
+    ld_max = 0.5 * sqrt(math.pi * ar * e / c_d0)
     
     return ld_max, cl_opt
 
@@ -295,13 +298,14 @@ def cruise_power_loading(
     float
         Power loading P/W in W/N
     """
-    prop = get_propulsion_efficiencies()
-    if eta_prop is None:
-        eta_prop = prop['eta_prop']
-    if eta_motor is None:
-        eta_motor = prop['eta_motor']
-    if eta_esc is None:
-        eta_esc = prop['eta_esc']
+    if None in (eta_prop, eta_motor, eta_esc):
+        prop = get_propulsion_efficiencies()
+        if eta_prop is None:
+            eta_prop = prop['eta_prop']
+        if eta_motor is None:
+            eta_motor = prop['eta_motor']
+        if eta_esc is None:
+            eta_esc = prop['eta_esc']
     
     eta_cruise = eta_prop * eta_motor * eta_esc
     return velocity / (ld * eta_cruise)
@@ -339,7 +343,7 @@ def stall_speed(wing_loading: float, rho: float = None, c_l_max: float = None) -
     if c_l_max is None:
         c_l_max = get_aerodynamic_params()['cl_max']
     
-    return math.sqrt((2 * wing_loading) / (rho * c_l_max))
+    return sqrt((2 * wing_loading) / (rho * c_l_max))
 
 
 def stall_wing_loading_limit(
@@ -478,6 +482,7 @@ def takeoff_ground_roll(
 # FEASIBILITY ANALYSIS (§5.2.6)
 # =============================================================================
 
+@traced('fixed_wing')
 def fixed_wing_feasibility_analysis() -> Dict[str, Any]:
     """
     Complete fixed-wing feasibility analysis.
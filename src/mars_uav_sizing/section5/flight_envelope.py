@@ -0,0 +1,520 @@
+"""
+Flight Envelope (V-n Diagram)
+=============================
+
+Builds the maneuver and gust V-n diagrams of the QuadPlane wing in the Mars
+atmosphere and derives the critical limit load factor used for structural
+sizing, vectorized over batches of wing loadings, altitudes and masses.
+
+Key equations:
+    - Finite-wing lift slope (Helmbold / DATCOM):
+        a = 2π·AR / (2 + sqrt(4 + (AR/κ)² (1 + tan²Λ))),  κ = a_0 / 2π
+    - Maneuver envelope: n = ½ρV²·C_L,max / (W/S), capped at n_limit
+      (positive) and at -ratio × n_limit (negative, C_L,min)
+    - Pegg/Pratt gust load factor (CS-23.341):
+        Δn = K_g ρ V U a / (2 W/S)
+        μ_g = 2 (W/S) / (ρ c a g),  K_g = 0.88 μ_g / (5.3 + μ_g)
+      with the design gust U at V_C and its reduced value at V_D = k × V_C
+    - Gust wing-loading limit (Δn = n_limit - 1), from
+        Δn = 0.88 V U / (c g (5.3 + μ_g))
+
+The design gust is the vertical environment.wind.design_gust (the recorded
+wind maxima are horizontal). The critical load factor feeds the structural
+mass model (section7/mass_closure) when mission.structural.envelope.use_in_sizing
+is set together with mission.mass_estimation.use_in_sizing, and the gust
+wing-loading limit is then reported on the matching chart.
+
+Reference:
+    - CS-23 Amdt. 4, §23.333-23.341 (flight envelope, gust loads)
+    - Pratt, K.G. (1953), NACA Report 1206
+    - Raymer (2018), Aircraft Design: A Conceptual Approach, §14.2
+
+Last Updated: 2026-10-19
+"""
+
+import math
+from datetime import datetime
+from typing import Any, Dict
+
+import numpy as np
+
+from ..config import (
+    get_aerodynamic_params,
+    get_density,
+    get_mars_gravity,
+    get_mission_params,
+    get_mtow,
+    get_param,
+)
+from ..instrumentation import traced
+
+
+# =============================================================================
+# AERODYNAMIC INPUTS
+# =============================================================================
+
+def lift_curve_slope(
+    aspect_ratio: float = None,
+    airfoil_cl_alpha: float = None,
+    sweep_deg: float = None,
+) -> float:
+    """
+    Finite-wing lift-curve slope (Helmbold / DATCOM, incompressible).
+
+    Parameters
+    ----------
+    aspect_ratio : float, optional
+        Wing aspect ratio (default: aerodynamic.wing.aspect_ratio)
+    airfoil_cl_alpha : float, optional
+        Section lift-curve slope in 1/rad
+        (default: mission.structural.envelope.airfoil_cl_alpha_per_rad)
+    sweep_deg : float, optional
+        Sweep angle in degrees (default: geometry.wing.sweep_angle_deg)
+
+    Returns
+    -------
+    float
+        Wing lift-curve slope in 1/rad
+    """
+    if aspect_ratio is None:
+        aspect_ratio = get_aerodynamic_params()['aspect_ratio']
+    if airfoil_cl_alpha is None:
+        airfoil_cl_alpha = get_param('mission.structural.envelope.airfoil_cl_alpha_per_rad')
+    if sweep_deg is None:
+        sweep_deg = get_param('geometry.wing.sweep_angle_deg')
+
+    kappa = airfoil_cl_alpha / (2.0 * math.pi)
+    tan_sweep = math.tan(math.radians(sweep_deg))
+    root = math.sqrt(4.0 + (aspect_ratio / kappa) ** 2 * (1.0 + tan_sweep ** 2))
+    return 2.0 * math.pi * aspect_ratio / (2.0 + root)
+
+
+def envelope_parameters() -> Dict[str, Any]:
+    """
+    Collect the inputs of the V-n diagram from config.
+
+    Returns
+    -------
+    dict
+        Scalar inputs. 'rho' may be replaced by an array (see
+        density_at_altitude) to evaluate a batch.
+    """
+    env = 'mission.structural.envelope'
+    n_limit = get_param('mission.structural.n_limit')
+    v_cruise = get_mission_params()['v_cruise']
+    gust_cruise = get_param(f"environment.wind.{get_param(f'{env}.gust_source')}")
+
+    return {
+        'g': get_mars_gravity(),
+        'rho': get_density(),
+        'aspect_ratio': get_aerodynamic_params()['aspect_ratio'],
+        'cl_alpha': lift_curve_slope(),
+        'cl_max': get_aerodynamic_params()['cl_max'],
+        'cl_min': get_param(f'{env}.cl_min'),
+        'n_limit': n_limit,
+        'n_negative': -get_param(f'{env}.negative_limit_ratio') * n_limit,
+        'safety_factor': get_param('mission.structural.safety_factor'),
+        'v_cruise': v_cruise,
+        'v_dive': get_param(f'{env}.dive_speed_factor') * v_cruise,
+        'gust_cruise': gust_cruise,
+        'gust_dive': get_param(f'{env}.dive_gust_ratio') * gust_cruise,
+    }
+
+
+def density_at_altitude(altitude_km) -> np.ndarray:
+    """
+    Air density at one or more altitudes above the Mars areoid.
+
+    Parameters
+    ----------
+    altitude_km : float or np.ndarray
+        Altitude in km
+
+    Returns
+    -------
+    np.ndarray
+        Density in kg/m³, same shape as altitude_km
+    """
+    from ..core.atmosphere import MarsAtmosphere
+
+    return np.vectorize(MarsAtmosphere().density, otypes=[float])(altitude_km)
+
+
+def mean_chord(wing_loading, mtow_kg, params: Dict[str, Any]) -> np.ndarray:
+    """Mean geometric chord c = sqrt(S / AR) with S = m g / (W/S), in m."""
+    wing_area = np.asarray(mtow_kg, dtype=float) * params['g'] / np.asarray(wing_loading, dtype=float)
+    return np.sqrt(wing_area / params['aspect_ratio'])
+
+
+# =============================================================================
+# LOAD FACTORS
+# =============================================================================
+
+def gust_alleviation_factor(wing_loading, chord, params: Dict[str, Any]):
+    """
+    Pratt gust alleviation factor.
+
+    Parameters
+    ----------
+    wing_loading : float or np.ndarray
+        W/S in N/m²
+    chord : float or np.ndarray
+        Mean geometric chord in m
+    params : dict
+        Inputs from envelope_parameters()
+
+    Returns
+    -------
+    tuple
+        (μ_g, K_g) as arrays
+    """
+    mu = 2.0 * np.asarray(wing_loading, dtype=float) / (
+        params['rho'] * chord * params['cl_alpha'] * params['g']
+    )
+    return mu, 0.88 * mu / (5.3 + mu)
+
+
+def gust_load_factor(wing_loading, velocity, gust_velocity, chord, params: Dict[str, Any]):
+    """
+    Incremental load factor of a sharp-edged gust with Pratt alleviation.
+
+    Δn = K_g ρ V U a / (2 W/S)
+
+    Parameters
+    ----------
+    wing_loading : float or np.ndarray
+        W/S in N/m²
+    velocity : float or np.ndarray
+        Flight speed in m/s
+    gust_velocity : float or np.ndarray
+        Vertical gust velocity in m/s
+    chord : float or np.ndarray
+        Mean geometric chord in m
+    params : dict
+        Inputs from envelope_parameters()
+
+    Returns
+    -------
+    np.ndarray
+        Δn (add to / subtract from 1 g)
+    """
+    wing_loading = np.asarray(wing_loading, dtype=float)
+    _, k_g = gust_alleviation_factor(wing_loading, chord, params)
+    return (k_g * params['rho'] * np.asarray(velocity) * np.asarray(gust_velocity)
+            * params['cl_alpha'] / (2.0 * wing_loading))
+
+
+def critical_load_factor(wing_loading=None, mtow_kg=None, params: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    Critical positive limit load factor of the maneuver and gust envelopes.
+
+    The gust increment grows linearly with V·U, so its maximum lies at V_C
+    (design gust) or V_D (reduced gust); both corners are evaluated.
+
+    Parameters
+    ----------
+    wing_loading : float or np.ndarray, optional
+        W/S in N/m² (default: matching-chart design point)
+    mtow_kg : float or np.ndarray, optional
+        Take-off mass in kg (default: mission.mass.mtow_kg)
+    params : dict, optional
+        Inputs from envelope_parameters()
+
+    Returns
+    -------
+    dict
+        'n_critical', 'n_gust' (1 + Δn at the worst corner), 'n_limit' and
+        'gust_critical' (True where the gust governs)
+    """
+    if params is None:
+        params = envelope_parameters()
+    if wing_loading is None:
+        from .matching_chart import find_design_point
+        wing_loading = find_design_point()['wing_loading']
+    if mtow_kg is None:
+        mtow_kg = get_mtow()
+
+    chord = mean_chord(wing_loading, mtow_kg, params)
+    dn_cruise = gust_load_factor(wing_loading, params['v_cruise'], params['gust_cruise'], chord, params)
+    dn_dive = gust_load_factor(wing_loading, params['v_dive'], params['gust_dive'], chord, params)
+    n_gust = 1.0 + np.maximum(dn_cruise, dn_dive)
+    n_critical = np.maximum(params['n_limit'], n_gust)
+
+    return {
+        'n_critical': n_critical,
+        'n_gust': n_gust,
+        'n_limit': params['n_limit'],
+        'gust_critical': n_gust > params['n_limit'],
+    }
+
+
+def ultimate_load_factor(wing_loading, mtow_kg, params: Dict[str, Any]):
+    """
+    Ultimate load factor for the structural mass model.
+
+    safety_factor × n_critical when mission.structural.envelope.use_in_sizing
+    is set (params['gust_sizing']), else params['n_ultimate'].
+
+    Parameters
+    ----------
+    wing_loading : float or np.ndarray
+        W/S in N/m²
+    mtow_kg : float or np.ndarray
+        Take-off mass in kg
+    params : dict
+        Model inputs holding the envelope_parameters() entries plus
+        'n_ultimate' and 'gust_sizing' (see mass_closure.closure_parameters)
+
+    Returns
+    -------
+    float or np.ndarray
+        Ultimate load factor
+    """
+    if not params.get('gust_sizing', False):
+        return params['n_ultimate']
+    n_critical = critical_load_factor(wing_loading, mtow_kg, params)['n_critical']
+    return params['safety_factor'] * n_critical
+
+
+def gust_wing_loading_limit(mtow_kg=None, params: Dict[str, Any] = None, iterations: int = 20):
+    """
+    Minimum wing loading at which the design gusts stay within n_limit.
+
+    Solves Δn(W/S) = n_limit - 1 at V_C and V_D. With the chord following
+    the wing area (c = sqrt(m g / (AR · W/S))) the relation
+        W/S = ρ c a g / 2 × (0.88 V U / (c g (n_limit - 1)) - 5.3)
+    is iterated on c; the limit is zero where even a vanishing W/S passes.
+
+    Parameters
+    ----------
+    mtow_kg : float or np.ndarray, optional
+        Take-off mass in kg (default: mission.mass.mtow_kg)
+    params : dict, optional
+        Inputs from envelope_parameters()
+    iterations : int
+        Fixed-point iterations on the chord
+
+    Returns
+    -------
+    np.ndarray
+        Minimum W/S in N/m² (vertical line on the matching chart)
+    """
+    if params is None:
+        params = envelope_parameters()
+    if mtow_kg is None:
+        mtow_kg = get_mtow()
+
+    dn_allowed = params['n_limit'] - 1.0
+    g = params['g']
+    corners = ((params['v_cruise'], params['gust_cruise']), (params['v_dive'], params['gust_dive']))
+    limits = []
+    for velocity, gust in corners:
+        # Initial chord from the 1 g wing loading that balances the gust alone
+        ws = np.broadcast_to(
+            np.asarray(0.5 * params['rho'] * velocity * gust * params['cl_alpha'] / dn_allowed, dtype=float),
+            np.broadcast(mtow_kg, params['rho']).shape,
+        ).copy()
+        for _ in range(iterations):
+            chord = mean_chord(np.maximum(ws, 1.0e-9), mtow_kg, params)
+            mu = 0.88 * velocity * gust / (chord * g * dn_allowed) - 5.3
+            ws = np.maximum(0.5 * params['rho'] * chord * params['cl_alpha'] * g * mu, 0.0)
+        limits.append(ws)
+    return np.maximum(*limits)
+
+
+# =============================================================================
+# V-n DIAGRAM
+# =============================================================================
+
+def vn_diagram(
+    wing_loading=None,
+    mtow_kg=None,
+    altitude_km=None,
+    n_speeds: int = 60,
+    params: Dict[str, Any] = None,
+) -> Dict[str, Any]:
+    """
+    Maneuver and gust V-n diagrams for a batch of designs.
+
+    wing_loading, mtow_kg and altitude_km broadcast together to the batch
+    shape B; every curve has shape B + (n_speeds,) on a speed grid from 0
+    to V_D.
+
+    Parameters
+    ----------
+    wing_loading : float or np.ndarray, optional
+        W/S in N/m² (default: matching-chart design point)
+    mtow_kg : float or np.ndarray, optional
+        Take-off mass in kg (default: mission.mass.mtow_kg)
+    altitude_km : float or np.ndarray, optional
+        Altitude above the areoid in km (default: operating density)
+    n_speeds : int
+        Number of speed samples
+    params : dict, optional
+        Inputs from envelope_parameters()
+
+    Returns
+    -------
+    dict
+        Speeds (V_S, V_A, V_C, V_D), the speed grid, maneuver and gust
+        curves, the combined envelope and the critical load factors
+    """
+    params = dict(envelope_parameters() if params is None else params)
+    if wing_loading is None:
+        from .matching_chart import find_design_point
+        wing_loading = find_design_point()['wing_loading']
+    if mtow_kg is None:
+        mtow_kg = get_mtow()
+    if altitude_km is not None:
+        params['rho'] = density_at_altitude(altitude_km)
+
+    shape = np.broadcast(wing_loading, mtow_kg, params['rho']).shape
+    ws = np.broadcast_to(np.asarray(wing_loading, dtype=float), shape)
+    mass = np.broadcast_to(np.asarray(mtow_kg, dtype=float), shape)
+    rho = np.broadcast_to(np.asarray(params['rho'], dtype=float), shape)
+    params['rho'] = rho[..., None]
+
+    v_stall = np.sqrt(2.0 * ws / (rho * params['cl_max']))
+    v_maneuver = v_stall * math.sqrt(params['n_limit'])
+    v_dive = params['v_dive']
+    speeds = np.linspace(0.0, v_dive, n_speeds)
+
+    # Maneuver envelope (stall lines capped at the limit load factors)
+    q = 0.5 * params['rho'] * speeds ** 2
+    n_pos = np.minimum(q * params['cl_max'] / ws[..., None], params['n_limit'])
+    n_neg = np.maximum(q * params['cl_min'] / ws[..., None], params['n_negative'])
+    # CS-23.333: the negative limit closes linearly to zero at V_D
+    v_c = params['v_cruise']
+    closing = np.clip((v_dive - speeds) / (v_dive - v_c), 0.0, 1.0)
+    n_neg = np.where(speeds > v_c, np.maximum(n_neg, params['n_negative'] * closing), n_neg)
+
+    # Gust lines: design gust up to V_C, reduced linearly to the V_D gust
+    gust = np.interp(speeds, [0.0, v_c, v_dive],
+                     [params['gust_cruise'], params['gust_cruise'], params['gust_dive']])
+    chord = mean_chord(ws, mass, params)[..., None]
+    dn = gust_load_factor(ws[..., None], speeds, gust, chord, params)
+    n_gust_pos = 1.0 + dn
+    n_gust_neg = 1.0 - dn
+
+    envelope_pos = np.maximum(n_pos, n_gust_pos)
+    envelope_neg = np.minimum(n_neg, n_gust_neg)
+
+    params['rho'] = rho
+    critical = critical_load_factor(ws, mass, params)
+
+    return {
+        'wing_loading': ws,
+        'mtow_kg': mass,
+        'rho_kg_m3': rho,
+        'v_stall_m_s': v_stall,
+        'v_maneuver_m_s': v_maneuver,
+        'v_cruise_m_s': v_c,
+        'v_dive_m_s': v_dive,
+        'speeds_m_s': speeds,
+        'gust_m_s': gust,
+        'maneuver_positive': n_pos,
+        'maneuver_negative': n_neg,
+        'gust_positive': n_gust_pos,
+        'gust_negative': n_gust_neg,
+        'envelope_positive': envelope_pos,
+        'envelope_negative': envelope_neg,
+        'n_max': envelope_pos.max(axis=-1),
+        'n_min': envelope_neg.min(axis=-1),
+        'n_critical': critical['n_critical'],
+        'n_gust': critical['n_gust'],
+        'gust_critical': critical['gust_critical'],
+        'n_ultimate': params['safety_factor'] * critical['n_critical'],
+    }
+
+
+# =============================================================================
+# COMPLETE ANALYSIS
+# =============================================================================
+
+@traced('flight_envelope')
+def flight_envelope_analysis() -> Dict[str, Any]:
+    """
+    V-n diagram at the design point plus the gust wing-loading limit.
+
+    Returns
+    -------
+    dict
+        'design' (vn_diagram at the design point), 'gust_ws_limit',
+        the lift slope and the gust inputs
+    """
+    params = envelope_parameters()
+    design = vn_diagram(params=params)
+    return {
+        'design': design,
+        'params': params,
+        'gust_ws_limit': float(gust_wing_loading_limit(design['mtow_kg'], params)),
+        'n_ultimate_config': get_param('mission.structural.n_ultimate'),
+        'use_in_sizing': get_param('mission.structural.envelope.use_in_sizing', False),
+        'mass_estimation': get_param('mission.mass_estimation.use_in_sizing', False),
+    }
+
+
+def print_analysis(results: Dict[str, Any] = None) -> None:
+    """Print the flight envelope summary."""
+    if results is None:
+        results = flight_envelope_analysis()
+
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    d = results['design']
+    p = results['params']
+
+    print("=" * 80)
+    print("FLIGHT ENVELOPE (V-n DIAGRAM)")
+    print("=" * 80)
+    print(f"Computed: {timestamp}")
+    print("Config:   All values loaded from config/ YAML files")
+    print()
+
+    print("INPUTS")
+    print("-" * 50)
+    print(f"  Wing loading:       {float(d['wing_loading']):.2f} N/m²")
+    print(f"  MTOW:               {float(d['mtow_kg']):.2f} kg")
+    print(f"  Air density:        {float(d['rho_kg_m3']):.5f} kg/m³")
+    print(f"  Wing lift slope:    {p['cl_alpha']:.3f} /rad")
+    print(f"  Design gust (V_C):  {p['gust_cruise']:.1f} m/s")
+    print(f"  Design gust (V_D):  {p['gust_dive']:.1f} m/s")
+    print()
+
+    print("CHARACTERISTIC SPEEDS")
+    print("-" * 50)
+    print(f"  V_S (1 g stall):    {float(d['v_stall_m_s']):.1f} m/s")
+    print(f"  V_A (maneuver):     {float(d['v_maneuver_m_s']):.1f} m/s")
+    print(f"  V_C (cruise):       {d['v_cruise_m_s']:.1f} m/s")
+    print(f"  V_D (dive):         {d['v_dive_m_s']:.1f} m/s")
+    print()
+
+    print("LOAD FACTORS")
+    print("-" * 50)
+    print(f"  Maneuver limit:     +{p['n_limit']:.2f} / {p['n_negative']:.2f}")
+    print(f"  Gust (worst):       +{float(d['n_gust']):.2f} / {float(d['n_min']):.2f}")
+    governing = 'GUST' if bool(d['gust_critical']) else 'MANEUVER'
+    print(f"  Critical limit n:   {float(d['n_critical']):.2f} ({governing})")
+    print(f"  Ultimate n:         {float(d['n_ultimate']):.2f} "
+          f"(config n_ultimate = {results['n_ultimate_config']:.2f})")
+    if not results['use_in_sizing']:
+        status = 'no (config n_ultimate)'
+    elif not results['mass_estimation']:
+        status = 'no (needs mission.mass_estimation.use_in_sizing)'
+    else:
+        status = 'yes'
+    print(f"  Used in sizing:     {status}")
+    print()
+
+    print("MATCHING CHART")
+    print("-" * 50)
+    print(f"  Gust W/S limit:     {results['gust_ws_limit']:.2f} N/m² "
+          f"(minimum W/S for gust n <= {p['n_limit']:.2f})")
+    print("=" * 80)
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+if __name__ == "__main__":
+    print_analysis()
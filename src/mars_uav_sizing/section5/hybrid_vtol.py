@@ -38,15 +38,18 @@ from ..config import (
     get_density,
     get_mtow,
     get_propulsion_efficiencies,
+    get_disk_loading,
     get_battery_params,
     get_mission_params,
     get_aerodynamic_params,
     get_param,
 )
+from ..instrumentation import traced
 
 # Import from sibling modules
 from .rotorcraft import electric_hover_power, induced_velocity_from_disk_loading
 from .fixed_wing import maximum_ld, cruise_power, stall_wing_loading_limit
+from .transition import transition_performance
 
 
 # =============================================================================
@@ -158,6 +161,7 @@ def quadplane_cruise_energy() -> float:
 #   [@mathurMultiModeFlightSimulation2025] - Multi-mode flight simulation
 #   [@zhaoDevelopmentMultimodeFlight2023] - Transition corridor theory
 
+@traced()
 def transition_energy_estimate() -> Dict[str, float]:
     """
     Estimate energy consumed during transition phases.
@@ -173,7 +177,10 @@ def transition_energy_estimate() -> Dict[str, float]:
     Note: During transition, hybrid mode can consume MORE power than pure hover
     at certain airspeeds due to the additional forward thrust requirement while
     lift rotors are still active (Mathur & Atkins 2025). This peak power effect
-    is not captured by this energy-only model.
+    is not captured by this energy-only model. With
+    mission.transition.simulation.use_in_sizing the energy comes instead from
+    the point-mass simulation of section5.transition, which also reports peak
+    power and duration.
 
     Returns
     -------
@@ -192,12 +199,24 @@ def transition_energy_estimate() -> Dict[str, float]:
     # Convert J to Wh
     J_PER_WH = 3600.0
 
-    # Scale transition energy by mass ratio (conservative linear scaling)
-    mass_ratio = actual_mtow_kg / ref_mtow_kg
-    scaled_energy_j = reference_energy_j * mass_ratio * mars_scaling
+    simulated = {}
+    if get_param('mission.transition.simulation.use_in_sizing', False):
+        # Point-mass simulation at the design MTOW and stall-limited W/S
+        perf = transition_performance(actual_mtow_kg)
+        total_transition_j = perf['total_energy_j']
+        scaled_energy_j = total_transition_j / n_transitions
+        simulated = {
+            'peak_power_w': perf['peak_power_w'],
+            'duration_s': perf['duration_s'],
+        }
+    else:
+        # Scale transition energy by mass ratio (conservative linear scaling)
+        mass_ratio = actual_mtow_kg / ref_mtow_kg
+        scaled_energy_j = reference_energy_j * mass_ratio * mars_scaling
+
+        # Total transition energy
+        total_transition_j = scaled_energy_j * n_transitions
 
-    # Total transition energy
-    total_transition_j = scaled_energy_j * n_transitions
     total_transition_wh = total_transition_j / J_PER_WH
 
     # Per-transition values
@@ -206,12 +225,14 @@ def transition_energy_estimate() -> Dict[str, float]:
 
     return {
         'n_transitions': n_transitions,
+        'method': 'simulation' if simulated else 'linear_scaling',
         'reference_energy_j': reference_energy_j,
         'mars_scaling_factor': mars_scaling,
         'per_transition_j': per_transition_j,
         'per_transition_wh': per_transition_wh,
         'total_transition_j': total_transition_j,
         'total_transition_wh': total_transition_wh,
+        **simulated,
     }
 
 
@@ -260,6 +281,7 @@ def transition_energy_impact(hover_energy_wh: float, mission_energy_wh: float) -
 # ENERGY BUDGET (§5.3.3)
 # =============================================================================
 
+@traced()
 def energy_budget() -> Dict[str, float]:
     """
     Calculate complete energy budget including transition phases.
@@ -292,6 +314,7 @@ def energy_budget() -> Dict[str, float]:
     }
 
 
+@traced()
 def available_energy() -> float:
     """
     Calculate available energy from battery.
@@ -350,6 +373,7 @@ def energy_margin() -> Dict[str, float]:
 # FEASIBILITY ANALYSIS (§5.3.4)
 # =============================================================================
 
+@traced('hybrid_vtol')
 def hybrid_vtol_feasibility_analysis() -> Dict[str, Any]:
     """
     Complete hybrid VTOL (QuadPlane) feasibility analysis.
@@ -375,7 +399,7 @@ def hybrid_vtol_feasibility_analysis() -> Dict[str, Any]:
     mission = get_mission_params()
     aero = get_aerodynamic_params()
     endurance_req = get_param('mission.requirements.endurance_min')
-    disk_loading = get_param('geometry.rotor.disk_loading_N_m2')
+    disk_loading = get_disk_loading(mtow_kg)
     ld_penalty = get_param('aerodynamic.quadplane.ld_penalty_factor')
     
     # Derived values
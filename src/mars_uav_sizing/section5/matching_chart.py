@@ -13,6 +13,8 @@ Equations implemented:
     @eq:hover-constraint-qp  - Hover constraint (horizontal line)
     @eq:stall-constraint     - Stall constraint (vertical line)
     @eq:cruise-constraint    - Cruise constraint (curve)
+    Gust constraint          - Minimum W/S for the design gust within
+                               n_limit (flight_envelope.py, vertical line)
     
 Reference:
     - Manuscript: sections_en/05_04_matching-chart-methodology-sec-comparative-results.md
@@ -32,13 +34,16 @@ from ..config import (
     get_density,
     get_mtow,
     get_propulsion_efficiencies,
+    get_disk_loading,
     get_aerodynamic_params,
     get_mission_params,
     get_param,
 )
+from ..instrumentation import traced
 
 # Import from sibling modules
 from .rotorcraft import hover_power_loading, induced_velocity_from_disk_loading
+from .flight_envelope import critical_load_factor, gust_wing_loading_limit
 from .fixed_wing import (
     cruise_lift_coefficient, 
     lift_to_drag, 
@@ -92,6 +97,27 @@ def stall_constraint() -> float:
     return stall_wing_loading_limit(rho, v_min, cl_max)
 
 
+def gust_constraint(mtow_kg: float = None) -> float:
+    """
+    Calculate minimum W/S from the gust load (vertical line on chart).
+
+    Pegg/Pratt gust load factor at V_C and V_D kept within n_limit
+    (see flight_envelope.gust_wing_loading_limit). A design below this
+    line needs a structure sized to the gust load factor.
+
+    Parameters
+    ----------
+    mtow_kg : float, optional
+        Take-off mass in kg (default: mission.mass.mtow_kg)
+
+    Returns
+    -------
+    float
+        Minimum wing loading in N/m²
+    """
+    return float(gust_wing_loading_limit(mtow_kg))
+
+
 def cruise_constraint(wing_loading: float) -> float:
     """
     Calculate P/W required for cruise at given W/S.
@@ -146,6 +172,7 @@ def cruise_constraint_curve(ws_range: np.ndarray) -> np.ndarray:
 # DESIGN POINT DETERMINATION
 # =============================================================================
 
+@traced()
 def find_design_point() -> Dict[str, float]:
     """
     Find the design point from constraint intersections.
@@ -177,13 +204,21 @@ def find_design_point() -> Dict[str, float]:
         active_constraint = 'hover'
     else:
         active_constraint = 'cruise'
-    
+
+    # Gust line: the structure carries the critical (maneuver or gust)
+    # load factor at the design W/S
+    ws_gust = gust_constraint()
+    n_critical = float(critical_load_factor(ws_design)['n_critical'])
+
     return {
         'wing_loading': ws_design,
         'power_loading': pw_design,
         'hover_pw': pw_hover,
         'cruise_pw_at_stall': pw_cruise_at_stall,
         'stall_ws': ws_stall,
+        'gust_ws': ws_gust,
+        'gust_feasible': ws_design >= ws_gust,
+        'n_critical': n_critical,
         'active_constraint': active_constraint,
     }
 
@@ -222,7 +257,7 @@ def derive_geometry(design_point: Dict[str, float] = None) -> Dict[str, float]:
     installed_power = pw * weight_n
     
     # Disk area (from disk loading)
-    disk_loading = get_param('geometry.rotor.disk_loading_N_m2')
+    disk_loading = get_disk_loading(mtow_kg)
     disk_area = weight_n / disk_loading
     
     return {
@@ -238,6 +273,7 @@ def derive_geometry(design_point: Dict[str, float] = None) -> Dict[str, float]:
 # COMPLETE ANALYSIS
 # =============================================================================
 
+@traced('matching_chart')
 def matching_chart_analysis() -> Dict[str, Any]:
     """
     Complete matching chart analysis.
@@ -256,7 +292,7 @@ def matching_chart_analysis() -> Dict[str, Any]:
     prop = get_propulsion_efficiencies()
     aero = get_aerodynamic_params()
     mission = get_mission_params()
-    disk_loading = get_param('geometry.rotor.disk_loading_N_m2')
+    disk_loading = get_disk_loading(mtow_kg)
     
     weight_n = mtow_kg * g_mars
     
@@ -266,6 +302,7 @@ def matching_chart_analysis() -> Dict[str, Any]:
     
     # Design point
     design_point = find_design_point()
+    ws_gust = design_point['gust_ws']
     
     # Geometry
     geometry = derive_geometry(design_point)
@@ -308,6 +345,7 @@ def matching_chart_analysis() -> Dict[str, Any]:
         # Constraint values
         'hover_pw': pw_hover,
         'stall_ws': ws_stall,
+        'gust_ws': ws_gust,
         'induced_velocity_m_s': v_i,
         
         # Design point
@@ -329,6 +367,9 @@ def print_analysis(results: Dict[str, Any] = None) -> None:
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     dp = results['design_point']
     geom = results['geometry']
+    # Gust line only when the V-n envelope sizes the structure (§5.4 table
+    # otherwise unchanged)
+    gust_lines = get_param('mission.structural.envelope.use_in_sizing', False)
     
     print("=" * 80)
     print("MATCHING CHART ANALYSIS (Section 5.4)")
@@ -350,6 +391,8 @@ def print_analysis(results: Dict[str, Any] = None) -> None:
     print("-" * 50)
     print(f"  Hover P/W:          {results['hover_pw']:.2f} W/N (horizontal line)")
     print(f"  Stall W/S limit:    {results['stall_ws']:.2f} N/m² (vertical line)")
+    if gust_lines:
+        print(f"  Gust W/S minimum:   {results['gust_ws']:.2f} N/m² (vertical line, n <= n_limit)")
     print()
     
     print("DESIGN POINT (intersection of constraints)")
@@ -357,6 +400,9 @@ def print_analysis(results: Dict[str, Any] = None) -> None:
     print(f"  Wing loading:       {dp['wing_loading']:.2f} N/m²")
     print(f"  Power loading:      {dp['power_loading']:.2f} W/N")
     print(f"  Active constraint:  {dp['active_constraint'].upper()}")
+    if gust_lines:
+        gust_note = '' if dp['gust_feasible'] else ' (GUST above n_limit)'
+        print(f"  Critical limit n:   {dp['n_critical']:.2f}{gust_note}")
     print()
     
     print("DERIVED GEOMETRY")
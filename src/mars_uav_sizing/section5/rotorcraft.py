@@ -21,21 +21,24 @@ Reference:
 Last Updated: 2025-12-29
 """
 
-import math
 from typing import Dict, Any
 from datetime import datetime
 
+from ..core.dual import sqrt
+
 # Import configuration loader
 from ..config import (
     get_mars_gravity,
     get_density,
     get_mtow,
     get_propulsion_efficiencies,
+    get_disk_loading,
     get_battery_params,
     get_mission_params,
     get_aerodynamic_params,
     get_param,
 )
+from ..instrumentation import traced
 
 
 # =============================================================================
@@ -65,7 +68,7 @@ def induced_velocity(thrust_n: float, rho: float, disk_area_m2: float) -> float:
     float
         Induced velocity in m/s
     """
-    return math.sqrt(thrust_n / (2 * rho * disk_area_m2))
+    return sqrt(thrust_n / (2 * rho * disk_area_m2))
 
 
 def induced_velocity_from_disk_loading(disk_loading: float, rho: float) -> float:
@@ -87,7 +90,7 @@ def induced_velocity_from_disk_loading(disk_loading: float, rho: float) -> float
     float
         Induced velocity in m/s
     """
-    return math.sqrt(disk_loading / (2 * rho))
+    return sqrt(disk_loading / (2 * rho))
 
 
 def ideal_hover_power(weight_n: float, rho: float, disk_area_m2: float) -> float:
@@ -113,7 +116,7 @@ def ideal_hover_power(weight_n: float, rho: float, disk_area_m2: float) -> float
     float
         Ideal hover power in Watts
     """
-    return (weight_n ** 1.5) / math.sqrt(2 * rho * disk_area_m2)
+    return (weight_n ** 1.5) / sqrt(2 * rho * disk_area_m2)
 
 
 def actual_hover_power(
@@ -189,10 +192,10 @@ def electric_hover_power(
     """
     # Load defaults from config
     g_mars = get_mars_gravity()
-    prop = get_propulsion_efficiencies()
     
     if weight_n is None:
         weight_n = get_mtow() * g_mars
+    prop = get_propulsion_efficiencies(weight_n / g_mars)
     if rho is None:
         rho = get_density()
     if figure_of_merit is None:
@@ -202,7 +205,7 @@ def electric_hover_power(
     if eta_esc is None:
         eta_esc = prop['eta_esc']
     if disk_area_m2 is None:
-        disk_loading = get_param('geometry.rotor.disk_loading_N_m2')
+        disk_loading = get_disk_loading(weight_n / g_mars)
         disk_area_m2 = weight_n / disk_loading
     
     p_hover = actual_hover_power(weight_n, rho, disk_area_m2, figure_of_merit)
@@ -214,7 +217,8 @@ def hover_power_loading(
     rho: float = None,
     figure_of_merit: float = None,
     eta_motor: float = None,
-    eta_esc: float = None
+    eta_esc: float = None,
+    mtow_kg: float = None
 ) -> float:
     """
     Calculate P/W ratio for hover constraint on matching chart.
@@ -237,24 +241,27 @@ def hover_power_loading(
         Motor efficiency (default: from config)
     eta_esc : float, optional
         ESC efficiency (default: from config)
+    mtow_kg : float, optional
+        MTOW for the BEMT design point when propulsion.bemt.use_in_sizing
+        is true (default: baseline MTOW)
     
     Returns
     -------
     float
         Power loading P/W in W/N
     """
-    prop = get_propulsion_efficiencies()
-    
     if disk_loading is None:
-        disk_loading = get_param('geometry.rotor.disk_loading_N_m2')
+        disk_loading = get_disk_loading(mtow_kg)
     if rho is None:
         rho = get_density()
-    if figure_of_merit is None:
-        figure_of_merit = prop['figure_of_merit']
-    if eta_motor is None:
-        eta_motor = prop['eta_motor']
-    if eta_esc is None:
-        eta_esc = prop['eta_esc']
+    if None in (figure_of_merit, eta_motor, eta_esc):
+        prop = get_propulsion_efficiencies(mtow_kg)
+        if figure_of_merit is None:
+            figure_of_merit = prop['figure_of_merit']
+        if eta_motor is None:
+            eta_motor = prop['eta_motor']
+        if eta_esc is None:
+            eta_esc = prop['eta_esc']
     
     eta_hover = figure_of_merit * eta_motor * eta_esc
     v_i = induced_velocity_from_disk_loading(disk_loading, rho)
@@ -394,6 +401,7 @@ def rotorcraft_endurance_seconds() -> float:
 # FEASIBILITY ANALYSIS (§5.1.4)
 # =============================================================================
 
+@traced('rotorcraft')
 def rotorcraft_feasibility_analysis() -> Dict[str, Any]:
     """
     Complete rotorcraft feasibility analysis.
@@ -422,7 +430,7 @@ def rotorcraft_feasibility_analysis() -> Dict[str, Any]:
     batt = get_battery_params()
     mission = get_mission_params()
     aero = get_aerodynamic_params()
-    disk_loading = get_param('geometry.rotor.disk_loading_N_m2')
+    disk_loading = get_disk_loading(mtow_kg)
     endurance_req = get_param('mission.requirements.endurance_min')
     
     # Derived values
@@ -0,0 +1,640 @@
+"""
+Transition Phase Simulation
+===========================
+
+Point-mass longitudinal simulation of the QuadPlane transitions (§5.3.2b),
+replacing the linear mass scaling of the ICAS 2022 reference energy in
+hybrid_vtol.transition_energy_estimate when enabled in mission_parameters.yaml
+(mission.transition.simulation.use_in_sizing).
+
+Forward (Q2P): level flight from hover. The pusher accelerates the aircraft at
+the commanded rate while the wing, limited to a maximum incidence, takes the
+weight over from the lift rotors. Pusher thrust is saturated so that the
+electrical power stays within peak_power_ratio × hover power; the transition
+ends at end_speed_factor × V_stall with the lift rotors unloaded.
+
+Back (P2Q): commanded deceleration from the same speed down to hover.
+Braking beyond the airframe drag comes from tilting the lift-rotor thrust.
+
+Every candidate schedule (acceleration or deceleration × maximum incidence)
+is integrated at once for every design point (fixed-step Heun). Energy, peak
+power and duration of the minimum-energy schedule are tabulated over
+MTOW × W/S, cached on disk keyed by a hash of every input, and interpolated
+bilinearly at the design point.
+
+Equations:
+    m dV/dt = T_p - D - F_b
+    L = min(W, ½ρV²S C_L(α_max)),  D = ½ρV²S (CD0 + C_L² / (π e AR))
+    C_L(α) = c_l(α) × eAR / (eAR + 2)     (wing airfoil polar, lifting line)
+    T_l = sqrt((W - L)² + F_b²)
+    Lift rotors (Glauert):  v⁴ + V²v² = v_h⁴,  v_h² = T_l / (2ρA),  P = T_l v / FM
+    Pusher (momentum):      P = T_p (V + v_p) / κ,  κ matches η_prop at cruise
+    P_elec = (P_lift + P_pusher) / (η_motor × η_ESC)
+
+Reference:
+    - Goetzendorf-Grabowski (ICAS 2022), Transition energy optimization
+    - Mathur & Atkins (MDPI 2025), Multi-mode flight simulation
+    - Leishman (2006), Principles of Helicopter Aerodynamics, Chapter 2
+
+Last Updated: 2026-10-19
+"""
+
+import hashlib
+import json
+import math
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from ..config import (
+    get_aerodynamic_params,
+    get_density,
+    get_disk_loading,
+    get_mars_gravity,
+    get_mission_params,
+    get_mtow,
+    get_param,
+    get_propulsion_efficiencies,
+)
+from ..instrumentation import traced
+
+
+# On-disk table cache (one .npz per input hash)
+CACHE_DIR = Path(__file__).resolve().parent.parent / 'cache' / 'transition'
+
+# Bump when the simulation changes so stale tables are not reused
+_SIMULATION_VERSION = 1
+
+DIRECTIONS: Tuple[str, ...] = ('forward', 'back')
+
+INCH_TO_M = 0.0254
+
+# In-process table cache, keyed by input hash; input hash per config state
+_tables: Dict[str, Dict[str, np.ndarray]] = {}
+_table_keys: Dict[str, str] = {}
+
+
+# =============================================================================
+# SIMULATION INPUTS
+# =============================================================================
+
+def simulation_settings() -> Dict[str, Any]:
+    """
+    Collect the schedule candidates and integration settings from config.
+
+    Returns
+    -------
+    dict
+        Contents of mission.transition.simulation
+    """
+    return dict(get_param('mission.transition.simulation'))
+
+
+def _wing_polar() -> Dict[str, list]:
+    """Section lift curve of the wing airfoil (aerodynamic.airfoil.name)."""
+    from ..section6.bemt import load_section_polar
+    polar = load_section_polar(get_param('aerodynamic.airfoil.name').lower())
+    return {'alpha_deg': polar['alpha_deg'].tolist(), 'cl': polar['cl'].tolist()}
+
+
+def _pusher_disk_area() -> float:
+    """Cruise propeller disk area (coaxial pairs share one disk)."""
+    cruise = get_param('geometry.propulsion_config.cruise')
+    n_disks = cruise['n_rotors']
+    if 'coaxial' in cruise['configuration']:
+        n_disks = max(n_disks // 2, 1)
+    diameter_m = get_param('propulsion.components.cruise.propeller.diameter_in') * INCH_TO_M
+    return n_disks * math.pi * diameter_m ** 2 / 4.0
+
+
+def _point_inputs(mtow_kg: np.ndarray, wing_loading: np.ndarray) -> Dict[str, list]:
+    """Per design point inputs that vary with MTOW and W/S."""
+    mtow_kg, wing_loading = np.broadcast_arrays(np.asarray(mtow_kg, dtype=float),
+                                                np.asarray(wing_loading, dtype=float))
+    columns: Dict[str, list] = {'cd0': [], 'disk_loading': [], 'figure_of_merit': [],
+                                'eta_elec': [], 'eta_prop': []}
+    for m, ws in zip(mtow_kg.ravel(), wing_loading.ravel()):
+        prop = get_propulsion_efficiencies(float(m))
+        columns['cd0'].append(float(get_aerodynamic_params(float(m), float(ws))['cd0']))
+        columns['disk_loading'].append(float(get_disk_loading(float(m))))
+        columns['figure_of_merit'].append(float(prop['figure_of_merit']))
+        columns['eta_elec'].append(float(prop['eta_motor'] * prop['eta_esc']))
+        columns['eta_prop'].append(float(prop['eta_prop']))
+    return {
+        'mtow_kg': mtow_kg.ravel().tolist(),
+        'wing_loading': wing_loading.ravel().tolist(),
+        **columns,
+    }
+
+
+def _common_inputs() -> Dict[str, Any]:
+    """Inputs shared by every design point (also part of the cache key)."""
+    aero = get_aerodynamic_params()
+    settings = simulation_settings()
+    return {
+        'version': _SIMULATION_VERSION,
+        'rho': float(get_density()),
+        'g': float(get_mars_gravity()),
+        'v_cruise': float(get_mission_params()['v_cruise']),
+        'aspect_ratio': float(aero['aspect_ratio']),
+        'oswald_e': float(aero['oswald_e']),
+        'cl_max': float(aero['cl_max']),
+        'pusher_disk_area_m2': float(_pusher_disk_area()),
+        'polar': _wing_polar(),
+        'accelerations_m_s2': [float(a) for a in settings['accelerations_m_s2']],
+        'decelerations_m_s2': [float(d) for d in settings['decelerations_m_s2']],
+        'max_alpha_deg': [float(a) for a in settings['max_alpha_deg']],
+        'end_speed_factor': float(settings['end_speed_factor']),
+        'hover_speed_m_s': float(settings['hover_speed_m_s']),
+        'peak_power_ratio': float(settings['peak_power_ratio']),
+        'dt_s': float(settings['dt_s']),
+        't_max_s': float(settings['t_max_s']),
+    }
+
+
+# =============================================================================
+# POINT-MASS MODEL
+# =============================================================================
+
+def wing_lift_coefficient(
+    alpha_deg: np.ndarray,
+    polar: Dict[str, Any],
+    aspect_ratio: float,
+    oswald_e: float,
+    cl_max: float,
+) -> np.ndarray:
+    """
+    Wing lift coefficient from the section polar.
+
+    C_L = c_l(α) × eAR / (eAR + 2), the lifting-line slope reduction with a
+    section slope of 2π, limited to the wing C_L,max.
+
+    Parameters
+    ----------
+    alpha_deg : array
+        Wing incidence in degrees
+    polar : dict
+        Section 'alpha_deg' and 'cl' (sorted by alpha)
+    aspect_ratio, oswald_e, cl_max : float
+        Wing aspect ratio, Oswald efficiency and maximum lift coefficient
+
+    Returns
+    -------
+    array
+        Wing lift coefficient
+    """
+    cl_section = np.interp(alpha_deg, polar['alpha_deg'], polar['cl'])
+    k = oswald_e * aspect_ratio / (oswald_e * aspect_ratio + 2.0)
+    return np.minimum(k * cl_section, cl_max)
+
+
+def rotor_induced_velocity(thrust_n: np.ndarray, v_edge: np.ndarray, rho: float,
+                           disk_area_m2: np.ndarray) -> np.ndarray:
+    """
+    Induced velocity of an edgewise rotor (Glauert), v⁴ + V²v² = v_h⁴.
+
+    Written as v² = 2 v_h⁴ / (V² + sqrt(V⁴ + 4 v_h⁴)) to avoid cancellation
+    at high advance ratio.
+    """
+    vh2 = np.maximum(thrust_n, 0.0) / (2.0 * rho * disk_area_m2)
+    v2 = v_edge ** 2
+    with np.errstate(invalid='ignore', divide='ignore'):
+        vi2 = np.where(vh2 > 0, 2.0 * vh2 ** 2 / (v2 + np.sqrt(v2 ** 2 + 4.0 * vh2 ** 2)), 0.0)
+    return np.sqrt(vi2)
+
+
+def pusher_velocity_ratio(thrust_n: np.ndarray, v_axial: np.ndarray, rho: float,
+                          disk_area_m2: float) -> np.ndarray:
+    """Slipstream velocity at the disk, u = V + v_p, from axial momentum theory."""
+    return 0.5 * v_axial + np.sqrt(0.25 * v_axial ** 2
+                                   + np.maximum(thrust_n, 0.0) / (2.0 * rho * disk_area_m2))
+
+
+def _pusher_thrust_at_power(shaft_power_w: np.ndarray, v_axial: np.ndarray, rho: float,
+                            disk_area_m2: float, kappa: np.ndarray) -> np.ndarray:
+    """
+    Pusher thrust that absorbs a given shaft power.
+
+    With u = V + v_p: T = 2ρA u (u - V) and κP = T u, so u solves
+    u³ - V u² = κP / (2ρA). Newton from u = V + c^(1/3) (above the root,
+    where the cubic is convex) converges monotonically.
+    """
+    c = np.maximum(kappa * shaft_power_w, 0.0) / (2.0 * rho * disk_area_m2)
+    u = v_axial + np.cbrt(c)
+    for _ in range(12):
+        f = u ** 3 - v_axial * u ** 2 - c
+        df = 3.0 * u ** 2 - 2.0 * v_axial * u
+        u = np.where(df > 0, u - f / np.where(df > 0, df, 1.0), u)
+    return 2.0 * rho * disk_area_m2 * u * np.maximum(u - v_axial, 0.0)
+
+
+def simulate_transitions(inputs: Dict[str, Any], direction: str = 'forward') -> Dict[str, np.ndarray]:
+    """
+    Integrate every candidate schedule at every design point.
+
+    Parameters
+    ----------
+    inputs : dict
+        Common inputs (_common_inputs) merged with per-point lists
+        (_point_inputs) of length n_points
+    direction : str
+        'forward' (hover to wing-borne flight) or 'back'
+
+    Returns
+    -------
+    dict
+        'rate_m_s2' and 'max_alpha_deg' per schedule (n_sched,), and
+        'energy_j', 'peak_power_w', 'duration_s' shaped (n_points, n_sched).
+        Schedules that do not complete within t_max_s, or exceed the power
+        limit, have NaN energy.
+    """
+    if direction not in DIRECTIONS:
+        raise ValueError(f"Unknown direction: {direction!r} (use 'forward' or 'back')")
+
+    rates = inputs['accelerations_m_s2' if direction == 'forward' else 'decelerations_m_s2']
+    rate, alpha_max = (grid.ravel() for grid in np.meshgrid(rates, inputs['max_alpha_deg'],
+                                                           indexing='ij'))
+
+    rho, g = inputs['rho'], inputs['g']
+    ar, e = inputs['aspect_ratio'], inputs['oswald_e']
+    col = {key: np.asarray(inputs[key], dtype=float)[:, None]
+           for key in ('mtow_kg', 'wing_loading', 'cd0', 'disk_loading',
+                       'figure_of_merit', 'eta_elec', 'eta_prop')}
+    m = col['mtow_kg']
+    weight = m * g
+    wing_area = weight / col['wing_loading']
+    rotor_area = weight / col['disk_loading']
+    pusher_area = inputs['pusher_disk_area_m2']
+    fm, eta_elec = col['figure_of_merit'], col['eta_elec']
+
+    cl_alpha = wing_lift_coefficient(alpha_max, inputs['polar'], ar, e, inputs['cl_max'])[None, :]
+    v_stall = np.sqrt(2.0 * col['wing_loading'] / (rho * inputs['cl_max']))
+    v_end = inputs['end_speed_factor'] * v_stall
+
+    # Pusher profile efficiency: momentum theory × κ = η_prop at cruise (§5.2)
+    v_c = inputs['v_cruise']
+    cl_c = 2.0 * col['wing_loading'] / (rho * v_c ** 2)
+    drag_c = 0.5 * rho * v_c ** 2 * wing_area * (col['cd0'] + cl_c ** 2 / (math.pi * e * ar))
+    u_c = pusher_velocity_ratio(drag_c, v_c, rho, pusher_area)
+    kappa = np.minimum(col['eta_prop'] * u_c / v_c, 1.0)
+
+    hover_power = (weight * rotor_induced_velocity(weight, 0.0, rho, rotor_area)
+                   / fm / eta_elec)
+    power_limit = inputs['peak_power_ratio'] * hover_power
+
+    def loads(v):
+        q_s = 0.5 * rho * v ** 2 * wing_area
+        lift = np.minimum(weight, q_s * cl_alpha)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cl = np.where(q_s > 0, lift / q_s, 0.0)
+        drag = q_s * (col['cd0'] + cl ** 2 / (math.pi * e * ar))
+        return lift, drag
+
+    def rotor_power(thrust, v):
+        return thrust * rotor_induced_velocity(thrust, v, rho, rotor_area) / fm
+
+    def pusher_power(thrust, v):
+        return thrust * pusher_velocity_ratio(thrust, v, rho, pusher_area) / kappa
+
+    def derivatives(v):
+        lift, drag = loads(v)
+        if direction == 'forward':
+            p_lift = rotor_power(weight - lift, v)
+            shaft_available = np.maximum(power_limit * eta_elec - p_lift, 0.0)
+            thrust = np.minimum(drag + m * rate, _pusher_thrust_at_power(
+                shaft_available, v, rho, pusher_area, kappa))
+            dv_dt = (thrust - drag) / m
+        else:
+            braking = np.maximum(m * rate - drag, 0.0)
+            thrust = np.maximum(drag - m * rate, 0.0)
+            p_lift = rotor_power(np.sqrt((weight - lift) ** 2 + braking ** 2), v)
+            dv_dt = -np.broadcast_to(rate, p_lift.shape)
+        return dv_dt, (p_lift + pusher_power(thrust, v)) / eta_elec
+
+    def finished(v):
+        if direction == 'forward':
+            return (v >= v_end) & (0.5 * rho * v ** 2 * wing_area * cl_alpha >= weight)
+        return v <= inputs['hover_speed_m_s']
+
+    shape = (m.shape[0], rate.size)
+    v = np.zeros(shape) if direction == 'forward' else np.broadcast_to(v_end, shape).copy()
+    energy = np.zeros(shape)
+    peak = np.zeros(shape)
+    duration = np.full(shape, np.nan)
+    done = np.zeros(shape, dtype=bool)
+    dt = inputs['dt_s']
+
+    for step in range(int(math.ceil(inputs['t_max_s'] / dt))):
+        a0, p0 = derivatives(v)
+        a1, p1 = derivatives(np.maximum(v + dt * a0, 0.0))
+        active = ~done
+        v = np.where(active, np.maximum(v + 0.5 * dt * (a0 + a1), 0.0), v)
+        energy = np.where(active, energy + 0.5 * dt * (p0 + p1), energy)
+        peak = np.where(active, np.maximum(peak, np.maximum(p0, p1)), peak)
+        now_done = active & finished(v)
+        duration[now_done] = (step + 1) * dt
+        done |= now_done
+        if done.all():
+            break
+
+    valid = done & (peak <= power_limit * (1.0 + 1.0e-9))
+    return {
+        'rate_m_s2': rate,
+        'max_alpha_deg': alpha_max,
+        'energy_j': np.where(valid, energy, np.nan),
+        'peak_power_w': np.where(valid, peak, np.nan),
+        'duration_s': np.where(valid, duration, np.nan),
+        'hover_power_w': hover_power[:, 0],
+        'end_speed_m_s': v_end[:, 0],
+    }
+
+
+def _best_schedule(sim: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Minimum-energy schedule per design point (NaN where none completes)."""
+    energy = sim['energy_j']
+    feasible = np.isfinite(energy).any(axis=1)
+    best = np.argmin(np.where(np.isfinite(energy), energy, np.inf), axis=1)
+    rows = np.arange(energy.shape[0])
+
+    def pick(name):
+        return np.where(feasible, sim[name][rows, best], np.nan)
+
+    return {
+        'energy_j': pick('energy_j'),
+        'peak_power_w': pick('peak_power_w'),
+        'duration_s': pick('duration_s'),
+        'schedule': np.where(feasible, best, -1),
+    }
+
+
+# =============================================================================
+# TABLES
+# =============================================================================
+
+def _state_key() -> str:
+    """Cheap fingerprint of every config section the tables read."""
+    return repr((
+        get_param('mission.transition'),
+        get_param('mission.velocity'),
+        get_param('aerodynamic'),
+        get_param('propulsion'),
+        get_param('geometry'),
+        get_param('environment'),
+        get_mars_gravity(),
+    ))
+
+
+def _table_inputs() -> Dict[str, Any]:
+    """Collect every input of the transition tables (also the cache key)."""
+    settings = simulation_settings()
+    mtow_grid = np.linspace(*settings['mtow_range_kg'], int(settings['n_mtow']))
+    ws_grid = np.linspace(*settings['wing_loading_range_n_m2'], int(settings['n_wing_loading']))
+    mtow, ws = np.meshgrid(mtow_grid, ws_grid, indexing='ij')
+    return {
+        **_common_inputs(),
+        'mtow_grid_kg': mtow_grid.tolist(),
+        'wing_loading_grid_n_m2': ws_grid.tolist(),
+        **_point_inputs(mtow, ws),
+    }
+
+
+@traced()
+def _compute_table(inputs: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """Simulate both directions over the MTOW × W/S grid."""
+    shape = (len(inputs['mtow_grid_kg']), len(inputs['wing_loading_grid_n_m2']))
+    table = {
+        'mtow_kg': np.asarray(inputs['mtow_grid_kg']),
+        'wing_loading_n_m2': np.asarray(inputs['wing_loading_grid_n_m2']),
+    }
+    for direction in DIRECTIONS:
+        sim = simulate_transitions(inputs, direction)
+        best = _best_schedule(sim)
+        for name, values in best.items():
+            table[f'{direction}_{name}'] = values.reshape(shape)
+        table[f'{direction}_rate_m_s2'] = sim['rate_m_s2']
+        table[f'{direction}_max_alpha_deg'] = sim['max_alpha_deg']
+        table[f'{direction}_candidates_energy_j'] = sim['energy_j'].reshape(shape + (-1,))
+    return table
+
+
+def transition_table(use_cache: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Forward and back transition tables over MTOW × W/S.
+
+    Parameters
+    ----------
+    use_cache : bool
+        Reuse tables from memory or from CACHE_DIR when the inputs match
+
+    Returns
+    -------
+    dict
+        Grids 'mtow_kg' and 'wing_loading_n_m2', and per direction
+        '<dir>_energy_j', '<dir>_peak_power_w', '<dir>_duration_s' and
+        '<dir>_schedule' (index of the minimum-energy candidate) shaped
+        (n_mtow, n_ws), the candidate schedules and their energies
+    """
+    state = _state_key()
+    if use_cache and _table_keys.get(state) in _tables:
+        return _tables[_table_keys[state]]
+
+    inputs = _table_inputs()
+    key = hashlib.sha256(json.dumps(inputs, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+    path = CACHE_DIR / f"transition_{key}.npz"
+    _table_keys[state] = key
+
+    if use_cache and key in _tables:
+        return _tables[key]
+    if use_cache and path.exists():
+        with np.load(path, allow_pickle=False) as data:
+            _tables[key] = {name: data[name] for name in data.files}
+        return _tables[key]
+
+    table = _compute_table(inputs)
+    _tables[key] = table
+    if use_cache:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(path, **table)
+    return table
+
+
+def _bilinear(grid_x: np.ndarray, grid_y: np.ndarray, values: np.ndarray, x, y):
+    """
+    Bilinear interpolation, linear extrapolation outside the grid.
+
+    Only plain arithmetic touches x and y, so dual numbers pass through.
+    """
+    i = int(np.clip(np.searchsorted(grid_x, x) - 1, 0, len(grid_x) - 2))
+    j = int(np.clip(np.searchsorted(grid_y, y) - 1, 0, len(grid_y) - 2))
+    tx = (x - grid_x[i]) / (grid_x[i + 1] - grid_x[i])
+    ty = (y - grid_y[j]) / (grid_y[j + 1] - grid_y[j])
+    return ((1 - tx) * (1 - ty) * values[i, j] + tx * (1 - ty) * values[i + 1, j]
+            + (1 - tx) * ty * values[i, j + 1] + tx * ty * values[i + 1, j + 1])
+
+
+def _design_wing_loading() -> float:
+    from .fixed_wing import stall_wing_loading_limit
+    return stall_wing_loading_limit()
+
+
+def transition_performance(mtow_kg: float = None, wing_loading: float = None) -> Dict[str, Any]:
+    """
+    Transition energy, peak power and duration at a design point.
+
+    Interpolated in the cached tables. Of mission.time.n_transitions, the
+    first half (rounded up) are forward transitions and the rest back
+    transitions.
+
+    Parameters
+    ----------
+    mtow_kg : float, optional
+        MTOW in kg (default: from config)
+    wing_loading : float, optional
+        W/S in N/m² (default: stall limit, §5.2)
+
+    Returns
+    -------
+    dict
+        Per direction 'energy_j', 'peak_power_w', 'duration_s', and mission
+        totals 'total_energy_j', 'peak_power_w', 'duration_s'
+    """
+    if mtow_kg is None:
+        mtow_kg = get_mtow()
+    if wing_loading is None:
+        wing_loading = _design_wing_loading()
+
+    table = transition_table()
+    n_transitions = get_param('mission.time.n_transitions')
+    counts = {'forward': (n_transitions + 1) // 2, 'back': n_transitions // 2}
+
+    result: Dict[str, Any] = {'mtow_kg': mtow_kg, 'wing_loading': wing_loading,
+                              'n_transitions': n_transitions}
+    for direction in DIRECTIONS:
+        result[direction] = {
+            name: _bilinear(table['mtow_kg'], table['wing_loading_n_m2'],
+                            table[f'{direction}_{name}'], mtow_kg, wing_loading)
+            for name in ('energy_j', 'peak_power_w', 'duration_s')
+        }
+    result['total_energy_j'] = sum(counts[d] * result[d]['energy_j'] for d in DIRECTIONS)
+    result['duration_s'] = sum(counts[d] * result[d]['duration_s'] for d in DIRECTIONS)
+    result['peak_power_w'] = max(result[d]['peak_power_w'] for d in DIRECTIONS)
+    return result
+
+
+def transition_energy_wh(mtow_kg: float = None, wing_loading: float = None) -> float:
+    """Total transition energy of the mission in Wh (see transition_performance)."""
+    return transition_performance(mtow_kg, wing_loading)['total_energy_j'] / 3600.0
+
+
+# =============================================================================
+# MAIN ANALYSIS
+# =============================================================================
+
+@traced('transition_simulation')
+def transition_analysis() -> Dict[str, Any]:
+    """
+    Simulate the transitions at the design point and compare with the tables
+    and with the linear mass scaling of §5.3.
+
+    Returns
+    -------
+    dict
+        Candidate results at the design point, the interpolated performance
+        and the linear-scaling estimate
+    """
+    mtow_kg = get_mtow()
+    wing_loading = _design_wing_loading()
+    inputs = {**_common_inputs(), **_point_inputs(mtow_kg, wing_loading)}
+
+    direct = {}
+    for direction in DIRECTIONS:
+        sim = simulate_transitions(inputs, direction)
+        direct[direction] = {
+            'candidates': {name: (values[0] if values.ndim == 2 else values)
+                           for name, values in sim.items()},
+            'best': {name: values[0] for name, values in _best_schedule(sim).items()},
+            'hover_power_w': float(sim['hover_power_w'][0]),
+            'end_speed_m_s': float(sim['end_speed_m_s'][0]),
+        }
+
+    linear_j = (get_param('mission.transition.reference_energy_j')
+                * mtow_kg / get_param('mission.transition.reference_mtow_kg')
+                * get_param('mission.transition.mars_scaling_factor'))
+
+    return {
+        'mtow_kg': mtow_kg,
+        'wing_loading': wing_loading,
+        'direct': direct,
+        'interpolated': transition_performance(mtow_kg, wing_loading),
+        'linear_per_transition_j': linear_j,
+        't_transition_s': get_param('mission.time.t_transition_s'),
+        'use_in_sizing': bool(simulation_settings()['use_in_sizing']),
+    }
+
+
+def print_analysis(results: Dict[str, Any] = None) -> None:
+    """Print formatted transition simulation results."""
+    if results is None:
+        results = transition_analysis()
+
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    print('=' * 80)
+    print('TRANSITION SIMULATION (point-mass, §5.3.2b)')
+    print('=' * 80)
+    print(f'Computed: {timestamp}')
+    print('Config:   All values loaded from config/ YAML files')
+    print()
+
+    print('DESIGN POINT')
+    print('-' * 50)
+    print(f"  MTOW:                  {results['mtow_kg']:.2f} kg")
+    print(f"  Wing loading:          {results['wing_loading']:.2f} N/m² (stall limit)")
+    fwd = results['direct']['forward']
+    print(f"  Hover power:           {fwd['hover_power_w']:.0f} W")
+    print(f"  Transition speed:      {fwd['end_speed_m_s']:.1f} m/s")
+    print()
+
+    for direction, label in (('forward', 'FORWARD (Q2P)'), ('back', 'BACK (P2Q)')):
+        d = results['direct'][direction]
+        c = d['candidates']
+        rate_label = 'accel' if direction == 'forward' else 'decel'
+        print(f'{label} CANDIDATES')
+        print('-' * 50)
+        print(f"  {rate_label + ' (m/s²)':<14} {'α_max (deg)':>11} {'E (kJ)':>8} "
+              f"{'P_peak (W)':>11} {'t (s)':>7}")
+        for k in range(c['rate_m_s2'].size):
+            if np.isfinite(c['energy_j'][k]):
+                print(f"  {c['rate_m_s2'][k]:<14.2f} {c['max_alpha_deg'][k]:>11.1f} "
+                      f"{c['energy_j'][k] / 1000:8.2f} {c['peak_power_w'][k]:11.0f} "
+                      f"{c['duration_s'][k]:7.1f}")
+            else:
+                print(f"  {c['rate_m_s2'][k]:<14.2f} {c['max_alpha_deg'][k]:>11.1f} "
+                      f"{'-- (incomplete or over power limit)':>28}")
+        b = d['best']
+        if b['schedule'] >= 0:
+            print(f"  Best: {b['energy_j'] / 1000:.2f} kJ, peak {b['peak_power_w']:.0f} W, "
+                  f"{b['duration_s']:.1f} s")
+        else:
+            print('  Best: no candidate completes within the power limit')
+        print()
+
+    interp = results['interpolated']
+    print('MISSION TOTAL')
+    print('-' * 50)
+    print(f"  Transitions:           {interp['n_transitions']}")
+    print(f"  Energy (table):        {interp['total_energy_j'] / 1000:.2f} kJ "
+          f"({interp['total_energy_j'] / 3600:.1f} Wh)")
+    linear_total = results['linear_per_transition_j'] * interp['n_transitions']
+    print(f"  Energy (linear scale): {linear_total / 1000:.2f} kJ ({linear_total / 3600:.1f} Wh)")
+    print(f"  Peak power:            {interp['peak_power_w']:.0f} W")
+    print(f"  Duration:              {interp['duration_s']:.1f} s "
+          f"(budget {results['t_transition_s']} s)")
+    print(f"  Used in sizing:        {'yes' if results['use_in_sizing'] else 'no'}")
+    print('=' * 80)
+
+
+if __name__ == '__main__':
+    print_analysis()
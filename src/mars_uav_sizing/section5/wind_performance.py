@@ -0,0 +1,473 @@
+"""
+Wind-Aware Radius and Endurance
+===============================
+
+Out-and-back operational radius and time-on-station of the QuadPlane in a
+steady horizontal wind, as a function of wind speed, wind direction and
+cruise airspeed. Replaces the still-air estimate of
+deprecated/endurance.operational_radius (and the range / 2 radius of §5.3).
+
+The cruise energy is what the §5.3 budget leaves after hover, transitions
+and reserve. Cruise power follows the §5.2 model at any airspeed, so the
+airspeed of each leg can be chosen for minimum energy per ground kilometre
+(speed-to-fly). Because the radius is r = E / (e_out + e_back), each leg is
+optimized independently.
+
+Equations:
+    P(V)   = W V / ((L/D)(V) × k_ld × η_cruise),  C_L = 2(W/S) / (ρV²)
+    V_g    = sqrt(V² - w² sin²θ) ± w cos θ       (crab into the crosswind)
+    e      = P(V) / V_g                           (energy per ground metre)
+    r      = (E_cruise - P_loiter t_station) / (e_out + e_back)
+
+θ is the angle between the wind vector (direction the wind blows toward)
+and the outbound course: θ = 0 is a tailwind outbound and a headwind on the
+way back. Maps are symmetric in θ, so headings span 0-180°.
+
+Every function broadcasts over wind speed, heading and airspeed arrays;
+wind_tables() evaluates the dense grid of mission.range.wind once per
+config state and lookup() interpolates it for mission planning.
+
+Reference:
+    - Manuscript: sections_en/05_03_hybrid-vtol-configuration-sec-hybrid-vtol-analysis.md
+    - Torenbeek (1982), Synthesis of Subsonic Airplane Design, Section 5.4
+
+Last Updated: 2026-10-19
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+
+from ..config import (
+    get_aerodynamic_params,
+    get_density,
+    get_param,
+)
+from ..instrumentation import traced
+from .fixed_wing import cruise_lift_coefficient, lift_to_drag, stall_wing_loading_limit
+
+# In-process table cache, keyed by config state
+_tables: Dict[str, Dict[str, np.ndarray]] = {}
+
+
+# =============================================================================
+# MODEL INPUTS
+# =============================================================================
+
+def performance_inputs(hybrid: Dict[str, Any] = None, wing_loading: float = None) -> Dict[str, float]:
+    """
+    Collect the aircraft and energy inputs of the wind model.
+
+    Parameters
+    ----------
+    hybrid : dict, optional
+        §5.3 result of hybrid_vtol_feasibility_analysis (default: computed
+        from config); pass the coupled package's result to evaluate the
+        coupled design
+    wing_loading : float, optional
+        W/S in N/m² (default: stall limit, §5.2)
+
+    Returns
+    -------
+    dict
+        Scalar model inputs, including the cruise energy 'cruise_energy_wh'
+        left after hover, transitions and reserve
+    """
+    if hybrid is None:
+        from .hybrid_vtol import hybrid_vtol_feasibility_analysis
+        hybrid = hybrid_vtol_feasibility_analysis()
+    if wing_loading is None:
+        wing_loading = stall_wing_loading_limit()
+
+    aero = get_aerodynamic_params(hybrid['mtow_kg'], wing_loading)
+    reserve = get_param('mission.energy.reserve_fraction')
+    cruise_energy_wh = (hybrid['usable_energy_wh'] * (1.0 - reserve)
+                        - hybrid['hover_energy_wh'] - hybrid['transition_energy_wh'])
+    rho = get_density()
+    motor = get_param('propulsion.components.cruise.motor')
+
+    return {
+        'weight_n': float(hybrid['weight_n']),
+        'wing_loading': float(wing_loading),
+        'rho': float(rho),
+        'cd0': float(aero['cd0']),
+        'aspect_ratio': float(aero['aspect_ratio']),
+        'oswald_e': float(aero['oswald_e']),
+        'ld_penalty': float(hybrid['ld_penalty_factor']),
+        'eta_cruise': float(hybrid['eta_cruise']),
+        'v_min': float(np.sqrt(2.0 * wing_loading / (rho * aero['cl_max']))),
+        'max_power_w': float(motor['max_power_w'] * motor['quantity']),
+        'cruise_energy_wh': float(max(cruise_energy_wh, 0.0)),
+        'fixed_time_min': float(hybrid['hover_time_min']
+                                + get_param('mission.time.t_transition_s') / 60.0),
+        'v_cruise': float(hybrid['v_cruise_m_s']),
+        'required_radius_km': float(get_param('mission.range.operational_radius_km')),
+    }
+
+
+def table_settings() -> Dict[str, Any]:
+    """Grid settings of the lookup tables (mission.range.wind)."""
+    return dict(get_param('mission.range.wind'))
+
+
+def airspeed_grid(inputs: Dict[str, float], settings: Dict[str, Any] = None) -> np.ndarray:
+    """Airspeeds from the minimum flight speed up to max_airspeed_m_s."""
+    if settings is None:
+        settings = table_settings()
+    v_max = max(float(settings['max_airspeed_m_s']), inputs['v_min'])
+    return np.linspace(inputs['v_min'], v_max, int(settings['n_airspeed']))
+
+
+# =============================================================================
+# POINT MODELS (broadcast over wind speed, heading and airspeed)
+# =============================================================================
+
+def cruise_power_curve(airspeed: np.ndarray, inputs: Dict[str, float]) -> np.ndarray:
+    """
+    Electrical cruise power at any airspeed (§5.2 model with the §5.3 L/D
+    penalty). NaN below the minimum flight speed or above the installed
+    cruise motor power.
+    """
+    airspeed = np.asarray(airspeed, dtype=float)
+    c_l = cruise_lift_coefficient(inputs['wing_loading'], inputs['rho'], airspeed)
+    ld = lift_to_drag(c_l, inputs['cd0'], inputs['aspect_ratio'], inputs['oswald_e'])
+    power = inputs['weight_n'] * airspeed / (ld * inputs['ld_penalty'] * inputs['eta_cruise'])
+    flyable = (airspeed >= inputs['v_min'] * (1.0 - 1.0e-9)) & (power <= inputs['max_power_w'])
+    return np.where(flyable, power, np.nan)
+
+
+def ground_speeds(airspeed, wind_speed, heading_deg):
+    """
+    Outbound and return ground speeds with the aircraft crabbing into the
+    crosswind.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (outbound, return) ground speeds in m/s, NaN where the leg cannot
+        be flown (crosswind at or above the airspeed, or no progress)
+    """
+    theta = np.radians(heading_deg)
+    along = wind_speed * np.cos(theta)
+    cross = wind_speed * np.sin(theta)
+    with np.errstate(invalid='ignore'):
+        track = np.sqrt(np.asarray(airspeed, dtype=float) ** 2 - cross ** 2)
+    out = track + along
+    back = track - along
+    return np.where(out > 0, out, np.nan), np.where(back > 0, back, np.nan)
+
+
+def energy_per_km(airspeed, wind_speed, heading_deg, inputs: Dict[str, float]):
+    """Energy per ground kilometre (Wh/km) on the outbound and return legs."""
+    power = cruise_power_curve(airspeed, inputs)
+    out, back = ground_speeds(airspeed, wind_speed, heading_deg)
+    to_wh_per_km = 1000.0 / 3600.0
+    return power / out * to_wh_per_km, power / back * to_wh_per_km
+
+
+def loiter_power(inputs: Dict[str, float], settings: Dict[str, Any] = None) -> Dict[str, float]:
+    """Minimum cruise power and its airspeed (loiter on station)."""
+    v = airspeed_grid(inputs, settings)
+    power = cruise_power_curve(v, inputs)
+    i = int(np.nanargmin(power))
+    return {'airspeed_m_s': float(v[i]), 'power_w': float(power[i])}
+
+
+def radius_map(wind_speed, heading_deg, airspeed, station_time_min=0.0,
+               inputs: Dict[str, float] = None) -> np.ndarray:
+    """
+    Out-and-back radius at one airspeed on both legs.
+
+    Parameters
+    ----------
+    wind_speed, heading_deg, airspeed : array_like
+        Broadcastable wind speed (m/s), wind direction relative to the
+        outbound course (deg) and airspeed (m/s)
+    station_time_min : array_like
+        Time on station at the far end, flown at minimum power
+    inputs : dict, optional
+        Model inputs (default: performance_inputs())
+
+    Returns
+    -------
+    np.ndarray
+        Radius in km (NaN where the mission cannot be flown)
+    """
+    if inputs is None:
+        inputs = performance_inputs()
+    e_out, e_back = energy_per_km(airspeed, wind_speed, heading_deg, inputs)
+    station_wh = loiter_power(inputs)['power_w'] * np.asarray(station_time_min) / 60.0
+    radius = (inputs['cruise_energy_wh'] - station_wh) / (e_out + e_back)
+    return np.where(radius >= 0, radius, np.nan)
+
+
+def optimal_airspeeds(wind_speed, heading_deg, inputs: Dict[str, float] = None,
+                      settings: Dict[str, Any] = None) -> Dict[str, np.ndarray]:
+    """
+    Minimum-energy airspeed of each leg and the resulting maximum radius.
+
+    Parameters
+    ----------
+    wind_speed, heading_deg : array_like
+        Broadcastable wind speed (m/s) and direction (deg)
+    inputs : dict, optional
+        Model inputs (default: performance_inputs())
+    settings : dict, optional
+        Airspeed grid settings (default: mission.range.wind)
+
+    Returns
+    -------
+    dict
+        'v_out_m_s', 'v_back_m_s', energies per km 'e_out_wh_km' and
+        'e_back_wh_km', and 'radius_km' with no time on station
+    """
+    if inputs is None:
+        inputs = performance_inputs()
+    v = airspeed_grid(inputs, settings)
+    wind_speed, heading_deg = np.broadcast_arrays(np.asarray(wind_speed, dtype=float),
+                                                  np.asarray(heading_deg, dtype=float))
+    e_out, e_back = energy_per_km(v, wind_speed[..., None], heading_deg[..., None], inputs)
+
+    result: Dict[str, np.ndarray] = {}
+    for leg, energy in (('out', e_out), ('back', e_back)):
+        flyable = np.isfinite(energy).any(axis=-1)
+        best = np.argmin(np.where(np.isfinite(energy), energy, np.inf), axis=-1)
+        result[f'v_{leg}_m_s'] = np.where(flyable, v[best], np.nan)
+        result[f'e_{leg}_wh_km'] = np.where(
+            flyable, np.take_along_axis(energy, best[..., None], axis=-1)[..., 0], np.nan)
+    result['radius_km'] = inputs['cruise_energy_wh'] / (result['e_out_wh_km'] + result['e_back_wh_km'])
+    return result
+
+
+def time_on_station(radius_km, wind_speed, heading_deg, inputs: Dict[str, float] = None,
+                    settings: Dict[str, Any] = None) -> np.ndarray:
+    """
+    Time on station (min) at a given radius with minimum-energy leg airspeeds.
+
+    NaN where the radius cannot be reached and flown back.
+    """
+    if inputs is None:
+        inputs = performance_inputs()
+    legs = optimal_airspeeds(wind_speed, heading_deg, inputs, settings)
+    transit_wh = np.asarray(radius_km) * (legs['e_out_wh_km'] + legs['e_back_wh_km'])
+    station_min = (inputs['cruise_energy_wh'] - transit_wh) / loiter_power(inputs, settings)['power_w'] * 60.0
+    return np.where(station_min >= 0, station_min, np.nan)
+
+
+# =============================================================================
+# LOOKUP TABLES
+# =============================================================================
+
+def _state_key() -> str:
+    """Cheap fingerprint of every config section the tables read."""
+    return repr((
+        get_param('mission'),
+        get_param('aerodynamic'),
+        get_param('propulsion'),
+        get_param('battery'),
+        get_param('geometry'),
+        get_param('environment'),
+    ))
+
+
+def _compute_tables(inputs: Dict[str, float], settings: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """Evaluate every map on the wind speed × heading (× airspeed) grid."""
+    wind = np.linspace(*settings['wind_speed_range_m_s'], int(settings['n_wind_speed']))
+    heading = np.linspace(0.0, 180.0, int(settings['n_heading']))
+    v = airspeed_grid(inputs, settings)
+    w, h = np.meshgrid(wind, heading, indexing='ij')
+
+    legs = optimal_airspeeds(w, h, inputs, settings)
+    station = time_on_station(inputs['required_radius_km'], w, h, inputs, settings)
+    gs_out, _ = ground_speeds(legs['v_out_m_s'], w, h)
+    _, gs_back = ground_speeds(legs['v_back_m_s'], w, h)
+    transit_min = inputs['required_radius_km'] * 1000.0 * (1.0 / gs_out + 1.0 / gs_back) / 60.0
+    radius = legs['radius_km']
+
+    return {
+        'wind_speed_m_s': wind,
+        'heading_deg': heading,
+        'airspeed_m_s': v,
+        'cruise_power_w': cruise_power_curve(v, inputs),
+        'radius_km': radius_map(w[..., None], h[..., None], v, 0.0, inputs),
+        'radius_max_km': radius,
+        'radius_worst_km': np.min(np.where(np.isfinite(radius), radius, 0.0), axis=1),
+        'v_out_m_s': legs['v_out_m_s'],
+        'v_back_m_s': legs['v_back_m_s'],
+        'station_time_min': station,
+        'endurance_min': inputs['fixed_time_min'] + transit_min + station,
+    }
+
+
+def wind_tables(inputs: Dict[str, float] = None, use_cache: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Radius, airspeed and endurance maps over wind speed × heading.
+
+    Parameters
+    ----------
+    inputs : dict, optional
+        Model inputs (default: performance_inputs(); tables for the default
+        inputs are cached per config state)
+    use_cache : bool
+        Reuse tables computed for the same config state
+
+    Returns
+    -------
+    dict
+        Grids 'wind_speed_m_s', 'heading_deg', 'airspeed_m_s'; maps shaped
+        (n_wind, n_heading): 'radius_max_km', 'v_out_m_s', 'v_back_m_s',
+        'station_time_min' and 'endurance_min' at the required operational
+        radius; 'radius_km' at fixed airspeed (n_wind, n_heading,
+        n_airspeed); 'radius_worst_km' over headings (n_wind,) and the
+        'cruise_power_w' curve
+    """
+    state = _state_key() if inputs is None else None
+    if use_cache and state in _tables:
+        return _tables[state]
+    tables = _compute_tables(performance_inputs() if inputs is None else inputs, table_settings())
+    if state is not None:
+        _tables[state] = tables
+    return tables
+
+
+def lookup(wind_speed, heading_deg, name: str = 'radius_max_km',
+           tables: Dict[str, np.ndarray] = None) -> np.ndarray:
+    """
+    Interpolate a (wind speed × heading) map for mission planning.
+
+    Headings are folded into 0-180° and values outside the wind grid are
+    clamped to its edge.
+
+    Parameters
+    ----------
+    wind_speed, heading_deg : array_like
+        Wind speed (m/s) and direction relative to the outbound course (deg)
+    name : str
+        Map name from wind_tables() shaped (n_wind, n_heading)
+    tables : dict, optional
+        Tables to interpolate (default: wind_tables())
+
+    Returns
+    -------
+    np.ndarray
+        Bilinearly interpolated values
+    """
+    if tables is None:
+        tables = wind_tables()
+    values = tables[name]
+    if values.shape != (tables['wind_speed_m_s'].size, tables['heading_deg'].size):
+        raise ValueError(f"'{name}' is not a wind speed × heading map")
+
+    heading = np.abs((np.asarray(heading_deg, dtype=float) + 180.0) % 360.0 - 180.0)
+    wind_grid, heading_grid = tables['wind_speed_m_s'], tables['heading_deg']
+    x = np.clip(np.asarray(wind_speed, dtype=float), wind_grid[0], wind_grid[-1])
+    i = np.clip(np.searchsorted(wind_grid, x) - 1, 0, wind_grid.size - 2)
+    j = np.clip(np.searchsorted(heading_grid, heading) - 1, 0, heading_grid.size - 2)
+    tx = (x - wind_grid[i]) / (wind_grid[i + 1] - wind_grid[i])
+    ty = (heading - heading_grid[j]) / (heading_grid[j + 1] - heading_grid[j])
+    return ((1 - tx) * (1 - ty) * values[i, j] + tx * (1 - ty) * values[i + 1, j]
+            + (1 - tx) * ty * values[i, j + 1] + tx * ty * values[i + 1, j + 1])
+
+
+def export_tables(path, tables: Dict[str, np.ndarray] = None) -> Path:
+    """Write the lookup tables to a compressed .npz for mission planning tools."""
+    path = Path(path)
+    np.savez_compressed(path, **(wind_tables() if tables is None else tables))
+    return path
+
+
+# =============================================================================
+# MAIN ANALYSIS
+# =============================================================================
+
+@traced('wind_performance')
+def wind_performance_analysis() -> Dict[str, Any]:
+    """
+    Radius and time-on-station maps of the design at the config wind speeds.
+
+    Returns
+    -------
+    dict
+        Model inputs, the lookup tables, the loiter point and a summary at
+        still air, the mean wind and the dust-devil wind speed
+    """
+    inputs = performance_inputs()
+    tables = wind_tables()
+    winds = {
+        'still air': 0.0,
+        'mean': get_param('environment.wind.mean'),
+        'dust devil': get_param('environment.wind.dust_devil'),
+    }
+    summary = {}
+    for label, w in winds.items():
+        radius = lookup(w, tables['heading_deg'], 'radius_max_km', tables)
+        station = lookup(w, tables['heading_deg'], 'station_time_min', tables)
+        summary[label] = {
+            'wind_m_s': w,
+            'headwind_out': {k: float(v) for k, v in optimal_airspeeds(w, 180.0, inputs).items()},
+            'crosswind': {k: float(v) for k, v in optimal_airspeeds(w, 90.0, inputs).items()},
+            # Unflyable headings count as zero
+            'worst_radius_km': float(np.min(np.where(np.isfinite(radius), radius, 0.0))),
+            'worst_station_min': float(np.min(np.where(np.isfinite(station), station, 0.0))),
+        }
+
+    return {
+        'inputs': inputs,
+        'tables': tables,
+        'loiter': loiter_power(inputs),
+        'summary': summary,
+        'still_air_radius_at_cruise_km': float(radius_map(0.0, 0.0, inputs['v_cruise'], 0.0, inputs)),
+    }
+
+
+def print_analysis(results: Dict[str, Any] = None) -> None:
+    """Print formatted wind-aware radius and endurance results."""
+    if results is None:
+        results = wind_performance_analysis()
+
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    inp = results['inputs']
+    tables = results['tables']
+
+    print('=' * 80)
+    print('WIND-AWARE RADIUS AND ENDURANCE')
+    print('=' * 80)
+    print(f'Computed: {timestamp}')
+    print('Config:   All values loaded from config/ YAML files')
+    print()
+
+    print('INPUTS')
+    print('-' * 50)
+    print(f"  Cruise energy:         {inp['cruise_energy_wh']:.1f} Wh (after hover, transitions, reserve)")
+    print(f"  Airspeed range:        {inp['v_min']:.1f} - {tables['airspeed_m_s'][np.isfinite(tables['cruise_power_w'])][-1]:.1f} m/s "
+          f"(installed cruise power {inp['max_power_w']:.0f} W)")
+    print(f"  Loiter:                {results['loiter']['power_w']:.0f} W at {results['loiter']['airspeed_m_s']:.1f} m/s")
+    print(f"  Still-air radius:      {results['still_air_radius_at_cruise_km']:.1f} km at V_cruise = {inp['v_cruise']:.0f} m/s")
+    print(f"  Required radius:       {inp['required_radius_km']:.0f} km")
+    print()
+
+    print('BY WIND SPEED (optimal airspeed per leg)')
+    print('-' * 50)
+    for label, s in results['summary'].items():
+        head, cross = s['headwind_out'], s['crosswind']
+        print(f"  {label} ({s['wind_m_s']:.0f} m/s)")
+        print(f"    Headwind out: r_max = {head['radius_km']:6.1f} km, "
+              f"V_out/V_back = {head['v_out_m_s']:.1f}/{head['v_back_m_s']:.1f} m/s")
+        print(f"    Crosswind:    r_max = {cross['radius_km']:6.1f} km, "
+              f"V = {cross['v_out_m_s']:.1f} m/s")
+        print(f"    Worst heading: r_max = {s['worst_radius_km']:6.1f} km, "
+              f"time on station at {inp['required_radius_km']:.0f} km = {s['worst_station_min']:.1f} min")
+    print()
+
+    print('WORST-HEADING RADIUS vs WIND SPEED')
+    print('-' * 50)
+    for w, r in zip(tables['wind_speed_m_s'][::5], tables['radius_worst_km'][::5]):
+        status = 'OK' if r >= inp['required_radius_km'] else 'SHORT'
+        print(f"  {w:5.1f} m/s: {r:6.1f} km  [{status}]")
+    print('=' * 80)
+
+
+if __name__ == '__main__':
+    print_analysis()
@@ -9,6 +9,7 @@ Modules:
     - airfoil_selection: Airfoil comparison and selection (§6.2)
     - airfoil_plots: Visualization of airfoil performance (§6.2)
     - propeller_sizing: Propeller sizing for lift and cruise (§6.3)
+    - bemt: Blade-element momentum performance maps for the propellers (§6.3)
     - tail_sizing: Tail surface sizing (§6.3)
 
 All modules load parameters from config/ YAML files - no hardcoded values.
@@ -17,11 +18,13 @@ All modules load parameters from config/ YAML files - no hardcoded values.
 from . import airfoil_selection
 from . import airfoil_plots
 from . import propeller_sizing
+from . import bemt
 from . import tail_sizing
 
 __all__ = [
     'airfoil_selection',
     'airfoil_plots',
     'propeller_sizing',
+    'bemt',
     'tail_sizing',
 ]
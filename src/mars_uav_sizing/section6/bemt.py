@@ -0,0 +1,873 @@
+#!/usr/bin/env python3
+"""
+Blade-Element Momentum Theory (BEMT) Rotor Module
+=================================================
+
+Computes thrust, power, figure of merit and propulsive efficiency maps for
+the lift and cruise propellers from blade geometry and section airfoil data,
+replacing the constant FM and eta_prop of §4.5 when enabled in
+propulsion_parameters.yaml (bemt.use_in_sizing).
+
+The solver is vectorized over radial stations, RPMs, axial velocities and
+candidate geometries (diameter × pitch × blade count): each blade element
+balances blade-element thrust against annulus momentum with Prandtl tip
+loss, and the induced velocity is found by bisection on all elements at once.
+
+Section polars are taken from airfoil_data.yaml (UIUC data at Re ~ 60,000)
+and corrected to the local blade conditions:
+    - Reynolds:  c_d scaled by (Re_ref / Re)^0.5 (laminar skin friction)
+    - Mach:      c_l scaled by 1 / sqrt(1 - M^2) (Prandtl-Glauert)
+    - Post-stall: blended to flat-plate c_l = sin(2α), c_d = 2 sin²(α)
+
+Swirl in the slipstream is neglected, and coaxial interference of the lift
+pairs is not modelled. Maps are cached on disk, keyed by a hash of every
+input. Design points are the hover thrust per lift rotor and the cruise
+thrust per cruise motor at the sizing MTOW, limited to the configured tip
+Mach number. Sizing operates the selected propellers (whose masses Section 7
+carries) at the current MTOW and stops if they cannot reach the thrust;
+hover power then uses the disk loading of the selected lift rotor.
+
+Key equations:
+    dT = B × ½ρW²c × (c_l cos φ - c_d sin φ) dr = 4πrρF(V + v)v dr
+    dQ = B × ½ρW²c × (c_l sin φ + c_d cos φ) r dr
+    F  = (2/π) × arccos(exp(-B(R - r) / (2r sin φ)))
+    FM = T^1.5 / (P × sqrt(2ρA)),   η = T × V / P
+
+Reference:
+    - Leishman (2006), Principles of Helicopter Aerodynamics, Chapter 3
+    - Glauert (1935), Airplane Propellers, in Durand (ed.), Aerodynamic Theory
+    - Manuscript: sections_en/06_03_geometry-selection-sec-geometry-selection.md
+
+Last Updated: 2026-10-19
+"""
+
+import functools
+import hashlib
+import itertools
+import json
+import math
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from ..config import (
+    get_aerodynamic_params,
+    get_density,
+    get_mars_gravity,
+    get_mtow,
+    get_param,
+)
+from ..instrumentation import traced
+from .airfoil_selection import load_airfoil_data
+
+
+# On-disk map cache (one .npz per input hash)
+CACHE_DIR = Path(__file__).resolve().parent.parent / 'cache' / 'bemt'
+
+# Bump when the solver changes so stale maps are not reused
+_SOLVER_VERSION = 1
+
+INCH_TO_M = 0.0254
+
+# In-process map cache, keyed by input hash
+_maps: Dict[str, Dict[str, np.ndarray]] = {}
+
+# Input hash per (kind, config state), so repeated calls skip the hashing
+_map_keys: Dict[Tuple[str, str], str] = {}
+
+# Selected-propeller maps per config state, and operating efficiencies per
+# (config state, MTOW); the latter is cleared when it reaches _MAX_MEMO
+_designs: Dict[str, Dict[str, Any]] = {}
+_efficiencies: Dict[Tuple[str, float], Dict[str, float]] = {}
+_MAX_MEMO = 4096
+
+
+# =============================================================================
+# SECTION AERODYNAMICS
+# =============================================================================
+
+@functools.lru_cache(maxsize=None)
+def _airfoil_polars() -> Dict[str, Any]:
+    """Parse airfoil_data.yaml once per process."""
+    return load_airfoil_data()
+
+
+def load_section_polar(name: str = None) -> Dict[str, Any]:
+    """
+    Load the blade section polar from airfoil_data.yaml.
+
+    Parameters
+    ----------
+    name : str, optional
+        Airfoil name (default: propulsion.bemt.airfoil)
+
+    Returns
+    -------
+    dict
+        'name', 'reynolds' and sorted 'alpha_deg', 'cl', 'cd' arrays
+    """
+    if name is None:
+        name = get_param('propulsion.bemt.airfoil')
+    polars = _airfoil_polars()
+    if name not in polars:
+        raise KeyError(f"Airfoil '{name}' not found in airfoil_data.yaml "
+                       f"(available: {sorted(polars)})")
+    alpha, cl, cd, _ = polars[name].get_arrays()
+    order = np.argsort(alpha)
+    return {
+        'name': name,
+        'reynolds': float(polars[name].reynolds),
+        'alpha_deg': np.asarray(alpha, dtype=float)[order],
+        'cl': np.asarray(cl, dtype=float)[order],
+        'cd': np.asarray(cd, dtype=float)[order],
+    }
+
+
+def section_coefficients(
+    alpha_rad: np.ndarray,
+    reynolds: np.ndarray,
+    mach: np.ndarray,
+    polar: Dict[str, Any],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Section lift and drag coefficients at the local blade conditions.
+
+    Parameters
+    ----------
+    alpha_rad : np.ndarray
+        Angle of attack in radians
+    reynolds : np.ndarray
+        Chord Reynolds number
+    mach : np.ndarray
+        Local Mach number
+    polar : dict
+        Section polar from load_section_polar()
+
+    Returns
+    -------
+    tuple
+        (c_l, c_d) arrays broadcast to the input shape
+    """
+    alpha_deg = np.degrees(alpha_rad)
+    a_data, cl_data, cd_data = polar['alpha_deg'], polar['cl'], polar['cd']
+
+    cl = np.interp(alpha_deg, a_data, cl_data)
+    cd = np.interp(alpha_deg, a_data, cd_data)
+
+    # Outside the measured range: blend to flat-plate values over 15 deg
+    beyond = np.maximum(alpha_deg - a_data[-1], a_data[0] - alpha_deg)
+    blend = np.clip(beyond / 15.0, 0.0, 1.0)
+    cl = (1.0 - blend) * cl + blend * np.sin(2.0 * alpha_rad)
+    cd = np.maximum(cd, (1.0 - blend) * cd + blend * 2.0 * np.sin(alpha_rad) ** 2)
+
+    # Reynolds (laminar skin friction) and Mach (Prandtl-Glauert) corrections
+    cd = cd * np.sqrt(polar['reynolds'] / np.maximum(reynolds, 1.0e3))
+    cl = cl / np.sqrt(1.0 - np.minimum(mach, 0.9) ** 2)
+    return cl, cd
+
+
+# =============================================================================
+# BLADE-ELEMENT MOMENTUM SOLVER
+# =============================================================================
+
+def blade_geometry(
+    diameter_m: np.ndarray,
+    pitch_m: np.ndarray,
+    chord_root_R: float,
+    chord_tip_R: float,
+    n_stations: int,
+    hub_radius_fraction: float,
+) -> Dict[str, np.ndarray]:
+    """
+    Discretise blades of constant geometric pitch and linear chord taper.
+
+    Parameters
+    ----------
+    diameter_m, pitch_m : np.ndarray
+        Propeller diameters and geometric pitches, shape (n_geom,)
+    chord_root_R, chord_tip_R : float
+        Chord-to-radius ratio at the hub and at the tip
+    n_stations : int
+        Radial stations (midpoints of equal-width elements)
+    hub_radius_fraction : float
+        Hub radius as a fraction of the tip radius
+
+    Returns
+    -------
+    dict
+        'radius_m', 'r_m', 'dr_m', 'chord_m', 'twist_rad', each shaped
+        (n_geom, n_stations) except radius_m and dr_m (n_geom, 1)
+    """
+    radius = np.asarray(diameter_m, dtype=float)[:, None] / 2.0
+    pitch = np.asarray(pitch_m, dtype=float)[:, None]
+
+    edges = np.linspace(hub_radius_fraction, 1.0, n_stations + 1)
+    x = 0.5 * (edges[:-1] + edges[1:])
+    dx = edges[1] - edges[0]
+
+    r = radius * x
+    chord = radius * (chord_root_R + (chord_tip_R - chord_root_R)
+                      * (x - hub_radius_fraction) / (1.0 - hub_radius_fraction))
+    twist = np.arctan(pitch / (2.0 * math.pi * r))
+
+    return {
+        'radius_m': radius,
+        'r_m': r,
+        'dr_m': radius * dx,
+        'chord_m': chord,
+        'twist_rad': twist,
+    }
+
+
+def bemt_solve(
+    geometry: Dict[str, np.ndarray],
+    rpm: np.ndarray,
+    velocity_m_s: np.ndarray,
+    n_blades: np.ndarray,
+    polar: Dict[str, Any],
+    rho: float,
+    mu: float,
+    speed_of_sound: float,
+    iterations: int = 40,
+) -> Dict[str, np.ndarray]:
+    """
+    Solve BEMT for every geometry, RPM and axial velocity at once.
+
+    Parameters
+    ----------
+    geometry : dict
+        Blade discretisation from blade_geometry()
+    rpm : np.ndarray
+        Rotational speeds, shape (n_rpm,)
+    velocity_m_s : np.ndarray
+        Axial (freestream) velocities, shape (n_v,); 0 = hover
+    n_blades : np.ndarray
+        Number of blades per geometry, shape (n_geom,)
+    polar : dict
+        Section polar from load_section_polar()
+    rho, mu, speed_of_sound : float
+        Air density [kg/m³], dynamic viscosity [Pa·s], speed of sound [m/s]
+    iterations : int
+        Bisection steps on the induced velocity
+
+    Returns
+    -------
+    dict
+        'thrust_n', 'torque_nm', 'power_w', shape (n_geom, n_rpm, n_v)
+    """
+    # Axes: (geometry, rpm, velocity, station)
+    r = geometry['r_m'][:, None, None, :]
+    chord = geometry['chord_m'][:, None, None, :]
+    twist = geometry['twist_rad'][:, None, None, :]
+    radius = geometry['radius_m'][:, None, None, :]
+    omega = (2.0 * math.pi / 60.0) * np.asarray(rpm, dtype=float)[None, :, None, None]
+    v_inf = np.asarray(velocity_m_s, dtype=float)[None, None, :, None]
+    blades = np.asarray(n_blades, dtype=float)[:, None, None, None]
+
+    u_t = omega * r
+    blade_factor = 0.5 * rho * blades * chord
+
+    def element_loads(v_i):
+        u_p = v_inf + v_i
+        phi = np.arctan2(u_p, u_t)
+        w2 = u_p ** 2 + u_t ** 2
+        w = np.sqrt(w2)
+        cl, cd = section_coefficients(twist - phi, rho * w * chord / mu,
+                                      w / speed_of_sound, polar)
+        cos_phi, sin_phi = np.cos(phi), np.sin(phi)
+        d_thrust = blade_factor * w2 * (cl * cos_phi - cd * sin_phi)
+        d_torque = blade_factor * w2 * (cl * sin_phi + cd * cos_phi) * r
+        return d_thrust, d_torque, u_p, sin_phi
+
+    def residual(v_i):
+        d_thrust, _, u_p, sin_phi = element_loads(v_i)
+        f_exp = np.exp(-0.5 * blades * (radius - r) / (r * np.maximum(sin_phi, 1.0e-6)))
+        tip_loss = np.maximum((2.0 / math.pi) * np.arccos(np.clip(f_exp, 0.0, 1.0)), 1.0e-4)
+        return d_thrust - 4.0 * math.pi * r * rho * tip_loss * u_p * v_i
+
+    # Bracket: no induced flow, and inflow angle 10 deg past the blade pitch
+    lo = np.zeros(np.broadcast_shapes(u_t.shape, v_inf.shape))
+    hi = np.maximum(u_t * np.tan(np.minimum(twist + math.radians(10.0), math.radians(85.0)))
+                    - v_inf, 1.0e-6)
+    for _ in range(iterations):
+        mid = 0.5 * (lo + hi)
+        positive = residual(mid) > 0.0
+        lo = np.where(positive, mid, lo)
+        hi = np.where(positive, hi, mid)
+
+    d_thrust, d_torque, _, _ = element_loads(0.5 * (lo + hi))
+    dr = geometry['dr_m'][:, None, None, 0]
+    thrust = d_thrust.sum(axis=-1) * dr
+    torque = d_torque.sum(axis=-1) * dr
+    return {
+        'thrust_n': thrust,
+        'torque_nm': torque,
+        'power_w': torque * omega[..., 0],
+    }
+
+
+# =============================================================================
+# PERFORMANCE MAPS
+# =============================================================================
+
+def _state_key() -> str:
+    """Cheap fingerprint of every config value the maps and design points read."""
+    return repr((
+        get_param('propulsion.bemt'),
+        get_param('propulsion.components.lift.propeller.diameter_in'),
+        get_param('propulsion.components.lift.propeller.pitch_in'),
+        get_param('propulsion.components.cruise.propeller.diameter_in'),
+        get_param('propulsion.components.cruise.propeller.pitch_in'),
+        get_param('environment.arcadia_planitia'),
+        get_aerodynamic_params(),
+        get_param('aerodynamic.quadplane.ld_penalty_factor'),
+        get_param('geometry.propulsion_config.lift.n_motors'),
+        get_param('geometry.propulsion_config.cruise.n_motors'),
+        get_param('mission.velocity.v_cruise_m_s'),
+        get_mars_gravity(),
+    ))
+
+
+def _map_inputs(kind: str) -> Dict[str, Any]:
+    """Collect every input of a performance map (also the cache key)."""
+    if kind not in ('lift', 'cruise'):
+        raise ValueError(f"Unknown rotor kind: {kind!r} (use 'lift' or 'cruise')")
+    bemt = get_param('propulsion.bemt')
+    rotor = bemt[kind]
+    selected = get_param(f'propulsion.components.{kind}.propeller')
+
+    geometries = [[float(d), float(p), int(b)] for d, p, b in itertools.product(
+        rotor['candidate_diameters_in'], rotor['candidate_pitches_in'],
+        rotor['candidate_n_blades'])]
+    selected_geometry = [float(selected['diameter_in']), float(selected['pitch_in']),
+                         int(rotor['n_blades'])]
+    if selected_geometry not in geometries:
+        geometries.append(selected_geometry)
+
+    if kind == 'lift':
+        velocities = [0.0]
+    else:
+        velocities = np.linspace(*rotor['velocity_range_m_s'], rotor['n_velocity']).tolist()
+
+    polar = load_section_polar(bemt['airfoil'])
+    return {
+        'version': _SOLVER_VERSION,
+        'kind': kind,
+        'geometries': geometries,
+        'selected_index': geometries.index(selected_geometry),
+        'rpm': np.linspace(*rotor['rpm_range'], rotor['n_rpm']).tolist(),
+        'velocity_m_s': [float(v) for v in velocities],
+        'chord_root_R': float(rotor['chord_root_R']),
+        'chord_tip_R': float(rotor['chord_tip_R']),
+        'n_stations': int(bemt['n_stations']),
+        'hub_radius_fraction': float(bemt['hub_radius_fraction']),
+        'iterations': int(bemt['inflow_iterations']),
+        'rho': float(get_density()),
+        'mu': float(get_param('environment.arcadia_planitia.viscosity_Pa_s')),
+        'speed_of_sound': float(get_param('environment.arcadia_planitia.speed_of_sound_m_s')),
+        'polar': {key: (value.tolist() if isinstance(value, np.ndarray) else value)
+                  for key, value in polar.items()},
+    }
+
+
+@traced()
+def _compute_map(inputs: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """Evaluate BEMT over the map grid and derive coefficients."""
+    geometries = np.asarray(inputs['geometries'])
+    diameter_m = geometries[:, 0] * INCH_TO_M
+    pitch_m = geometries[:, 1] * INCH_TO_M
+    rpm = np.asarray(inputs['rpm'])
+    velocity = np.asarray(inputs['velocity_m_s'])
+    polar = {key: (np.asarray(value) if isinstance(value, list) else value)
+             for key, value in inputs['polar'].items()}
+    rho = inputs['rho']
+
+    geometry = blade_geometry(diameter_m, pitch_m, inputs['chord_root_R'],
+                              inputs['chord_tip_R'], inputs['n_stations'],
+                              inputs['hub_radius_fraction'])
+    loads = bemt_solve(geometry, rpm, velocity, geometries[:, 2], polar, rho,
+                       inputs['mu'], inputs['speed_of_sound'], inputs['iterations'])
+    thrust, power = loads['thrust_n'], loads['power_w']
+
+    d = diameter_m[:, None, None]
+    n = (rpm / 60.0)[None, :, None]
+    v = velocity[None, None, :]
+    disk_area = math.pi * d ** 2 / 4.0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        producing = (thrust > 0) & (power > 0)
+        figure_of_merit = np.where(producing, np.maximum(thrust, 0.0) ** 1.5
+                                   / (power * np.sqrt(2.0 * rho * disk_area)), np.nan)
+        efficiency = np.where(producing, thrust * v / power, np.nan)
+
+    return {
+        'diameter_in': geometries[:, 0],
+        'pitch_in': geometries[:, 1],
+        'n_blades': geometries[:, 2].astype(int),
+        'rpm': rpm,
+        'velocity_m_s': velocity,
+        'thrust_n': thrust,
+        'torque_nm': loads['torque_nm'],
+        'power_w': power,
+        'ct': thrust / (rho * n ** 2 * d ** 4),
+        'cp': power / (rho * n ** 3 * d ** 5),
+        'advance_ratio': np.broadcast_to(v / (n * d), thrust.shape).copy(),
+        'figure_of_merit': figure_of_merit,
+        'efficiency': efficiency,
+        'mach_tip': np.sqrt((math.pi * n * d) ** 2 + v ** 2) / inputs['speed_of_sound'],
+        'selected_index': np.array(inputs['selected_index']),
+    }
+
+
+def performance_map(kind: str = 'lift', use_cache: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Thrust, power, FM and efficiency map for the lift or cruise propellers.
+
+    Maps cover every candidate geometry (diameter × pitch × blade count from
+    propulsion.bemt.<kind>, plus the selected propeller) over the RPM grid
+    and, for cruise, the axial velocity grid.
+
+    Parameters
+    ----------
+    kind : str
+        'lift' (hover, V = 0) or 'cruise'
+    use_cache : bool
+        Reuse maps from memory or from CACHE_DIR when the inputs match
+
+    Returns
+    -------
+    dict
+        Per-geometry 'diameter_in', 'pitch_in', 'n_blades', grids 'rpm' and
+        'velocity_m_s', map arrays shaped (n_geom, n_rpm, n_v) and
+        'selected_index'
+    """
+    state = (kind, _state_key())
+    if use_cache and _map_keys.get(state) in _maps:
+        return _maps[_map_keys[state]]
+
+    inputs = _map_inputs(kind)
+    key = hashlib.sha256(json.dumps(inputs, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+    path = CACHE_DIR / f"{kind}_{key}.npz"
+    _map_keys[state] = key
+
+    if use_cache and key in _maps:
+        return _maps[key]
+    if use_cache and path.exists():
+        with np.load(path, allow_pickle=False) as data:
+            _maps[key] = {name: data[name] for name in data.files}
+        return _maps[key]
+
+    perf = _compute_map(inputs)
+    _maps[key] = perf
+    if use_cache:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(path, **perf)
+    return perf
+
+
+def static_coefficients(
+    diameter_in: np.ndarray,
+    pitch_in: np.ndarray,
+    n_blades: np.ndarray,
+    kind: str = 'lift',
+    mach_tip: float = 0.5,
+) -> Dict[str, np.ndarray]:
+    """
+    Static thrust and power coefficients of arbitrary propeller geometries.
+
+    Evaluated at V = 0 and the RPM giving ``mach_tip`` at Mars conditions,
+    with the blade planform of propulsion.bemt.<kind>. Used to fill ct0/cp0
+    in config/catalogs/propellers.csv.
+
+    Parameters
+    ----------
+    diameter_in, pitch_in, n_blades : array-like
+        Propeller geometries, shape (n_geom,)
+    kind : str
+        Blade planform: 'lift' or 'cruise'
+    mach_tip : float
+        Tip Mach number of the evaluation point
+
+    Returns
+    -------
+    dict
+        'ct0', 'cp0' and 'rpm' per geometry
+    """
+    bemt = get_param('propulsion.bemt')
+    rotor = bemt[kind]
+    a = get_param('environment.arcadia_planitia.speed_of_sound_m_s')
+    rho = get_density()
+    d = np.atleast_1d(np.asarray(diameter_in, dtype=float)) * INCH_TO_M
+    n = mach_tip * a / (math.pi * d)
+
+    geometry = blade_geometry(d, np.atleast_1d(np.asarray(pitch_in, dtype=float)) * INCH_TO_M,
+                              rotor['chord_root_R'], rotor['chord_tip_R'],
+                              bemt['n_stations'], bemt['hub_radius_fraction'])
+    # One geometry at a time: each has its own RPM
+    thrust, power = np.empty_like(d), np.empty_like(d)
+    blades = np.atleast_1d(np.asarray(n_blades, dtype=float))
+    for g in range(d.size):
+        single = {key: value[g:g + 1] for key, value in geometry.items()}
+        loads = bemt_solve(single, np.array([60.0 * n[g]]), np.array([0.0]), blades[g:g + 1],
+                           load_section_polar(bemt['airfoil']), rho,
+                           get_param('environment.arcadia_planitia.viscosity_Pa_s'), a,
+                           bemt['inflow_iterations'])
+        thrust[g], power[g] = loads['thrust_n'][0, 0, 0], loads['power_w'][0, 0, 0]
+
+    return {
+        'ct0': thrust / (rho * n ** 2 * d ** 4),
+        'cp0': power / (rho * n ** 3 * d ** 5),
+        'rpm': 60.0 * n,
+    }
+
+
+# =============================================================================
+# OPERATING POINTS
+# =============================================================================
+
+def operating_point(
+    perf: Dict[str, np.ndarray],
+    thrust_n: float,
+    velocity_m_s: float = 0.0,
+) -> Dict[str, np.ndarray]:
+    """
+    Interpolate every mapped geometry to a required thrust.
+
+    Parameters
+    ----------
+    perf : dict
+        Map from performance_map()
+    thrust_n : float
+        Required thrust per propeller in N
+    velocity_m_s : float
+        Axial velocity in m/s (interpolated between map velocities)
+
+    Returns
+    -------
+    dict
+        Per-geometry arrays 'rpm', 'power_w', 'figure_of_merit',
+        'efficiency', 'mach_tip'; NaN where the thrust is not reachable
+        within the mapped RPM range
+    """
+    velocity = perf['velocity_m_s']
+    if len(velocity) > 1:
+        j = int(np.clip(np.searchsorted(velocity, velocity_m_s) - 1, 0, len(velocity) - 2))
+        w = (velocity_m_s - velocity[j]) / (velocity[j + 1] - velocity[j])
+        thrust = (1.0 - w) * perf['thrust_n'][:, :, j] + w * perf['thrust_n'][:, :, j + 1]
+        power = (1.0 - w) * perf['power_w'][:, :, j] + w * perf['power_w'][:, :, j + 1]
+    else:
+        thrust, power = perf['thrust_n'][:, :, 0], perf['power_w'][:, :, 0]
+
+    # Thrust rises with RPM; take the first grid interval that brackets it
+    rpm_grid = perf['rpm']
+    t_g = np.maximum.accumulate(np.maximum(thrust, 0.0), axis=1)
+    k = (t_g < thrust_n).sum(axis=1)
+    reachable = (k > 0) & (k < len(rpm_grid))
+    rows = np.arange(thrust.shape[0])
+    lo, hi = np.clip(k - 1, 0, len(rpm_grid) - 1), np.clip(k, 0, len(rpm_grid) - 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        w = (thrust_n - t_g[rows, lo]) / (t_g[rows, hi] - t_g[rows, lo])
+        rpm = np.where(reachable, rpm_grid[lo] + w * (rpm_grid[hi] - rpm_grid[lo]), np.nan)
+        power_req = np.where(reachable,
+                             power[rows, lo] + w * (power[rows, hi] - power[rows, lo]), np.nan)
+
+    d = perf['diameter_in'] * INCH_TO_M
+    rho = get_density()
+    return {
+        'rpm': rpm,
+        'power_w': power_req,
+        'figure_of_merit': thrust_n ** 1.5 / (power_req * np.sqrt(2.0 * rho * math.pi * d ** 2 / 4.0)),
+        'efficiency': thrust_n * velocity_m_s / power_req,
+        'mach_tip': (np.sqrt((math.pi * rpm / 60.0 * d) ** 2 + velocity_m_s ** 2)
+                     / get_param('environment.arcadia_planitia.speed_of_sound_m_s')),
+    }
+
+
+def _design_thrusts(mtow_kg: float = None) -> Dict[str, float]:
+    """Per-propeller thrust required in hover and cruise (default: baseline MTOW)."""
+    from ..section5.fixed_wing import maximum_ld
+
+    if mtow_kg is None:
+        mtow_kg = get_mtow()
+    weight_n = mtow_kg * get_mars_gravity()
+    ld_max, _ = maximum_ld()
+    ld_cruise = ld_max * get_param('aerodynamic.quadplane.ld_penalty_factor')
+    return {
+        'hover_thrust_n': weight_n / get_param('geometry.propulsion_config.lift.n_motors'),
+        'cruise_thrust_n': (weight_n / ld_cruise
+                            / get_param('geometry.propulsion_config.cruise.n_motors')),
+        'v_cruise_m_s': get_param('mission.velocity.v_cruise_m_s'),
+        'mtow_kg': float(mtow_kg),
+    }
+
+
+def _design_choice(perf: Dict[str, np.ndarray], point: Dict[str, np.ndarray],
+                   metric: str) -> Dict[str, Any]:
+    """Selected propeller if feasible, otherwise the best feasible candidate."""
+    with np.errstate(invalid='ignore'):
+        feasible = (np.isfinite(point[metric])
+                    & (point['mach_tip'] <= get_param('propulsion.bemt.mach_tip_limit')))
+    selected = int(perf['selected_index'])
+    if feasible[selected]:
+        index = selected
+    elif feasible.any():
+        index = int(np.nanargmax(np.where(feasible, point[metric], np.nan)))
+    else:
+        index = None
+
+    choice = {'index': index, 'feasible': feasible,
+              'selected_feasible': bool(feasible[selected]), 'n_feasible': int(feasible.sum())}
+    if index is not None:
+        choice.update({
+            'diameter_in': float(perf['diameter_in'][index]),
+            'pitch_in': float(perf['pitch_in'][index]),
+            'n_blades': int(perf['n_blades'][index]),
+            'rpm': float(point['rpm'][index]),
+            'power_w': float(point['power_w'][index]),
+            metric: float(point[metric][index]),
+            'mach_tip': float(point['mach_tip'][index]),
+        })
+    return choice
+
+
+def design_propellers(mtow_kg: float = None) -> Dict[str, Any]:
+    """
+    Design choice of lift and cruise propellers, with their operating points.
+
+    The choice is the selected propeller (propulsion.components) when it
+    reaches the design thrust within the tip Mach limit, otherwise the mapped
+    candidate with the highest FM (lift) or efficiency (cruise). It is
+    reported only: sizing operates the selected propellers
+    (operating_efficiencies) and stops if they are infeasible.
+
+    Parameters
+    ----------
+    mtow_kg : float, optional
+        MTOW setting the design thrusts (default: baseline MTOW)
+
+    Returns
+    -------
+    dict
+        'thrusts', 'lift' and 'cruise' design choices
+    """
+    thrusts = _design_thrusts(mtow_kg)
+    lift = performance_map('lift')
+    cruise = performance_map('cruise')
+    hover = operating_point(lift, thrusts['hover_thrust_n'])
+    forward = operating_point(cruise, thrusts['cruise_thrust_n'], thrusts['v_cruise_m_s'])
+    return {
+        'thrusts': thrusts,
+        'lift': _design_choice(lift, hover, 'figure_of_merit'),
+        'cruise': _design_choice(cruise, forward, 'efficiency'),
+        'hover_points': hover,
+        'cruise_points': forward,
+    }
+
+
+def sizing_propellers() -> Dict[str, Any]:
+    """
+    Maps of the selected lift and cruise propellers, fixed per config state.
+
+    Sizing always operates the selected propellers (propulsion.components),
+    whose masses are the ones carried by Section 7; a larger mapped
+    candidate is only reported (design_propellers), never substituted.
+
+    Returns
+    -------
+    dict
+        'lift' and 'cruise' geometries (diameter_in, pitch_in, n_blades) and
+        'lift_rotor_map' / 'cruise_rotor_map' (maps of those geometries only,
+        for fast operating points)
+    """
+    state = _state_key()
+    if state in _designs:
+        return _designs[state]
+
+    design = {}
+    for kind in ('lift', 'cruise'):
+        perf = performance_map(kind)
+        g = int(perf['selected_index'])
+        design[kind] = {
+            'diameter_in': float(perf['diameter_in'][g]),
+            'pitch_in': float(perf['pitch_in'][g]),
+            'n_blades': int(perf['n_blades'][g]),
+        }
+        design[f'{kind}_rotor_map'] = {
+            'rpm': perf['rpm'],
+            'velocity_m_s': perf['velocity_m_s'],
+            'diameter_in': perf['diameter_in'][g:g + 1],
+            'thrust_n': perf['thrust_n'][g:g + 1],
+            'power_w': perf['power_w'][g:g + 1],
+        }
+    _designs[state] = design
+    return design
+
+
+def _infeasible_selection(kind: str, phase: str, mtow_kg: float) -> ValueError:
+    """Error for a selected propeller that cannot reach the thrust at mtow_kg."""
+    selected = get_param(f'propulsion.components.{kind}.propeller.model')
+    best = design_propellers(mtow_kg)[kind]
+    if best['index'] is None:
+        hint = 'no mapped candidate reaches it either'
+    else:
+        hint = (f"best mapped candidate {best['diameter_in']:.0f}x{best['pitch_in']:.0f} in, "
+                f"{best['n_blades']} blades")
+    return ValueError(
+        f"BEMT: selected {kind} propeller {selected} cannot reach {phase} thrust at MTOW "
+        f"{mtow_kg:.3f} kg within M_tip <= {get_param('propulsion.bemt.mach_tip_limit')} "
+        f"({hint}); select a sourced propeller that does in propulsion.components"
+    )
+
+
+def operating_efficiencies(mtow_kg: float = None) -> Dict[str, float]:
+    """
+    BEMT figure of merit, propeller efficiency and lift-rotor disk loading.
+
+    Used by config.get_propulsion_efficiencies() and config.get_disk_loading()
+    when propulsion.bemt.use_in_sizing is true. The selected propellers
+    (sizing_propellers) are operated at the thrusts of mtow_kg, and the disk
+    loading is that of the lift propeller, so hover power matches the rotor
+    the FM was evaluated on. Results are memoized per config state and MTOW.
+
+    Parameters
+    ----------
+    mtow_kg : float, optional
+        MTOW setting the operating thrusts (default: baseline MTOW)
+
+    Returns
+    -------
+    dict
+        'figure_of_merit', 'eta_prop' and 'disk_loading_N_m2'
+
+    Raises
+    ------
+    ValueError
+        If a selected propeller cannot reach its thrust at mtow_kg within
+        propulsion.bemt.mach_tip_limit
+    """
+    if mtow_kg is None:
+        mtow_kg = get_mtow()
+    key = (_state_key(), float(mtow_kg))
+    if key in _efficiencies:
+        return dict(_efficiencies[key])
+
+    design = sizing_propellers()
+    thrusts = _design_thrusts(mtow_kg)
+    hover = operating_point(design['lift_rotor_map'], thrusts['hover_thrust_n'])
+    forward = operating_point(design['cruise_rotor_map'], thrusts['cruise_thrust_n'],
+                              thrusts['v_cruise_m_s'])
+    mach_limit = get_param('propulsion.bemt.mach_tip_limit')
+    for kind, phase, point in (('lift', 'hover', hover), ('cruise', 'cruise', forward)):
+        if not (np.isfinite(point['power_w'][0]) and point['mach_tip'][0] <= mach_limit):
+            raise _infeasible_selection(kind, phase, float(mtow_kg))
+    figure_of_merit = float(hover['figure_of_merit'][0])
+    eta_prop = float(forward['efficiency'][0])
+
+    disk_area = math.pi * (design['lift']['diameter_in'] * INCH_TO_M) ** 2 / 4.0
+    if len(_efficiencies) >= _MAX_MEMO:
+        _efficiencies.clear()
+    _efficiencies[key] = {
+        'figure_of_merit': figure_of_merit,
+        'eta_prop': eta_prop,
+        'disk_loading_N_m2': thrusts['hover_thrust_n'] / disk_area,
+    }
+    return dict(_efficiencies[key])
+
+
+# =============================================================================
+# COMPLETE ANALYSIS
+# =============================================================================
+
+@traced('bemt')
+def bemt_analysis() -> Dict[str, Any]:
+    """
+    BEMT performance of all candidate propellers at the design points.
+
+    Returns
+    -------
+    dict
+        Maps, per-candidate operating points and the design choices
+    """
+    results = design_propellers()
+    results.update({
+        'lift_map': performance_map('lift'),
+        'cruise_map': performance_map('cruise'),
+        'constant_figure_of_merit': get_param('propulsion.rotor.figure_of_merit'),
+        'constant_eta_prop': get_param('propulsion.electromechanical.eta_prop'),
+        'use_in_sizing': bool(get_param('propulsion.bemt.use_in_sizing', False)),
+    })
+    return results
+
+
+def print_analysis(results: Dict[str, Any] = None, top: int = 8) -> None:
+    """Print formatted BEMT propeller results."""
+    if results is None:
+        results = bemt_analysis()
+
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    thrusts = results['thrusts']
+    mach_limit = get_param('propulsion.bemt.mach_tip_limit')
+
+    print("=" * 80)
+    print("BEMT PROPELLER PERFORMANCE (Section 6.3)")
+    print("=" * 80)
+    print(f"Computed: {timestamp}")
+    print(f"Config:   All values loaded from config/ YAML files")
+    print(f"Airfoil:  {get_param('propulsion.bemt.airfoil')} (airfoil_data.yaml)")
+    print()
+
+    sections = (
+        ('LIFT PROPELLERS (Hover)', 'lift', 'lift_map', 'hover_points', 'figure_of_merit', 'FM',
+         f"{thrusts['hover_thrust_n']:.2f} N per rotor"),
+        ('CRUISE PROPELLERS', 'cruise', 'cruise_map', 'cruise_points', 'efficiency', 'eta',
+         f"{thrusts['cruise_thrust_n']:.2f} N per motor at {thrusts['v_cruise_m_s']:.1f} m/s"),
+    )
+    for title, kind, map_key, point_key, metric, label, requirement in sections:
+        perf, point, choice = results[map_key], results[point_key], results[kind]
+        selected = int(perf['selected_index'])
+        print(title)
+        print("-" * 50)
+        print(f"  Required thrust:       {requirement}")
+        print(f"  Feasible candidates:   {choice['n_feasible']} of {len(perf['diameter_in'])} "
+              f"(M_tip <= {mach_limit})")
+        print(f"  {'D [in]':>8} {'P [in]':>8} {'B':>3} {'RPM':>8} {'Power [W]':>10} "
+              f"{label:>7} {'M_tip':>7}")
+        # Feasible candidates first, then by FM / efficiency
+        ranked = [int(g) for g in np.lexsort((-np.nan_to_num(point[metric], nan=-1.0),
+                                              ~choice['feasible']))]
+        shown = ranked[:top] + ([selected] if selected not in ranked[:top] else [])
+        for g in shown:
+            marker = ''
+            if g == selected:
+                marker = '  <- selected'
+            elif g == choice['index']:
+                marker = '  <- design'
+            print(f"  {perf['diameter_in'][g]:>8.1f} {perf['pitch_in'][g]:>8.1f} "
+                  f"{perf['n_blades'][g]:>3d} {point['rpm'][g]:>8.0f} "
+                  f"{point['power_w'][g]:>10.2f} {point[metric][g]:>7.3f} "
+                  f"{point['mach_tip'][g]:>7.3f}{marker}")
+        if choice['index'] is None:
+            print("  [FAIL] No mapped candidate reaches the design thrust "
+                  "within the tip Mach limit")
+        elif not choice['selected_feasible']:
+            print("  [WARN] Selected propeller cannot reach the design thrust "
+                  "within the tip Mach limit (BEMT sizing stops)")
+        print()
+
+    print("COMPARISON WITH CONSTANT EFFICIENCIES (§4.5)")
+    print("-" * 50)
+    fm = results['lift'].get('figure_of_merit', math.nan)
+    eta = results['cruise'].get('efficiency', math.nan)
+    print(f"  Figure of merit:       BEMT {fm:.3f}   constant "
+          f"{results['constant_figure_of_merit']:.3f}")
+    print(f"  Propeller efficiency:  BEMT {eta:.3f}   constant "
+          f"{results['constant_eta_prop']:.3f}")
+    print(f"  Used in sizing:        {'BEMT' if results['use_in_sizing'] else 'constant'} "
+          f"(propulsion.bemt.use_in_sizing)")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    print_analysis()
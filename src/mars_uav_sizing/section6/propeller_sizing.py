@@ -36,6 +36,7 @@ from ..config import (
     get_propulsion_efficiencies,
     get_mission_params,
 )
+from ..instrumentation import traced
 
 
 # =============================================================================
@@ -241,6 +242,7 @@ def cruise_propeller_sizing() -> Dict[str, Any]:
 # COMPLETE PROPELLER ANALYSIS
 # =============================================================================
 
+@traced('propeller')
 def propeller_sizing_analysis() -> Dict[str, Any]:
     """
     Complete propeller sizing analysis for both lift and cruise systems.
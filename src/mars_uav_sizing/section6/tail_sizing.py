@@ -17,18 +17,24 @@ Key equations:
     @eq:vtail-span      - V-tail span from aspect ratio
     @eq:vtail-dihedral  - Dihedral angle for combined function
 
+vtail_sizing_batch() and vtail_sweep() size a batch of designs at once and
+return structure-of-arrays results with the active-constraint mask, for
+parameter sweeps and plotting.
+
 Reference:
     - Roskam (2004), Airplane Design Part II, Chapter 8
     - Manuscript: sections_en/06_03_geometry-selection-sec-geometry-selection.md
 
-Last Updated: 2026-01-01
+Last Updated: 2026-10-19
 """
 
-import math
 from typing import Dict, Any
 from datetime import datetime
 
+import numpy as np
+
 from ..config import get_param
+from ..instrumentation import traced
 
 
 def get_wing_geometry() -> Dict[str, float]:
@@ -75,86 +81,89 @@ def get_fuselage_geometry() -> Dict[str, float]:
     }
 
 
-def vtail_sizing() -> Dict[str, Any]:
-    """
-    Size V-tail surfaces using volume coefficient method.
+# =============================================================================
+# BATCH SIZING
+# =============================================================================
 
-    For an inverted V-tail configuration:
-    - Horizontal component provides pitch control
-    - Vertical component (from dihedral) provides yaw control
-    - Combined surfaces use ruddervator mixing
+# Tail inputs and their configuration defaults
+TAIL_INPUTS = {
+    'v_h': 'geometry.tail.v_h',
+    'v_v': 'geometry.tail.v_v',
+    'dihedral_deg': 'geometry.tail.vtail_dihedral_deg',
+    'aspect_ratio': 'geometry.tail.vtail_aspect_ratio',
+    'moment_arm_ratio': 'geometry.tail.moment_arm_ratio',
+}
 
-    Implements @eq:vtail-area:
+
+def vtail_sizing_batch(
+    wing_area_m2,
+    wingspan_m,
+    mac_m,
+    fuselage_length_m,
+    **tail: Any,
+) -> Dict[str, np.ndarray]:
+    """
+    Size the V-tail for a batch of wing/fuselage geometries.
+
+    Implements @eq:vtail-area elementwise:
         S_H = V_H × S × MAC / l_H
         S_V = V_V × S × b / l_V
-        S_V-tail = sqrt(S_H^2 + S_V^2) / (2 × cos(Gamma))
+        S_V-tail = max(S_H / cos²(Gamma), S_V / sin²(Gamma))
+
+    Parameters
+    ----------
+    wing_area_m2, wingspan_m, mac_m, fuselage_length_m : float or np.ndarray
+        Wing and fuselage reference geometry
+    **tail : float or np.ndarray
+        Any of TAIL_INPUTS; omitted inputs are read from config once
 
     Returns
     -------
     dict
-        V-tail sizing results
+        Structure-of-arrays with the keys of vtail_sizing() (except
+        'active_constraint'), plus 'pitch_limited': True where the
+        horizontal (pitch) requirement sizes the tail, False where the
+        vertical (yaw) one does
     """
-    # Wing geometry
-    wing = get_wing_geometry()
-    S_wing = wing['wing_area_m2']
-    b_wing = wing['wingspan_m']
-    mac = wing['chord_m']
-
-    # Fuselage geometry
-    fus = get_fuselage_geometry()
-    L_fus = fus['length_m']
-
-    # Tail parameters from configuration
-    V_H = get_param('geometry.tail.v_h')
-    V_V = get_param('geometry.tail.v_v')
-    gamma_deg = get_param('geometry.tail.vtail_dihedral_deg')
-    AR_tail = get_param('geometry.tail.vtail_aspect_ratio')
-    arm_ratio = get_param('geometry.tail.moment_arm_ratio')
+    unknown = set(tail) - set(TAIL_INPUTS)
+    if unknown:
+        raise ValueError(f"Unknown tail inputs: {sorted(unknown)}")
+
+    values = [wing_area_m2, wingspan_m, mac_m, fuselage_length_m] + [
+        tail[name] if tail.get(name) is not None else get_param(path)
+        for name, path in TAIL_INPUTS.items()
+    ]
+    (S_wing, b_wing, mac, L_fus, V_H, V_V, gamma_deg, AR_tail, arm_ratio) = (
+        np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in values])
+    )
 
     # Moment arms (from tail to wing AC)
     # Assumed equal for horizontal and vertical
     l_tail = arm_ratio * L_fus
 
-    # Required horizontal tail area
+    # Required horizontal and vertical tail areas
     S_H_required = (V_H * S_wing * mac) / l_tail
-
-    # Required vertical tail area
     S_V_required = (V_V * S_wing * b_wing) / l_tail
 
-    # V-tail dihedral
-    gamma_rad = math.radians(gamma_deg)
-    cos_gamma = math.cos(gamma_rad)
-    sin_gamma = math.sin(gamma_rad)
-
     # V-tail effective areas
     # S_H_eff = S_Vtail × cos^2(Gamma)
     # S_V_eff = S_Vtail × sin^2(Gamma)
     # Solve for S_Vtail from both constraints, take max
-    S_vtail_from_H = S_H_required / (cos_gamma ** 2)
-    S_vtail_from_V = S_V_required / (sin_gamma ** 2)
-    S_vtail_total = max(S_vtail_from_H, S_vtail_from_V)
-
-    # Per-surface area (2 surfaces)
-    S_vtail_per_surface = S_vtail_total / 2
+    gamma_rad = np.radians(gamma_deg)
+    cos2_gamma = np.cos(gamma_rad) ** 2
+    sin2_gamma = np.sin(gamma_rad) ** 2
+    S_vtail_from_H = S_H_required / cos2_gamma
+    S_vtail_from_V = S_V_required / sin2_gamma
+    pitch_limited = S_vtail_from_H >= S_vtail_from_V
+    S_vtail_total = np.where(pitch_limited, S_vtail_from_H, S_vtail_from_V)
 
     # V-tail geometry from aspect ratio
-    b_vtail = math.sqrt(AR_tail * S_vtail_total)  # Total projected span
-    b_vtail_per_surface = b_vtail / 2  # Per surface (from centerline)
+    b_vtail = np.sqrt(AR_tail * S_vtail_total)  # Total projected span
     c_vtail = S_vtail_total / b_vtail  # Mean chord
 
     # Actual effective areas achieved
-    S_H_actual = S_vtail_total * (cos_gamma ** 2)
-    S_V_actual = S_vtail_total * (sin_gamma ** 2)
-
-    # Verification
-    V_H_actual = (S_H_actual * l_tail) / (S_wing * mac)
-    V_V_actual = (S_V_actual * l_tail) / (S_wing * b_wing)
-
-    # Check which constraint is active
-    if S_vtail_from_H >= S_vtail_from_V:
-        active_constraint = 'horizontal (pitch)'
-    else:
-        active_constraint = 'vertical (yaw)'
+    S_H_actual = S_vtail_total * cos2_gamma
+    S_V_actual = S_vtail_total * sin2_gamma
 
     return {
         # Wing reference
@@ -181,9 +190,9 @@ def vtail_sizing() -> Dict[str, Any]:
 
         # V-tail sizing
         'S_vtail_total_m2': S_vtail_total,
-        'S_vtail_per_surface_m2': S_vtail_per_surface,
+        'S_vtail_per_surface_m2': S_vtail_total / 2,
         'b_vtail_m': b_vtail,
-        'b_vtail_per_surface_m': b_vtail_per_surface,
+        'b_vtail_per_surface_m': b_vtail / 2,
         'c_vtail_m': c_vtail,
 
         # Actual effective areas
@@ -191,12 +200,104 @@ def vtail_sizing() -> Dict[str, Any]:
         'S_V_actual_m2': S_V_actual,
 
         # Verification
-        'V_H_actual': V_H_actual,
-        'V_V_actual': V_V_actual,
-        'active_constraint': active_constraint,
+        'V_H_actual': (S_H_actual * l_tail) / (S_wing * mac),
+        'V_V_actual': (S_V_actual * l_tail) / (S_wing * b_wing),
+        'pitch_limited': pitch_limited,
     }
 
 
+def vtail_sweep(
+    wing_loading=None,
+    wing_aspect_ratio=None,
+    mtow_kg=None,
+    length_to_span=None,
+    **tail: Any,
+) -> Dict[str, np.ndarray]:
+    """
+    Size the V-tail over a sweep of wing and tail parameters.
+
+    Wing geometry follows the matching chart (S = W / (W/S),
+    b = sqrt(AR × S)) and the fuselage length the Section 6 length/span
+    ratio, so every input may be an array.
+
+    Parameters
+    ----------
+    wing_loading : float or np.ndarray, optional
+        W/S in N/m² (default: matching chart design point)
+    wing_aspect_ratio : float or np.ndarray, optional
+        Wing aspect ratio (default: from config)
+    mtow_kg : float or np.ndarray, optional
+        MTOW in kg (default: from config)
+    length_to_span : float or np.ndarray, optional
+        Fuselage length/span ratio (default: design.fuselage)
+    **tail : float or np.ndarray
+        Any of TAIL_INPUTS (moment_arm_ratio, dihedral_deg, ...)
+
+    Returns
+    -------
+    dict
+        Structure-of-arrays from vtail_sizing_batch()
+    """
+    if wing_loading is None:
+        from ..section5.matching_chart import find_design_point
+        wing_loading = find_design_point()['wing_loading']
+    if wing_aspect_ratio is None:
+        wing_aspect_ratio = get_param('aerodynamic.wing.aspect_ratio')
+    if mtow_kg is None:
+        mtow_kg = get_param('mission.mass.mtow_kg')
+    if length_to_span is None:
+        length_to_span = get_param('design.fuselage.length_to_span_ratio')
+
+    weight_n = np.asarray(mtow_kg, dtype=float) * get_param('physical.mars.g')
+    wing_area = weight_n / np.asarray(wing_loading, dtype=float)
+    wingspan = np.sqrt(np.asarray(wing_aspect_ratio, dtype=float) * wing_area)
+    mac = wing_area / wingspan
+    fuselage_length = np.asarray(length_to_span, dtype=float) * wingspan
+
+    return vtail_sizing_batch(wing_area, wingspan, mac, fuselage_length, **tail)
+
+
+@traced('tail')
+def vtail_sizing() -> Dict[str, Any]:
+    """
+    Size V-tail surfaces using volume coefficient method.
+
+    For an inverted V-tail configuration:
+    - Horizontal component provides pitch control
+    - Vertical component (from dihedral) provides yaw control
+    - Combined surfaces use ruddervator mixing
+
+    Implements @eq:vtail-area:
+        S_H = V_H × S × MAC / l_H
+        S_V = V_V × S × b / l_V
+        S_V-tail = sqrt(S_H^2 + S_V^2) / (2 × cos(Gamma))
+
+    Returns
+    -------
+    dict
+        V-tail sizing results
+    """
+    wing = get_wing_geometry()
+    fus = get_fuselage_geometry()
+
+    batch = vtail_sizing_batch(
+        wing['wing_area_m2'],
+        wing['wingspan_m'],
+        wing['chord_m'],
+        fus['length_m'],
+    )
+    results = {key: value.item() for key, value in batch.items()}
+    pitch_limited = results.pop('pitch_limited')
+
+    # Check which constraint is active
+    if pitch_limited:
+        results['active_constraint'] = 'horizontal (pitch)'
+    else:
+        results['active_constraint'] = 'vertical (yaw)'
+
+    return results
+
+
 def print_analysis(results: Dict[str, Any] = None) -> None:
     """Print formatted tail sizing results."""
     if results is None:
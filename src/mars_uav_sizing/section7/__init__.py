@@ -7,16 +7,22 @@ Section 7 (Component Selection and Verification).
 
 Modules:
     - component_selection: Component trade-off and selection (§7.1-7.4)
+    - catalog_selection: Catalog-based branch-and-bound selection (§7)
     - mass_breakdown: Propulsion mass breakdown calculator (§7.2)
+    - mass_closure: Component-based MTOW closure (§7)
     - verification: Requirements compliance check (§7.5)
 
 All modules load parameters from config/ YAML files - no hardcoded values.
 """
 
+from . import catalog_selection
 from . import component_selection
 from . import mass_breakdown
+from . import mass_closure
 
 __all__ = [
+    'catalog_selection',
     'component_selection',
     'mass_breakdown',
+    'mass_closure',
 ]
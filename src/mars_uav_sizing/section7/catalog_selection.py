@@ -0,0 +1,723 @@
+#!/usr/bin/env python3
+"""
+Catalog Component Selection Module
+==================================
+
+Selects lift and cruise propulsion components and the battery pack from
+part catalogs (config/catalogs/*.csv) by enumerating compatible
+motor / ESC / propeller / battery-cell combinations and ranking them by
+system mass at the required hover and cruise power (Section 5).
+
+Catalogs are loaded into columnar numpy arrays. For every bus voltage
+option (series cell count S × cell nominal voltage) the engine:
+    1. Filters each catalog with vectorized checks:
+         - cell count within the motor and ESC ratings
+         - motor max power >= margin × required electrical power
+         - ESC (and motor, if rated) current >= margin × P / V_bus
+         - propeller tip Mach at the required speed, and (hover) shaft power
+           at that speed within the available shaft power
+    2. Matches motors to propellers as a vectorized pair matrix:
+         - propeller diameter within the motor's recommended range
+         - KV matching: KV × V_bus × k_load >= n_req and <= headroom × n_req
+       Lift propellers without static coefficients (ct0/cp0) cannot be
+       checked; they are excluded unless selection.allow_unverified is true,
+       in which case combinations using them are flagged as unverified.
+    3. Sizes the battery pack from the catalog cell:
+         P = max(ceil(E_pack / (S × V_cell × C_Ah)), ceil(I_peak / (C_rate × C_Ah)))
+    4. Runs a branch-and-bound search over
+         (bus, pack, lift motor+prop, lift ESC, cruise motor+prop, cruise ESC),
+       pruning every branch whose mass lower bound exceeds the k-th best.
+
+Required propeller speed:
+    - Hover:  n = sqrt(T / (rho × C_T0 × D^4)), with T = W / n_lift,
+              and C_P0 × rho × n^3 × D^5 <= P_elec × eta_drive
+    - Cruise: n = V / (J × D), with J = f_J × pitch / D
+
+Reference: Manuscript Section 7 - Component Selection and Verification
+Last Updated: 2026-10-19
+"""
+
+import csv
+import heapq
+import math
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from ..config import (
+    get_battery_params,
+    get_density,
+    get_mars_gravity,
+    get_param,
+    get_propulsion_efficiencies,
+)
+from ..instrumentation import traced
+
+
+# =============================================================================
+# CATALOG SCHEMA
+# =============================================================================
+
+# Default catalog location
+CATALOG_DIR = Path(__file__).resolve().parent.parent / 'config' / 'catalogs'
+
+CATALOG_FILES: Dict[str, str] = {
+    'motors': 'motors.csv',
+    'escs': 'escs.csv',
+    'propellers': 'propellers.csv',
+    'battery_cells': 'battery_cells.csv',
+}
+
+# Column name -> type (str columns are kept as string arrays, others as float)
+CATALOG_COLUMNS: Dict[str, Dict[str, type]] = {
+    'motors': {
+        'manufacturer': str, 'model': str, 'role': str, 'mass_g': float,
+        'max_power_w': float, 'kv': float, 'cells_min': float, 'cells_max': float,
+        'prop_min_in': float, 'prop_max_in': float, 'max_current_a': float,
+        'thrust_g': float, 'source_key': str,
+    },
+    'escs': {
+        'manufacturer': str, 'model': str, 'role': str, 'mass_g': float,
+        'continuous_a': float, 'burst_a': float, 'cells_min': float, 'cells_max': float,
+        'has_bec': float, 'source_key': str,
+    },
+    'propellers': {
+        'manufacturer': str, 'model': str, 'role': str, 'diameter_in': float,
+        'pitch_in': float, 'n_blades': float, 'mass_g': float, 'ct0': float,
+        'cp0': float, 'source_key': str,
+    },
+    'battery_cells': {
+        'manufacturer': str, 'model': str, 'chemistry': str, 'nominal_v': float,
+        'capacity_ah': float, 'mass_g': float, 'max_discharge_c': float,
+        'source_key': str,
+    },
+}
+
+INCH_TO_M = 0.0254
+
+# Search levels below the bus voltage, in branching order
+LEVELS: Tuple[str, ...] = ('pack', 'lift_pair', 'lift_esc', 'cruise_pair', 'cruise_esc')
+
+
+# =============================================================================
+# CATALOG LOADING
+# =============================================================================
+
+def load_catalog(name: str, path: Path = None) -> Dict[str, np.ndarray]:
+    """
+    Load one catalog CSV into columnar arrays.
+
+    Lines starting with '#' are comments. Empty numeric fields become NaN.
+
+    Parameters
+    ----------
+    name : str
+        Catalog name from CATALOG_FILES
+    path : Path, optional
+        CSV file (default: CATALOG_DIR / CATALOG_FILES[name])
+
+    Returns
+    -------
+    dict
+        Column name -> np.ndarray (str or float64)
+    """
+    if name not in CATALOG_COLUMNS:
+        raise ValueError(f"Unknown catalog: {name!r} (available: {sorted(CATALOG_COLUMNS)})")
+    if path is None:
+        path = CATALOG_DIR / CATALOG_FILES[name]
+
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(line for line in f if not line.startswith('#')))
+
+    columns = CATALOG_COLUMNS[name]
+    missing = set(columns) - set(rows[0] if rows else columns)
+    if missing:
+        raise KeyError(f"Catalog {path} is missing columns: {sorted(missing)}")
+
+    table = {}
+    for column, kind in columns.items():
+        values = [(row[column] or '').strip() for row in rows]
+        if kind is str:
+            table[column] = np.array(values, dtype=str)
+        else:
+            table[column] = np.array([float(v) if v else math.nan for v in values])
+    return table
+
+
+def load_catalogs(directory: Path = None) -> Dict[str, Dict[str, np.ndarray]]:
+    """Load all catalogs from a directory (default: CATALOG_DIR)."""
+    directory = CATALOG_DIR if directory is None else Path(directory)
+    return {name: load_catalog(name, directory / filename)
+            for name, filename in CATALOG_FILES.items()}
+
+
+def synthetic_catalogs(
+    n_motors: int = 3000,
+    n_escs: int = 1000,
+    n_propellers: int = 3000,
+    n_cells: int = 300,
+    seed: int = 0,
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Generate random catalogs with plausible part ranges (for benchmarking).
+
+    Parameters
+    ----------
+    n_motors, n_escs, n_propellers, n_cells : int
+        Number of parts per catalog
+    seed : int
+        Random seed
+
+    Returns
+    -------
+    dict
+        Catalogs in the same layout as load_catalogs()
+    """
+    rng = np.random.default_rng(seed)
+    roles = np.array(['lift', 'cruise', 'any'])
+
+    def names(prefix, n):
+        return np.array([f"{prefix}-{i:05d}" for i in range(n)])
+
+    motor_mass = rng.uniform(20, 500, n_motors)
+    motor_cells_min = rng.integers(2, 9, n_motors).astype(float)
+    motor_prop_min = rng.uniform(8, 36, n_motors).round()
+    motors = {
+        'manufacturer': np.full(n_motors, 'Synthetic'), 'model': names('M', n_motors),
+        'role': rng.choice(roles, n_motors), 'mass_g': motor_mass,
+        'max_power_w': motor_mass * rng.uniform(3, 9, n_motors),
+        'kv': rng.uniform(100, 2500, n_motors).round(),
+        'cells_min': motor_cells_min,
+        'cells_max': motor_cells_min + rng.integers(0, 7, n_motors),
+        'prop_min_in': motor_prop_min,
+        'prop_max_in': motor_prop_min + rng.integers(1, 6, n_motors),
+        'max_current_a': np.full(n_motors, math.nan),
+        'thrust_g': np.full(n_motors, math.nan),
+        'source_key': np.full(n_motors, ''),
+    }
+
+    esc_current = rng.uniform(10, 120, n_escs).round()
+    esc_cells_min = rng.integers(2, 7, n_escs).astype(float)
+    escs = {
+        'manufacturer': np.full(n_escs, 'Synthetic'), 'model': names('E', n_escs),
+        'role': np.full(n_escs, 'any'), 'mass_g': esc_current * rng.uniform(0.2, 1.2, n_escs),
+        'continuous_a': esc_current, 'burst_a': esc_current * 1.3,
+        'cells_min': esc_cells_min, 'cells_max': esc_cells_min + rng.integers(0, 9, n_escs),
+        'has_bec': rng.integers(0, 2, n_escs).astype(float),
+        'source_key': np.full(n_escs, ''),
+    }
+
+    # Up to large, high-solidity rotors (Mars hover needs low C_T / high C_P)
+    diameter = rng.uniform(8, 40, n_propellers).round()
+    propellers = {
+        'manufacturer': np.full(n_propellers, 'Synthetic'), 'model': names('P', n_propellers),
+        'role': rng.choice(roles, n_propellers), 'diameter_in': diameter,
+        'pitch_in': (diameter * rng.uniform(0.3, 1.2, n_propellers)).round(1),
+        'n_blades': rng.integers(2, 5, n_propellers).astype(float),
+        'mass_g': 0.04 * diameter ** 2 * rng.uniform(0.6, 1.5, n_propellers),
+        'ct0': rng.uniform(0.04, 0.14, n_propellers),
+        'cp0': rng.uniform(0.02, 0.25, n_propellers),
+        'source_key': np.full(n_propellers, ''),
+    }
+
+    capacity = rng.uniform(1, 30, n_cells)
+    nominal_v = rng.choice([3.6, 3.7, 3.85], n_cells)
+    cells = {
+        'manufacturer': np.full(n_cells, 'Synthetic'), 'model': names('C', n_cells),
+        'chemistry': np.full(n_cells, 'Li-ion'), 'nominal_v': nominal_v,
+        'capacity_ah': capacity,
+        'mass_g': 1000.0 * capacity * nominal_v / rng.uniform(150, 320, n_cells),
+        'max_discharge_c': rng.uniform(1, 20, n_cells),
+        'source_key': np.full(n_cells, ''),
+    }
+    return {'motors': motors, 'escs': escs, 'propellers': propellers, 'battery_cells': cells}
+
+
+# =============================================================================
+# REQUIREMENTS
+# =============================================================================
+
+def selection_requirements() -> Dict[str, float]:
+    """
+    Power, energy and speed requirements from the Section 5 analysis.
+
+    Returns
+    -------
+    dict
+        Per-motor electrical power, motor counts, hover thrust per lift
+        propeller, pack energy, peak bus power and cruise speed
+    """
+    from ..section5 import hybrid_vtol
+    from .component_selection import get_mass_budget, get_power_requirements
+
+    power = get_power_requirements()
+    budget = hybrid_vtol.energy_budget()
+    mass = get_mass_budget()
+    batt = get_battery_params()
+    prop = get_propulsion_efficiencies()
+
+    return {
+        'lift_power_w': power['per_lift_motor_w'],
+        'cruise_power_w': power['per_cruise_motor_w'],
+        'n_lift': int(power['n_lift_motors']),
+        'n_cruise': int(power['n_cruise_motors']),
+        'lift_thrust_n': mass['mtow_kg'] * get_mars_gravity() / power['n_lift_motors'],
+        # Nameplate energy so that usable energy covers the mission
+        'pack_energy_wh': budget['required_wh'] / (batt['dod'] * batt['eta_discharge']),
+        # Transition: lift and cruise motors at full power together
+        'peak_power_w': power['hover_total_w'] + power['cruise_total_w'],
+        'eta_drive': prop['eta_motor'] * prop['eta_esc'],
+        'v_cruise_m_s': get_param('mission.velocity.v_cruise_m_s'),
+        'rho': get_density(),
+        'speed_of_sound': get_param('environment.arcadia_planitia.speed_of_sound_m_s'),
+    }
+
+
+# =============================================================================
+# VECTORIZED FILTERING
+# =============================================================================
+
+def _role_mask(table: Dict[str, np.ndarray], role: str) -> np.ndarray:
+    return (table['role'] == role) | (table['role'] == 'any')
+
+
+def _within(value: float, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    return (lo <= value) & (value <= hi)
+
+
+def _required_rpm(props: Dict[str, np.ndarray], role: str, req: Dict[str, float],
+                  rules: Dict[str, Any]) -> np.ndarray:
+    """Propeller speed at the design point (NaN where coefficients are unknown)."""
+    d = props['diameter_in'] * INCH_TO_M
+    if role == 'lift':
+        with np.errstate(invalid='ignore', divide='ignore'):
+            n = np.sqrt(req['lift_thrust_n'] / (req['rho'] * props['ct0'] * d ** 4))
+    else:
+        j = rules['cruise_advance_ratio_fraction'] * props['pitch_in'] / props['diameter_in']
+        n = req['v_cruise_m_s'] / (j * d)
+    return 60.0 * n
+
+
+def _prop_checks(props: Dict[str, np.ndarray], role: str, req: Dict[str, float],
+                 rules: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Required speed, feasibility and verification of every propeller for one role.
+
+    Returns (rpm [NaN if unverified], feasible mask, verified mask). Unverified
+    propellers are feasible only when selection.allow_unverified is true.
+    """
+    rpm = _required_rpm(props, role, req, rules)
+    verified = np.isfinite(rpm)
+    if role == 'lift':
+        verified &= np.isfinite(props['cp0'])
+    with np.errstate(invalid='ignore'):
+        ok = verified & (_prop_tip_mach(props, rpm, role, req) <= rules['mach_tip_limit'])
+        if role == 'lift':
+            d = props['diameter_in'] * INCH_TO_M
+            p_shaft = props['cp0'] * req['rho'] * (rpm / 60.0) ** 3 * d ** 5
+            ok &= p_shaft <= req['lift_power_w'] * req['eta_drive']
+    if rules.get('allow_unverified', False):
+        ok |= ~verified
+    return rpm, _role_mask(props, role) & ok, verified
+
+
+def _prop_tip_mach(props: Dict[str, np.ndarray], rpm: np.ndarray, role: str,
+                   req: Dict[str, float]) -> np.ndarray:
+    v = req['v_cruise_m_s'] if role == 'cruise' else 0.0
+    tip = math.pi * rpm / 60.0 * props['diameter_in'] * INCH_TO_M
+    return np.sqrt(tip ** 2 + v ** 2) / req['speed_of_sound']
+
+
+def _role_filters(catalogs: Dict[str, Dict[str, np.ndarray]], role: str, series: int,
+                  v_bus: float, req: Dict[str, float], rules: Dict[str, Any],
+                  prop_rpm: np.ndarray, prop_ok: np.ndarray) -> Dict[str, np.ndarray]:
+    """1-D feasibility masks of motors and ESCs for one role and bus voltage."""
+    motors, escs = catalogs['motors'], catalogs['escs']
+    power = req[f'{role}_power_w']
+    current = power / v_bus
+
+    with np.errstate(invalid='ignore'):
+        motor_ok = (_role_mask(motors, role)
+                    & _within(series, motors['cells_min'], motors['cells_max'])
+                    & (motors['max_power_w'] >= rules['power_margin'] * power)
+                    & ~(motors['max_current_a'] < rules['current_margin'] * current))
+        esc_ok = (_role_mask(escs, role)
+                  & _within(series, escs['cells_min'], escs['cells_max'])
+                  & (escs['continuous_a'] >= rules['current_margin'] * current))
+    return {'motors': motor_ok, 'escs': esc_ok, 'props': prop_ok, 'prop_rpm': prop_rpm}
+
+
+def _pair_level(catalogs: Dict[str, Dict[str, np.ndarray]], masks: Dict[str, np.ndarray],
+                v_bus: float, n_units: int, rules: Dict[str, Any], limit: float,
+                top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lightest compatible motor-propeller pairs (vectorized pair matrix).
+
+    Returns (mass per role [g], (motor, prop) index array), sorted by mass
+    and truncated to the top_k lightest pairs below ``limit``.
+    """
+    motors, props = catalogs['motors'], catalogs['propellers']
+    m_idx = np.nonzero(masks['motors'])[0]
+    p_idx = np.nonzero(masks['props'])[0]
+    if m_idx.size == 0 or p_idx.size == 0:
+        return np.empty(0), np.empty((0, 2), dtype=int)
+
+    # Bound-prune single parts that cannot fit under the limit in any pair
+    m_mass = motors['mass_g'][m_idx]
+    p_mass = props['mass_g'][p_idx]
+    m_keep = n_units * (m_mass + p_mass.min()) < limit
+    p_keep = n_units * (p_mass + m_mass.min()) < limit
+    m_idx, m_mass = m_idx[m_keep], m_mass[m_keep]
+    p_idx, p_mass = p_idx[p_keep], p_mass[p_keep]
+    if m_idx.size == 0 or p_idx.size == 0:
+        return np.empty(0), np.empty((0, 2), dtype=int)
+
+    diameter = props['diameter_in'][p_idx][None, :]
+    rpm_req = masks['prop_rpm'][p_idx][None, :]
+    rpm_loaded = (motors['kv'][m_idx] * v_bus * rules['kv_load_factor'])[:, None]
+
+    # Unverified propellers (no required speed) only reach this point when
+    # selection.allow_unverified is true; their KV match cannot be checked
+    with np.errstate(invalid='ignore'):
+        ok = ((motors['prop_min_in'][m_idx][:, None] <= diameter)
+              & (diameter <= motors['prop_max_in'][m_idx][:, None])
+              & (np.isnan(rpm_req)
+                 | ((rpm_loaded >= rpm_req) & (rpm_loaded <= rules['kv_headroom'] * rpm_req))))
+    mi, pi = np.nonzero(ok)
+    mass = n_units * (m_mass[mi] + p_mass[pi])
+    below = mass < limit
+    mass, mi, pi = mass[below], mi[below], pi[below]
+    if mass.size > top_k:
+        keep = np.argpartition(mass, top_k - 1)[:top_k]
+        mass, mi, pi = mass[keep], mi[keep], pi[keep]
+    order = np.argsort(mass, kind='stable')
+    return mass[order], np.stack([m_idx[mi[order]], p_idx[pi[order]]], axis=1)
+
+
+def _single_level(table: Dict[str, np.ndarray], mask: np.ndarray, n_units: int,
+                  top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Lightest feasible single parts (mass per role [g], index array)."""
+    idx = np.nonzero(mask)[0]
+    mass = n_units * table['mass_g'][idx]
+    order = np.argsort(mass, kind='stable')[:top_k]
+    return mass[order], idx[order]
+
+
+def _pack_level(cells: Dict[str, np.ndarray], mask: np.ndarray, series: int,
+                req: Dict[str, float], top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Lightest battery packs S×P per cell (mass [g], (cell, parallel) index array)."""
+    idx = np.nonzero(mask)[0]
+    capacity = cells['capacity_ah'][idx]
+    v_bus = series * cells['nominal_v'][idx]
+    n_energy = np.ceil(req['pack_energy_wh'] / (v_bus * capacity))
+    with np.errstate(invalid='ignore'):
+        n_current = np.ceil(req['peak_power_w'] / v_bus / (cells['max_discharge_c'][idx] * capacity))
+    parallel = np.fmax(n_energy, np.nan_to_num(n_current, nan=1.0)).astype(int)
+    mass = series * parallel * cells['mass_g'][idx]
+    order = np.argsort(mass, kind='stable')[:top_k]
+    return mass[order], np.stack([idx[order], parallel[order]], axis=1)
+
+
+# =============================================================================
+# BRANCH-AND-BOUND SEARCH
+# =============================================================================
+
+class _Ranking:
+    """Bounded max-heap of the k lightest combinations found so far."""
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._count = 0
+
+    def limit(self) -> float:
+        """Mass a new combination must beat to enter the ranking."""
+        return -self._heap[0][0] if len(self._heap) >= self.k else math.inf
+
+    def push(self, mass: float, item: Any) -> None:
+        self._count += 1
+        entry = (-mass, -self._count, item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        else:
+            heapq.heappushpop(self._heap, entry)
+
+    def sorted(self) -> List[Tuple[float, Any]]:
+        return [(-m, item) for m, _, item in sorted(self._heap, reverse=True)]
+
+
+def _branch(levels: List[Tuple[np.ndarray, np.ndarray]], rest_min: np.ndarray,
+            ranking: _Ranking, root: Tuple[int, float], level: int, partial: float,
+            chosen: Tuple[int, ...], stats: Dict[str, int]) -> None:
+    masses = levels[level][0]
+    stats['nodes'] += 1
+    for i in range(masses.size):
+        # Children are sorted by mass: once one cannot beat the ranking, none can
+        if partial + masses[i] + rest_min[level + 1] >= ranking.limit():
+            stats['pruned'] += masses.size - i
+            break
+        if level == len(levels) - 1:
+            ranking.push(partial + masses[i], (root, chosen + (i,)))
+        else:
+            _branch(levels, rest_min, ranking, root, level + 1, partial + masses[i],
+                    chosen + (i,), stats)
+
+
+@traced('catalog_selection')
+def select_components(
+    catalogs: Dict[str, Dict[str, np.ndarray]] = None,
+    requirements: Dict[str, float] = None,
+    top_k: int = None,
+) -> Dict[str, Any]:
+    """
+    Rank compatible propulsion/battery combinations by system mass.
+
+    Parameters
+    ----------
+    catalogs : dict, optional
+        Catalogs from load_catalogs() or synthetic_catalogs() (default: config/catalogs)
+    requirements : dict, optional
+        From selection_requirements() (default: baseline Section 5 values)
+    top_k : int, optional
+        Number of combinations to rank (default: propulsion.selection.top_k)
+
+    Returns
+    -------
+    dict
+        'combinations' (lightest first), 'requirements', 'diagnostics' and
+        search 'stats'
+    """
+    t_start = time.perf_counter()
+    rules = get_param('propulsion.selection')
+    catalogs = load_catalogs() if catalogs is None else catalogs
+    req = selection_requirements() if requirements is None else requirements
+    top_k = rules['top_k'] if top_k is None else top_k
+
+    cells = catalogs['battery_cells']
+    props = catalogs['propellers']
+    s_lo, s_hi = rules['series_cells']
+    stats = {'roots': 0, 'roots_infeasible': 0, 'roots_pruned': 0, 'nodes': 0, 'pruned': 0,
+             'pairs_checked': 0}
+    diagnostics = {f'{role}_{kind}': np.zeros(len(catalogs[table]['model']), dtype=bool)
+                   for role in ('lift', 'cruise')
+                   for kind, table in (('motors', 'motors'), ('escs', 'escs'),
+                                       ('props', 'propellers'))}
+
+    # Propeller checks do not depend on the bus voltage
+    prop_checks, verified = {}, {}
+    for role in ('lift', 'cruise'):
+        rpm, prop_ok, verified[role] = _prop_checks(props, role, req, rules)
+        prop_checks[role] = (rpm, prop_ok)
+
+    # Roots: bus voltage options, with 1-D filters and a mass lower bound
+    roots = []
+    for v_cell in np.unique(cells['nominal_v']):
+        cell_mask = cells['nominal_v'] == v_cell
+        for series in range(int(s_lo), int(s_hi) + 1):
+            v_bus = series * float(v_cell)
+            masks = {role: _role_filters(catalogs, role, series, v_bus, req, rules,
+                                         *prop_checks[role])
+                     for role in ('lift', 'cruise')}
+            for role, m in masks.items():
+                diagnostics[f'{role}_motors'] |= m['motors']
+                diagnostics[f'{role}_escs'] |= m['escs']
+                diagnostics[f'{role}_props'] |= m['props']
+
+            pack = _pack_level(cells, cell_mask, series, req, 1)
+            bound = pack[0][0] if pack[0].size else math.inf
+            for role in ('lift', 'cruise'):
+                n_units = req[f'n_{role}']
+                m = masks[role]
+                parts = [catalogs['motors']['mass_g'][m['motors']],
+                         catalogs['escs']['mass_g'][m['escs']],
+                         props['mass_g'][m['props']]]
+                bound += (n_units * sum(p.min() for p in parts)
+                          if all(p.size for p in parts) else math.inf)
+            roots.append((bound, series, float(v_cell), cell_mask, masks))
+
+    # Best-first over roots, depth-first branch-and-bound below each root
+    ranking = _Ranking(top_k)
+    for bound, series, v_cell, cell_mask, masks in sorted(roots, key=lambda r: r[0]):
+        stats['roots'] += 1
+        if math.isinf(bound):
+            stats['roots_infeasible'] += 1
+            continue
+        if bound >= ranking.limit():
+            stats['roots_pruned'] += 1
+            continue
+        v_bus = series * v_cell
+        levels = [_pack_level(cells, cell_mask, series, req, top_k)]
+        for role in ('lift', 'cruise'):
+            n_units = req[f'n_{role}']
+            m = masks[role]
+            stats['pairs_checked'] += int(m['motors'].sum()) * int(m['props'].sum())
+            levels.append(_pair_level(catalogs, m, v_bus, n_units, rules,
+                                      ranking.limit(), top_k))
+            levels.append(_single_level(catalogs['escs'], m['escs'], n_units, top_k))
+        if any(level[0].size == 0 for level in levels):
+            continue
+        level_min = np.array([level[0][0] for level in levels])
+        rest_min = np.append(np.cumsum(level_min[::-1])[::-1], 0.0)
+        _branch(levels, rest_min, ranking, (series, v_cell, levels), 0, 0.0, (), stats)
+
+    combinations = [_describe(catalogs, req, mass, root, chosen)
+                    for mass, (root, chosen) in ranking.sorted()]
+    for role in ('lift', 'cruise'):
+        diagnostics[f'{role}_props_unverified'] = _role_mask(props, role) & ~verified[role]
+    stats['time_s'] = time.perf_counter() - t_start
+
+    return {
+        'combinations': combinations,
+        'requirements': req,
+        'diagnostics': {key: int(mask.sum()) for key, mask in diagnostics.items()},
+        'catalog_sizes': {name: len(table['model']) for name, table in catalogs.items()},
+        'stats': stats,
+    }
+
+
+def _describe(catalogs: Dict[str, Dict[str, np.ndarray]], req: Dict[str, float],
+              mass_g: float, root: Tuple[int, float, list], chosen: Tuple[int, ...]
+              ) -> Dict[str, Any]:
+    """Expand a ranked combination into part names and masses."""
+    series, v_cell, levels = root
+    picks = {name: levels[k][1][i] for k, (name, i) in enumerate(zip(LEVELS, chosen))}
+
+    def part(table, index):
+        t = catalogs[table]
+        return f"{t['manufacturer'][index]} {t['model'][index]}"
+
+    cell, parallel = (int(v) for v in picks['pack'])
+    v_bus = series * v_cell
+    combo = {
+        'total_mass_kg': mass_g / 1000.0,
+        'series_cells': series,
+        'bus_voltage_v': v_bus,
+        'battery': {
+            'cell': part('battery_cells', cell),
+            'configuration': f"{series}S{parallel}P",
+            'mass_kg': levels[0][0][chosen[0]] / 1000.0,
+            'energy_wh': series * parallel * v_cell * catalogs['battery_cells']['capacity_ah'][cell],
+        },
+    }
+    for k, role in ((1, 'lift'), (3, 'cruise')):
+        motor, prop = (int(v) for v in picks[f'{role}_pair'])
+        esc = int(picks[f'{role}_esc'])
+        combo[role] = {
+            'motor': part('motors', motor),
+            'propeller': part('propellers', prop),
+            'esc': part('escs', esc),
+            'quantity': req[f'n_{role}'],
+            'kv': float(catalogs['motors']['kv'][motor]),
+            'current_a': req[f'{role}_power_w'] / v_bus,
+            # Static coefficients known, so speed, tip Mach and KV were checked
+            'verified': role == 'cruise' or bool(
+                np.isfinite(catalogs['propellers']['ct0'][prop])
+                & np.isfinite(catalogs['propellers']['cp0'][prop])),
+            'mass_kg': (levels[k][0][chosen[k]] + levels[k + 1][0][chosen[k + 1]]) / 1000.0,
+        }
+    return combo
+
+
+# =============================================================================
+# OUTPUT
+# =============================================================================
+
+def print_analysis(results: Dict[str, Any] = None) -> None:
+    """Print the ranked component combinations."""
+    if results is None:
+        results = select_components()
+
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    req = results['requirements']
+    stats = results['stats']
+    diag = results['diagnostics']
+    sizes = results['catalog_sizes']
+
+    print("=" * 80)
+    print("CATALOG COMPONENT SELECTION (Section 7)")
+    print("=" * 80)
+    print(f"Computed: {timestamp}")
+    print("Config:   All values loaded from config/ YAML files and config/catalogs/")
+    print()
+
+    print("REQUIREMENTS (from Section 5)")
+    print("-" * 50)
+    print(f"  Lift motor power:      {req['lift_power_w']:.0f} W x {req['n_lift']}")
+    print(f"  Hover thrust:          {req['lift_thrust_n']:.2f} N per lift propeller")
+    print(f"  Cruise motor power:    {req['cruise_power_w']:.0f} W x {req['n_cruise']}")
+    print(f"  Pack energy:           {req['pack_energy_wh']:.0f} Wh (nameplate)")
+    print(f"  Peak bus power:        {req['peak_power_w']:.0f} W")
+    print()
+
+    print("CATALOG FILTERING (parts passing at any bus voltage)")
+    print("-" * 50)
+    print(f"  Catalog sizes:         {sizes['motors']} motors, {sizes['escs']} ESCs, "
+          f"{sizes['propellers']} propellers, {sizes['battery_cells']} cells")
+    for role in ('lift', 'cruise'):
+        print(f"  {role.capitalize():<7} motors / ESCs / props: "
+              f"{diag[f'{role}_motors']} / {diag[f'{role}_escs']} / {diag[f'{role}_props']}")
+    unverified = diag['lift_props_unverified'] + diag['cruise_props_unverified']
+    if unverified:
+        allowed = get_param('propulsion.selection.allow_unverified', False)
+        print(f"  Unverified props:      {unverified} without ct0/cp0 "
+              f"({'allowed, flagged' if allowed else 'excluded'}; selection.allow_unverified)")
+    print(f"  Bus options:           {stats['roots']} ({stats['roots_infeasible']} without "
+          f"compatible parts, {stats['roots_pruned']} pruned by bound)")
+    print(f"  Search:                {stats['pairs_checked']} motor-prop pairs, "
+          f"{stats['nodes']} nodes, {stats['pruned']} branches pruned, "
+          f"{stats['time_s'] * 1000:.1f} ms")
+    print()
+
+    print("RANKED COMBINATIONS (lightest first)")
+    print("-" * 80)
+    if not results['combinations']:
+        print("  No compatible combination in the catalogs")
+        empty = [key.replace('_', ' ') for key, count in diag.items()
+                 if count == 0 and not key.endswith('_unverified')]
+        if empty:
+            print(f"  No part passes the checks for: {', '.join(empty)}")
+    for rank, combo in enumerate(results['combinations'], start=1):
+        batt = combo['battery']
+        print(f"  #{rank}  {combo['total_mass_kg']:.3f} kg   bus {combo['bus_voltage_v']:.1f} V "
+              f"({combo['series_cells']}S)")
+        for role in ('lift', 'cruise'):
+            sub = combo[role]
+            print(f"      {role.capitalize():<7} {sub['quantity']}x {sub['motor']} "
+                  f"(KV {sub['kv']:.0f}) + {sub['propeller']} + {sub['esc']} "
+                  f"[{sub['current_a']:.1f} A, {sub['mass_kg']:.3f} kg]"
+                  f"{'' if sub['verified'] else '  [UNVERIFIED: no ct0/cp0]'}")
+        print(f"      Battery {batt['configuration']} {batt['cell']} "
+              f"[{batt['energy_wh']:.0f} Wh, {batt['mass_kg']:.3f} kg]")
+    print("=" * 80)
+
+
+def benchmark(n_parts: int = 3000, seed: int = 0) -> Dict[str, Any]:
+    """
+    Time a search over synthetic catalogs with ``n_parts`` motors and propellers.
+
+    Parameters
+    ----------
+    n_parts : int
+        Motors and propellers per catalog (ESCs: n_parts / 3, cells: n_parts / 10)
+    seed : int
+        Random seed
+
+    Returns
+    -------
+    dict
+        Selection results (see select_components)
+    """
+    catalogs = synthetic_catalogs(n_parts, max(1, n_parts // 3), n_parts,
+                                  max(1, n_parts // 10), seed)
+    return select_components(catalogs)
+
+
+if __name__ == "__main__":
+    import sys
+    if '--benchmark' in sys.argv:
+        print_analysis(benchmark())
+    else:
+        print_analysis()
@@ -6,16 +6,20 @@ Component Selection Module
 Implements component trade-off analysis and selection for the Mars UAV.
 Generates the comparison tables and selection rationale for Section 7.
 
-All values are loaded from YAML configuration files.
+All values are loaded from YAML configuration files; candidate parts are
+read from the catalogs in config/catalogs/.
 
 Reference: Manuscript Section 7 - Component Selection and Verification
 Last Updated: 2025-12-31
 """
 
+import math
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from ..config import get_param
+from ..instrumentation import traced
+from .catalog_selection import load_catalog
 
 
 @dataclass
@@ -48,119 +52,78 @@ class ESCCandidate:
 # =============================================================================
 # MOTOR CANDIDATES DATABASE
 # =============================================================================
+# Candidates are read from the part catalogs in config/catalogs/ (shared with
+# the catalog selection engine in catalog_selection.py). Only parts with a
+# source_key (sources/*.sources.yaml) enter the trade tables: parts without
+# an authoritative source are UNVERIFIED and must not be used.
 
-LIFT_MOTOR_CANDIDATES: List[MotorCandidate] = [
-    MotorCandidate(
-        model="V4006-380",
-        manufacturer="SunnySky",
-        mass_g=66,
-        power_w=375,
-        kv=380,
-        lipo="4-6S",
-        prop_size="12-15",
-        thrust_g=2560,
-        source_key="sunnyskySunnySkyV4006Multicopter2024",
-    ),
-    MotorCandidate(
-        model="4008 EEE-380",
-        manufacturer="MAD",
-        mass_g=88,
-        power_w=400,
-        kv=380,
-        lipo="4-6S",
-        prop_size="14-18",
-        thrust_g=2700,
-        source_key="madcomponentsMAD4008EEE2024",
-    ),
-    MotorCandidate(
-        model="MN5008-400",
-        manufacturer="T-Motor",
-        mass_g=135,
-        power_w=800,
-        kv=400,
-        lipo="6S",
-        prop_size="15-17",
-        thrust_g=4200,
-        source_key="t-motorTMotorMN5008Antigravity2024",
-    ),
-    MotorCandidate(
-        model="MN505-S-260",
-        manufacturer="T-Motor",
-        mass_g=225,
-        power_w=2500,
-        kv=260,
-        lipo="12S",
-        prop_size="16-17",
-        thrust_g=None,
-        source_key="t-motorMN505SKV260Brushless2024",
-    ),
-]
-
-CRUISE_MOTOR_CANDIDATES: List[MotorCandidate] = [
-    MotorCandidate(
-        model="AT2312-1150",
-        manufacturer="T-Motor",
-        mass_g=60,
-        power_w=350,
-        kv=1150,
-        lipo="2-4S",
-        prop_size="10-12",
-        source_key="t-motorTMotorAT2312FixedWing2024",
-    ),
-    MotorCandidate(
-        model="AT2814-1000",
-        manufacturer="T-Motor",
-        mass_g=109,
-        power_w=370,
-        kv=1000,
-        lipo="2-4S",
-        prop_size="11-13",
-        source_key=None,
-    ),
-    MotorCandidate(
-        model="AT4130-230",
-        manufacturer="T-Motor",
-        mass_g=408,
-        power_w=2500,
-        kv=230,
-        lipo="12S",
-        prop_size="15-18",
-        source_key=None,
-    ),
-]
-
-ESC_CANDIDATES: List[ESCCandidate] = [
-    ESCCandidate(
-        model="XRotor Micro 30A",
-        manufacturer="Hobbywing",
-        mass_g=6,
-        continuous_a=30,
-        burst_a=40,
-        lipo="2-4S",
-        has_bec=False,
-        source_key="hobbywingHobbywingXRotorMicro2024",
-    ),
-    ESCCandidate(
-        model="F35A",
-        manufacturer="T-Motor",
-        mass_g=7,
-        continuous_a=35,
-        burst_a=45,
-        lipo="3-6S",
-        has_bec=False,
-        source_key=None,
-    ),
-    ESCCandidate(
-        model="FLAME 60A 12S",
-        manufacturer="T-Motor",
-        mass_g=74,
-        continuous_a=60,
-        burst_a=80,
-        lipo="12S",
-        has_bec=False,
-        source_key="t-motorFLAME60A12S2024",
-    ),
-]
+def _cell_range(lo: float, hi: float) -> str:
+    return f"{lo:.0f}S" if lo == hi else f"{lo:.0f}-{hi:.0f}S"
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if math.isnan(value) else float(value)
+
+
+def load_motor_candidates(role: str, sourced_only: bool = True) -> List[MotorCandidate]:
+    """
+    Load motor candidates for one role from config/catalogs/motors.csv.
+
+    Parameters
+    ----------
+    role : str
+        'lift' or 'cruise' (catalog entries with role 'any' are included)
+    sourced_only : bool
+        Skip catalog entries without a source_key
+
+    Returns
+    -------
+    list
+        MotorCandidate objects in catalog order
+    """
+    table = load_catalog('motors')
+    return [
+        MotorCandidate(
+            model=str(table['model'][i]),
+            manufacturer=str(table['manufacturer'][i]),
+            mass_g=float(table['mass_g'][i]),
+            power_w=float(table['max_power_w'][i]),
+            kv=int(table['kv'][i]),
+            lipo=_cell_range(table['cells_min'][i], table['cells_max'][i]),
+            prop_size=f"{table['prop_min_in'][i]:.0f}-{table['prop_max_in'][i]:.0f}",
+            thrust_g=_optional(table['thrust_g'][i]),
+            source_key=str(table['source_key'][i]) or None,
+        )
+        for i in range(len(table['model']))
+        if table['role'][i] in (role, 'any')
+        and (table['source_key'][i] or not sourced_only)
+    ]
+
+
+def load_esc_candidates(sourced_only: bool = True) -> List[ESCCandidate]:
+    """Load ESC candidates from config/catalogs/escs.csv (sourced entries only by default)."""
+    table = load_catalog('escs')
+    return [
+        ESCCandidate(
+            model=str(table['model'][i]),
+            manufacturer=str(table['manufacturer'][i]),
+            mass_g=float(table['mass_g'][i]),
+            continuous_a=int(table['continuous_a'][i]),
+            burst_a=int(table['burst_a'][i]),
+            lipo=_cell_range(table['cells_min'][i], table['cells_max'][i]),
+            has_bec=bool(table['has_bec'][i]),
+            source_key=str(table['source_key'][i]) or None,
+        )
+        for i in range(len(table['model']))
+        if table['source_key'][i] or not sourced_only
+    ]
+
+
+LIFT_MOTOR_CANDIDATES: List[MotorCandidate] = load_motor_candidates('lift')
+
+CRUISE_MOTOR_CANDIDATES: List[MotorCandidate] = load_motor_candidates('cruise')
+
+ESC_CANDIDATES: List[ESCCandidate] = load_esc_candidates()
 
 
 def get_power_requirements() -> Dict[str, float]:
@@ -200,18 +163,15 @@ def get_mass_budget() -> Dict[str, float]:
     dict
         Mass budget allocation for propulsion components.
     """
-    mtow = get_param('mission.mass.mtow_kg')
-    f_prop = get_param('mission.mass_fractions.f_propulsion')
-    
-    # Propulsion mass budget
-    m_propulsion = f_prop * mtow
-    
-    # 70:30 split between lift and cruise
-    lift_fraction = 0.70
-    cruise_fraction = 0.30
-    
-    m_lift = lift_fraction * m_propulsion
-    m_cruise = cruise_fraction * m_propulsion
+    from .mass_breakdown import get_parametric_mass_estimate
+
+    # Propulsion mass budget and lift/cruise split (§7.1 allocation)
+    parametric = get_parametric_mass_estimate()
+    mtow = parametric['mtow_kg']
+    f_prop = parametric['f_propulsion']
+    m_propulsion = parametric['m_propulsion_kg']
+    m_lift = parametric['m_lift_kg']
+    m_cruise = parametric['m_cruise_kg']
     
     # Component count
     n_lift_motors = get_param('propulsion.components.lift.motor.quantity')
@@ -283,6 +243,7 @@ def evaluate_motor_candidates(
     return results
 
 
+@traced('components')
 def get_selected_components() -> Dict[str, Any]:
     """
     Get the selected component specifications from configuration.
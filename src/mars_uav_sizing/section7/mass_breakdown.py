@@ -15,8 +15,10 @@ Last Updated: 2025-12-31
 
 from typing import Dict, Any
 from ..config import get_param
+from ..instrumentation import traced
 
 
+@traced('mass')
 def get_propulsion_mass_breakdown() -> Dict[str, Any]:
     """
     Calculate complete propulsion mass breakdown from component data.
@@ -139,22 +141,34 @@ def get_parametric_mass_estimate() -> Dict[str, Any]:
     
     Uses mass fractions rather than specific components.
     This is appropriate for the constraint analysis phase.
+    The lift/cruise split is mass_closure.lift_cruise_split() (the §7.1
+    allocation). With mission.mass_estimation.use_in_sizing set, MTOW,
+    propulsion mass and split come from the closed component-based mass
+    balance instead.
     
     Returns
     -------
     dict
         Parametric mass estimates based on mass fractions.
     """
-    mtow = get_param('mission.mass.mtow_kg')
-    f_prop = get_param('mission.mass_fractions.f_propulsion')
-    
-    # Total propulsion mass from mass fraction
-    m_propulsion = f_prop * mtow
-    
-    # Estimated split between lift and cruise (based on reference data)
-    # Octocopter lift system is heavier than quadcopter
-    lift_fraction = 0.70  # 70% for lift system
-    cruise_fraction = 0.30  # 30% for cruise system
+    from .mass_closure import close_mass, closure_parameters, lift_cruise_split
+
+    params = None
+    if get_param('mission.mass_estimation.use_in_sizing', False):
+        params = closure_parameters()
+        closure = close_mass(params)
+        mtow = closure['mtow_kg']
+        m_propulsion = closure['propulsion']['total_kg']
+        f_prop = m_propulsion / mtow
+    else:
+        mtow = get_param('mission.mass.mtow_kg')
+        f_prop = get_param('mission.mass_fractions.f_propulsion')
+        # Total propulsion mass from mass fraction
+        m_propulsion = f_prop * mtow
+    
+    split = lift_cruise_split(mtow, params)
+    lift_fraction = split['lift_fraction']
+    cruise_fraction = split['cruise_fraction']
     
     m_lift = lift_fraction * m_propulsion
     m_cruise = cruise_fraction * m_propulsion
@@ -0,0 +1,542 @@
+#!/usr/bin/env python3
+"""
+Component-Based Mass Closure
+============================
+
+Closes the MTOW of the QuadPlane from component mass models instead of the
+constant mass fractions f_empty, f_propulsion and f_avionics:
+
+    MTOW = m_payload + m_avionics + m_structure(MTOW) + m_propulsion(MTOW)
+           + m_battery(MTOW)
+
+Component models:
+    - Wing (Sadraey 2013, Eq. 10.3):
+        m_wing = S × c × (t/c) × ρ_mat × K_ρ × (AR × n_ult / cos Λ)^0.6 × λ^0.04
+      with S = W / (W/S), b = sqrt(AR × S), c = S / b
+    - Fuselage (matchingcharts.m):  m_fus = k_fus × n_ult × MTOW × L_fus
+    - n_ult = mission.structural.n_ultimate, or safety factor × critical
+      maneuver/gust load factor of the V-n diagram (section5/flight_envelope)
+      at the current MTOW and W/S when mission.structural.envelope.use_in_sizing
+      is set
+    - Tail: wing mass per unit area × tail_areal_ratio × (S_H + S_V), with the
+      tail areas from the volume coefficients (§4.12)
+    - Propulsion: mass per unit rated power of the selected lift and cruise
+      units × margin × required electrical power (P/W × W), plus mounting
+    - Battery: m_batt = E_required / (e_spec × DoD × η_batt), with E_required
+      the §5.3 energy budget at the current MTOW
+
+The fixed point MTOW = g(MTOW) is solved with secant-accelerated iteration
+(Anderson mixing with depth 1) vectorized over design batches: every
+parameter of closure_parameters() may be replaced by an array, and all
+designs are iterated together.
+
+Reference: Manuscript Section 7 - Component Selection and Verification
+Last Updated: 2026-10-19
+"""
+
+from datetime import datetime
+from typing import Any, Dict
+
+import numpy as np
+
+from ..config import (
+    get_battery_params,
+    get_mars_gravity,
+    get_mission_params,
+    get_mtow,
+    get_param,
+)
+from ..instrumentation import traced
+
+
+# =============================================================================
+# MODEL PARAMETERS
+# =============================================================================
+
+def _specific_mass(role: str) -> float:
+    """Mass per unit rated power (kg/W) of one motor + ESC + propeller unit."""
+    base = f'propulsion.components.{role}'
+    unit_mass = (
+        get_param(f'{base}.motor.mass_kg')
+        + get_param(f'{base}.esc.mass_kg')
+        + get_param(f'{base}.propeller.mass_kg')
+    )
+    return unit_mass / get_param(f'{base}.motor.max_power_w')
+
+
+def _transition_wh_per_kg() -> float:
+    """Mission transition energy per kg of MTOW (Wh/kg, §5.3)."""
+    if get_param('mission.transition.simulation.use_in_sizing', False):
+        # Simulated energy at the design point, linearised in MTOW
+        from ..section5.transition import transition_energy_wh
+        return transition_energy_wh() / get_mtow()
+    return (
+        get_param('mission.time.n_transitions')
+        * get_param('mission.transition.reference_energy_j')
+        * get_param('mission.transition.mars_scaling_factor')
+        / get_param('mission.transition.reference_mtow_kg')
+        / 3600.0
+    )
+
+
+def closure_parameters() -> Dict[str, Any]:
+    """
+    Collect the inputs of the mass model from config.
+
+    Returns
+    -------
+    dict
+        Scalar model inputs. Any entry may be replaced by a numpy array to
+        evaluate a batch of designs (arrays must broadcast together).
+    """
+    from ..section5.flight_envelope import envelope_parameters
+    from ..section5.hybrid_vtol import get_quadplane_ld
+    from ..section5.matching_chart import find_design_point
+    from ..section5.fixed_wing import cruise_power_loading
+    from ..section5.rotorcraft import hover_power_loading
+
+    mission = get_mission_params()
+    batt = get_battery_params()
+    est = 'mission.mass_estimation'
+
+    return {
+        # V-n diagram inputs (gust load factor for n_ult)
+        **envelope_parameters(),
+        'gust_sizing': get_param('mission.structural.envelope.use_in_sizing', False),
+        # Fixed masses
+        'payload_kg': get_param('mission.mass.payload_kg'),
+        'avionics_kg': get_param(f'{est}.avionics_kg'),
+        'g': get_mars_gravity(),
+        # Wing and airframe geometry
+        'wing_loading': find_design_point()['wing_loading'],
+        'aspect_ratio': get_param('aerodynamic.wing.aspect_ratio'),
+        'thickness_ratio': get_param('geometry.wing.thickness_ratio'),
+        'taper_ratio': get_param('geometry.wing.taper_ratio'),
+        'sweep_deg': get_param('geometry.wing.sweep_angle_deg'),
+        'length_to_span': get_param('geometry.fuselage.length_to_span_ratio'),
+        'moment_arm_ratio': get_param('geometry.tail.moment_arm_ratio'),
+        'v_h': get_param('geometry.tail.v_h'),
+        'v_v': get_param('geometry.tail.v_v'),
+        # Structural correlations
+        'n_ultimate': get_param('mission.structural.n_ultimate'),
+        'material_density': get_param(f'{est}.structure.material_density_kg_m3'),
+        'k_rho': get_param(f'{est}.structure.k_rho'),
+        'k_fuselage': get_param(f'{est}.structure.k_fuselage'),
+        'tail_areal_ratio': get_param(f'{est}.structure.tail_areal_ratio'),
+        'landing_gear_fraction': get_param(f'{est}.structure.landing_gear_fraction'),
+        # Propulsion (power loadings are electrical, W/N)
+        'pw_hover': hover_power_loading(),
+        'pw_cruise': cruise_power_loading(mission['v_cruise'], get_quadplane_ld()),
+        'lift_specific_mass': _specific_mass('lift'),
+        'cruise_specific_mass': _specific_mass('cruise'),
+        'power_margin': get_param('propulsion.selection.power_margin'),
+        'shared_fraction': get_param(f'{est}.propulsion.shared_fraction'),
+        # Energy (§5.3)
+        't_hover_s': mission['t_hover_s'],
+        't_cruise_min': mission['t_cruise_min'],
+        'transition_wh_per_kg': _transition_wh_per_kg(),
+        'reserve': mission['energy_reserve'],
+        'e_spec_Wh_kg': batt['e_spec_Wh_kg'],
+        'dod': batt['dod'],
+        'eta_discharge': batt['eta_discharge'],
+    }
+
+
+# =============================================================================
+# COMPONENT MASS MODELS
+# =============================================================================
+
+def structure_masses(mtow_kg, params: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """
+    Structural masses from the wing, fuselage and tail correlations.
+
+    Parameters
+    ----------
+    mtow_kg : float or np.ndarray
+        Take-off mass in kg
+    params : dict
+        Model inputs from closure_parameters()
+
+    Returns
+    -------
+    dict
+        Wing, fuselage, tail, landing gear and total mass in kg, plus the
+        wing geometry and ultimate load factor used
+    """
+    from ..section5.flight_envelope import ultimate_load_factor
+
+    p = params
+    mtow_kg = np.asarray(mtow_kg, dtype=float)
+    n_ultimate = ultimate_load_factor(p['wing_loading'], mtow_kg, p)
+
+    wing_area = mtow_kg * p['g'] / p['wing_loading']
+    wingspan = np.sqrt(p['aspect_ratio'] * wing_area)
+    chord = wing_area / wingspan
+    cos_sweep = np.maximum(0.1, np.cos(np.radians(p['sweep_deg'])))
+
+    wing = (
+        wing_area * chord * p['thickness_ratio']
+        * p['material_density'] * p['k_rho']
+        * (p['aspect_ratio'] * n_ultimate / cos_sweep) ** 0.6
+        * p['taper_ratio'] ** 0.04
+    )
+
+    fuselage_length = p['length_to_span'] * wingspan
+    fuselage = p['k_fuselage'] * n_ultimate * mtow_kg * fuselage_length
+
+    moment_arm = p['moment_arm_ratio'] * fuselage_length
+    tail_area = (p['v_h'] * wing_area * chord + p['v_v'] * wing_area * wingspan) / moment_arm
+    tail = p['tail_areal_ratio'] * wing / wing_area * tail_area
+
+    landing_gear = p['landing_gear_fraction'] * mtow_kg
+
+    return {
+        'wing_kg': wing,
+        'fuselage_kg': fuselage,
+        'tail_kg': tail,
+        'landing_gear_kg': landing_gear,
+        'total_kg': wing + fuselage + tail + landing_gear,
+        'wing_area_m2': wing_area,
+        'wingspan_m': wingspan,
+        'tail_area_m2': tail_area,
+        'n_ultimate': n_ultimate * np.ones_like(mtow_kg),
+    }
+
+
+def propulsion_masses(
+    mtow_kg,
+    params: Dict[str, Any],
+    p_lift_w=None,
+    p_cruise_w=None,
+) -> Dict[str, np.ndarray]:
+    """
+    Propulsion masses scaled from the required electrical power.
+
+    Parameters
+    ----------
+    mtow_kg : float or np.ndarray
+        Take-off mass in kg
+    params : dict
+        Model inputs from closure_parameters()
+    p_lift_w, p_cruise_w : float or np.ndarray, optional
+        Required hover and cruise power in W (default: P/W × W)
+
+    Returns
+    -------
+    dict
+        Lift, cruise, shared and total mass in kg
+    """
+    p = params
+    mtow_kg = np.asarray(mtow_kg, dtype=float)
+    weight_n = mtow_kg * p['g']
+    if p_lift_w is None:
+        p_lift_w = p['pw_hover'] * weight_n
+    if p_cruise_w is None:
+        p_cruise_w = p['pw_cruise'] * weight_n
+
+    lift = p['lift_specific_mass'] * p['power_margin'] * p_lift_w
+    cruise = p['cruise_specific_mass'] * p['power_margin'] * p_cruise_w
+    shared = p['shared_fraction'] * mtow_kg
+
+    return {
+        'lift_kg': lift,
+        'cruise_kg': cruise,
+        'shared_kg': shared,
+        'total_kg': lift + cruise + shared,
+    }
+
+
+def battery_masses(mtow_kg, params: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """
+    Battery mass sized to the §5.3 energy budget at the given MTOW.
+
+    Parameters
+    ----------
+    mtow_kg : float or np.ndarray
+        Take-off mass in kg
+    params : dict
+        Model inputs from closure_parameters()
+
+    Returns
+    -------
+    dict
+        Required energy in Wh and battery mass in kg
+    """
+    p = params
+    mtow_kg = np.asarray(mtow_kg, dtype=float)
+    weight_n = mtow_kg * p['g']
+
+    e_mission = (
+        p['pw_hover'] * weight_n * p['t_hover_s'] / 3600.0
+        + p['pw_cruise'] * weight_n * p['t_cruise_min'] / 60.0
+        + p['transition_wh_per_kg'] * mtow_kg
+    )
+    e_required = e_mission * (1.0 + p['reserve'])
+    usable_wh_kg = p['e_spec_Wh_kg'] * p['dod'] * p['eta_discharge']
+
+    return {
+        'required_wh': e_required,
+        'total_kg': e_required / usable_wh_kg,
+    }
+
+
+def mass_map(mtow_kg, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Evaluate the closure map g(MTOW) = sum of component masses.
+
+    Returns
+    -------
+    dict
+        'total_kg' plus the structure, propulsion and battery breakdowns
+    """
+    structure = structure_masses(mtow_kg, params)
+    propulsion = propulsion_masses(mtow_kg, params)
+    battery = battery_masses(mtow_kg, params)
+    total = (
+        params['payload_kg'] + params['avionics_kg']
+        + structure['total_kg'] + propulsion['total_kg'] + battery['total_kg']
+    )
+    return {
+        'total_kg': total,
+        'structure': structure,
+        'propulsion': propulsion,
+        'battery': battery,
+    }
+
+
+def lift_cruise_split(mtow_kg=None, params: Dict[str, Any] = None) -> Dict[str, float]:
+    """
+    Lift/cruise share of the propulsion mass.
+
+    The §7.1 allocation (mission.mass_fractions.lift_propulsion_share)
+    unless mission.mass_estimation.use_in_sizing is set, in which case the
+    split follows the power-scaled unit masses at the given MTOW.
+
+    Parameters
+    ----------
+    mtow_kg : float, optional
+        Take-off mass in kg (default: mission.mass.mtow_kg)
+    params : dict, optional
+        Model inputs from closure_parameters()
+
+    Returns
+    -------
+    dict
+        'lift_fraction' and 'cruise_fraction'
+    """
+    if get_param('mission.mass_estimation.use_in_sizing', False):
+        if params is None:
+            params = closure_parameters()
+        if mtow_kg is None:
+            mtow_kg = get_param('mission.mass.mtow_kg')
+        units = propulsion_masses(mtow_kg, params)
+        lift_fraction = float(units['lift_kg'] / (units['lift_kg'] + units['cruise_kg']))
+    else:
+        lift_fraction = get_param('mission.mass_fractions.lift_propulsion_share')
+    return {'lift_fraction': lift_fraction, 'cruise_fraction': 1.0 - lift_fraction}
+
+
+# =============================================================================
+# FIXED-POINT CLOSURE
+# =============================================================================
+
+def close_mass(
+    params: Dict[str, Any] = None,
+    mtow_guess=None,
+    accelerate: bool = True,
+    tol: float = None,
+    max_iter: int = None,
+) -> Dict[str, Any]:
+    """
+    Solve MTOW = g(MTOW) for one design or a batch of designs.
+
+    Parameters
+    ----------
+    params : dict, optional
+        Model inputs (default: closure_parameters()); array-valued entries
+        define a batch
+    mtow_guess : float or np.ndarray, optional
+        Starting MTOW in kg (default: mission.mass.mtow_kg)
+    accelerate : bool
+        Use secant (Anderson depth-1) steps; False = plain substitution
+    tol : float, optional
+        Convergence tolerance on |g(MTOW) - MTOW| in kg
+    max_iter : int, optional
+        Maximum number of map evaluations
+
+    Returns
+    -------
+    dict
+        'mtow_kg' (NaN where the closure diverges), 'converged',
+        'growth_factor' (dMTOW/dm_fixed = 1 / (1 - dg/dMTOW)),
+        'iterations', and the component breakdown at the solution
+    """
+    if params is None:
+        params = closure_parameters()
+    if tol is None:
+        tol = get_param('mission.mass_estimation.solver.tol_kg')
+    if max_iter is None:
+        max_iter = get_param('mission.mass_estimation.solver.max_iter')
+    if mtow_guess is None:
+        mtow_guess = get_param('mission.mass.mtow_kg')
+
+    shape = np.broadcast(mtow_guess, *[np.asarray(v) for v in params.values()
+                                       if not isinstance(v, str)]).shape
+    m0 = np.broadcast_to(np.asarray(mtow_guess, dtype=float), shape).copy()
+    r0 = mass_map(m0, params)['total_kg'] - m0
+    m1 = m0 + r0
+    limit = 1.0e3 * m0
+    iterations = 1
+
+    active = np.abs(r0) > tol
+    m_prev, r_prev = m0, r0
+    m, r = m1, r0
+    slope = np.zeros(shape)
+    while iterations < max_iter:
+        r = mass_map(m, params)['total_kg'] - m
+        iterations += 1
+        dm = m - m_prev
+        dr = r - r_prev
+        with np.errstate(divide='ignore', invalid='ignore'):
+            secant = np.where(np.abs(dm) > 0, dr / dm, 0.0)
+        slope = np.where(active, secant, slope)
+        # The residual is convex in MTOW: once it is positive and growing,
+        # no larger MTOW closes the balance (mass spiral)
+        spiral = (r > tol) & (secant >= 0)
+        active = active & (np.abs(r) > tol) & ~spiral & np.isfinite(m) & (m < limit)
+        if not active.any():
+            break
+
+        step = r
+        if accelerate:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                newton = -r / secant
+            usable = np.isfinite(newton) & (secant < 0) & (m + newton > 0)
+            step = np.where(usable, newton, r)
+        m_prev, r_prev = m, r
+        m = np.where(active, m + step, m)
+
+    # dg/dMTOW = 1 + d(residual)/dMTOW; closure requires dg/dMTOW < 1
+    converged = (np.abs(r) <= tol) & (slope < 0) & np.isfinite(m)
+    mtow = np.where(converged, m, np.nan)
+    with np.errstate(divide='ignore'):
+        growth = np.where(converged, -1.0 / slope, np.nan)
+
+    breakdown = mass_map(mtow, params)
+    propulsion = breakdown['propulsion']
+    prop_units = propulsion['lift_kg'] + propulsion['cruise_kg']
+
+    def _out(value):
+        value = np.asarray(value, dtype=float)
+        return float(value) if value.ndim == 0 else value
+
+    return {
+        'mtow_kg': _out(mtow),
+        'converged': bool(converged) if converged.ndim == 0 else converged,
+        'growth_factor': _out(growth),
+        'iterations': iterations,
+        'structure': {k: _out(v) for k, v in breakdown['structure'].items()},
+        'propulsion': {k: _out(v) for k, v in propulsion.items()},
+        'battery': {k: _out(v) for k, v in breakdown['battery'].items()},
+        'payload_kg': _out(params['payload_kg']),
+        'avionics_kg': _out(params['avionics_kg']),
+        'lift_fraction': _out(propulsion['lift_kg'] / prop_units),
+    }
+
+
+# =============================================================================
+# COMPLETE ANALYSIS
+# =============================================================================
+
+@traced('mass_closure')
+def mass_closure_analysis() -> Dict[str, Any]:
+    """
+    Close the baseline design and compare with the mass-fraction estimate.
+
+    Returns
+    -------
+    dict
+        Closure results plus the fixed-fraction masses at the baseline MTOW
+        and the iteration count without acceleration
+    """
+    params = closure_parameters()
+    closure = close_mass(params)
+    plain = close_mass(params, accelerate=False)
+
+    mtow_ref = get_param('mission.mass.mtow_kg')
+    fractions = get_param('mission.mass_fractions')
+
+    return {
+        'closure': closure,
+        'plain_iterations': plain['iterations'],
+        'baseline': {
+            'mtow_kg': mtow_ref,
+            'structure_kg': fractions['f_empty'] * mtow_ref,
+            'propulsion_kg': fractions['f_propulsion'] * mtow_ref,
+            'avionics_kg': fractions['f_avionics'] * mtow_ref,
+            'battery_kg': fractions['f_battery'] * mtow_ref,
+            'payload_kg': get_param('mission.mass.payload_kg'),
+        },
+    }
+
+
+def print_analysis(results: Dict[str, Any] = None) -> None:
+    """Print the closed mass breakdown."""
+    if results is None:
+        results = mass_closure_analysis()
+
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    c = results['closure']
+    ref = results['baseline']
+    s, p, b = c['structure'], c['propulsion'], c['battery']
+
+    print("=" * 80)
+    print("COMPONENT-BASED MASS CLOSURE (Section 7)")
+    print("=" * 80)
+    print(f"Computed: {timestamp}")
+    print("Config:   All values loaded from config/ YAML files")
+    print()
+
+    if not c['converged']:
+        print("  [FAIL] Mass closure diverges (no MTOW satisfies the mass balance)")
+        print("=" * 80)
+        return
+
+    print(f"{'Component':<22} {'Closure':>10} {'Fractions':>10}")
+    print("-" * 50)
+    rows = [
+        ('Payload', c['payload_kg'], ref['payload_kg']),
+        ('Avionics', c['avionics_kg'], ref['avionics_kg']),
+        ('Structure', s['total_kg'], ref['structure_kg']),
+        ('  Wing', s['wing_kg'], None),
+        ('  Fuselage', s['fuselage_kg'], None),
+        ('  Tail', s['tail_kg'], None),
+        ('  Landing gear', s['landing_gear_kg'], None),
+        ('Propulsion', p['total_kg'], ref['propulsion_kg']),
+        ('  Lift', p['lift_kg'], None),
+        ('  Cruise', p['cruise_kg'], None),
+        ('  Mounting/wiring', p['shared_kg'], None),
+        ('Battery', b['total_kg'], ref['battery_kg']),
+    ]
+    for name, closed, fixed in rows:
+        fixed_str = f"{fixed:10.3f}" if fixed is not None else ""
+        print(f"{name:<22} {closed:10.3f} {fixed_str}")
+    print("-" * 50)
+    print(f"{'MTOW':<22} {c['mtow_kg']:10.3f} {ref['mtow_kg']:10.3f}")
+    print()
+
+    print("CLOSURE")
+    print("-" * 50)
+    print(f"  Wing area / span:      {s['wing_area_m2']:.3f} m² / {s['wingspan_m']:.3f} m")
+    print(f"  Ultimate load factor:  {s['n_ultimate']:.2f}")
+    print(f"  Battery energy:        {b['required_wh']:.1f} Wh (incl. reserve)")
+    print(f"  Lift/cruise split:     {100 * c['lift_fraction']:.1f}% / "
+          f"{100 * (1 - c['lift_fraction']):.1f}% of motor units")
+    print(f"  Mass growth factor:    {c['growth_factor']:.2f} kg per kg of fixed mass")
+    print(f"  Iterations:            {c['iterations']} (secant), "
+          f"{results['plain_iterations']} (plain substitution)")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    print_analysis()
@@ -8,6 +8,8 @@ habitat hangar and ground support equipment.
 
 Submodules:
 - solar_power: Solar power system sizing for charging infrastructure
+- thermal: Battery night survival heater energy (lumped thermal network)
+- dust_scenarios: Dust-storm/degradation Monte Carlo of the charging system
 - hangar: Hangar zone dimensions and specifications
 
 Reference: Manuscript Section 8 - Infrastructure Requirements
@@ -20,8 +22,22 @@ from .solar_power import (
     get_buffer_battery_sizing,
     get_charging_infrastructure,
     get_solar_system_specs,
+    get_thermal_energy_Wh,
     print_solar_power_analysis,
 )
+from .thermal import (
+    thermal_parameters,
+    simulate_unit,
+    design_heater_energy_Wh,
+    thermal_analysis,
+)
+from .dust_scenarios import (
+    scenario_parameters,
+    daily_yield_Wh_m2,
+    simulate_buffer,
+    loss_of_operations,
+    scenario_analysis,
+)
 
 __all__ = [
     'get_solar_irradiance_params',
@@ -29,5 +45,15 @@ __all__ = [
     'get_buffer_battery_sizing',
     'get_charging_infrastructure',
     'get_solar_system_specs',
+    'get_thermal_energy_Wh',
     'print_solar_power_analysis',
+    'thermal_parameters',
+    'simulate_unit',
+    'design_heater_energy_Wh',
+    'thermal_analysis',
+    'scenario_parameters',
+    'daily_yield_Wh_m2',
+    'simulate_buffer',
+    'loss_of_operations',
+    'scenario_analysis',
 ]
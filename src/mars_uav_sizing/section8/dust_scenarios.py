@@ -0,0 +1,513 @@
+"""
+Dust-Storm and Degradation Scenarios for the Charging System
+============================================================
+
+Monte Carlo assessment of the solar charging system (solar_power.py) over
+many Mars-year realizations, replacing the single design irradiance and the
+fixed margins with the processes they stand for.
+
+Per realization and sol t (one Mars year, Ls = 0 at t = 0):
+
+    tau(t)   = tau_bg(Ls) × exp(x_t - σ²/2) + Σ regional storms + global storm
+    I(t)     = I_design × f_orbit(Ls) × exp(-k (tau - tau_design))
+    E_gen(t) = A × η_cell × (1 - r_deg)^age × s(t) × I × t_sun × cos_avg
+
+    x_t      AR(1) log-opacity anomaly (correlation ρ, std σ)
+    storms   Poisson onsets in the storm season, added tau decaying
+             exponentially; at most one global storm per year
+    k        ln(I_design / I_storm) / (tau_storm - tau_design), so tau_design
+             and tau_storm reproduce surface_aphelion_dusty and
+             surface_dust_storm at aphelion
+    f_orbit  ((1 + e cos ν) / (1 - e))², e from the perihelion/aphelion ratio
+    s(t)     panel cover transmission: drops by deposition × tau each sol,
+             partly restored by wind cleaning events, fully by crew cleaning
+
+The buffer is charged by day (surplus above capacity is spilled to the
+habitat) and on a flight sol delivers one UAV charge if it can still keep
+the night heater reserve (thermal.py); otherwise the sol is lost. The
+heaters then draw overnight; a buffer that cannot cover them is a survival
+failure.
+
+Every design of the panel area × buffer capacity grid sees the same weather
+realizations (common random numbers), and the state of charge is integrated
+for the whole (realization × area × buffer) batch in one loop over sols.
+
+Reference: Manuscript Section 8.1.4 - Solar Power System
+Last Updated: 2026-10-19
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Sequence
+
+import numpy as np
+
+from ..config import get_param
+from ..instrumentation import traced
+
+
+# =============================================================================
+# MODEL PARAMETERS
+# =============================================================================
+
+def scenario_parameters() -> Dict[str, Any]:
+    """
+    Collect the inputs of the scenario engine from config.
+
+    Returns
+    -------
+    dict
+        Dust climatology, irradiance calibration, panel, soiling,
+        degradation, operations and the design grid
+    """
+    from .solar_power import get_thermal_energy_Wh, get_uav_battery_capacity_Wh
+
+    dust = 'environment.dust'
+    solar = 'environment.solar'
+    sc = 'infrastructure.scenarios'
+    include_heaters = get_param(f'{sc}.operations.include_heaters', False) or None
+    charge_Wh = (get_uav_battery_capacity_Wh()
+                 * get_param('battery.utilization.depth_of_discharge')
+                 / get_param('infrastructure.charging.charger_efficiency'))
+    return {
+        'n_sols': int(round(get_param('physical.mars.sols_per_year'))),
+        'n_realizations': get_param(f'{sc}.n_realizations'),
+        'seed': get_param(f'{sc}.seed'),
+        'panel_area_m2': np.asarray(get_param(f'{sc}.panel_area_m2'), dtype=float),
+        'buffer_capacity_Wh': np.asarray(get_param(f'{sc}.buffer_capacity_Wh'), dtype=float),
+        # Irradiance
+        'design_irradiance': get_param(f'{solar}.surface_aphelion_dusty'),
+        'storm_irradiance': get_param(f'{solar}.surface_dust_storm'),
+        'perihelion': get_param(f'{solar}.perihelion'),
+        'aphelion': get_param(f'{solar}.aphelion'),
+        'sun_hours': get_param(f'{solar}.effective_sun_hours'),
+        'incidence_factor': get_param(f'{solar}.avg_incidence_factor'),
+        'design_tau': get_param(f'{dust}.design_tau'),
+        'storm_tau': get_param(f'{dust}.storm_tau'),
+        'perihelion_Ls_deg': get_param(f'{dust}.perihelion_Ls_deg'),
+        # Dust climatology
+        'background': get_param(f'{dust}.background'),
+        'regional': get_param(f'{dust}.regional'),
+        'global': get_param(f'{dust}.global'),
+        # Panel
+        'cell_efficiency': get_param('infrastructure.solar_array.cell_efficiency'),
+        'soiling': get_param(f'{sc}.soiling'),
+        'degradation': get_param(f'{sc}.degradation'),
+        # Operations
+        'charge_Wh': charge_Wh * get_param(f'{sc}.operations.flights_per_sol'),
+        'heater_Wh': get_thermal_energy_Wh(include_heaters),
+        'initial_soc': get_param(f'{sc}.operations.initial_soc'),
+        'long_outage_sols': get_param(f'{sc}.operations.long_outage_sols'),
+        # Deterministic sizing point for comparison
+        'design_margin': get_param('infrastructure.solar_array.design_margin'),
+        'night_reserve_factor': get_param('infrastructure.charging.night_reserve_factor'),
+    }
+
+
+# =============================================================================
+# ORBIT AND IRRADIANCE
+# =============================================================================
+
+def orbit_eccentricity(perihelion_W_m2: float, aphelion_W_m2: float) -> float:
+    """Eccentricity from the perihelion/aphelion irradiance ratio ((1+e)/(1-e))²."""
+    q = np.sqrt(perihelion_W_m2 / aphelion_W_m2)
+    return float((q - 1.0) / (q + 1.0))
+
+
+def solar_longitude(n_sols: int, eccentricity: float, perihelion_Ls_deg: float):
+    """
+    Areocentric longitude and true anomaly of each sol of a Mars year.
+
+    Mean anomaly advances uniformly from Ls = 0 at sol 0; the true anomaly
+    follows from the equation of centre to second order in e.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (Ls in degrees 0-360, true anomaly in radians), shape (n_sols,)
+    """
+    e = eccentricity
+    nu0 = np.radians(-perihelion_Ls_deg)
+    m0 = nu0 - 2.0 * e * np.sin(nu0) + 0.75 * e ** 2 * np.sin(2.0 * nu0)
+    m = m0 + 2.0 * np.pi * (np.arange(n_sols) + 0.5) / n_sols
+    nu = m + 2.0 * e * np.sin(m) + 1.25 * e ** 2 * np.sin(2.0 * m)
+    ls = np.mod(np.degrees(nu) + perihelion_Ls_deg, 360.0)
+    return ls, nu
+
+
+def surface_irradiance(tau, true_anomaly, params: Dict[str, Any]):
+    """
+    Design-basis surface irradiance for an optical depth (elementwise).
+
+    I = I_design × ((1 + e cos ν) / (1 - e))² × exp(-k (tau - tau_design))
+
+    Returns
+    -------
+    float or np.ndarray
+        Irradiance in W/m² (same basis as solar.surface_aphelion_dusty)
+    """
+    p = params
+    e = orbit_eccentricity(p['perihelion'], p['aphelion'])
+    k = np.log(p['design_irradiance'] / p['storm_irradiance']) / (p['storm_tau'] - p['design_tau'])
+    orbit = ((1.0 + e * np.cos(true_anomaly)) / (1.0 - e)) ** 2
+    return p['design_irradiance'] * orbit * np.exp(-k * (np.asarray(tau) - p['design_tau']))
+
+
+def _in_window(ls, window: Sequence[float]):
+    """Ls inside [start, end] degrees, wrapping through 360."""
+    start, end = window
+    if end - start >= 360.0:
+        return np.ones(np.shape(ls), dtype=bool)
+    return np.mod(ls - start, 360.0) <= np.mod(end - start, 360.0)
+
+
+# =============================================================================
+# STOCHASTIC WEATHER AND PANEL STATE
+# =============================================================================
+
+def sample_opacity(n_realizations: int, ls, rng: np.random.Generator,
+                   params: Dict[str, Any]) -> np.ndarray:
+    """
+    Draw dust optical depth series for Mars-year realizations.
+
+    Parameters
+    ----------
+    n_realizations : int
+        Number of Mars years
+    ls : np.ndarray
+        Solar longitude of each sol in degrees, shape (n_sols,)
+    rng : np.random.Generator
+        Random source
+    params : dict
+        Model inputs (scenario_parameters())
+
+    Returns
+    -------
+    np.ndarray
+        tau, shape (n_realizations, n_sols)
+    """
+    bg = params['background']
+    reg = params['regional']
+    glob = params['global']
+    n_sols = len(ls)
+
+    # Seasonal background with an AR(1) log-normal anomaly (unit mean)
+    tau_bg = bg['tau_min'] + (bg['tau_max'] - bg['tau_min']) * 0.5 * (
+        1.0 + np.cos(np.radians(ls - bg['peak_Ls_deg'])))
+    rho, sigma = bg['noise_correlation'], bg['noise_sigma']
+    shocks = rng.standard_normal((n_realizations, n_sols)) * sigma * np.sqrt(1.0 - rho ** 2)
+    anomaly = np.empty((n_realizations, n_sols))
+    anomaly[:, 0] = rng.standard_normal(n_realizations) * sigma
+    for t in range(1, n_sols):
+        anomaly[:, t] = rho * anomaly[:, t - 1] + shocks[:, t]
+    tau = tau_bg * np.exp(anomaly - 0.5 * sigma ** 2)
+
+    # Regional storms: Poisson onsets, exponentially distributed peaks
+    onset = (rng.random((n_realizations, n_sols)) < reg['rate_per_sol']) & _in_window(ls, reg['season_Ls_deg'])
+    kick = onset * rng.exponential(reg['peak_tau_mean'], (n_realizations, n_sols))
+    decay = np.exp(-1.0 / reg['decay_sols'])
+    storm = np.zeros(n_realizations)
+    for t in range(n_sols):
+        storm = storm * decay + kick[:, t]
+        tau[:, t] += storm
+
+    # Global storm: onset at a uniform Ls inside the window
+    has_global = rng.random(n_realizations) < glob['annual_probability']
+    onset_ls = rng.uniform(*glob['onset_Ls_deg'], n_realizations)
+    onset_sol = np.argmax(ls[None, :] >= onset_ls[:, None], axis=1)
+    age = np.arange(n_sols)[None, :] - onset_sol[:, None]
+    tau += np.where(has_global[:, None] & (age >= 0),
+                    glob['peak_tau'] * np.exp(-np.maximum(age, 0) / glob['decay_sols']), 0.0)
+    return tau
+
+
+def sample_soiling(tau: np.ndarray, rng: np.random.Generator,
+                   params: Dict[str, Any]) -> np.ndarray:
+    """
+    Panel cover transmission under dust deposition and cleaning.
+
+    Returns
+    -------
+    np.ndarray
+        Transmission (0-1) during each sol, same shape as tau
+    """
+    s = params['soiling']
+    n_realizations, n_sols = tau.shape
+    wind = rng.random((n_realizations, n_sols)) < s['wind_cleaning_rate_per_sol']
+    interval = s.get('manual_cleaning_interval_sols')
+    transmission = np.empty_like(tau)
+    state = np.ones(n_realizations)
+    for t in range(n_sols):
+        state = np.maximum(state * (1.0 - s['deposition_per_sol'] * tau[:, t]), s['min_transmission'])
+        transmission[:, t] = state
+        # Cleaning acts at the end of the sol
+        state = np.where(wind[:, t], state + s['wind_cleaning_recovery'] * (1.0 - state), state)
+        if interval and (t + 1) % interval == 0:
+            state = np.ones(n_realizations)
+    return transmission
+
+
+def degradation_factor(n_sols: int, params: Dict[str, Any]) -> np.ndarray:
+    """Cell efficiency factor (1 - r)^(age + t / year) of each sol, shape (n_sols,)."""
+    d = params['degradation']
+    years = d['age_years'] + np.arange(n_sols) / n_sols
+    return (1.0 - d['rate_per_year']) ** years
+
+
+def daily_yield_Wh_m2(n_realizations: int, seed: int = None,
+                      params: Dict[str, Any] = None) -> Dict[str, np.ndarray]:
+    """
+    Panel energy per m² of every sol of every realization.
+
+    Returns
+    -------
+    dict
+        'yield_Wh_m2', 'tau', 'transmission' (n_realizations, n_sols);
+        'ls_deg', 'irradiance_clear_W_m2' (n_sols,)
+    """
+    p = params if params is not None else scenario_parameters()
+    rng = np.random.default_rng(p['seed'] if seed is None else seed)
+    e = orbit_eccentricity(p['perihelion'], p['aphelion'])
+    ls, nu = solar_longitude(p['n_sols'], e, p['perihelion_Ls_deg'])
+
+    tau = sample_opacity(n_realizations, ls, rng, p)
+    transmission = sample_soiling(tau, rng, p)
+    efficiency = p['cell_efficiency'] * degradation_factor(p['n_sols'], p)
+    irradiance = surface_irradiance(tau, nu, p)
+    return {
+        'yield_Wh_m2': efficiency * transmission * irradiance * p['sun_hours'] * p['incidence_factor'],
+        'tau': tau,
+        'transmission': transmission,
+        'ls_deg': ls,
+        'irradiance_clear_W_m2': surface_irradiance(p['design_tau'], nu, p),
+    }
+
+
+# =============================================================================
+# BUFFER STATE OF CHARGE
+# =============================================================================
+
+def simulate_buffer(yield_Wh_m2: np.ndarray, panel_area_m2, buffer_capacity_Wh,
+                    params: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """
+    Sol-by-sol buffer energy balance for a grid of designs.
+
+    Parameters
+    ----------
+    yield_Wh_m2 : np.ndarray
+        Panel energy per m², shape (n_realizations, n_sols)
+    panel_area_m2 : sequence of float
+        Panel areas (grid axis 1)
+    buffer_capacity_Wh : sequence of float
+        Buffer capacities (grid axis 2)
+    params : dict
+        Model inputs (scenario_parameters())
+
+    Returns
+    -------
+    dict
+        Arrays of shape (n_realizations, area, buffer): 'lost_sols',
+        'longest_outage_sols', 'survival_failures', 'min_soc',
+        'spilled_Wh'
+    """
+    p = params
+    area = np.asarray(panel_area_m2, dtype=float)[None, :, None]
+    capacity = np.asarray(buffer_capacity_Wh, dtype=float)[None, None, :]
+    n_realizations, n_sols = yield_Wh_m2.shape
+    shape = (n_realizations, area.shape[1], capacity.shape[2])
+
+    energy = np.broadcast_to(p['initial_soc'] * capacity, shape).copy()
+    lost = np.zeros(shape, dtype=int)
+    run = np.zeros(shape, dtype=int)
+    longest = np.zeros(shape, dtype=int)
+    failures = np.zeros(shape, dtype=int)
+    min_soc = np.ones(shape)
+    spilled = np.zeros(shape)
+    charge, heater = p['charge_Wh'], p['heater_Wh']
+
+    for t in range(n_sols):
+        # Day: charge the buffer, spill the surplus
+        energy += area * yield_Wh_m2[:, t, None, None]
+        spilled += np.maximum(energy - capacity, 0.0)
+        np.minimum(energy, capacity, out=energy)
+
+        # Flight if one UAV charge leaves the night heater reserve
+        fly = energy >= charge + heater
+        energy -= fly * charge
+        lost += ~fly
+        run = np.where(fly, 0, run + 1)
+        np.maximum(longest, run, out=longest)
+
+        # Night: heaters
+        energy -= heater
+        failures += energy < 0.0
+        np.maximum(energy, 0.0, out=energy)
+        np.minimum(min_soc, energy / capacity, out=min_soc)
+
+    return {
+        'lost_sols': lost,
+        'longest_outage_sols': longest,
+        'survival_failures': failures,
+        'min_soc': min_soc,
+        'spilled_Wh': spilled,
+    }
+
+
+def loss_of_operations(sim: Dict[str, np.ndarray], n_sols: int,
+                       long_outage_sols: int) -> Dict[str, np.ndarray]:
+    """
+    Reduce realizations to loss-of-operations statistics per design.
+
+    Returns
+    -------
+    dict
+        Arrays of shape (area, buffer): 'lolp' (fraction of sols without
+        operations), 'p_outage' (probability of any lost sol in a Mars
+        year), 'p_long_outage', 'p_survival_failure', 'mean_lost_sols',
+        'p95_lost_sols'
+    """
+    lost = sim['lost_sols']
+    return {
+        'lolp': lost.mean(axis=0) / n_sols,
+        'p_outage': (lost > 0).mean(axis=0),
+        'p_long_outage': (sim['longest_outage_sols'] >= long_outage_sols).mean(axis=0),
+        'p_survival_failure': (sim['survival_failures'] > 0).mean(axis=0),
+        'mean_lost_sols': lost.mean(axis=0),
+        'p95_lost_sols': np.percentile(lost, 95, axis=0),
+    }
+
+
+# =============================================================================
+# FULL ANALYSIS
+# =============================================================================
+
+@traced('dust_scenarios')
+def scenario_analysis(n_realizations: int = None, seed: int = None,
+                      panel_area_m2=None, buffer_capacity_Wh=None) -> Dict[str, Any]:
+    """
+    Loss-of-operations probability over the panel area × buffer grid.
+
+    Parameters
+    ----------
+    n_realizations : int, optional
+        Mars years to simulate (default: infrastructure.scenarios.n_realizations)
+    seed : int, optional
+        Random seed (default: infrastructure.scenarios.seed)
+    panel_area_m2, buffer_capacity_Wh : sequence of float, optional
+        Design grid (default: the configured grid)
+
+    Returns
+    -------
+    dict
+        Model inputs, weather statistics, per-design statistics and the
+        deterministic design point of solar_power.py
+    """
+    from .solar_power import get_buffer_battery_sizing, get_solar_panel_sizing
+
+    p = scenario_parameters()
+    n = p['n_realizations'] if n_realizations is None else n_realizations
+    areas = p['panel_area_m2'] if panel_area_m2 is None else np.asarray(panel_area_m2, dtype=float)
+    buffers = p['buffer_capacity_Wh'] if buffer_capacity_Wh is None else np.asarray(buffer_capacity_Wh, dtype=float)
+
+    weather = daily_yield_Wh_m2(n, seed, p)
+    sim = simulate_buffer(weather['yield_Wh_m2'], areas, buffers, p)
+    stats = loss_of_operations(sim, p['n_sols'], p['long_outage_sols'])
+    return {
+        'params': p,
+        'n_realizations': n,
+        'panel_area_m2': areas,
+        'buffer_capacity_Wh': buffers,
+        'tau_mean': float(weather['tau'].mean()),
+        'tau_p99': float(np.percentile(weather['tau'], 99)),
+        'transmission_mean': float(weather['transmission'].mean()),
+        'yield_mean_Wh_m2': float(weather['yield_Wh_m2'].mean()),
+        'yield_p05_Wh_m2': float(np.percentile(weather['yield_Wh_m2'], 5)),
+        'deterministic_yield_Wh_m2': (p['cell_efficiency'] * p['design_irradiance']
+                                      * p['sun_hours'] * p['incidence_factor']),
+        'design_panel_m2': get_solar_panel_sizing().panel_area_design_m2,
+        'design_buffer_Wh': get_buffer_battery_sizing().buffer_capacity_Wh,
+        **stats,
+    }
+
+
+def _print_grid(title: str, values: np.ndarray, areas, buffers, fmt: str) -> None:
+    print(title)
+    print(f"  {'A (m²)':>8} " + ''.join(f"{b:>9.0f}" for b in buffers) + '  (buffer Wh)')
+    for a, row in zip(areas, values):
+        print(f"  {a:8.1f} " + ''.join(format(v, fmt) for v in row))
+
+
+def print_analysis(results: Dict[str, Any] = None) -> None:
+    """Print formatted dust-storm scenario results."""
+    if results is None:
+        results = scenario_analysis()
+
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    p = results['params']
+    areas, buffers = results['panel_area_m2'], results['buffer_capacity_Wh']
+
+    print('=' * 80)
+    print('DUST-STORM AND DEGRADATION SCENARIOS (charging system)')
+    print('=' * 80)
+    print(f'Computed: {timestamp}')
+    print('Config:   All values loaded from config/ YAML files')
+    print()
+
+    print('WEATHER AND PANEL STATE')
+    print('-' * 50)
+    print(f"  Realizations:          {results['n_realizations']} Mars years × {p['n_sols']} sols "
+          f"(seed {p['seed']})")
+    print(f"  Global storm:          {p['global']['annual_probability'] * 100:.0f}% of years, "
+          f"tau {p['global']['peak_tau']:.1f}")
+    print(f"  Optical depth:         mean {results['tau_mean']:.2f}, 99th pct {results['tau_p99']:.2f}")
+    print(f"  Cover transmission:    mean {results['transmission_mean']:.3f}")
+    print(f"  Degradation at age:    ×{degradation_factor(1, p)[0]:.3f} "
+          f"({p['degradation']['age_years']:.0f} years)")
+    print(f"  Panel yield:           mean {results['yield_mean_Wh_m2']:.0f} Wh/m²/sol, "
+          f"5th pct {results['yield_p05_Wh_m2']:.0f} "
+          f"(deterministic basis {results['deterministic_yield_Wh_m2']:.0f})")
+    print()
+
+    print('DEMAND')
+    print('-' * 50)
+    print(f"  UAV charge per sol:    {p['charge_Wh']:.0f} Wh (from buffer)")
+    print(f"  Night heaters:         {p['heater_Wh']:.0f} Wh/sol")
+    print(f"  Deterministic design:  {results['design_panel_m2']:.1f} m² panel "
+          f"(×{p['design_margin']:.1f}), {results['design_buffer_Wh']:.0f} Wh buffer "
+          f"(×{p['night_reserve_factor']:.1f})")
+    print()
+
+    _print_grid('LOSS-OF-OPERATIONS PROBABILITY (fraction of sols without flight, %)',
+                results['lolp'] * 100, areas, buffers, '9.2f')
+    print()
+    _print_grid('PROBABILITY OF ANY LOST SOL IN A MARS YEAR (%)',
+                results['p_outage'] * 100, areas, buffers, '9.1f')
+    print()
+    _print_grid(f"PROBABILITY OF AN OUTAGE ≥ {p['long_outage_sols']} SOLS (%)",
+                results['p_long_outage'] * 100, areas, buffers, '9.1f')
+    print()
+    _print_grid('PROBABILITY OF A HEATER SURVIVAL FAILURE (%)',
+                results['p_survival_failure'] * 100, areas, buffers, '9.1f')
+    print('=' * 80)
+
+
+def main() -> None:
+    """Command-line entry point."""
+    import argparse
+    from ..config import load_scenario
+
+    parser = argparse.ArgumentParser(
+        description='Loss-of-operations probability of the solar charging system '
+                    'over dust-storm and degradation realizations.')
+    parser.add_argument('-n', '--realizations', type=int, default=None,
+                        help='Mars years to simulate (default: from config)')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed (default: from config)')
+    parser.add_argument('--scenario', nargs='+', default=[],
+                        help='Apply scenario overlays from config/scenarios/ (stacked in order)')
+    args = parser.parse_args()
+
+    with load_scenario(*args.scenario).applied():
+        print_analysis(scenario_analysis(args.realizations, args.seed))
+
+
+if __name__ == '__main__':
+    main()
@@ -44,6 +44,7 @@ class SolarPanelSizing:
     design_margin: float        # For dust/degradation
     panel_area_design_m2: float # With margin
     panel_mass_kg: float        # Total mass
+    heater_energy_Wh: float = 0.0  # Night survival heaters per sol (thermal.py)
 
 
 @dataclass
@@ -58,6 +59,7 @@ class BufferBatterySizing:
     battery_energy_density_Wh_kg: float  # Same as UAV
     buffer_mass_kg: float             # Total mass
     rationale: str                    # Design decision rationale
+    heater_energy_Wh: float = 0.0     # Night survival heaters per sol (thermal.py)
 
 
 @dataclass
@@ -122,7 +124,30 @@ def get_solar_irradiance_params() -> SolarIrradianceParams:
     )
 
 
-def get_solar_panel_sizing() -> SolarPanelSizing:
+def get_thermal_energy_Wh(include_thermal: bool = None) -> float:
+    """
+    Night survival heater energy charged to the solar system per sol.
+    
+    Parameters
+    ----------
+    include_thermal : bool, optional
+        Include the heater energy (default: battery.thermal.use_in_sizing)
+    
+    Returns
+    -------
+    float
+        Heater energy of the sizing units (worst season, design point) in
+        Wh/sol, or 0 when not included.
+    """
+    if include_thermal is None:
+        include_thermal = get_param('battery.thermal.use_in_sizing', False)
+    if not include_thermal:
+        return 0.0
+    from .thermal import design_heater_energy_Wh
+    return sum(design_heater_energy_Wh().values())
+
+
+def get_solar_panel_sizing(include_thermal: bool = None) -> SolarPanelSizing:
     """
     Calculate solar panel area for UAV charging.
     
@@ -135,14 +160,22 @@ def get_solar_panel_sizing() -> SolarPanelSizing:
     
     Design margin of 1.5× added for cell degradation and operational margin.
     
+    With battery.thermal.use_in_sizing the night survival heater energy
+    (thermal.py) is added to the daily energy requirement.
+    
+    Parameters
+    ----------
+    include_thermal : bool, optional
+        Override battery.thermal.use_in_sizing
+    
     Returns
     -------
     SolarPanelSizing
         Solar panel sizing results.
     """
     # Solar cell parameters (SolAero IMM-α selected)
-    cell_efficiency = 0.33  # 33% BOL efficiency
-    cell_mass_kg_m2 = 0.49  # 49 mg/cm² = 0.49 kg/m²
+    cell_efficiency = get_param('infrastructure.solar_array.cell_efficiency')
+    cell_mass_kg_m2 = get_param('infrastructure.solar_array.cell_mass_kg_m2')
     
     # Irradiance parameters - use DESIGN (worst-case) value, not clear-sky
     irradiance = get_solar_irradiance_params()
@@ -162,13 +195,15 @@ def get_solar_panel_sizing() -> SolarPanelSizing:
     # Get UAV battery specs
     batt_capacity = get_uav_battery_capacity_Wh()
     depth_of_discharge = get_param('battery.utilization.depth_of_discharge')
-    charger_efficiency = 0.90  # Typical charger efficiency
+    charger_efficiency = get_param('infrastructure.charging.charger_efficiency')
     
     # Energy to replenish = capacity × DoD
     energy_per_charge = batt_capacity * depth_of_discharge
     
-    # Energy required from solar (accounting for charger losses)
-    energy_required = energy_per_charge / charger_efficiency
+    # Energy required from solar (accounting for charger losses), plus the
+    # battery heaters that keep the stored packs warm overnight
+    heater_energy = get_thermal_energy_Wh(include_thermal)
+    energy_required = energy_per_charge / charger_efficiency + heater_energy
     
     # Minimum panel area
     panel_area_min = energy_required / daily_energy_Wh_m2
@@ -176,12 +211,13 @@ def get_solar_panel_sizing() -> SolarPanelSizing:
     # Design margin for cell degradation and operational margin
     # Sizing basis already uses worst-case (aphelion + dust) irradiance
     # 1.5x margin ensures daily generation comfortably exceeds buffer capacity
-    design_margin = 1.5
+    design_margin = get_param('infrastructure.solar_array.design_margin')
     panel_area_design = panel_area_min * design_margin
     
     # Round UP to practical value (0.5 m² increments)
     import math
-    panel_area_design = math.ceil(panel_area_design * 2) / 2
+    increment = get_param('infrastructure.solar_array.area_increment_m2')
+    panel_area_design = math.ceil(panel_area_design / increment) * increment
     
     # Panel mass (cells only, mounting structure separate)
     panel_mass = panel_area_design * cell_mass_kg_m2
@@ -196,6 +232,7 @@ def get_solar_panel_sizing() -> SolarPanelSizing:
         design_margin=design_margin,
         panel_area_design_m2=panel_area_design,
         panel_mass_kg=panel_mass,
+        heater_energy_Wh=heater_energy,
     )
 
 
@@ -222,7 +259,7 @@ def get_uav_battery_capacity_Wh() -> float:
     return capacity_Wh
 
 
-def get_buffer_battery_sizing() -> BufferBatterySizing:
+def get_buffer_battery_sizing(include_thermal: bool = None) -> BufferBatterySizing:
     """
     Calculate buffer battery capacity for solar energy storage.
     
@@ -238,6 +275,14 @@ def get_buffer_battery_sizing() -> BufferBatterySizing:
     4. Operational flexibility: UAV battery packs can serve as buffer
        spares if needed
     
+    With battery.thermal.use_in_sizing the buffer also carries the night
+    survival heater energy (thermal.py), drawn while the panels are dark.
+    
+    Parameters
+    ----------
+    include_thermal : bool, optional
+        Override battery.thermal.use_in_sizing
+    
     Returns
     -------
     BufferBatterySizing
@@ -251,16 +296,17 @@ def get_buffer_battery_sizing() -> BufferBatterySizing:
     energy_per_charge = batt_capacity * depth_of_discharge
     
     # Charger efficiency
-    charger_efficiency = 0.90
+    charger_efficiency = get_param('infrastructure.charging.charger_efficiency')
     
     # Energy required from buffer
     energy_from_buffer = energy_per_charge / charger_efficiency
     
     # Night reserve factor (allows one overnight charge + margin)
-    night_reserve_factor = 1.5
+    night_reserve_factor = get_param('infrastructure.charging.night_reserve_factor')
     
-    # Buffer capacity
-    buffer_capacity = energy_from_buffer * night_reserve_factor
+    # Buffer capacity (charge reserve plus overnight heater draw)
+    heater_energy = get_thermal_energy_Wh(include_thermal)
+    buffer_capacity = energy_from_buffer * night_reserve_factor + heater_energy
     
     # DESIGN DECISION: Use same battery technology as UAV
     # UAV uses solid-state Li-ion at 270 Wh/kg
@@ -286,6 +332,7 @@ def get_buffer_battery_sizing() -> BufferBatterySizing:
         battery_energy_density_Wh_kg=battery_energy_density,
         buffer_mass_kg=buffer_mass,
         rationale=rationale,
+        heater_energy_Wh=heater_energy,
     )
 
 
@@ -349,7 +396,7 @@ def get_solar_system_specs() -> SolarSystemSpecs:
     return SolarSystemSpecs(
         cell_technology="SolAero IMM-α",
         cell_efficiency_pct=panel.cell_efficiency * 100,
-        cell_mass_kg_m2=0.49,
+        cell_mass_kg_m2=get_param('infrastructure.solar_array.cell_mass_kg_m2'),
         panel_area_m2=panel.panel_area_design_m2,
         peak_power_W=peak_power,
         daily_energy_Wh=daily_energy,
@@ -391,11 +438,13 @@ def print_solar_power_analysis():
     print(f"  Design irradiance:    {panel.surface_irradiance_W_m2:.0f} W/m² (aphelion + typical dust)")
     print(f"  Peak power output:    P_peak = {panel.cell_efficiency:.2f} × {panel.surface_irradiance_W_m2:.0f} = {panel.peak_power_W_m2:.1f} W/m²")
     print(f"  Daily energy yield:   E_panel = {panel.peak_power_W_m2:.1f} × {irrad.effective_sun_hours:.0f} × {irrad.avg_incidence_factor:.1f} = {panel.daily_energy_Wh_m2:.1f} Wh/m²/sol")
+    if panel.heater_energy_Wh > 0:
+        print(f"  Battery heaters:      {panel.heater_energy_Wh:.0f} Wh/sol (night survival, included below)")
     print(f"  Energy required:      {panel.energy_required_Wh:.0f} Wh (per charge cycle)")
     print(f"  Minimum panel area:   A = {panel.energy_required_Wh:.0f} / {panel.daily_energy_Wh_m2:.1f} = {panel.panel_area_min_m2:.2f} m²")
     print(f"  Design margin:        ×{panel.design_margin:.2f} (degradation only, dust in irradiance)")
     print(f"  Design panel area:    {panel.panel_area_min_m2:.2f} × {panel.design_margin:.2f} = {panel.panel_area_design_m2:.1f} m²")
-    print(f"  Panel mass:           {panel.panel_area_design_m2:.1f} × 0.49 = {panel.panel_mass_kg:.2f} kg")
+    print(f"  Panel mass:           {panel.panel_area_design_m2:.1f} × {panel.panel_mass_kg / panel.panel_area_design_m2:.2f} = {panel.panel_mass_kg:.2f} kg")
     
     # Buffer battery sizing
     buffer = get_buffer_battery_sizing()
@@ -406,7 +455,11 @@ def print_solar_power_analysis():
     print(f"  Charger efficiency:       {buffer.charger_efficiency*100:.0f}%")
     print(f"  Energy from buffer:       {buffer.energy_per_charge_Wh:.0f} / {buffer.charger_efficiency:.2f} = {buffer.energy_from_buffer_Wh:.0f} Wh")
     print(f"  Night reserve factor:     ×{buffer.night_reserve_factor:.1f}")
-    print(f"  Buffer capacity:          {buffer.energy_from_buffer_Wh:.0f} × {buffer.night_reserve_factor:.1f} = {buffer.buffer_capacity_Wh:.0f} Wh")
+    if buffer.heater_energy_Wh > 0:
+        print(f"  Battery heaters:          {buffer.heater_energy_Wh:.0f} Wh/sol (night survival)")
+        print(f"  Buffer capacity:          {buffer.energy_from_buffer_Wh:.0f} × {buffer.night_reserve_factor:.1f} + {buffer.heater_energy_Wh:.0f} = {buffer.buffer_capacity_Wh:.0f} Wh")
+    else:
+        print(f"  Buffer capacity:          {buffer.energy_from_buffer_Wh:.0f} × {buffer.night_reserve_factor:.1f} = {buffer.buffer_capacity_Wh:.0f} Wh")
     print(f"  Battery energy density:   {buffer.battery_energy_density_Wh_kg:.0f} Wh/kg")
     print(f"  Buffer mass:              {buffer.buffer_capacity_Wh:.0f} / {buffer.battery_energy_density_Wh_kg:.0f} = {buffer.buffer_mass_kg:.2f} kg")
     
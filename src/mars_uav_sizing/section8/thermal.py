@@ -0,0 +1,383 @@
+"""
+Battery Night Survival Thermal Model
+====================================
+
+Heater energy needed to keep the stored battery packs (UAV pack, buffer
+battery) inside their operating window through the Martian night.
+
+Each stored pack is a lumped-parameter network of three nodes driven by the
+diurnal ambient temperature of the season:
+
+    pack --G_pack-- airframe --G_af-- hangar --G_h-- ambient T_amb(t)
+
+    G_pack = k_ins × A_pack / t_ins + G_leads,   A_pack = 6 (m / ρ)^(2/3)
+    C dT/dt = Σ G (T_j - T) + Q_heater          (per node)
+    T_amb(t) = T_season + ΔT_season × cos(2π (t - t_peak) / 24 h)
+
+The pack heater is an ideal thermostat capped at its rated power: it supplies
+the heat that holds the pack at T_min + margin, up to P_heater. A hangar with
+a setpoint is held there by the habitat (its heating is reported, not charged
+to the solar budget); without a setpoint it floats; a unit without a hangar
+couples its airframe directly to ambient.
+
+The network is integrated with explicit Euler steps over spin-up sols and one
+recorded sol, vectorized over (season × insulation thickness × heater power),
+so every design option and season is evaluated in the same time loop.
+
+With battery.thermal.use_in_sizing the design-point heater energy of the worst
+season is added to the solar panel energy requirement and to the buffer
+battery capacity (solar_power.py).
+
+Reference: Manuscript Section 7.4 (battery thermal management) and 8.1
+Last Updated: 2026-10-19
+"""
+
+import math
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from ..config import get_param
+from ..instrumentation import traced
+
+
+# =============================================================================
+# MODEL PARAMETERS
+# =============================================================================
+
+def thermal_parameters() -> Dict[str, Any]:
+    """
+    Collect the inputs of the night survival model from config.
+
+    Returns
+    -------
+    dict
+        Seasons with their ambient profile, pack limits, insulation and
+        heater options, the design point and the unit networks
+    """
+    thermal = 'battery.thermal'
+    diurnal = 'environment.arcadia_planitia.diurnal'
+    means = get_param(f'{diurnal}.mean_K')
+    seasons = tuple(means)
+    return {
+        'seasons': seasons,
+        'ambient_mean_K': np.array([means[s] for s in seasons], dtype=float),
+        'ambient_amplitude_K': np.array(
+            [get_param(f'{diurnal}.amplitude_K.{s}') for s in seasons], dtype=float),
+        'season_fraction': np.array(
+            [get_param(f'{diurnal}.season_fraction.{s}') for s in seasons], dtype=float),
+        'peak_hour': get_param(f'{diurnal}.peak_hour'),
+        'sol_s': get_param('physical.mars.sol_s'),
+        'sols_per_year': get_param('physical.mars.sols_per_year'),
+        'temp_min_C': get_param('battery.specifications.operating_temp_min_C'),
+        'temp_max_C': get_param('battery.specifications.operating_temp_max_C'),
+        'setpoint_margin_K': get_param(f'{thermal}.setpoint_margin_K'),
+        'pack_specific_heat': get_param(f'{thermal}.pack_specific_heat_J_kgK'),
+        'pack_density': get_param(f'{thermal}.pack_density_kg_m3'),
+        'insulation_conductivity': get_param(f'{thermal}.insulation_conductivity_W_mK'),
+        'insulation_thickness_m': np.asarray(get_param(f'{thermal}.insulation_thickness_m'), dtype=float),
+        'heater_power_W': np.asarray(get_param(f'{thermal}.heater_power_W'), dtype=float),
+        'design_insulation_m': get_param(f'{thermal}.design.insulation_thickness_m'),
+        'design_heater_W': get_param(f'{thermal}.design.heater_power_W'),
+        'time_step_s': get_param(f'{thermal}.time_step_s'),
+        'spin_up_sols': get_param(f'{thermal}.spin_up_sols'),
+        'units': get_param(f'{thermal}.units'),
+        'sizing_units': tuple(get_param(f'{thermal}.sizing_units', [])),
+    }
+
+
+def pack_mass_kg(unit: str) -> float:
+    """
+    Mass of the stored pack of a unit (UAV pack or buffer battery).
+
+    The buffer is taken at its capacity without heater energy, so the
+    thermal mass does not depend on the result of this model.
+    """
+    from .solar_power import get_buffer_battery_sizing, get_uav_battery_capacity_Wh
+
+    if unit.startswith('buffer'):
+        return get_buffer_battery_sizing(include_thermal=False).buffer_mass_kg
+    return get_uav_battery_capacity_Wh() / get_param('battery.specifications.specific_energy_Wh_kg')
+
+
+def pack_area_m2(mass_kg, density_kg_m3):
+    """Surface area of a cubic pack of the given mass (elementwise)."""
+    return 6.0 * (np.asarray(mass_kg, dtype=float) / density_kg_m3) ** (2.0 / 3.0)
+
+
+def ambient_temperature(hour, mean_K, amplitude_K, peak_hour: float = 14.0):
+    """
+    Diurnal ambient temperature (elementwise).
+
+    Parameters
+    ----------
+    hour : float or np.ndarray
+        Local solar time in Mars hours (0-24)
+    mean_K, amplitude_K : float or np.ndarray
+        Sol-mean temperature and half of the daily swing in K
+    peak_hour : float
+        Local time of the daily maximum
+
+    Returns
+    -------
+    float or np.ndarray
+        Temperature in K
+    """
+    phase = 2.0 * np.pi * (np.asarray(hour, dtype=float) - peak_hour) / 24.0
+    return mean_K + amplitude_K * np.cos(phase)
+
+
+# =============================================================================
+# NETWORK INTEGRATION
+# =============================================================================
+
+def simulate_unit(unit: str, insulation_m=None, heater_W=None,
+                  params: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    Integrate the thermal network of one stored pack over a sol per season.
+
+    Parameters
+    ----------
+    unit : str
+        Key of battery.thermal.units
+    insulation_m : sequence of float, optional
+        Insulation thicknesses (default: the configured options)
+    heater_W : sequence of float, optional
+        Heater power ratings (default: the configured options)
+    params : dict, optional
+        Model inputs (default: thermal_parameters())
+
+    Returns
+    -------
+    dict
+        Arrays of shape (season, insulation, heater) for the recorded sol:
+        'heater_energy_Wh', 'peak_heater_W', 'min_pack_C', 'max_pack_C',
+        'hours_below_min', 'hangar_energy_Wh', 'feasible'; the
+        'annual_heater_kWh' (insulation, heater) and the network inputs
+    """
+    p = params if params is not None else thermal_parameters()
+    spec = p['units'][unit]
+    insulation = np.atleast_1d(np.asarray(
+        p['insulation_thickness_m'] if insulation_m is None else insulation_m, dtype=float))
+    heater = np.atleast_1d(np.asarray(
+        p['heater_power_W'] if heater_W is None else heater_W, dtype=float))
+
+    # Batch axes: (season, insulation, heater)
+    n_seasons = len(p['seasons'])
+    shape = (n_seasons, len(insulation), len(heater))
+    mass = pack_mass_kg(unit)
+    area = pack_area_m2(mass, p['pack_density'])
+    c_pack = mass * p['pack_specific_heat']
+    g_pack = (p['insulation_conductivity'] * area / insulation[None, :, None]
+              + spec.get('lead_conductance_W_K', 0.0))
+    p_max = heater[None, None, :]
+
+    c_af = spec['airframe']['heat_capacity_J_K']
+    g_af = spec['airframe']['conductance_W_K']
+    hangar = spec.get('hangar')
+    hangar_setpoint = None
+    if hangar is not None and hangar.get('setpoint_C') is not None:
+        hangar_setpoint = hangar['setpoint_C'] + 273.15
+    floating = hangar is not None and hangar_setpoint is None
+
+    # Step below half the shortest time constant of the free nodes
+    tau = [c_pack / float(np.max(g_pack)), c_af / (float(np.max(g_pack)) + g_af)]
+    if floating:
+        tau.append(hangar['heat_capacity_J_K'] / (g_af + hangar['conductance_W_K']))
+    dt_max = min(p['time_step_s'], 0.5 * min(tau))
+    n_steps = int(math.ceil(p['sol_s'] / dt_max))
+    dt = p['sol_s'] / n_steps
+
+    hours = (np.arange(n_steps) + 0.5) * 24.0 / n_steps
+    ambient = ambient_temperature(hours[None, :], p['ambient_mean_K'][:, None],
+                                  p['ambient_amplitude_K'][:, None], p['peak_hour'])
+    ambient = ambient[:, :, None, None]  # (season, step, 1, 1)
+
+    t_min = p['temp_min_C'] + 273.15
+    t_set = t_min + p['setpoint_margin_K']
+    t_pack = np.full(shape, t_set)
+    t_af = np.full(shape, t_set)
+    if hangar_setpoint is not None:
+        t_hangar = np.full(shape, hangar_setpoint)
+    else:
+        t_hangar = np.broadcast_to(p['ambient_mean_K'][:, None, None], shape).copy()
+
+    for sol in range(p['spin_up_sols'] + 1):
+        record = sol == p['spin_up_sols']
+        if record:
+            heater_J = np.zeros(shape)
+            hangar_J = np.zeros(shape)
+            peak_W = np.zeros(shape)
+            below_s = np.zeros(shape)
+            min_pack = np.full(shape, np.inf)
+            max_pack = np.full(shape, -np.inf)
+        for k in range(n_steps):
+            t_amb = ambient[:, k]
+            t_shelter = t_amb if hangar is None else t_hangar
+            q_pack = g_pack * (t_pack - t_af)
+            q_af = g_af * (t_af - t_shelter)
+
+            # Thermostat: the heat that restores the setpoint, capped at rating
+            t_pack = t_pack - dt * q_pack / c_pack
+            q_heat = np.minimum(np.maximum(t_set - t_pack, 0.0) * c_pack / dt, p_max)
+            t_pack = t_pack + dt * q_heat / c_pack
+            t_af = t_af + dt * (q_pack - q_af) / c_af
+
+            q_hangar = 0.0
+            if floating:
+                q_env = hangar['conductance_W_K'] * (t_hangar - t_amb)
+                t_hangar = t_hangar + dt * (q_af - q_env + hangar['heat_gain_W']) / hangar['heat_capacity_J_K']
+            elif hangar_setpoint is not None:
+                # Habitat holds the bay: supplies the wall losses net of the
+                # heat released by the stored airframe
+                q_hangar = np.maximum(
+                    hangar['conductance_W_K'] * (hangar_setpoint - t_amb) - q_af
+                    - hangar['heat_gain_W'], 0.0)
+
+            if record:
+                heater_J += q_heat * dt
+                hangar_J += q_hangar * dt
+                np.maximum(peak_W, q_heat, out=peak_W)
+                np.minimum(min_pack, t_pack, out=min_pack)
+                np.maximum(max_pack, t_pack, out=max_pack)
+                below_s += (t_pack < t_min - 1e-9) * dt
+
+    heater_Wh = heater_J / 3600.0
+    annual_kWh = np.tensordot(p['season_fraction'], heater_Wh, axes=1) * p['sols_per_year'] / 1000.0
+    return {
+        'unit': unit,
+        'seasons': p['seasons'],
+        'insulation_thickness_m': insulation,
+        'heater_power_W': heater,
+        'pack_mass_kg': mass,
+        'pack_area_m2': float(area),
+        'pack_conductance_W_K': g_pack[0, :, 0],
+        'setpoint_C': t_set - 273.15,
+        'time_step_s': dt,
+        'heater_energy_Wh': heater_Wh,
+        'peak_heater_W': peak_W,
+        'min_pack_C': min_pack - 273.15,
+        'max_pack_C': max_pack - 273.15,
+        'hours_below_min': below_s * 24.0 / p['sol_s'],  # Mars hours
+        'hangar_energy_Wh': hangar_J / 3600.0,
+        'feasible': (min_pack >= t_min - 1e-9) & (max_pack <= p['temp_max_C'] + 273.15),
+        'annual_heater_kWh': annual_kWh,
+    }
+
+
+def design_heater_energy_Wh(units: Optional[Sequence[str]] = None,
+                            params: Dict[str, Any] = None) -> Dict[str, float]:
+    """
+    Heater energy per sol of the worst season at the design point.
+
+    Parameters
+    ----------
+    units : sequence of str, optional
+        Units to evaluate (default: battery.thermal.sizing_units)
+    params : dict, optional
+        Model inputs (default: thermal_parameters())
+
+    Returns
+    -------
+    dict
+        Unit -> Wh/sol
+    """
+    p = params if params is not None else thermal_parameters()
+    units = p['sizing_units'] if units is None else units
+    energy = {}
+    for unit in units:
+        result = simulate_unit(unit, [p['design_insulation_m']], [p['design_heater_W']], p)
+        energy[unit] = float(result['heater_energy_Wh'].max())
+    return energy
+
+
+# =============================================================================
+# FULL ANALYSIS
+# =============================================================================
+
+@traced('battery_thermal')
+def thermal_analysis() -> Dict[str, Any]:
+    """
+    Night survival heater energy of every unit over the design options.
+
+    Returns
+    -------
+    dict
+        Model inputs, per-unit simulation results and the design-point
+        energies used in sizing
+    """
+    p = thermal_parameters()
+    units = {name: simulate_unit(name, params=p) for name in p['units']}
+    design = design_heater_energy_Wh(params=p)
+    return {
+        'params': p,
+        'units': units,
+        'design_energy_Wh': design,
+        'sizing_energy_Wh': sum(design.values()),
+        'use_in_sizing': get_param('battery.thermal.use_in_sizing', False),
+    }
+
+
+def print_analysis(results: Dict[str, Any] = None) -> None:
+    """Print formatted night survival results."""
+    if results is None:
+        results = thermal_analysis()
+
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    p = results['params']
+
+    print('=' * 80)
+    print('BATTERY NIGHT SURVIVAL (lumped thermal network)')
+    print('=' * 80)
+    print(f'Computed: {timestamp}')
+    print('Config:   All values loaded from config/ YAML files')
+    print()
+
+    print('DIURNAL AMBIENT (Arcadia Planitia)')
+    print('-' * 50)
+    for season, mean, amp, frac in zip(p['seasons'], p['ambient_mean_K'],
+                                       p['ambient_amplitude_K'], p['season_fraction']):
+        print(f"  {season:<8} {mean - amp - 273.15:7.1f} to {mean + amp - 273.15:6.1f} °C "
+              f"({frac * 100:.0f}% of the year)")
+    print(f"  Pack window:           {p['temp_min_C']:.0f} to {p['temp_max_C']:.0f} °C, "
+          f"heater setpoint {p['temp_min_C'] + p['setpoint_margin_K']:.0f} °C")
+    print()
+
+    ins = p['design_insulation_m']
+    heat = p['design_heater_W']
+    for name, r in results['units'].items():
+        print(f"UNIT: {name} (pack {r['pack_mass_kg']:.2f} kg, {r['pack_area_m2']:.3f} m², "
+              f"dt = {r['time_step_s']:.0f} s)")
+        print('-' * 50)
+        header = ''.join(f"{h:>8.0f} W" for h in r['heater_power_W'])
+        print(f"  Heater energy, worst season (Wh/sol); * = pack below {p['temp_min_C']:.0f} °C")
+        print(f"  {'t_ins':>8} {'G (W/K)':>8} {header}")
+        worst = r['heater_energy_Wh'].max(axis=0)
+        feasible = r['feasible'].all(axis=0)
+        for i, t in enumerate(r['insulation_thickness_m']):
+            cells = ''.join(f"{e:9.0f}{' ' if ok else '*'}" for e, ok in zip(worst[i], feasible[i]))
+            print(f"  {t * 1000:6.0f} mm {r['pack_conductance_W_K'][i]:8.3f} {cells}")
+        i = int(np.argmin(np.abs(r['insulation_thickness_m'] - ins)))
+        j = int(np.argmin(np.abs(r['heater_power_W'] - heat)))
+        print(f"  Design ({ins * 1000:.0f} mm, {heat:.0f} W) by season:")
+        for s, season in enumerate(r['seasons']):
+            print(f"    {season:<8} {r['heater_energy_Wh'][s, i, j]:7.1f} Wh/sol, "
+                  f"min pack {r['min_pack_C'][s, i, j]:6.1f} °C, "
+                  f"{r['hours_below_min'][s, i, j]:4.1f} h below limit"
+                  + (f", hangar {r['hangar_energy_Wh'][s, i, j] / 1000:.1f} kWh/sol (habitat)"
+                     if r['hangar_energy_Wh'][s, i, j] > 0 else ''))
+        print(f"    annual   {r['annual_heater_kWh'][i, j]:7.1f} kWh/year")
+        print()
+
+    print('SOLAR SIZING')
+    print('-' * 50)
+    for name, energy in results['design_energy_Wh'].items():
+        print(f"  {name:<20} {energy:7.1f} Wh/sol (worst season, design point)")
+    print(f"  Total heater energy:   {results['sizing_energy_Wh']:.1f} Wh/sol")
+    print(f"  Used in sizing:        {'yes' if results['use_in_sizing'] else 'no'}")
+    print('=' * 80)
+
+
+if __name__ == '__main__':
+    print_analysis()
@@ -6,13 +6,16 @@ Script verification functions to ensure calculations match manuscript values.
 
 Functions:
     - verify_all: Run all verification tests
+    - run_checks: Run check units in parallel, reusing cached outcomes
+    - write_junit / write_json: Reports for CI
+    - value_registry: Computed-value keys and placeholder binding for the manuscript sections
     - verify_section3: Verify atmospheric calculations
     - verify_section4: Verify reference data calculations
     - verify_section5: Verify constraint analysis results
 
-Last Updated: 2025-12-29
+Last Updated: 2026-10-19
 """
 
-from . import verify_manuscript
+from . import value_registry, verify_manuscript
 
-__all__ = ['verify_manuscript']
+__all__ = ['value_registry', 'verify_manuscript']
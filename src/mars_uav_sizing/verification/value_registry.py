@@ -0,0 +1,395 @@
+"""
+Manuscript Value Registry
+=========================
+
+Stable keys for every computed value quoted in the manuscript, locale-aware
+number formatting and placeholder binding for the section markdown files.
+
+Registry keys:
+    param.<yaml path>             configuration inputs (param.mission.mass.mtow_kg)
+    section3.atmosphere.<name>    check-unit analyses of verify_manuscript.CHECKS
+    section4.<unit>.<name>
+    section5..7.<analysis>.<name> run_analysis.run_all_analyses() results
+                                  (same dot-paths as the run archive)
+
+Placeholders in section files:
+    {{v:section5.hybrid_vtol.mtow_kg}}           default format
+    {{v:section5.hybrid_vtol.mtow_kg|.2f}}       Python format spec
+    {{v:section5.hybrid_vtol.margin_percent|.1f}}
+    {{v:param.battery.utilization.depth_of_discharge*100|.0f}}   scaled
+
+Formatting follows the manuscript style rules (docs/style_rules.txt,
+docs/regole_di_stile.txt): a ',' in the format spec groups thousands with
+the locale's separator, and inside $...$ math a comma separator is written
+as {,} so LaTeX does not add a space after it.
+
+Binding reads the template sections (sections_<lang>/) and writes the
+resolved copies to a build directory in one pass. A file is rewritten only
+when its resolved text changes, so unchanged sections keep their
+modification times for incremental builds; values.json in the build
+directory records the values bound in each file.
+
+Usage:
+    python tools/bind_values.py --lang all
+    python -m mars_uav_sizing.verification.value_registry --list section5.hybrid_vtol
+    python -m mars_uav_sizing.verification.value_registry --find sections_en/05_03_*.md
+
+Last Updated: 2026-10-19
+"""
+
+import contextlib
+import io
+import json
+import math
+import re
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..instrumentation import traced
+
+
+# =============================================================================
+# LOCALES
+# =============================================================================
+
+@dataclass(frozen=True)
+class Locale:
+    """Number and word conventions of one manuscript language."""
+
+    decimal: str = '.'
+    thousands: str = ','
+    true: str = 'yes'
+    false: str = 'no'
+
+
+# Both manuscripts use United States numerals (style rules, section 1)
+LOCALES: Dict[str, Locale] = {
+    'en': Locale(),
+    'it': Locale(true='sì', false='no'),
+}
+
+# Format spec for values without one: 4 significant digits, grouped thousands
+DEFAULT_FORMAT = ',.4g'
+
+PLACEHOLDER = re.compile(
+    r'\{\{v:(?P<key>[^{}|*]+?)(?:\*(?P<scale>[-+0-9.eE]+))?(?:\|(?P<fmt>[^{}]*))?\}\}'
+)
+
+# Inline and display math (display first, so $$ is not read as two $)
+_MATH = re.compile(r'\$\$.*?\$\$|\$[^$\n]+\$', re.DOTALL)
+
+
+def get_locale(lang: str, number_format: Optional[Dict[str, str]] = None) -> Locale:
+    """
+    Locale of a manuscript language, with optional separator overrides.
+
+    Parameters
+    ----------
+    lang : str
+        Language code ('en', 'it'); unknown codes use the English words
+    number_format : dict, optional
+        {'decimal': ..., 'thousands': ...} (config.yaml languages.<lang>.number_format)
+    """
+    locale = LOCALES.get(lang, Locale())
+    if number_format:
+        locale = Locale(
+            decimal=number_format.get('decimal', locale.decimal),
+            thousands=number_format.get('thousands', locale.thousands),
+            true=locale.true,
+            false=locale.false,
+        )
+    return locale
+
+
+def format_value(value: Any, fmt: Optional[str] = None, locale: Locale = LOCALES['en'],
+                 math_mode: bool = False) -> str:
+    """
+    Format a registry value for the manuscript.
+
+    Parameters
+    ----------
+    value : float, bool or str
+        Registry value
+    fmt : str, optional
+        Python format spec (default: DEFAULT_FORMAT for numbers)
+    locale : Locale
+        Separators and words
+    math_mode : bool
+        The value sits inside $...$ math (thousands comma written as {,})
+
+    Returns
+    -------
+    str
+    """
+    if isinstance(value, bool):
+        return locale.true if value else locale.false
+    if isinstance(value, str):
+        return format(value, fmt) if fmt else value
+    if not math.isfinite(value):
+        return '∞' if value > 0 else ('-∞' if value < 0 else 'n/a')
+    if fmt is None:
+        fmt = DEFAULT_FORMAT
+    text = format(int(round(value)) if fmt.endswith('d') else value, fmt)
+    # US-formatted text -> locale separators (placeholder avoids a double swap)
+    text = text.replace(',', '\0').replace('.', locale.decimal)
+    thousands = locale.thousands
+    if math_mode and thousands == ',':
+        thousands = '{,}'
+    return text.replace('\0', thousands)
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+@traced('value_registry.build_registry')
+def build_registry() -> Dict[str, Any]:
+    """
+    Every key the manuscript can reference, evaluated for the active scenario.
+
+    Returns
+    -------
+    dict
+        key -> float, bool or str (flattened as in the run archive)
+    """
+    from ..config import load_config
+    from ..run_analysis import run_all_analyses
+    from ..run_archive import flatten
+    from .verify_manuscript import CHECKS
+
+    registry: Dict[str, Any] = dict(flatten(load_config(), 'param'))
+    for unit in CHECKS:
+        if unit.name.startswith(('section3.', 'section4.')):
+            registry.update(flatten(unit.computed(), unit.name))
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = run_all_analyses(verbose=False)
+    registry.update(flatten(results))
+    return registry
+
+
+def find_keys(registry: Dict[str, Any], prefix: str = '') -> List[str]:
+    """Sorted registry keys starting with prefix."""
+    return sorted(key for key in registry if key.startswith(prefix))
+
+
+# =============================================================================
+# BINDING
+# =============================================================================
+
+def _math_spans(text: str) -> List[Tuple[int, int]]:
+    return [m.span() for m in _MATH.finditer(text)]
+
+
+def _in_spans(position: int, spans: List[Tuple[int, int]]) -> bool:
+    return any(start <= position < end for start, end in spans)
+
+
+def bind_text(text: str, registry: Dict[str, Any],
+              locale: Locale = LOCALES['en']) -> Tuple[str, Dict[str, str], List[str]]:
+    """
+    Resolve every placeholder of a markdown text.
+
+    Parameters
+    ----------
+    text : str
+        Template text
+    registry : dict
+        From build_registry()
+    locale : Locale
+        Formatting conventions
+
+    Returns
+    -------
+    tuple
+        (resolved text, {placeholder: rendered value}, unknown keys).
+        Placeholders with unknown keys are left in the text.
+    """
+    spans = _math_spans(text) if '$' in text else []
+    bound: Dict[str, str] = {}
+    missing: List[str] = []
+
+    def replace(match: re.Match) -> str:
+        key = match.group('key').strip()
+        if key not in registry:
+            missing.append(key)
+            return match.group(0)
+        value = registry[key]
+        if match.group('scale') and not isinstance(value, (bool, str)):
+            value = value * float(match.group('scale'))
+        rendered = format_value(value, match.group('fmt'), locale,
+                                math_mode=_in_spans(match.start(), spans))
+        bound[match.group(0)] = rendered
+        return rendered
+
+    return PLACEHOLDER.sub(replace, text), bound, missing
+
+
+def _read(path: Path) -> str:
+    # newline='' keeps the files' own line endings
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    if path.exists() and _read(path) == text:
+        # Mark as current for the staleness check of join_sections.py
+        path.touch()
+        return False
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+    return True
+
+
+def bind_sections(sections_dir: Path, output_dir: Path, registry: Dict[str, Any],
+                  locale: Locale = LOCALES['en'], check: bool = False) -> Dict[str, Any]:
+    """
+    Resolve one language's section files into output_dir in a single pass.
+
+    Markdown files are resolved, other files (front matter) are copied.
+    Files whose resolved text is unchanged are not rewritten (only their
+    modification time is refreshed, so every resolved file is newer than its
+    template after a bind), and files no longer present in sections_dir are
+    removed from output_dir.
+
+    Parameters
+    ----------
+    sections_dir : Path
+        Template sections (e.g. sections_en/)
+    output_dir : Path
+        Resolved sections (e.g. build/sections_en/)
+    registry : dict
+        From build_registry()
+    locale : Locale
+        Formatting conventions
+    check : bool
+        Do not write anything; only report what would change
+
+    Returns
+    -------
+    dict
+        'files' (number scanned), 'written' (names rewritten or that would
+        be), 'removed', 'n_values' (placeholders bound), 'changed_values'
+        ({file: {placeholder: (old, new)}}) and 'missing' ({file: [keys]})
+    """
+    sections_dir, output_dir = Path(sections_dir), Path(output_dir)
+    manifest_path = output_dir / 'values.json'
+    try:
+        previous = json.loads(manifest_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        previous = {}
+    if not check:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    sources = sorted(p for p in sections_dir.iterdir() if p.is_file())
+    report = {'files': len(sources), 'written': [], 'removed': [], 'n_values': 0,
+              'changed_values': {}, 'missing': {}}
+    manifest: Dict[str, Dict[str, str]] = {}
+    for source in sources:
+        target = output_dir / source.name
+        if source.suffix != '.md':
+            if not target.exists() or _read(target) != _read(source):
+                report['written'].append(source.name)
+                if not check:
+                    shutil.copyfile(source, target)
+            elif not check:
+                target.touch()
+            continue
+
+        text, bound, missing = bind_text(_read(source), registry, locale)
+        report['n_values'] += len(bound)
+        if missing:
+            report['missing'][source.name] = sorted(set(missing))
+        if bound:
+            manifest[source.name] = bound
+            old = previous.get(source.name, {})
+            changed = {p: (old.get(p), v) for p, v in bound.items() if old.get(p) != v}
+            if changed:
+                report['changed_values'][source.name] = changed
+        if check:
+            if not target.exists() or _read(target) != text:
+                report['written'].append(source.name)
+        elif _write_if_changed(target, text):
+            report['written'].append(source.name)
+
+    names = {p.name for p in sources} | {manifest_path.name}
+    if output_dir.exists():
+        for stale in sorted(p for p in output_dir.iterdir() if p.is_file() and p.name not in names):
+            report['removed'].append(stale.name)
+            if not check:
+                stale.unlink()
+    if not check:
+        _write_if_changed(manifest_path, json.dumps(manifest, indent=1, ensure_ascii=False) + '\n')
+    return report
+
+
+# =============================================================================
+# MIGRATION HELPER
+# =============================================================================
+
+_NUMBER = re.compile(r'(?<![\w.])-?\d{1,3}(?:(?:,|\{,\})\d{3})*(?:\.\d+)?(?![\w])')
+
+
+def find_literals(text: str, registry: Dict[str, Any], prefix: str = '',
+                  min_digits: int = 3) -> List[Tuple[int, str, List[str]]]:
+    """
+    Hard-coded numbers in a text that equal a registry value as printed.
+
+    A literal matches a key when the value rounded to the literal's decimals
+    gives the literal. Literals with fewer than min_digits significant digits
+    are skipped (too many chance matches).
+
+    Returns
+    -------
+    list of tuple
+        (line number, literal, matching keys)
+    """
+    numeric = [(k, v) for k, v in registry.items()
+               if k.startswith(prefix) and isinstance(v, float) and not isinstance(v, bool)
+               and math.isfinite(v)]
+    found = []
+    for line_no, line in enumerate(text.splitlines(), 1):
+        for match in _NUMBER.finditer(line):
+            literal = match.group(0)
+            plain = literal.replace('{,}', '').replace(',', '')
+            if len(plain.lstrip('-0.').replace('.', '')) < min_digits:
+                continue
+            decimals = len(plain.split('.')[1]) if '.' in plain else 0
+            number = float(plain)
+            keys = [k for k, v in numeric if round(v, decimals) == number]
+            if keys:
+                found.append((line_no, literal, keys))
+    return found
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Manuscript value registry')
+    parser.add_argument('--list', nargs='?', const='', metavar='PREFIX',
+                        help='Print registry keys and values (optionally by prefix)')
+    parser.add_argument('--find', nargs='+', metavar='FILE',
+                        help='Report hard-coded numbers that match registry values')
+    parser.add_argument('--prefix', default='', help='Only match keys with this prefix (--find)')
+    parser.add_argument('--scenario', nargs='+', default=[], metavar='NAME')
+    args = parser.parse_args()
+
+    from ..config import load_scenario
+
+    with load_scenario(*args.scenario).applied():
+        registry = build_registry()
+    if args.list is not None:
+        for key in find_keys(registry, args.list):
+            print(f'{key:70} {format_value(registry[key])}')
+    for name in args.find or []:
+        path = Path(name)
+        for line_no, literal, keys in find_literals(_read(path), registry, args.prefix):
+            shown = ', '.join(keys[:3]) + (f' (+{len(keys) - 3})' if len(keys) > 3 else '')
+            print(f'{path.name}:{line_no}: {literal:>12}  {shown}')
+    if args.list is None and not args.find:
+        print(f'{len(registry)} registry keys (use --list PREFIX or --find FILE)')
+
+
+if __name__ == '__main__':
+    main()
@@ -5,19 +5,44 @@ Manuscript Verification
 Comprehensive verification of all computed values against expected results
 derived from configuration and explicit formulas.
 
-Last Updated: 2025-12-29
+Verification is split into independent check units (CHECKS), one per
+analysis: each compares the analysis output with its expected values. The
+expected-value helpers share memoized intermediate quantities (weight, drag
+polar, stall wing loading, efficiency chains, battery energy) computed once
+per verification run.
+
+Every unit records the configuration paths it read (expected and computed
+side). Outcomes are cached in mars_uav_sizing/cache/verification.json with
+a fingerprint of those values and the source version; on the next run only
+the units whose inputs or code changed are re-executed, the others are
+reported from the cache. Units run in parallel (threads or processes).
+
+Usage:
+    python -m mars_uav_sizing.verification.verify_manuscript
+    python -m mars_uav_sizing.verification.verify_manuscript --junit verify.xml --json verify.json
+    python -m mars_uav_sizing.verification.verify_manuscript --no-cache --workers 1
+    python -m mars_uav_sizing.verification.verify_manuscript --scenario dusty_season
+
+Last Updated: 2026-10-19
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import math
-from dataclasses import dataclass
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
 
-from ..config import get_param
+from ..config import BASELINE, active_scenario, get_param, note_params, scenario_hash, track_params
 from ..section3 import atmospheric_model
 from ..section4 import aerodynamic_calculations, derived_requirements, geometry_calculations
 from ..section5 import rotorcraft, fixed_wing, hybrid_vtol, matching_chart
@@ -26,6 +51,11 @@ from ..section5 import rotorcraft, fixed_wing, hybrid_vtol, matching_chart
 DEFAULT_TOLERANCE_PCT = 0.5
 ARRAY_TOLERANCE_PCT = 0.5
 
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / "cache" / "verification.json"
+
+# Bump when the cached outcome format changes
+CACHE_VERSION = 1
+
 
 @dataclass
 class VerificationResult:
@@ -272,6 +302,165 @@ def _compare_dict(
     return results
 
 
+# =============================================================================
+# SHARED QUANTITIES
+# =============================================================================
+
+# (quantity, scenario hash) -> (value, configuration paths read); cleared at
+# the start of every verification run
+_NODES: Dict[Tuple[str, str], Tuple[Dict[str, float], frozenset]] = {}
+
+
+def _shared(func: Callable[[], Dict[str, float]]) -> Callable[[], Dict[str, float]]:
+    """
+    Memoize an intermediate quantity per scenario for the expected-value helpers.
+
+    The paths read on the first evaluation are passed on to the caller's
+    track_params() block on every call, so a unit using a cached quantity
+    still depends on its parameters.
+    """
+
+    @functools.wraps(func)
+    def wrapper() -> Dict[str, float]:
+        key = (func.__name__, scenario_hash())
+        node = _NODES.get(key)
+        if node is None:
+            with track_params() as paths:
+                value = func()
+            node = _NODES[key] = (value, frozenset(paths))
+        note_params(node[1])
+        return node[0]
+
+    return wrapper
+
+
+@_shared
+def _weight() -> Dict[str, float]:
+    g = get_param("physical.mars.g")
+    mtow = get_param("mission.mass.mtow_kg")
+    return {"g": g, "mtow_kg": mtow, "weight_n": mtow * g}
+
+
+@_shared
+def _drag_polar() -> Dict[str, float]:
+    ar = get_param("aerodynamic.wing.aspect_ratio")
+    e = get_param("aerodynamic.wing.oswald_efficiency")
+    cd0 = get_param("aerodynamic.drag_polar.cd0")
+    return {
+        "ar": ar,
+        "e": e,
+        "cd0": cd0,
+        "k": 1 / (math.pi * ar * e),
+        "cl_opt": math.sqrt(cd0 * math.pi * ar * e),
+        "ld_max": 0.5 * math.sqrt(math.pi * ar * e / cd0),
+    }
+
+
+@_shared
+def _stall_point() -> Dict[str, float]:
+    """Wing loading at which the minimum speed is reached at CL_max."""
+    rho = get_param("environment.arcadia_planitia.density_kg_m3")
+    cl_max = get_param("aerodynamic.airfoil.cl_max")
+    v_stall = get_param("mission.velocity.v_stall_m_s")
+    v_min_factor = get_param("mission.velocity.v_min_factor")
+    v_min = v_stall * v_min_factor
+    return {
+        "rho": rho,
+        "cl_max": cl_max,
+        "v_stall": v_stall,
+        "v_min_factor": v_min_factor,
+        "v_min": v_min,
+        "ws": 0.5 * rho * v_min**2 * cl_max,
+    }
+
+
+@_shared
+def _efficiencies() -> Dict[str, float]:
+    fm = get_param("propulsion.rotor.figure_of_merit")
+    eta_m = get_param("propulsion.electromechanical.eta_motor")
+    eta_e = get_param("propulsion.electromechanical.eta_esc")
+    eta_p = get_param("propulsion.electromechanical.eta_prop")
+    return {
+        "fm": fm,
+        "eta_motor": eta_m,
+        "eta_esc": eta_e,
+        "eta_prop": eta_p,
+        "eta_hover": fm * eta_m * eta_e,
+        "eta_cruise": eta_p * eta_m * eta_e,
+    }
+
+
+@_shared
+def _battery() -> Dict[str, float]:
+    mtow = get_param("mission.mass.mtow_kg")
+    f_batt = get_param("mission.mass_fractions.f_battery")
+    e_spec = get_param("battery.specifications.specific_energy_Wh_kg")
+    dod = get_param("battery.utilization.depth_of_discharge")
+    eta_dis = get_param("battery.utilization.discharge_efficiency")
+    battery_mass = f_batt * mtow
+    total_energy = battery_mass * e_spec
+    return {
+        "battery_mass_kg": battery_mass,
+        "total_energy_wh": total_energy,
+        "usable_energy_wh": total_energy * dod * eta_dis,
+        "reserve": get_param("mission.energy.reserve_fraction"),
+    }
+
+
+@_shared
+def _gust_envelope() -> Dict[str, float]:
+    """Pratt gust load factor at the stall point and the gust W/S limit."""
+    env = "mission.structural.envelope"
+    g = get_param("physical.mars.g")
+    mtow = get_param("mission.mass.mtow_kg")
+    ar = get_param("aerodynamic.wing.aspect_ratio")
+    rho = get_param("environment.arcadia_planitia.density_kg_m3")
+    n_limit = get_param("mission.structural.n_limit")
+    v_cruise = get_param("mission.velocity.v_cruise_m_s")
+    u_cruise = get_param(f"environment.wind.{get_param(f'{env}.gust_source')}")
+    corners = (
+        (v_cruise, u_cruise),
+        (get_param(f"{env}.dive_speed_factor") * v_cruise, get_param(f"{env}.dive_gust_ratio") * u_cruise),
+    )
+
+    # Helmbold lift slope
+    kappa = get_param(f"{env}.airfoil_cl_alpha_per_rad") / (2 * math.pi)
+    tan_sweep = math.tan(math.radians(get_param("geometry.wing.sweep_angle_deg")))
+    a = 2 * math.pi * ar / (2 + math.sqrt(4 + (ar / kappa) ** 2 * (1 + tan_sweep**2)))
+
+    def delta_n(ws, v, u):
+        # Δn = K_g ρ V U a / (2 W/S) = 0.88 V U / (g (5.3 c + 2 W/S / (ρ a g)))
+        c = math.sqrt(mtow * g / (ar * ws))
+        return 0.88 * v * u / (g * (5.3 * c + 2 * ws / (rho * a * g)))
+
+    # Largest W/S with Δn = n_limit - 1, by bisection above the Δn peak
+    dn_allowed = n_limit - 1
+    ws_peak = (5.3 * rho * a * g * math.sqrt(mtow * g / ar) / 4) ** (2 / 3)
+    limits = []
+    for v, u in corners:
+        if delta_n(ws_peak, v, u) <= dn_allowed:
+            limits.append(0.0)
+            continue
+        lo, hi = ws_peak, 2 * ws_peak
+        while delta_n(hi, v, u) > dn_allowed:
+            hi *= 2
+        for _ in range(100):
+            mid = 0.5 * (lo + hi)
+            lo, hi = (mid, hi) if delta_n(mid, v, u) > dn_allowed else (lo, mid)
+        limits.append(0.5 * (lo + hi))
+
+    ws_stall = _stall_point()["ws"]
+    n_gust = 1 + max(delta_n(ws_stall, v, u) for v, u in corners)
+    return {
+        "gust_ws": max(limits),
+        "n_critical": max(n_limit, n_gust),
+    }
+
+
+# =============================================================================
+# EXPECTED VALUES
+# =============================================================================
+
 def _expected_arcadia_conditions() -> Dict[str, float]:
     surface_elevation_km = get_param("environment.arcadia_planitia.elevation_km")
     agl_m = get_param("environment.arcadia_planitia.operating_altitude_agl_m")
@@ -315,12 +504,9 @@ def _expected_arcadia_conditions() -> Dict[str, float]:
 
 
 def _expected_aero() -> Dict[str, float]:
-    ar = get_param("aerodynamic.wing.aspect_ratio")
-    e = get_param("aerodynamic.wing.oswald_efficiency")
-    cd0 = get_param("aerodynamic.drag_polar.cd0")
-    k = 1 / (math.pi * ar * e)
-    cl_opt = math.sqrt(cd0 * math.pi * ar * e)
-    ld_max = 0.5 * math.sqrt(math.pi * ar * e / cd0)
+    polar = _drag_polar()
+    ar, e, cd0 = polar["ar"], polar["e"], polar["cd0"]
+    k, cl_opt, ld_max = polar["k"], polar["cl_opt"], polar["ld_max"]
     e_sadraey = 1.78 * (1 - 0.045 * ar ** 0.68) - 0.64
     ld_qp = ld_max * get_param("aerodynamic.quadplane.ld_penalty_factor")
     ld_rotor = get_param("aerodynamic.rotorcraft.ld_effective")
@@ -338,12 +524,12 @@ def _expected_aero() -> Dict[str, float]:
 
 
 def _expected_derived_requirements() -> Dict[str, float]:
-    g = get_param("physical.mars.g")
-    mtow_kg = get_param("mission.mass.mtow_kg")
-    weight_n = mtow_kg * g
-    ar = get_param("aerodynamic.wing.aspect_ratio")
+    mass = _weight()
+    mtow_kg, weight_n = mass["mtow_kg"], mass["weight_n"]
+    ar = _drag_polar()["ar"]
     v_cruise = get_param("mission.velocity.v_cruise_m_s")
-    v_min_factor = get_param("mission.velocity.v_min_factor")
+    stall = _stall_point()
+    v_min_factor = stall["v_min_factor"]
 
     target_re = 60000
     rho = get_param("environment.arcadia_planitia.density_kg_m3")
@@ -352,13 +538,13 @@ def _expected_derived_requirements() -> Dict[str, float]:
     wing_area_re = chord_re**2 * ar
     wingspan_re = math.sqrt(ar * wing_area_re)
     ws_re = weight_n / wing_area_re
-    cl_max = get_param("aerodynamic.airfoil.cl_max")
+    cl_max = stall["cl_max"]
     v_stall_re = math.sqrt(2 * ws_re / (rho * cl_max))
     v_min_re = v_stall_re * v_min_factor
 
-    v_stall_config = get_param("mission.velocity.v_stall_m_s")
-    v_min_stall = v_stall_config * v_min_factor
-    ws_stall = 0.5 * rho * v_min_stall**2 * cl_max
+    v_stall_config = stall["v_stall"]
+    v_min_stall = stall["v_min"]
+    ws_stall = stall["ws"]
     wing_area_stall = weight_n / ws_stall
     wingspan_stall = math.sqrt(ar * wing_area_stall)
     chord_stall = wing_area_stall / wingspan_stall
@@ -392,17 +578,9 @@ def _expected_derived_requirements() -> Dict[str, float]:
 
 
 def _expected_geometry() -> Dict[str, Any]:
-    g = get_param("physical.mars.g")
-    mtow = get_param("mission.mass.mtow_kg")
-    weight_n = mtow * g
-    ar = get_param("aerodynamic.wing.aspect_ratio")
-
-    v_stall = get_param("mission.velocity.v_stall_m_s")
-    v_min_factor = get_param("mission.velocity.v_min_factor")
-    rho = get_param("environment.arcadia_planitia.density_kg_m3")
-    cl_max = get_param("aerodynamic.airfoil.cl_max")
-    v_min = v_stall * v_min_factor
-    ws = 0.5 * rho * v_min**2 * cl_max
+    weight_n = _weight()["weight_n"]
+    ar = _drag_polar()["ar"]
+    ws = _stall_point()["ws"]
 
     wing_area = weight_n / ws
     wingspan = math.sqrt(ar * wing_area)
@@ -430,7 +608,7 @@ def _expected_geometry() -> Dict[str, Any]:
     span_per_surface = math.sqrt(vtail_ar * s_per_surface)
     vtail_chord = s_per_surface / span_per_surface
 
-    n_rotors = get_param("geometry.rotor.n_rotors")
+    n_rotors = get_param("geometry.propulsion_config.lift.n_rotors")
     disk_loading = get_param("geometry.rotor.disk_loading_N_m2")
     area_per_rotor = (weight_n / n_rotors) / disk_loading
     rotor_diam = math.sqrt(4 * area_per_rotor / math.pi)
@@ -455,6 +633,7 @@ def _expected_geometry() -> Dict[str, Any]:
             "aspect_ratio": vtail_ar,
             "actual_sh": s_vtail_total * cos2_gamma,
             "actual_sv": s_vtail_total * sin2_gamma,
+            "pitch_limited": s_vtail_from_h >= s_vtail_from_v,
         },
         "n_rotors": n_rotors,
         "rotor_diameter_m": rotor_diam,
@@ -463,22 +642,17 @@ def _expected_geometry() -> Dict[str, Any]:
 
 
 def _expected_rotorcraft() -> Dict[str, Any]:
-    g = get_param("physical.mars.g")
     rho = get_param("environment.arcadia_planitia.density_kg_m3")
-    mtow = get_param("mission.mass.mtow_kg")
-    weight_n = mtow * g
+    mass = _weight()
+    mtow, weight_n = mass["mtow_kg"], mass["weight_n"]
     disk_loading = get_param("geometry.rotor.disk_loading_N_m2")
     disk_area = weight_n / disk_loading
     v_cruise = get_param("mission.velocity.v_cruise_m_s")
     t_hover_s = get_param("mission.time.t_hover_s")
-    reserve = get_param("mission.energy.reserve_fraction")
-    f_batt = get_param("mission.mass_fractions.f_battery")
-    e_spec = get_param("battery.specifications.specific_energy_Wh_kg")
-    dod = get_param("battery.utilization.depth_of_discharge")
-    eta_dis = get_param("battery.utilization.discharge_efficiency")
-    fm = get_param("propulsion.rotor.figure_of_merit")
-    eta_m = get_param("propulsion.electromechanical.eta_motor")
-    eta_e = get_param("propulsion.electromechanical.eta_esc")
+    battery = _battery()
+    reserve = battery["reserve"]
+    eta = _efficiencies()
+    fm, eta_m, eta_e = eta["fm"], eta["eta_motor"], eta["eta_esc"]
     ld_eff = get_param("aerodynamic.rotorcraft.ld_effective")
     endurance_req = get_param("mission.requirements.endurance_min")
 
@@ -489,9 +663,9 @@ def _expected_rotorcraft() -> Dict[str, Any]:
     p_fwd_mech = (weight_n * v_cruise) / ld_eff
     p_fwd_elec = p_fwd_mech / (eta_m * eta_e)
 
-    battery_mass = f_batt * mtow
-    total_energy = battery_mass * e_spec
-    usable_energy = total_energy * dod * eta_dis
+    battery_mass = battery["battery_mass_kg"]
+    total_energy = battery["total_energy_wh"]
+    usable_energy = battery["usable_energy_wh"]
     energy_after_reserve = usable_energy * (1 - reserve)
     hover_energy = p_hover_elec * (t_hover_s / 3600)
     cruise_energy = energy_after_reserve - hover_energy
@@ -509,7 +683,7 @@ def _expected_rotorcraft() -> Dict[str, Any]:
     feasible = endurance_min >= endurance_req
     margin_pct = ((endurance_min / endurance_req) - 1) * 100
 
-    eta_hover = fm * eta_m * eta_e
+    eta_hover = eta["eta_hover"]
     eta_cruise = eta_m * eta_e
 
     return {
@@ -547,46 +721,33 @@ def _expected_rotorcraft() -> Dict[str, Any]:
 
 
 def _expected_fixed_wing() -> Dict[str, Any]:
-    g = get_param("physical.mars.g")
-    rho = get_param("environment.arcadia_planitia.density_kg_m3")
-    mtow = get_param("mission.mass.mtow_kg")
-    weight_n = mtow * g
+    mass = _weight()
+    mtow, weight_n = mass["mtow_kg"], mass["weight_n"]
     v_cruise = get_param("mission.velocity.v_cruise_m_s")
-    v_stall = get_param("mission.velocity.v_stall_m_s")
-    v_min_factor = get_param("mission.velocity.v_min_factor")
-    f_batt = get_param("mission.mass_fractions.f_battery")
-    e_spec = get_param("battery.specifications.specific_energy_Wh_kg")
-    dod = get_param("battery.utilization.depth_of_discharge")
-    eta_dis = get_param("battery.utilization.discharge_efficiency")
     endurance_req = get_param("mission.requirements.endurance_min")
 
-    ar = get_param("aerodynamic.wing.aspect_ratio")
-    e = get_param("aerodynamic.wing.oswald_efficiency")
-    cd0 = get_param("aerodynamic.drag_polar.cd0")
-    cl_max = get_param("aerodynamic.airfoil.cl_max")
+    polar = _drag_polar()
+    ar, e, cd0 = polar["ar"], polar["e"], polar["cd0"]
+    k, cl_opt, ld_max = polar["k"], polar["cl_opt"], polar["ld_max"]
 
-    k = 1 / (math.pi * ar * e)
-    cl_opt = math.sqrt(math.pi * ar * e * cd0)
-    ld_max = 0.5 * math.sqrt(math.pi * ar * e / cd0)
-
-    v_min = v_stall * v_min_factor
-    ws_max = 0.5 * rho * v_min**2 * cl_max
+    stall = _stall_point()
+    rho, cl_max, ws_max = stall["rho"], stall["cl_max"], stall["ws"]
     cl_cruise = (2 * ws_max) / (rho * v_cruise**2)
     cd_cruise = cd0 + k * cl_cruise**2
     ld_cruise = cl_cruise / cd_cruise
 
-    eta_prop = get_param("propulsion.electromechanical.eta_prop")
-    eta_motor = get_param("propulsion.electromechanical.eta_motor")
-    eta_esc = get_param("propulsion.electromechanical.eta_esc")
-    eta_cruise = eta_prop * eta_motor * eta_esc
+    eta = _efficiencies()
+    eta_prop, eta_motor, eta_esc = eta["eta_prop"], eta["eta_motor"], eta["eta_esc"]
+    eta_cruise = eta["eta_cruise"]
 
     p_cruise = (weight_n * v_cruise) / (ld_max * eta_cruise)
     pw_cruise = v_cruise / (ld_max * eta_cruise)
 
-    reserve = get_param("mission.energy.reserve_fraction")
-    battery_mass = f_batt * mtow
-    total_energy = battery_mass * e_spec
-    usable_energy = total_energy * dod * eta_dis * (1 - reserve)
+    battery = _battery()
+    reserve = battery["reserve"]
+    battery_mass = battery["battery_mass_kg"]
+    total_energy = battery["total_energy_wh"]
+    usable_energy = battery["usable_energy_wh"] * (1 - reserve)
     endurance_h = usable_energy / p_cruise
     endurance_min = endurance_h * 60
     range_km = v_cruise * endurance_h * 3.6
@@ -636,10 +797,9 @@ def _expected_fixed_wing() -> Dict[str, Any]:
 
 
 def _expected_hybrid_vtol() -> Dict[str, Any]:
-    g = get_param("physical.mars.g")
     rho = get_param("environment.arcadia_planitia.density_kg_m3")
-    mtow = get_param("mission.mass.mtow_kg")
-    weight_n = mtow * g
+    mass = _weight()
+    mtow, weight_n = mass["mtow_kg"], mass["weight_n"]
     disk_loading = get_param("geometry.rotor.disk_loading_N_m2")
     disk_area = weight_n / disk_loading
     v_cruise = get_param("mission.velocity.v_cruise_m_s")
@@ -647,22 +807,14 @@ def _expected_hybrid_vtol() -> Dict[str, Any]:
     t_cruise_min = get_param("mission.time.t_cruise_min")
     t_transition_s = get_param("mission.time.t_transition_s")
     n_transitions = get_param("mission.time.n_transitions")
-    reserve = get_param("mission.energy.reserve_fraction")
-    f_batt = get_param("mission.mass_fractions.f_battery")
-    e_spec = get_param("battery.specifications.specific_energy_Wh_kg")
-    dod = get_param("battery.utilization.depth_of_discharge")
-    eta_dis = get_param("battery.utilization.discharge_efficiency")
+    battery = _battery()
+    reserve = battery["reserve"]
     endurance_req = get_param("mission.requirements.endurance_min")
 
-    fm = get_param("propulsion.rotor.figure_of_merit")
-    eta_m = get_param("propulsion.electromechanical.eta_motor")
-    eta_e = get_param("propulsion.electromechanical.eta_esc")
-    eta_p = get_param("propulsion.electromechanical.eta_prop")
+    eta = _efficiencies()
+    fm, eta_m, eta_e, eta_p = eta["fm"], eta["eta_motor"], eta["eta_esc"], eta["eta_prop"]
 
-    ar = get_param("aerodynamic.wing.aspect_ratio")
-    e = get_param("aerodynamic.wing.oswald_efficiency")
-    cd0 = get_param("aerodynamic.drag_polar.cd0")
-    ld_max = 0.5 * math.sqrt(math.pi * ar * e / cd0)
+    ld_max = _drag_polar()["ld_max"]
     ld_penalty = get_param("aerodynamic.quadplane.ld_penalty_factor")
     ld_qp = ld_max * ld_penalty
 
@@ -671,7 +823,7 @@ def _expected_hybrid_vtol() -> Dict[str, Any]:
     p_hover = p_ideal / fm
     p_hover_elec = p_hover / (eta_m * eta_e)
 
-    eta_cruise = eta_p * eta_m * eta_e
+    eta_cruise = eta["eta_cruise"]
     p_cruise = (weight_n * v_cruise) / (ld_qp * eta_cruise)
 
     reference_energy_j = get_param("mission.transition.reference_energy_j")
@@ -689,9 +841,9 @@ def _expected_hybrid_vtol() -> Dict[str, Any]:
     e_reserve = e_mission * reserve
     e_required = e_mission + e_reserve
 
-    battery_mass = f_batt * mtow
-    total_energy = battery_mass * e_spec
-    usable_energy = total_energy * dod * eta_dis
+    battery_mass = battery["battery_mass_kg"]
+    total_energy = battery["total_energy_wh"]
+    usable_energy = battery["usable_energy_wh"]
 
     margin_wh = usable_energy - e_required
     margin_pct = (margin_wh / e_required) * 100 if e_required > 0 else 0.0
@@ -733,7 +885,7 @@ def _expected_hybrid_vtol() -> Dict[str, Any]:
         "eta_motor": eta_m,
         "eta_esc": eta_e,
         "eta_prop": eta_p,
-        "eta_hover": fm * eta_m * eta_e,
+        "eta_hover": eta["eta_hover"],
         "eta_cruise": eta_cruise,
         "induced_velocity_m_s": v_i,
         "hover_power_w": p_hover_elec,
@@ -768,37 +920,25 @@ def _expected_hybrid_vtol() -> Dict[str, Any]:
 
 
 def _expected_matching_chart() -> Dict[str, Any]:
-    g = get_param("physical.mars.g")
-    rho = get_param("environment.arcadia_planitia.density_kg_m3")
-    mtow = get_param("mission.mass.mtow_kg")
-    weight_n = mtow * g
+    mass = _weight()
+    mtow, weight_n = mass["mtow_kg"], mass["weight_n"]
     v_cruise = get_param("mission.velocity.v_cruise_m_s")
     disk_loading = get_param("geometry.rotor.disk_loading_N_m2")
-    fm = get_param("propulsion.rotor.figure_of_merit")
-    eta_m = get_param("propulsion.electromechanical.eta_motor")
-    eta_e = get_param("propulsion.electromechanical.eta_esc")
-    eta_p = get_param("propulsion.electromechanical.eta_prop")
-    eta_hover = fm * eta_m * eta_e
-    eta_cruise = eta_p * eta_m * eta_e
+    eta = _efficiencies()
+    fm, eta_hover, eta_cruise = eta["fm"], eta["eta_hover"], eta["eta_cruise"]
     ld_penalty = get_param("aerodynamic.quadplane.ld_penalty_factor")
 
-    ar = get_param("aerodynamic.wing.aspect_ratio")
-    e = get_param("aerodynamic.wing.oswald_efficiency")
-    cd0 = get_param("aerodynamic.drag_polar.cd0")
-    cl_max = get_param("aerodynamic.airfoil.cl_max")
-    v_stall = get_param("mission.velocity.v_stall_m_s")
-    v_min_factor = get_param("mission.velocity.v_min_factor")
-    v_min = v_stall * v_min_factor
-
-    k = 1 / (math.pi * ar * e)
-    ld_max = 0.5 * math.sqrt(math.pi * ar * e / cd0)
+    polar = _drag_polar()
+    ar, cd0, k, ld_max = polar["ar"], polar["cd0"], polar["k"], polar["ld_max"]
     ld_quad = ld_max * ld_penalty
 
+    stall = _stall_point()
+    rho, cl_max, ws_stall = stall["rho"], stall["cl_max"], stall["ws"]
     v_i = math.sqrt(disk_loading / (2 * rho))
     pw_hover = v_i / eta_hover
-    ws_stall = 0.5 * rho * v_min**2 * cl_max
 
-    def cruise_constraint(ws: float) -> float:
+    def cruise_constraint(ws):
+        # Scalar or array of wing loadings
         cl = (2 * ws) / (rho * v_cruise**2)
         ld_pure = cl / (cd0 + k * cl**2)
         ld = ld_pure * ld_penalty
@@ -815,9 +955,11 @@ def _expected_matching_chart() -> Dict[str, Any]:
     disk_area = weight_n / disk_loading
 
     ws_range = np.linspace(2.0, 15.0, 50)
-    pw_cruise_curve = np.array([cruise_constraint(ws) for ws in ws_range])
+    pw_cruise_curve = cruise_constraint(ws_range)
     pw_hover_line = np.full_like(ws_range, pw_hover)
 
+    gust = _gust_envelope()
+
     return {
         "mtow_kg": mtow,
         "weight_n": weight_n,
@@ -832,6 +974,7 @@ def _expected_matching_chart() -> Dict[str, Any]:
         "cl_max": cl_max,
         "hover_pw": pw_hover,
         "stall_ws": ws_stall,
+        "gust_ws": gust["gust_ws"],
         "induced_velocity_m_s": v_i,
         "design_point": {
             "wing_loading": ws_stall,
@@ -839,6 +982,9 @@ def _expected_matching_chart() -> Dict[str, Any]:
             "hover_pw": pw_hover,
             "cruise_pw_at_stall": pw_cruise_at_stall,
             "stall_ws": ws_stall,
+            "gust_ws": gust["gust_ws"],
+            "gust_feasible": ws_stall >= gust["gust_ws"],
+            "n_critical": gust["n_critical"],
             "active_constraint": active,
         },
         "geometry": {
@@ -854,74 +1000,398 @@ def _expected_matching_chart() -> Dict[str, Any]:
     }
 
 
-def verify_section3() -> List[VerificationResult]:
-    results = []
-    computed = atmospheric_model.arcadia_planitia_conditions()
-    expected = _expected_arcadia_conditions()
-    results.extend(_compare_dict("§3.1", expected, computed))
-    return results
+# =============================================================================
+# CHECK UNITS
+# =============================================================================
 
+@dataclass(frozen=True)
+class CheckUnit:
+    """One independent verification check: an analysis against its expected values."""
 
-def verify_section4() -> List[VerificationResult]:
-    results = []
+    name: str
+    section: str
+    expected: Callable[[], Dict[str, Any]]
+    computed: Callable[[], Dict[str, Any]]
+
+
+CHECKS: Tuple[CheckUnit, ...] = (
+    CheckUnit("section3.atmosphere", "§3.1", _expected_arcadia_conditions,
+              atmospheric_model.arcadia_planitia_conditions),
+    CheckUnit("section4.drag_polar", "§4.7", _expected_aero,
+              aerodynamic_calculations.drag_polar_analysis),
+    CheckUnit("section4.derived_requirements", "§4.12", _expected_derived_requirements,
+              derived_requirements.derived_requirements_analysis),
+    CheckUnit("section4.geometry", "§4 (Geometry)", _expected_geometry,
+              geometry_calculations.geometry_analysis),
+    CheckUnit("section5.rotorcraft", "§5.1", _expected_rotorcraft,
+              rotorcraft.rotorcraft_feasibility_analysis),
+    CheckUnit("section5.fixed_wing", "§5.2", _expected_fixed_wing,
+              fixed_wing.fixed_wing_feasibility_analysis),
+    CheckUnit("section5.hybrid_vtol", "§5.3", _expected_hybrid_vtol,
+              hybrid_vtol.hybrid_vtol_feasibility_analysis),
+    CheckUnit("section5.matching_chart", "§5.4", _expected_matching_chart,
+              matching_chart.matching_chart_analysis),
+)
+
+_UNITS = {unit.name: unit for unit in CHECKS}
 
-    computed_aero = aerodynamic_calculations.drag_polar_analysis()
-    expected_aero = _expected_aero()
-    results.extend(_compare_dict("§4.7", expected_aero, computed_aero))
 
-    computed_req = derived_requirements.derived_requirements_analysis()
-    expected_req = _expected_derived_requirements()
-    results.extend(_compare_dict("§4.12", expected_req, computed_req))
+@dataclass
+class CheckOutcome:
+    """Results of one check unit and how they were obtained."""
 
-    computed_geom = geometry_calculations.geometry_analysis()
-    expected_geom = _expected_geometry()
-    results.extend(_compare_dict("§4 (Geometry)", expected_geom, computed_geom))
+    unit: str
+    section: str
+    results: List[VerificationResult]
+    elapsed_s: float
+    cached: bool
+    params: List[str] = field(default_factory=list)
+    fingerprint: str = ""
+    error: str = ""
+
+    @property
+    def passed(self) -> bool:
+        return all(r.passed for r in self.results)
+
+
+def _select(names: Optional[Iterable[str]]) -> List[CheckUnit]:
+    """Units by name or name prefix (e.g. 'section5'), in CHECKS order."""
+    if names is None:
+        return list(CHECKS)
+    names = list(names)
+    units = [u for u in CHECKS if any(u.name == n or u.name.startswith(n + ".") for n in names)]
+    unknown = [n for n in names if not any(u.name == n or u.name.startswith(n + ".") for u in CHECKS)]
+    if unknown:
+        raise KeyError(f"Unknown check units: {unknown} (available: {list(_UNITS)})")
+    return units
+
+
+def _fingerprint(params: Iterable[str] = ()) -> str:
+    """Digest of the current values of the given configuration paths."""
+    values = {}
+    for path in sorted(params):
+        try:
+            values[path] = get_param(path)
+        except KeyError:
+            values[path] = "<missing>"
+    text = json.dumps(values, sort_keys=True, default=repr, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _evaluate_unit(name: str, scenario=None) -> CheckOutcome:
+    """Run one check unit on top of scenario (default: the baseline)."""
+    unit = _UNITS[name]
+    start = time.perf_counter()
+    with (scenario or BASELINE).applied():
+        error = ""
+        with track_params() as params:
+            try:
+                results = _compare_dict(unit.section, unit.expected(), unit.computed())
+            except Exception as exc:  # a broken analysis fails its unit, not the run
+                error = f"{type(exc).__name__}: {exc}"
+                results = [
+                    VerificationResult(
+                        name=unit.name,
+                        expected="no error",
+                        computed=None,
+                        unit="",
+                        passed=False,
+                        error_pct=None,
+                        section=unit.section,
+                        note=error,
+                    )
+                ]
+        fingerprint = _fingerprint(params)
+    return CheckOutcome(
+        unit=unit.name,
+        section=unit.section,
+        results=results,
+        elapsed_s=time.perf_counter() - start,
+        cached=False,
+        params=sorted(params),
+        fingerprint=fingerprint,
+        error=error,
+    )
 
-    return results
 
+# =============================================================================
+# OUTCOME CACHE
+# =============================================================================
 
-def verify_section5() -> List[VerificationResult]:
-    results = []
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    return repr(value)
 
-    computed_rot = rotorcraft.rotorcraft_feasibility_analysis()
-    expected_rot = _expected_rotorcraft()
-    results.extend(_compare_dict("§5.1", expected_rot, computed_rot))
 
-    computed_fw = fixed_wing.fixed_wing_feasibility_analysis()
-    expected_fw = _expected_fixed_wing()
-    results.extend(_compare_dict("§5.2", expected_fw, computed_fw))
+def _load_cache(path: Path, code_version: str) -> Dict[str, Dict[str, Any]]:
+    """Cached unit outcomes of the same code version (empty if unreadable)."""
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("cache_version") != CACHE_VERSION or data.get("code_version") != code_version:
+        return {}
+    return data.get("units", {})
 
-    computed_hyb = hybrid_vtol.hybrid_vtol_feasibility_analysis()
-    expected_hyb = _expected_hybrid_vtol()
-    results.extend(_compare_dict("§5.3", expected_hyb, computed_hyb))
 
-    computed_match = matching_chart.matching_chart_analysis()
-    expected_match = _expected_matching_chart()
-    results.extend(_compare_dict("§5.4", expected_match, computed_match))
+def _save_cache(path: Path, code_version: str, units: Dict[str, Dict[str, Any]]) -> None:
+    """Write the cache atomically; failures never break verification."""
+    payload = {"cache_version": CACHE_VERSION, "code_version": code_version, "units": units}
+    try:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(payload, indent=1, default=_json_default), encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        pass
+
+
+def _cache_entry(outcome: CheckOutcome) -> Dict[str, Any]:
+    return {
+        "params": outcome.params,
+        "fingerprint": outcome.fingerprint,
+        "elapsed_s": outcome.elapsed_s,
+        "results": [asdict(r) for r in outcome.results],
+    }
+
+
+def _from_cache(unit: CheckUnit, entry: Dict[str, Any]) -> CheckOutcome:
+    return CheckOutcome(
+        unit=unit.name,
+        section=unit.section,
+        results=[VerificationResult(**r) for r in entry["results"]],
+        elapsed_s=entry["elapsed_s"],
+        cached=True,
+        params=entry["params"],
+        fingerprint=entry["fingerprint"],
+    )
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+def run_checks(
+    names: Optional[Iterable[str]] = None,
+    n_workers: Optional[int] = None,
+    executor: str = "thread",
+    cache: bool = True,
+    cache_path: Optional[Path] = None,
+) -> List[CheckOutcome]:
+    """
+    Run check units in parallel, re-executing only those whose inputs changed.
+
+    Parameters
+    ----------
+    names : iterable of str, optional
+        Unit names or prefixes (e.g. 'section5'); default: all of CHECKS
+    n_workers : int, optional
+        Parallel workers (default: one per pending unit, up to the CPU count;
+        1 = run in-process)
+    executor : str
+        'thread' or 'process'. Every worker evaluates on top of the caller's
+        active scenario.
+    cache : bool
+        Reuse cached outcomes whose configuration inputs and source version
+        are unchanged, and store the new ones
+    cache_path : Path, optional
+        Cache file (default: DEFAULT_CACHE_PATH)
+
+    Returns
+    -------
+    list of CheckOutcome
+        In CHECKS order
+    """
+    if executor not in ("thread", "process"):
+        raise ValueError(f"Unknown executor: {executor!r} (use 'thread' or 'process')")
+    units = _select(names)
+    scenario = active_scenario() or BASELINE
+    cache_path = Path(cache_path) if cache_path is not None else DEFAULT_CACHE_PATH
+    _NODES.clear()
+
+    version = ""
+    stored: Dict[str, Dict[str, Any]] = {}
+    if cache:
+        from ..run_archive import code_version
+
+        version = code_version()
+        stored = _load_cache(cache_path, version)
+
+    outcomes: Dict[str, CheckOutcome] = {}
+    pending: List[str] = []
+    for unit in units:
+        entry = stored.get(unit.name)
+        if entry is not None and entry["fingerprint"] == _fingerprint(entry["params"]):
+            outcomes[unit.name] = _from_cache(unit, entry)
+        else:
+            pending.append(unit.name)
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = max(1, min(n_workers, len(pending)))
+    if n_workers == 1:
+        fresh = [_evaluate_unit(name, scenario) for name in pending]
+    else:
+        pool = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        with pool(max_workers=n_workers) as workers:
+            fresh = list(workers.map(_evaluate_unit, pending, [scenario] * len(pending)))
+    outcomes.update((outcome.unit, outcome) for outcome in fresh)
+
+    if cache and fresh:
+        for outcome in fresh:
+            if outcome.error:
+                stored.pop(outcome.unit, None)
+            else:
+                stored[outcome.unit] = _cache_entry(outcome)
+        _save_cache(cache_path, version, stored)
+
+    return [outcomes[unit.name] for unit in units]
 
-    return results
 
+def _flatten(outcomes: Sequence[CheckOutcome]) -> List[VerificationResult]:
+    return [r for outcome in outcomes for r in outcome.results]
 
-def verify_all() -> Tuple[List[VerificationResult], int, int]:
-    all_results: List[VerificationResult] = []
-    all_results.extend(verify_section3())
-    all_results.extend(verify_section4())
-    all_results.extend(verify_section5())
 
+def verify_section3() -> List[VerificationResult]:
+    return _flatten(run_checks(["section3"], n_workers=1, cache=False))
+
+
+def verify_section4() -> List[VerificationResult]:
+    return _flatten(run_checks(["section4"], n_workers=1, cache=False))
+
+
+def verify_section5() -> List[VerificationResult]:
+    return _flatten(run_checks(["section5"], n_workers=1, cache=False))
+
+
+def verify_all(
+    n_workers: Optional[int] = None,
+    cache: bool = True,
+    executor: str = "thread",
+) -> Tuple[List[VerificationResult], int, int]:
+    """
+    Run every check unit (see run_checks).
+
+    Returns
+    -------
+    tuple
+        (results, number passed, number failed)
+    """
+    all_results = _flatten(run_checks(n_workers=n_workers, executor=executor, cache=cache))
     passed = sum(1 for r in all_results if r.passed)
     failed = len(all_results) - passed
     return all_results, passed, failed
 
 
-def print_verification_report() -> bool:
+# =============================================================================
+# REPORTS
+# =============================================================================
+
+def report_dict(outcomes: Sequence[CheckOutcome]) -> Dict[str, Any]:
+    """JSON-serializable report of check outcomes."""
+    results = _flatten(outcomes)
+    passed = sum(1 for r in results if r.passed)
+    return {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "scenario_hash": scenario_hash(),
+        "summary": {
+            "tests": len(results),
+            "passed": passed,
+            "failed": len(results) - passed,
+            "units": len(outcomes),
+            "units_cached": sum(1 for o in outcomes if o.cached),
+        },
+        "units": [
+            {
+                "unit": o.unit,
+                "section": o.section,
+                "passed": o.passed,
+                "cached": o.cached,
+                "elapsed_s": o.elapsed_s,
+                "n_params": len(o.params),
+                "error": o.error,
+                "results": [asdict(r) for r in o.results],
+            }
+            for o in outcomes
+        ],
+    }
+
+
+def write_json(outcomes: Sequence[CheckOutcome], path) -> Path:
+    """Write the report as JSON."""
+    path = Path(path)
+    path.write_text(json.dumps(report_dict(outcomes), indent=2, default=_json_default),
+                    encoding="utf-8")
+    return path
+
+
+def write_junit(outcomes: Sequence[CheckOutcome], path) -> Path:
+    """
+    Write the report as JUnit XML: one testsuite per check unit and one
+    testcase per verified value.
+    """
+    import xml.etree.ElementTree as ET
+
+    results = _flatten(outcomes)
+    root = ET.Element(
+        "testsuites",
+        name="manuscript_verification",
+        tests=str(len(results)),
+        failures=str(sum(1 for r in results if not r.passed)),
+        time=f"{sum(o.elapsed_s for o in outcomes):.6f}",
+    )
+    for outcome in outcomes:
+        suite = ET.SubElement(
+            root,
+            "testsuite",
+            name=outcome.unit,
+            tests=str(len(outcome.results)),
+            failures=str(sum(1 for r in outcome.results if not r.passed)),
+            errors="1" if outcome.error else "0",
+            time=f"{outcome.elapsed_s:.6f}",
+        )
+        properties = ET.SubElement(suite, "properties")
+        ET.SubElement(properties, "property", name="section", value=outcome.section)
+        ET.SubElement(properties, "property", name="cached", value=str(outcome.cached).lower())
+        per_case = outcome.elapsed_s / max(len(outcome.results), 1)
+        for r in outcome.results:
+            case = ET.SubElement(
+                suite, "testcase", classname=outcome.unit, name=r.name, time=f"{per_case:.6f}"
+            )
+            if not r.passed:
+                tag = "error" if outcome.error else "failure"
+                ET.SubElement(case, tag, message=r.note or "value mismatch").text = str(r)
+    tree = ET.ElementTree(root)
+    ET.indent(tree)
+    path = Path(path)
+    tree.write(path, encoding="utf-8", xml_declaration=True)
+    return path
+
+
+def print_verification_report(
+    n_workers: Optional[int] = None,
+    cache: bool = True,
+    executor: str = "thread",
+    junit: Optional[str] = None,
+    json_path: Optional[str] = None,
+) -> bool:
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     print("=" * 80)
     print("MANUSCRIPT VERIFICATION REPORT")
     print("=" * 80)
     print(f"Generated: {timestamp}")
-    print()
 
-    all_results, passed, failed = verify_all()
+    start = time.perf_counter()
+    outcomes = run_checks(n_workers=n_workers, executor=executor, cache=cache)
+    all_results = _flatten(outcomes)
+    passed = sum(1 for r in all_results if r.passed)
+    failed = len(all_results) - passed
+    n_cached = sum(1 for o in outcomes if o.cached)
+    print(f"Check units: {len(outcomes)} ({len(outcomes) - n_cached} run, {n_cached} cached) "
+          f"in {time.perf_counter() - start:.2f} s")
+    print()
 
     sections: Dict[str, List[VerificationResult]] = {}
     for r in all_results:
@@ -940,11 +1410,42 @@ def print_verification_report() -> bool:
         print(f"\nFAILURES: {failed} discrepancies found - review values")
     else:
         print("\nPASS: All calculations match expected values")
+    if junit:
+        print(f"JUnit XML: {write_junit(outcomes, junit)}")
+    if json_path:
+        print(f"JSON report: {write_json(outcomes, json_path)}")
     print("=" * 80)
 
     return failed == 0
 
 
-if __name__ == "__main__":
-    success = print_verification_report()
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Verify the analyses against expected values")
+    parser.add_argument("--junit", metavar="PATH", help="Write a JUnit XML report")
+    parser.add_argument("--json", metavar="PATH", help="Write a JSON report")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-run every check unit and do not update the cache")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Parallel workers (default: CPU count; 1 = in-process)")
+    parser.add_argument("--executor", choices=("thread", "process"), default="thread")
+    parser.add_argument("--scenario", nargs="+", default=[], metavar="NAME",
+                        help="Verify on top of the named scenario(s)")
+    args = parser.parse_args()
+
+    from ..config import load_scenario
+
+    with load_scenario(*args.scenario).applied():
+        success = print_verification_report(
+            n_workers=args.workers,
+            cache=not args.no_cache,
+            executor=args.executor,
+            junit=args.junit,
+            json_path=args.json,
+        )
     raise SystemExit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
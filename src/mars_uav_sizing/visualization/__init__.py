@@ -10,9 +10,16 @@ Functions:
     - plot_power_budget: Power consumption breakdown
     - plot_mission_profile: Power vs time through mission
 
+Large sweeps:
+    - sweep_store: Chunked columnar sweep files (streamed column by column)
+    - binned: Streaming 2-D binning, heatmap/contour matching charts,
+      feasibility probability and MTOW maps, min/max line decimation
+
 Reference: sections_en/05_04_* (§5.4 matching chart)
 """
 
 from . import plotting
+from . import sweep_store
+from . import binned
 
-__all__ = ['plotting']
+__all__ = ['plotting', 'sweep_store', 'binned']
@@ -0,0 +1,618 @@
+"""
+Binned Plots for Large Sweeps
+=============================
+
+Aggregated rendering of sweep results too large to scatter or line-plot
+point by point. Rows are streamed from columnar sweep files (sweep_store)
+chunk by chunk and accumulated on a fixed 2-D grid of bins; only the grid
+(count, sum, sum of squares, min and max per bin) is ever held in memory,
+so figure cost and file size depend on the number of bins, not on the
+number of rows.
+
+Statistics per bin:
+    count, density         Number of rows (2-D histogram)
+    mean, std, min, max    Of a value column over the rows in the bin
+    probability            Mean of a 0/1 column (e.g. feasibility)
+
+Plots:
+    - plot_binned_heatmap / plot_binned_contours: any BinnedGrid
+    - plot_feasibility_map: feasibility probability over (W/S, P/W), as a
+      heatmap or contour variant of the matching chart with the nominal
+      constraint lines on top
+    - plot_mtow_map: MTOW over (payload, battery specific energy)
+
+decimate() reduces a long 1-D series to per-bin min/max pairs for line
+plots, which keeps every peak visible.
+
+Last Updated: 2026-10-19
+"""
+
+import numpy as np
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union
+
+from .plotting import HAS_MATPLOTLIB, check_matplotlib, get_text
+from .sweep_store import Chunk, SweepSource, column_ranges, iter_columns
+
+if HAS_MATPLOTLIB:
+    import matplotlib.pyplot as plt
+
+
+# Columns written by the coupled batch studies (mars_uav_sizing_coupled.studies)
+WING_LOADING_COLUMN = 'wing_loading_n_m2'
+POWER_LOADING_COLUMN = 'power_loading_w_n'
+FEASIBLE_COLUMN = 'feasible'
+MTOW_COLUMN = 'mtow_kg'
+PAYLOAD_COLUMN = 'mission.mass.payload_kg'
+SPECIFIC_ENERGY_COLUMN = 'battery.specifications.specific_energy_Wh_kg'
+
+STATISTICS = ('count', 'density', 'sum', 'mean', 'probability', 'std', 'min', 'max')
+
+# A value or mask: a column name, or a function of the chunk
+ColumnSpec = Union[str, Callable[[Chunk], np.ndarray]]
+
+
+# =============================================================================
+# BINNED GRID
+# =============================================================================
+
+class BinnedGrid:
+    """
+    Streaming 2-D accumulator over fixed bin edges.
+
+    Parameters
+    ----------
+    x_edges, y_edges : array-like
+        Increasing bin edges; the last bin includes its upper edge
+
+    Notes
+    -----
+    Rows with non-finite coordinates or outside the edges are counted in
+    `dropped`. Non-finite values (e.g. NaN for a non-converged design) still
+    count towards `count` but not towards the value statistics.
+    """
+
+    def __init__(self, x_edges: Sequence[float], y_edges: Sequence[float]):
+        self.x_edges = np.asarray(x_edges, dtype=float)
+        self.y_edges = np.asarray(y_edges, dtype=float)
+        if self.x_edges.ndim != 1 or self.y_edges.ndim != 1 \
+                or len(self.x_edges) < 2 or len(self.y_edges) < 2:
+            raise ValueError("Bin edges must be 1-D with at least two entries")
+        if np.any(np.diff(self.x_edges) <= 0) or np.any(np.diff(self.y_edges) <= 0):
+            raise ValueError("Bin edges must be strictly increasing")
+        self.shape = (len(self.x_edges) - 1, len(self.y_edges) - 1)
+        self.count = np.zeros(self.shape, dtype=np.int64)
+        self.n_values = np.zeros(self.shape, dtype=np.int64)
+        self.sum = np.zeros(self.shape)
+        self.sumsq = np.zeros(self.shape)
+        self.min = np.full(self.shape, np.inf)
+        self.max = np.full(self.shape, -np.inf)
+        self.dropped = 0
+
+    @classmethod
+    def uniform(cls, x_range: Tuple[float, float], y_range: Tuple[float, float],
+                bins: Union[int, Tuple[int, int]] = 64) -> 'BinnedGrid':
+        """Grid of evenly spaced bins over the given ranges."""
+        nx, ny = (bins, bins) if np.ndim(bins) == 0 else bins
+        (x0, x1), (y0, y1) = _widen(x_range), _widen(y_range)
+        return cls(np.linspace(x0, x1, int(nx) + 1), np.linspace(y0, y1, int(ny) + 1))
+
+    def __repr__(self) -> str:
+        return f"BinnedGrid({self.shape[0]}x{self.shape[1]} bins, {self.n_rows} rows)"
+
+    @property
+    def n_rows(self) -> int:
+        """Rows accumulated inside the grid."""
+        return int(self.count.sum())
+
+    @property
+    def x_centers(self) -> np.ndarray:
+        return 0.5 * (self.x_edges[:-1] + self.x_edges[1:])
+
+    @property
+    def y_centers(self) -> np.ndarray:
+        return 0.5 * (self.y_edges[:-1] + self.y_edges[1:])
+
+    def _bin_index(self, values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+        index = np.searchsorted(edges, values, side='right') - 1
+        index[values == edges[-1]] = len(edges) - 2
+        return index
+
+    def add(self, x: np.ndarray, y: np.ndarray, values: Optional[np.ndarray] = None) -> None:
+        """
+        Accumulate one chunk of rows.
+
+        Parameters
+        ----------
+        x, y : np.ndarray
+            Bin coordinates, shape (n,)
+        values : np.ndarray, optional
+            Value per row for the mean/std/min/max statistics (booleans
+            count as 0/1)
+        """
+        x = np.ravel(np.asarray(x, dtype=float))
+        y = np.ravel(np.asarray(y, dtype=float))
+        ix = self._bin_index(x, self.x_edges)
+        iy = self._bin_index(y, self.y_edges)
+        inside = (np.isfinite(x) & np.isfinite(y)
+                  & (ix >= 0) & (ix < self.shape[0]) & (iy >= 0) & (iy < self.shape[1]))
+        self.dropped += int(len(x) - inside.sum())
+        flat = ix[inside] * self.shape[1] + iy[inside]
+        size = self.count.size
+        self.count += np.bincount(flat, minlength=size).reshape(self.shape)
+        if values is None:
+            return
+
+        v = np.ravel(np.asarray(values, dtype=float))[inside]
+        finite = np.isfinite(v)
+        flat, v = flat[finite], v[finite]
+        self.n_values += np.bincount(flat, minlength=size).reshape(self.shape)
+        self.sum += np.bincount(flat, weights=v, minlength=size).reshape(self.shape)
+        self.sumsq += np.bincount(flat, weights=v * v, minlength=size).reshape(self.shape)
+        np.minimum.at(self.min.reshape(-1), flat, v)
+        np.maximum.at(self.max.reshape(-1), flat, v)
+
+    def merge(self, other: 'BinnedGrid') -> 'BinnedGrid':
+        """Add the accumulators of a grid with the same edges (e.g. from another worker)."""
+        if not (np.array_equal(self.x_edges, other.x_edges)
+                and np.array_equal(self.y_edges, other.y_edges)):
+            raise ValueError("Cannot merge grids with different bin edges")
+        self.count += other.count
+        self.n_values += other.n_values
+        self.sum += other.sum
+        self.sumsq += other.sumsq
+        np.minimum(self.min, other.min, out=self.min)
+        np.maximum(self.max, other.max, out=self.max)
+        self.dropped += other.dropped
+        return self
+
+    def statistic(self, name: str = 'mean', min_count: int = 1) -> np.ndarray:
+        """
+        Per-bin statistic, shape (nx, ny); NaN where a bin has fewer than
+        min_count rows (min_count values for the value statistics).
+
+        Parameters
+        ----------
+        name : str
+            One of STATISTICS
+        min_count : int
+            Smallest row count for a bin to be reported
+        """
+        if name not in STATISTICS:
+            raise ValueError(f"Unknown statistic: {name!r} (available: {STATISTICS})")
+        if name in ('count', 'density'):
+            out = self.count.astype(float)
+            if name == 'density':
+                area = np.outer(np.diff(self.x_edges), np.diff(self.y_edges))
+                out = out / (max(self.n_rows, 1) * area)
+            out[self.count < min_count] = np.nan
+            return out
+
+        n = self.n_values
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if name == 'sum':
+                out = self.sum.copy()
+            elif name in ('mean', 'probability'):
+                out = self.sum / n
+            elif name == 'std':
+                mean = self.sum / n
+                out = np.sqrt(np.maximum(self.sumsq / n - mean ** 2, 0.0))
+            elif name == 'min':
+                out = self.min.copy()
+            else:
+                out = self.max.copy()
+        out[n < max(min_count, 1)] = np.nan
+        return out
+
+
+def _widen(value_range: Tuple[float, float]) -> Tuple[float, float]:
+    """Range with a non-zero width (a constant column gets a unit-wide bin)."""
+    lo, hi = float(value_range[0]), float(value_range[1])
+    if not (np.isfinite(lo) and np.isfinite(hi)):
+        raise ValueError(f"Range must be finite, got ({lo}, {hi})")
+    if hi < lo:
+        raise ValueError(f"Invalid range ({lo}, {hi})")
+    if hi == lo:
+        half = 1e-3 * max(abs(lo), 1.0)
+        lo, hi = lo - half, hi + half
+    return lo, hi
+
+
+# =============================================================================
+# STREAMING BINNING
+# =============================================================================
+
+def _evaluate(spec: ColumnSpec, chunk: Chunk) -> np.ndarray:
+    return np.asarray(spec(chunk) if callable(spec) else chunk[spec])
+
+
+def bin_sweep(
+    source: SweepSource,
+    x: str,
+    y: str,
+    value: Optional[ColumnSpec] = None,
+    bins: Union[int, Tuple[int, int]] = 64,
+    ranges: Optional[Dict[str, Tuple[float, float]]] = None,
+    where: Optional[ColumnSpec] = None,
+) -> BinnedGrid:
+    """
+    Bin a sweep on an evenly spaced (x, y) grid, streaming it chunk by chunk.
+
+    Parameters
+    ----------
+    source : str, Path or iterable of dict
+        Sweep directory (sweep_store) or chunks in memory
+    x, y : str
+        Coordinate columns
+    value : str or callable, optional
+        Value column, or chunk -> array (e.g. a derived indicator)
+    bins : int or (int, int)
+        Bins along x and y
+    ranges : dict, optional
+        Column -> (min, max) for x and/or y; missing ranges are found with
+        an extra streaming pass (sweep directories and re-iterable sources
+        only)
+    where : str or callable, optional
+        Row filter: boolean column, or chunk -> boolean mask
+
+    Returns
+    -------
+    BinnedGrid
+
+    Notes
+    -----
+    Named columns are loaded selectively; a callable value or mask receives
+    every column of the chunk.
+    """
+    ranges = dict(ranges or {})
+    missing = [name for name in (x, y) if name not in ranges]
+    if missing:
+        if not isinstance(source, (str, Path)) and iter(source) is source:
+            raise ValueError(
+                f"No range given for {missing} and the source is a one-shot iterator; "
+                "pass ranges or a sweep directory"
+            )
+        mask = None if where is None else (lambda chunk: _evaluate(where, chunk).astype(bool))
+        ranges.update(column_ranges(source, missing, mask))
+    grid = BinnedGrid.uniform(ranges[x], ranges[y], bins)
+
+    specs = [spec for spec in (value, where) if spec is not None]
+    if any(callable(spec) for spec in specs):
+        columns = None
+    else:
+        columns = list(dict.fromkeys([x, y] + specs))
+
+    for chunk in iter_columns(source, columns):
+        xs, ys = chunk[x], chunk[y]
+        values = None if value is None else _evaluate(value, chunk)
+        if where is not None:
+            mask = _evaluate(where, chunk).astype(bool)
+            xs, ys = xs[mask], ys[mask]
+            values = None if values is None else values[mask]
+        grid.add(xs, ys, values)
+    return grid
+
+
+def decimate(x: np.ndarray, y: np.ndarray, n_bins: int = 2000) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Min/max decimation of a long series for line plots.
+
+    The x range is split into n_bins bins and each bin is replaced by its
+    lowest and highest y (in x order), so peaks survive at any zoom level
+    the output resolution can show.
+
+    Parameters
+    ----------
+    x, y : np.ndarray
+        Series, shape (n,); x need not be sorted
+    n_bins : int
+        Number of x bins (output has at most 2 * n_bins points)
+
+    Returns
+    -------
+    tuple
+        (x, y) of the decimated series, sorted by x
+    """
+    x = np.ravel(np.asarray(x, dtype=float))
+    y = np.ravel(np.asarray(y, dtype=float))
+    ok = np.isfinite(x) & np.isfinite(y)
+    x, y = x[ok], y[ok]
+    if len(x) <= 2 * n_bins:
+        order = np.argsort(x, kind='stable')
+        return x[order], y[order]
+
+    edges = np.linspace(x.min(), x.max(), n_bins + 1)
+    index = np.clip(np.searchsorted(edges, x, side='right') - 1, 0, n_bins - 1)
+    # Sorted by bin, then by y: the first and last row of each bin are its extremes
+    order = np.lexsort((y, index))
+    first = np.flatnonzero(np.diff(index[order], prepend=-1))
+    last = np.append(first[1:], len(order)) - 1
+    keep = np.unique(np.concatenate([order[first], order[last]]))
+    keep = keep[np.argsort(x[keep], kind='stable')]
+    return x[keep], y[keep]
+
+
+# =============================================================================
+# PLOTS
+# =============================================================================
+
+def _draw(ax, grid: BinnedGrid, kind: str, statistic: str, min_count: int,
+          levels: Union[int, Sequence[float]], cmap: str,
+          vmin: Optional[float] = None, vmax: Optional[float] = None):
+    """Heatmap (pcolormesh, rasterized) or filled contours of a grid statistic."""
+    data = grid.statistic(statistic, min_count).T
+    if kind == 'heatmap':
+        return ax.pcolormesh(grid.x_edges, grid.y_edges, np.ma.masked_invalid(data),
+                             cmap=cmap, vmin=vmin, vmax=vmax, shading='flat',
+                             rasterized=True)
+    if kind == 'contour':
+        if np.ndim(levels) == 0 and vmin is not None and vmax is not None:
+            levels = np.linspace(vmin, vmax, int(levels) + 1)
+        filled = ax.contourf(grid.x_centers, grid.y_centers, np.ma.masked_invalid(data),
+                             levels=levels, cmap=cmap)
+        lines = ax.contour(grid.x_centers, grid.y_centers, np.ma.masked_invalid(data),
+                           levels=filled.levels, colors='k', linewidths=0.5, alpha=0.6)
+        ax.clabel(lines, fontsize=8, fmt='%.3g')
+        return filled
+    raise ValueError(f"Unknown kind: {kind!r} (use 'heatmap' or 'contour')")
+
+
+def _finish(fig, save_path: Optional[str], show: bool) -> None:
+    plt.tight_layout()
+
+    if save_path:
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Saved: {save_path}")
+
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
+
+
+def _plot_grid(
+    grid: BinnedGrid,
+    kind: str,
+    statistic: str,
+    title: Optional[str],
+    xlabel: Optional[str],
+    ylabel: Optional[str],
+    cbar_label: Optional[str],
+    min_count: int,
+    levels: Union[int, Sequence[float]],
+    cmap: str,
+    save_path: Optional[str],
+    show: bool,
+) -> None:
+    check_matplotlib()
+
+    fig, ax = plt.subplots(figsize=(10, 7))
+    mappable = _draw(ax, grid, kind, statistic, min_count, levels, cmap)
+    fig.colorbar(mappable, ax=ax, label=cbar_label or statistic)
+
+    ax.set_xlabel(xlabel or '', fontsize=12)
+    ax.set_ylabel(ylabel or '', fontsize=12)
+    if title:
+        ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+
+    _finish(fig, save_path, show)
+
+
+def plot_binned_heatmap(
+    grid: BinnedGrid,
+    statistic: str = 'count',
+    title: str = None,
+    xlabel: str = None,
+    ylabel: str = None,
+    cbar_label: str = None,
+    min_count: int = 1,
+    cmap: str = 'viridis',
+    save_path: Optional[str] = None,
+    show: bool = True,
+    lang: str = 'en',
+) -> None:
+    """
+    Plot a statistic of a binned sweep as a heatmap (one cell per bin).
+
+    Parameters
+    ----------
+    grid : BinnedGrid
+        Binned sweep (bin_sweep)
+    statistic : str
+        One of STATISTICS
+    title, xlabel, ylabel, cbar_label : str, optional
+        Labels (colour bar default: translated statistic name)
+    min_count : int
+        Bins with fewer rows are left blank
+    cmap : str
+        Colour map
+    save_path : str, optional
+        Path to save figure
+    show : bool
+        Whether to display the plot
+    lang : str
+        Language code ('en' or 'it')
+    """
+    _plot_grid(grid, 'heatmap', statistic, title, xlabel, ylabel,
+               cbar_label or get_text(f'binned_{statistic}', lang),
+               min_count, 10, cmap, save_path, show)
+
+
+def plot_binned_contours(
+    grid: BinnedGrid,
+    statistic: str = 'mean',
+    levels: Union[int, Sequence[float]] = 10,
+    title: str = None,
+    xlabel: str = None,
+    ylabel: str = None,
+    cbar_label: str = None,
+    min_count: int = 1,
+    cmap: str = 'viridis',
+    save_path: Optional[str] = None,
+    show: bool = True,
+    lang: str = 'en',
+) -> None:
+    """
+    Plot a statistic of a binned sweep as filled contours over the bin centres.
+
+    Parameters are those of plot_binned_heatmap, plus levels (number of
+    contour levels or explicit level values).
+    """
+    _plot_grid(grid, 'contour', statistic, title, xlabel, ylabel,
+               cbar_label or get_text(f'binned_{statistic}', lang),
+               min_count, levels, cmap, save_path, show)
+
+
+def plot_feasibility_map(
+    source: Union[SweepSource, BinnedGrid],
+    kind: str = 'heatmap',
+    x: str = WING_LOADING_COLUMN,
+    y: str = POWER_LOADING_COLUMN,
+    value: ColumnSpec = FEASIBLE_COLUMN,
+    bins: Union[int, Tuple[int, int]] = 60,
+    ranges: Optional[Dict[str, Tuple[float, float]]] = None,
+    min_count: int = 5,
+    levels: Union[int, Sequence[float]] = 10,
+    show_constraints: bool = True,
+    title: str = None,
+    save_path: Optional[str] = None,
+    show: bool = True,
+    lang: str = 'en',
+) -> BinnedGrid:
+    """
+    Matching chart variant: probability of a feasible design over (W/S, P/W).
+
+    Each bin shows the fraction of sweep rows landing in it whose design is
+    feasible; the nominal hover, stall and cruise constraints and the
+    baseline design point are drawn on top, as in plot_constraint_diagram.
+
+    Parameters
+    ----------
+    source : str, Path, iterable of dict or BinnedGrid
+        Sweep directory, chunks in memory, or an already binned grid
+    kind : str
+        'heatmap' or 'contour'
+    x, y : str
+        Wing loading and power loading columns
+    value : str or callable
+        0/1 feasibility column, or chunk -> boolean array
+    bins : int or (int, int)
+        Bins along W/S and P/W
+    ranges : dict, optional
+        Column -> (min, max); default: the sweep extent
+    min_count : int
+        Bins with fewer rows are left blank
+    levels : int or sequence
+        Contour levels (kind='contour')
+    show_constraints : bool
+        Overlay the nominal constraint lines (section5.matching_chart)
+    title : str
+        Plot title (default: translated)
+    save_path : str, optional
+        Path to save figure
+    show : bool
+        Whether to display the plot
+    lang : str
+        Language code ('en' or 'it')
+
+    Returns
+    -------
+    BinnedGrid
+        The binned sweep (re-usable for the other variant)
+    """
+    check_matplotlib()
+
+    grid = source if isinstance(source, BinnedGrid) else bin_sweep(
+        source, x, y, value, bins, ranges)
+
+    fig, ax = plt.subplots(figsize=(10, 7))
+    mappable = _draw(ax, grid, kind, 'probability', min_count, levels, 'RdYlGn',
+                     vmin=0.0, vmax=1.0)
+    fig.colorbar(mappable, ax=ax, label=get_text('feasibility_probability', lang))
+
+    if show_constraints:
+        from ..section5 import matching_chart
+
+        ws_range = np.linspace(max(grid.x_edges[0], 1e-3), grid.x_edges[-1], 200)
+        ax.axhline(y=matching_chart.hover_constraint(), color='red', linestyle='-',
+                   linewidth=2, label=get_text('hover_constraint', lang))
+        ax.axvline(x=matching_chart.stall_constraint(), color='green', linestyle='--',
+                   linewidth=2, label=get_text('stall_limit', lang))
+        ax.plot(ws_range, matching_chart.cruise_constraint_curve(ws_range), 'b-',
+                linewidth=2, label=get_text('cruise_constraint', lang))
+        dp = matching_chart.find_design_point()
+        ax.scatter(dp['wing_loading'], dp['power_loading'], s=200, c='black', marker='*',
+                   zorder=5, label=get_text('design_point', lang))
+        ax.legend(loc='upper right', fontsize=10)
+
+    ax.set_xlim(grid.x_edges[0], grid.x_edges[-1])
+    ax.set_ylim(grid.y_edges[0], grid.y_edges[-1])
+    ax.set_xlabel(get_text('wing_loading', lang), fontsize=12)
+    ax.set_ylabel(get_text('power_loading', lang), fontsize=12)
+    ax.set_title(title or get_text('feasibility_map_title', lang), fontsize=14,
+                 fontweight='bold')
+    ax.grid(True, alpha=0.3)
+
+    _finish(fig, save_path, show)
+    return grid
+
+
+def plot_mtow_map(
+    source: Union[SweepSource, BinnedGrid],
+    kind: str = 'contour',
+    x: str = PAYLOAD_COLUMN,
+    y: str = SPECIFIC_ENERGY_COLUMN,
+    value: ColumnSpec = MTOW_COLUMN,
+    statistic: str = 'mean',
+    bins: Union[int, Tuple[int, int]] = 40,
+    ranges: Optional[Dict[str, Tuple[float, float]]] = None,
+    min_count: int = 1,
+    levels: Union[int, Sequence[float]] = 12,
+    title: str = None,
+    save_path: Optional[str] = None,
+    show: bool = True,
+    lang: str = 'en',
+) -> BinnedGrid:
+    """
+    MTOW over (payload mass, battery specific energy) from a sweep.
+
+    Bins average the closed MTOW of all rows in them (the other sampled
+    parameters are marginalized); statistic='max' shows the worst case.
+
+    Parameters
+    ----------
+    source : str, Path, iterable of dict or BinnedGrid
+        Sweep directory, chunks in memory, or an already binned grid
+    kind : str
+        'contour' or 'heatmap'
+    x, y : str
+        Payload and specific energy columns (YAML dot-paths)
+    value : str or callable
+        MTOW column
+    statistic : str
+        'mean', 'min', 'max' or 'std'
+    bins, ranges, min_count, levels
+        See plot_feasibility_map
+    title : str
+        Plot title (default: translated)
+    save_path : str, optional
+        Path to save figure
+    show : bool
+        Whether to display the plot
+    lang : str
+        Language code ('en' or 'it')
+
+    Returns
+    -------
+    BinnedGrid
+        The binned sweep
+    """
+    grid = source if isinstance(source, BinnedGrid) else bin_sweep(
+        source, x, y, value, bins, ranges)
+    _plot_grid(grid, kind, statistic, title or get_text('mtow_map_title', lang),
+               get_text('payload_mass', lang), get_text('specific_energy', lang),
+               get_text('mtow_label', lang), min_count, levels, 'viridis',
+               save_path, show)
+    return grid
+
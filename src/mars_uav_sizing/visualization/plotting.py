@@ -79,6 +79,30 @@ TRANSLATIONS = {
         'rotorcraft_equiv': 'Rotorcraft\n(equivalent)',
         'fixed_wing_pure': 'Fixed-Wing\n(pure)',
         'hybrid_vtol_qp': 'Hybrid VTOL\n(QuadPlane)',
+        
+        # V-tail sweep
+        'vtail_sweep_title': 'V-Tail Area vs Dihedral',
+        'dihedral_xlabel': 'V-tail dihedral Γ (deg)',
+        'vtail_area_ylabel': 'V-tail planform area (m²)',
+        'moment_arm_ratio': 'l/L_fus',
+        'pitch_limited': 'Pitch-limited',
+        'yaw_limited': 'Yaw-limited',
+
+        # Binned sweep plots
+        'feasibility_map_title': 'Feasibility Probability - Matching Chart Sweep',
+        'feasibility_probability': 'Feasibility probability',
+        'mtow_map_title': 'MTOW over Payload and Battery Specific Energy',
+        'mtow_label': 'MTOW (kg)',
+        'payload_mass': 'Payload mass (kg)',
+        'specific_energy': 'Battery specific energy (Wh/kg)',
+        'binned_count': 'Samples per bin',
+        'binned_density': 'Sample density',
+        'binned_sum': 'Sum per bin',
+        'binned_mean': 'Mean',
+        'binned_probability': 'Probability',
+        'binned_std': 'Standard deviation',
+        'binned_min': 'Minimum',
+        'binned_max': 'Maximum',
     },
     'it': {
         # Matching chart
@@ -129,6 +153,30 @@ TRANSLATIONS = {
         'rotorcraft_equiv': 'Rotorcraft\n(equivalente)',
         'fixed_wing_pure': 'Ala fissa\n(pura)',
         'hybrid_vtol_qp': 'VTOL ibrido\n(QuadPlane)',
+        
+        # V-tail sweep
+        'vtail_sweep_title': 'Superficie del V-tail in funzione del diedro',
+        'dihedral_xlabel': 'Diedro del V-tail Γ (gradi)',
+        'vtail_area_ylabel': 'Superficie in pianta del V-tail (m²)',
+        'moment_arm_ratio': 'l/L_fus',
+        'pitch_limited': 'Limitato dal beccheggio',
+        'yaw_limited': 'Limitato dall\'imbardata',
+
+        # Binned sweep plots
+        'feasibility_map_title': 'Probabilità di ammissibilità - Sweep del diagramma di matching',
+        'feasibility_probability': 'Probabilità di ammissibilità',
+        'mtow_map_title': 'MTOW in funzione di carico utile ed energia specifica della batteria',
+        'mtow_label': 'MTOW (kg)',
+        'payload_mass': 'Massa del carico utile (kg)',
+        'specific_energy': 'Energia specifica della batteria (Wh/kg)',
+        'binned_count': 'Campioni per cella',
+        'binned_density': 'Densità dei campioni',
+        'binned_sum': 'Somma per cella',
+        'binned_mean': 'Media',
+        'binned_probability': 'Probabilità',
+        'binned_std': 'Deviazione standard',
+        'binned_min': 'Minimo',
+        'binned_max': 'Massimo',
     }
 }
 
@@ -792,6 +840,80 @@ def plot_ld_comparison(
         plt.close()
 
 
+def plot_vtail_sweep(
+    results: Dict[str, np.ndarray] = None,
+    save_path: Optional[str] = None,
+    show: bool = True,
+    lang: str = 'en',
+) -> None:
+    """
+    Plot V-tail area against dihedral for several tail moment arms.
+    
+    Each curve is one moment-arm ratio; filled markers show where the
+    pitch requirement sizes the tail, open markers the yaw requirement.
+    
+    Parameters
+    ----------
+    results : dict, optional
+        Structure-of-arrays from tail_sizing.vtail_sweep() with dihedral
+        on the last axis and moment-arm ratio on the first
+        (default: 20-60 deg × 0.4-0.8)
+    save_path : str, optional
+        Path to save figure
+    show : bool
+        Whether to display
+    lang : str
+        Language code ('en' or 'it')
+    """
+    check_matplotlib()
+    
+    if results is None:
+        from ..section6.tail_sizing import vtail_sweep
+        results = vtail_sweep(
+            moment_arm_ratio=np.linspace(0.4, 0.8, 5)[:, None],
+            dihedral_deg=np.linspace(20.0, 60.0, 81),
+        )
+    
+    dihedral = np.atleast_2d(results['dihedral_deg'])
+    area = np.atleast_2d(results['S_vtail_total_m2'])
+    arm = np.atleast_2d(results['moment_arm_ratio'])
+    pitch = np.atleast_2d(results['pitch_limited'])
+    
+    fig, ax = plt.subplots(figsize=(10, 7))
+    colors = plt.cm.viridis(np.linspace(0, 0.9, len(area)))
+    
+    for row, color in enumerate(colors):
+        ax.plot(dihedral[row], area[row], '-', color=color, linewidth=2,
+                label=f"{get_text('moment_arm_ratio', lang)} = {arm[row, 0]:.2f}")
+        mask = pitch[row]
+        ax.plot(dihedral[row][mask], area[row][mask], 'o', color=color,
+                markersize=4)
+        ax.plot(dihedral[row][~mask], area[row][~mask], 'o', color=color,
+                markersize=4, markerfacecolor='white')
+    
+    # Legend entries for the constraint markers
+    ax.plot([], [], 'ko', markersize=4, label=get_text('pitch_limited', lang))
+    ax.plot([], [], 'ko', markersize=4, markerfacecolor='white',
+            label=get_text('yaw_limited', lang))
+    
+    ax.set_xlabel(get_text('dihedral_xlabel', lang), fontsize=12)
+    ax.set_ylabel(get_text('vtail_area_ylabel', lang), fontsize=12)
+    ax.set_title(get_text('vtail_sweep_title', lang), fontsize=14, fontweight='bold')
+    ax.legend(loc='upper center', fontsize=10)
+    ax.grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    
+    if save_path:
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Saved: {save_path}")
+    
+    if show:
+        plt.show()
+    else:
+        plt.close()
+
+
 def generate_all_figures(output_dir: str = "./figures", lang: str = 'en') -> None:
     """
     Generate all standard figures in specified language.
@@ -0,0 +1,241 @@
+"""
+Columnar Sweep Files
+====================
+
+Chunked, column-oriented storage for large parameter sweeps (10^6+ rows).
+
+A sweep is a directory holding one .npz file per written chunk
+(part-00000.npz, part-00001.npz, ...) with one array per column, and a
+columns.json manifest listing the column names, the parts and the row
+count. Readers stream the parts one at a time and load only the requested
+columns (npz members are read on access), so no reader ever holds the
+whole sweep in memory.
+
+Layout:
+    sweep_dir/
+        columns.json     {"columns": [...], "parts": [...], "n_rows": N}
+        part-00000.npz   one 1-D array per column, equal lengths
+        part-00001.npz
+        ...
+
+The manifest is rewritten after every chunk, so a sweep interrupted half
+way is readable up to its last complete part.
+
+Last Updated: 2026-10-19
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+
+MANIFEST_NAME = 'columns.json'
+PART_PATTERN = 'part-{:05d}.npz'
+
+# A chunk: column name -> 1-D array (all the same length)
+Chunk = Dict[str, np.ndarray]
+
+# Anything iter_columns can stream: a sweep directory or chunks in memory
+SweepSource = Union[str, Path, Iterable[Chunk]]
+
+
+# =============================================================================
+# WRITING
+# =============================================================================
+
+class SweepWriter:
+    """
+    Append-only writer for a columnar sweep directory.
+
+    Parameters
+    ----------
+    path : str or Path
+        Sweep directory (created if missing)
+    columns : sequence of str, optional
+        Column names; default: the keys of the first chunk written
+    compress : bool
+        Write compressed parts (np.savez_compressed)
+    overwrite : bool
+        Remove the parts of an existing sweep in the directory first;
+        otherwise new chunks are appended to it
+
+    Examples
+    --------
+    >>> with SweepWriter('sweeps/lhs') as writer:
+    ...     for samples, y in chunks:
+    ...         writer.write({'ws': samples[:, 0], 'mtow_kg': y[:, 0]})
+    """
+
+    def __init__(self, path: Union[str, Path], columns: Optional[Sequence[str]] = None,
+                 compress: bool = True, overwrite: bool = False):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.compress = compress
+        manifest = self.path / MANIFEST_NAME
+        if manifest.exists() and not overwrite:
+            info = read_manifest(self.path)
+            if columns is not None and list(columns) != info['columns']:
+                raise ValueError(
+                    f"Columns {list(columns)} do not match the existing sweep "
+                    f"{info['columns']} in {self.path}"
+                )
+            self.columns: Optional[List[str]] = info['columns']
+            self.parts: List[str] = info['parts']
+            self.n_rows = info['n_rows']
+        else:
+            for part in self.path.glob('part-*.npz'):
+                part.unlink()
+            self.columns = list(columns) if columns is not None else None
+            self.parts = []
+            self.n_rows = 0
+
+    def __enter__(self) -> 'SweepWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write(self, chunk: Chunk) -> None:
+        """
+        Append one chunk.
+
+        Parameters
+        ----------
+        chunk : dict
+            Column name -> 1-D array; every column of the sweep is required
+            and all arrays must have the same length
+        """
+        if self.columns is None:
+            self.columns = list(chunk)
+        missing = set(self.columns) - set(chunk)
+        if missing:
+            raise KeyError(f"Chunk is missing columns: {sorted(missing)}")
+        arrays = {name: np.ravel(np.asarray(chunk[name])) for name in self.columns}
+        lengths = {len(a) for a in arrays.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+        n = lengths.pop() if lengths else 0
+        if n == 0:
+            return
+
+        name = PART_PATTERN.format(len(self.parts))
+        # Column names are YAML dot-paths; npz members are keyed by position
+        save = np.savez_compressed if self.compress else np.savez
+        save(self.path / name, **{f'c{i}': arrays[c] for i, c in enumerate(self.columns)})
+        self.parts.append(name)
+        self.n_rows += n
+        self._write_manifest()
+
+    def close(self) -> None:
+        """Write the manifest (also done after every chunk)."""
+        if self.columns is not None:
+            self._write_manifest()
+
+    def _write_manifest(self) -> None:
+        info = {'columns': self.columns, 'parts': self.parts, 'n_rows': self.n_rows}
+        tmp = self.path / (MANIFEST_NAME + '.tmp')
+        tmp.write_text(json.dumps(info, indent=2), encoding='utf-8')
+        tmp.replace(self.path / MANIFEST_NAME)
+
+
+def write_sweep(path: Union[str, Path], chunks: Iterable[Chunk],
+                compress: bool = True) -> Dict[str, Any]:
+    """
+    Write an iterable of chunks to a new sweep directory.
+
+    Returns
+    -------
+    dict
+        The manifest ('columns', 'parts', 'n_rows')
+    """
+    with SweepWriter(path, compress=compress, overwrite=True) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    return read_manifest(path)
+
+
+# =============================================================================
+# READING
+# =============================================================================
+
+def read_manifest(path: Union[str, Path]) -> Dict[str, Any]:
+    """Manifest of a sweep directory ('columns', 'parts', 'n_rows')."""
+    manifest = Path(path) / MANIFEST_NAME
+    if not manifest.exists():
+        raise FileNotFoundError(f"No sweep manifest ({MANIFEST_NAME}) in {path}")
+    return json.loads(manifest.read_text(encoding='utf-8'))
+
+
+def iter_columns(source: SweepSource,
+                 columns: Optional[Sequence[str]] = None) -> Iterator[Chunk]:
+    """
+    Stream a sweep chunk by chunk, loading only the requested columns.
+
+    Parameters
+    ----------
+    source : str, Path or iterable of dict
+        Sweep directory, or chunks already in memory (dicts of arrays)
+    columns : sequence of str, optional
+        Columns to load (default: all)
+
+    Yields
+    ------
+    dict
+        Column name -> 1-D array for one part
+    """
+    if not isinstance(source, (str, Path)):
+        for chunk in source:
+            names = list(chunk) if columns is None else columns
+            missing = set(names) - set(chunk)
+            if missing:
+                raise KeyError(f"Chunk is missing columns: {sorted(missing)}")
+            yield {name: np.ravel(np.asarray(chunk[name])) for name in names}
+        return
+
+    info = read_manifest(source)
+    names = info['columns'] if columns is None else list(columns)
+    missing = set(names) - set(info['columns'])
+    if missing:
+        raise KeyError(f"Unknown sweep columns: {sorted(missing)} (available: {info['columns']})")
+    keys = {name: f"c{info['columns'].index(name)}" for name in names}
+    for part in info['parts']:
+        with np.load(Path(source) / part) as data:
+            yield {name: data[key] for name, key in keys.items()}
+
+
+def column_ranges(source: SweepSource, columns: Sequence[str],
+                  where: Optional[Callable[[Chunk], np.ndarray]] = None,
+                  ) -> Dict[str, tuple]:
+    """
+    Finite (min, max) of each column in one streaming pass.
+
+    Parameters
+    ----------
+    source : str, Path or iterable of dict
+        Sweep directory or in-memory chunks
+    columns : sequence of str
+        Columns to scan
+    where : callable, optional
+        chunk -> boolean mask of the rows to include (loads every column)
+
+    Returns
+    -------
+    dict
+        Column name -> (min, max); (nan, nan) for columns without finite values
+    """
+    lo = {name: np.inf for name in columns}
+    hi = {name: -np.inf for name in columns}
+    # A mask callable may read any column, so all of them are loaded then
+    for chunk in iter_columns(source, list(columns) if where is None else None):
+        mask = np.asarray(where(chunk), dtype=bool) if where is not None else None
+        for name in columns:
+            values = chunk[name] if mask is None else chunk[name][mask]
+            values = values[np.isfinite(values)]
+            if len(values):
+                lo[name] = min(lo[name], float(values.min()))
+                hi[name] = max(hi[name], float(values.max()))
+    return {name: (lo[name], hi[name]) if lo[name] <= hi[name] else (np.nan, np.nan)
+            for name in columns}
+
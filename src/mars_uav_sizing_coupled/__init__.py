@@ -4,6 +4,8 @@ Mars UAV Sizing Tool (Coupled Solver)
 
 Parallel package that preserves the original structure while adding a
 coupled, solver-based sizing workflow (matching chart initial guess + fsolve).
+The engine module runs the Section 5 analyses in fixed-MTOW and coupled
+mode in one pass and diffs the two.
 """
 
 __version__ = "0.1.0"
@@ -17,6 +19,8 @@ from . import section4
 from . import section5
 from . import visualization
 from . import verification
+from . import studies
+from . import engine
 
 __all__ = [
     "__version__",
@@ -29,4 +33,6 @@ __all__ = [
     "section5",
     "visualization",
     "verification",
+    "studies",
+    "engine",
 ]
@@ -4,42 +4,40 @@ Configuration Module (Coupled Solver)
 
 Extends the base mars_uav_sizing configuration with solver parameters.
 Base parameters are loaded from mars_uav_sizing.config; solver options
-are loaded from this package's config/solver_parameters.yaml.
+are loaded from this package's config/solver_parameters.yaml and registered
+as the "solver" section of the base configuration tree.
 """
 
 from pathlib import Path
 from typing import Any, Dict
-import yaml
 
 from mars_uav_sizing import config as base_config
+from mars_uav_sizing.config import (
+    BASELINE,
+    Scenario,
+    active_scenario,
+    list_scenarios,
+    load_scenario,
+    parameters,
+    scenario_hash,
+)
+from mars_uav_sizing import instrumentation
 
 CONFIG_DIR = Path(__file__).parent
 SOLVER_FILE = "solver_parameters.yaml"
 
-_config_cache: Dict[str, Any] = {}
-
-
-def _load_yaml(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        return {}
-    with open(path, "r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
+# The solver options are a section of the base configuration tree, so
+# scenarios and overrides apply to both packages alike
+base_config.register_config_file("solver", CONFIG_DIR / SOLVER_FILE, section="solver")
 
 
 def load_config(reload: bool = False) -> Dict[str, Any]:
-    global _config_cache
-    if _config_cache and not reload:
-        return _config_cache
-
-    base = base_config.load_config(reload=reload)
-    solver_blob = _load_yaml(CONFIG_DIR / SOLVER_FILE)
-
-    _config_cache = dict(base)
-    _config_cache["solver"] = solver_blob.get("solver", {})
-    return _config_cache
+    return base_config.load_config(reload=reload)
 
 
 def get_param(path: str, default: Any = None) -> Any:
+    if instrumentation.ACTIVE:
+        instrumentation.record_param_access(path)
     config = load_config()
     keys = path.split(".")
     value: Any = config
@@ -67,16 +65,20 @@ def get_mtow() -> float:
     return base_config.get_mtow()
 
 
-def get_propulsion_efficiencies() -> Dict[str, float]:
-    return base_config.get_propulsion_efficiencies()
+def get_propulsion_efficiencies(mtow_kg: float | None = None) -> Dict[str, float]:
+    return base_config.get_propulsion_efficiencies(mtow_kg)
+
+
+def get_disk_loading(mtow_kg: float | None = None) -> float:
+    return base_config.get_disk_loading(mtow_kg)
 
 
 def get_battery_params() -> Dict[str, float]:
     return base_config.get_battery_params()
 
 
-def get_aerodynamic_params() -> Dict[str, float]:
-    return base_config.get_aerodynamic_params()
+def get_aerodynamic_params(mtow_kg: float | None = None, wing_loading: float | None = None) -> Dict[str, float]:
+    return base_config.get_aerodynamic_params(mtow_kg, wing_loading)
 
 
 def get_mission_params() -> Dict[str, float]:
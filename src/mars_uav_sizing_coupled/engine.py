@@ -0,0 +1,295 @@
+﻿"""
+Unified Section 5 Engine
+========================
+
+Runs the Section 5 analyses in one or both sizing modes within a single
+process and parameter snapshot:
+
+    fixed_mtow   Baseline MTOW from mission_parameters.yaml
+                 (mars_uav_sizing.section5, the uncoupled study)
+    coupled      MTOW, wing loading, power loading and battery mass from the
+                 coupled solver (mars_uav_sizing_coupled.section5)
+
+Both modes read the same configuration tree (the active scenario is frozen
+for the run), share the imported models and the physics functions of
+mars_uav_sizing (atmosphere, aerodynamics, constraint equations), and the
+coupled solution is solved once and reused by every coupled analysis. The
+comparative summaries reuse the configuration analyses already evaluated.
+Running both modes therefore costs about one analysis run instead of two
+separate processes, and the result carries a diff of the two.
+
+Usage:
+    python -m mars_uav_sizing_coupled.engine
+    python -m mars_uav_sizing_coupled.engine --mode coupled
+    python -m mars_uav_sizing_coupled.run_analysis --mode both
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+from mars_uav_sizing.instrumentation import traced
+
+from .config import parameters
+
+MODES: Tuple[str, ...] = ("fixed_mtow", "coupled")
+
+# Analyses evaluated per mode, in order
+ANALYSES: Tuple[str, ...] = ("rotorcraft", "fixed_wing", "hybrid_vtol", "matching_chart", "comparative")
+
+# Keys left out of the diff: solver internals, plot arrays and the
+# comparative summary (its inputs are diffed directly)
+DIFF_SKIP: Tuple[str, ...] = ("solver", "ws_range", "pw_cruise_curve", "pw_hover_line", "comparative")
+
+# Quantities shown in the printed diff (all differing leaves are in the result)
+SUMMARY_KEYS: Tuple[str, ...] = (
+    "rotorcraft.mtow_kg",
+    "rotorcraft.endurance_min",
+    "fixed_wing.endurance_min",
+    "hybrid_vtol.battery_mass_kg",
+    "hybrid_vtol.endurance_min",
+    "hybrid_vtol.margin_percent",
+    "hybrid_vtol.transition_energy_wh",
+    "matching_chart.design_point.wing_loading",
+    "matching_chart.design_point.power_loading",
+    "matching_chart.geometry.wing_area_m2",
+    "matching_chart.geometry.wingspan_m",
+)
+
+
+# =============================================================================
+# MODES
+# =============================================================================
+
+def _check_modes(mode: str | Sequence[str]) -> Tuple[str, ...]:
+    modes = MODES if mode == "both" else ((mode,) if isinstance(mode, str) else tuple(mode))
+    unknown = [m for m in modes if m not in MODES]
+    if unknown or not modes:
+        raise ValueError(f"Unknown mode: {unknown or mode!r} (use {MODES} or 'both')")
+    return modes
+
+
+@traced("engine.fixed_mtow")
+def _evaluate_fixed_mtow() -> Dict[str, Any]:
+    from mars_uav_sizing.section5 import comparative, fixed_wing, hybrid_vtol, matching_chart, rotorcraft
+
+    results = {
+        "rotorcraft": rotorcraft.rotorcraft_feasibility_analysis(),
+        "fixed_wing": fixed_wing.fixed_wing_feasibility_analysis(),
+        "hybrid_vtol": hybrid_vtol.hybrid_vtol_feasibility_analysis(),
+        "matching_chart": matching_chart.matching_chart_analysis(),
+    }
+    results["comparative"] = comparative.comparative_summary(results)
+    return results
+
+
+@traced("engine.coupled")
+def _evaluate_coupled() -> Dict[str, Any]:
+    from .section5 import comparative, fixed_wing, hybrid_vtol, matching_chart, rotorcraft
+
+    results = {
+        "rotorcraft": rotorcraft.rotorcraft_feasibility_analysis(),
+        "fixed_wing": fixed_wing.fixed_wing_feasibility_analysis(),
+        "hybrid_vtol": hybrid_vtol.hybrid_vtol_feasibility_analysis(),
+        "matching_chart": matching_chart.matching_chart_analysis(use_coupled_solver=True),
+    }
+    results["comparative"] = comparative.comparative_summary(results)
+    return results
+
+
+_EVALUATORS = {"fixed_mtow": _evaluate_fixed_mtow, "coupled": _evaluate_coupled}
+
+
+def evaluate_mode(mode: str) -> Dict[str, Any]:
+    """
+    Evaluate the Section 5 analyses in one mode.
+
+    Parameters
+    ----------
+    mode : str
+        'fixed_mtow' or 'coupled'
+
+    Returns
+    -------
+    dict
+        One entry per name in ANALYSES
+    """
+    (mode,) = _check_modes(mode)
+    return _EVALUATORS[mode]()
+
+
+@traced("engine")
+def run_engine(
+    mode: str | Sequence[str] = "both",
+    overrides: Dict[str, Any] | None = None,
+) -> Dict[str, Any]:
+    """
+    Run the Section 5 analyses in one or both modes on one parameter snapshot.
+
+    Parameters
+    ----------
+    mode : str or sequence of str
+        'fixed_mtow', 'coupled', 'both' or a sequence of modes
+    overrides : dict, optional
+        YAML dot-path -> value, applied on top of the active scenario
+
+    Returns
+    -------
+    dict
+        'modes', one result dict per mode, 'diff' (when both modes ran),
+        'scenario_hash' and 'timing_s' per mode
+    """
+    modes = _check_modes(mode)
+    results: Dict[str, Any] = {"modes": modes, "timing_s": {}}
+    with parameters(overrides) as snapshot:
+        results["scenario_hash"] = snapshot.hash
+        for name in modes:
+            start = time.perf_counter()
+            results[name] = _EVALUATORS[name]()
+            results["timing_s"][name] = time.perf_counter() - start
+    if set(MODES) <= set(modes):
+        results["diff"] = diff_modes(results["fixed_mtow"], results["coupled"])
+    return results
+
+
+# =============================================================================
+# DIFF
+# =============================================================================
+
+def _iter_leaves(node: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    for key, value in node.items():
+        if key in DIFF_SKIP:
+            continue
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict):
+            yield from _iter_leaves(value, path)
+        elif isinstance(value, (bool, int, float, str)):
+            yield path, value
+
+
+def diff_modes(
+    fixed: Dict[str, Any],
+    coupled: Dict[str, Any],
+    rel_tol: float = 1.0e-9,
+) -> List[Dict[str, Any]]:
+    """
+    Compare the results of the two modes leaf by leaf.
+
+    Parameters
+    ----------
+    fixed, coupled : dict
+        Results of evaluate_mode('fixed_mtow') and evaluate_mode('coupled')
+    rel_tol : float
+        Relative tolerance below which numbers count as equal
+
+    Returns
+    -------
+    list of dict
+        One row per differing quantity present in both: 'path', 'fixed_mtow',
+        'coupled', and for numbers 'delta' and 'delta_pct' (None when the
+        fixed-MTOW value is zero); booleans and strings only report the values
+    """
+    left = dict(_iter_leaves(fixed))
+    rows: List[Dict[str, Any]] = []
+    for path, b in _iter_leaves(coupled):
+        if path not in left:
+            continue
+        a = left[path]
+        numeric = all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in (a, b))
+        if numeric:
+            if math.isclose(a, b, rel_tol=rel_tol, abs_tol=1.0e-12):
+                continue
+            rows.append({
+                "path": path, "fixed_mtow": a, "coupled": b, "delta": b - a,
+                "delta_pct": 100.0 * (b - a) / abs(a) if a else None,
+            })
+        elif a != b:
+            rows.append({"path": path, "fixed_mtow": a, "coupled": b})
+    return rows
+
+
+# =============================================================================
+# OUTPUT
+# =============================================================================
+
+def _format(value: Any) -> str:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return str(value)
+    return f"{value:.4g}"
+
+
+def print_analysis(results: Dict[str, Any] | None = None) -> None:
+    """Print both modes side by side with the headline differences."""
+    if results is None:
+        results = run_engine()
+
+    print("=" * 80)
+    print("UNIFIED SECTION 5 ENGINE (FIXED MTOW / COUPLED)")
+    print("=" * 80)
+    print(f"Computed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("Config:   All values loaded from config/ YAML files")
+    print(f"Scenario: {results['scenario_hash']}")
+    print()
+
+    print("TIMING")
+    print("-" * 50)
+    for name in results["modes"]:
+        print(f"  {name:12} {results['timing_s'][name]:8.3f} s")
+    print()
+
+    print("FEASIBILITY")
+    print("-" * 50)
+    print(f"  {'Configuration':20} " + " ".join(f"{m:>14}" for m in results["modes"]))
+    for config in ("rotorcraft", "fixed_wing", "hybrid_vtol"):
+        flags = ["FEASIBLE" if results[m][config]["feasible"] else "NOT FEASIBLE" for m in results["modes"]]
+        print(f"  {config.replace('_', ' ').title():20} " + " ".join(f"{f:>14}" for f in flags))
+    selected = [results[m]["comparative"]["selected"].replace("_", " ").upper() for m in results["modes"]]
+    print(f"  {'Selected':20} " + " ".join(f"{s:>14}" for s in selected))
+    print()
+
+    if "diff" not in results:
+        return
+
+    rows = {row["path"]: row for row in results["diff"]}
+    print("DIFFERENCES (coupled - fixed MTOW)")
+    print("-" * 50)
+    print(f"  {'Quantity':44} {'Fixed MTOW':>11} {'Coupled':>11} {'Delta %':>9}")
+    for path in SUMMARY_KEYS:
+        row = rows.get(path)
+        if row is None:
+            continue
+        pct = row.get("delta_pct")
+        pct_text = f"{pct:+.1f}" if pct is not None else "-"
+        print(f"  {path:44} {_format(row['fixed_mtow']):>11} {_format(row['coupled']):>11} {pct_text:>9}")
+    flips = [row for row in results["diff"] if isinstance(row["coupled"], (bool, str))]
+    for row in flips:
+        print(f"  {row['path']:44} {_format(row['fixed_mtow']):>11} {_format(row['coupled']):>11}")
+    print(f"\n  {len(results['diff'])} quantities differ (see results['diff'])")
+    print()
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Section 5 analyses in fixed-MTOW and/or coupled mode")
+    parser.add_argument("--mode", choices=MODES + ("both",), default="both", help="Sizing mode(s) to run")
+    parser.add_argument(
+        "--scenario",
+        nargs="+",
+        metavar="NAME",
+        default=[],
+        help="Apply scenario overlays from mars_uav_sizing/config/scenarios/ (stacked in order)",
+    )
+    args = parser.parse_args()
+
+    from .config import load_scenario
+
+    with load_scenario(*args.scenario).applied():
+        print_analysis(run_engine(args.mode))
+
+
+if __name__ == "__main__":
+    main()
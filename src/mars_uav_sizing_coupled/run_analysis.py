@@ -8,13 +8,15 @@ All parameters are loaded from config/ YAML files.
 """
 
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
 if __name__ == "__main__":
     sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from mars_uav_sizing_coupled.config import get_param
+from mars_uav_sizing import instrumentation, run_archive
+from mars_uav_sizing_coupled.config import active_scenario, get_param, load_scenario, parameters
 from mars_uav_sizing_coupled.section5 import (
     rotorcraft,
     fixed_wing,
@@ -34,10 +36,14 @@ def print_header() -> None:
     print()
     print(f"  Analysis run: {timestamp}")
     print("  Configuration: All parameters from config/ YAML files")
+    scenario = active_scenario()
+    if scenario is not None and scenario.layers:
+        print(f"  Scenario:      {scenario.name} ({scenario.hash})")
     print(f"  Baseline MTOW: {get_param('mission.mass.mtow_kg')} kg")
     print()
 
 
+@instrumentation.traced("section5")
 def run_all_analyses(verbose: bool = True, use_coupled_solver: bool = True) -> dict:
     print_header()
 
@@ -91,7 +97,7 @@ def run_all_analyses(verbose: bool = True, use_coupled_solver: bool = True) -> d
     print("\n" + "-" * 80)
     print(" 5/5  COMPARATIVE ANALYSIS")
     print("-" * 80 + "\n")
-    results["comparative"] = comparative.comparative_summary()
+    results["comparative"] = comparative.comparative_summary(results)
     if verbose:
         comparative.print_analysis(results["comparative"])
     else:
@@ -139,8 +145,70 @@ def main() -> None:
         action="store_true",
         help="Run full uncoupled analysis from mars_uav_sizing (ignores --analysis)",
     )
+    parser.add_argument(
+        "--mode",
+        choices=["coupled", "fixed_mtow", "both"],
+        default="coupled",
+        help="fixed_mtow or both: run the Section 5 analyses through the unified engine "
+        "(both modes in one pass, with a diff)",
+    )
+    parser.add_argument(
+        "--scenario",
+        nargs="+",
+        metavar="NAME",
+        default=[],
+        help="Apply scenario overlays from mars_uav_sizing/config/scenarios/ (stacked in order)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Solve without the persistent solution cache (solver.cache)",
+    )
+    parser.add_argument(
+        "--no-archive",
+        action="store_true",
+        help="Do not record this run in the run archive (mars_uav_sizing.run_archive)",
+    )
+    parser.add_argument(
+        "--archive",
+        metavar="PATH",
+        default=None,
+        help="Run archive file (default: mars_uav_sizing/cache/run_archive.sqlite)",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        default=None,
+        help="Record get_param accesses, timing spans and solver evaluations to a "
+        "Chrome trace JSON (use a .speedscope.json suffix for speedscope format)",
+    )
 
     args = parser.parse_args()
+
+    if args.trace:
+        instrumentation.enable()
+    try:
+        overrides = {"solver.cache.enabled": False} if args.no_cache else None
+        with load_scenario(*args.scenario).applied(), parameters(overrides):
+            started = (time.perf_counter(), time.process_time())
+            results = _run_selected(args)
+            if not args.no_archive:
+                command = "uncoupled" if args.uncoupled else (
+                    f"engine_{args.mode}" if args.mode != "coupled" else "all")
+                run_archive.archive_run(
+                    results, "mars_uav_sizing_coupled", command, started,
+                    packages=("mars_uav_sizing", "mars_uav_sizing_coupled"), path=args.archive,
+                )
+    finally:
+        if args.trace:
+            instrumentation.disable()
+            instrumentation.print_summary()
+            path = instrumentation.write_trace(args.trace)
+            print(f"Trace written to: {path}")
+
+
+def _run_selected(args) -> dict | None:
+    """Dispatch the selected run; returns the results of full runs (single analyses only print)."""
     verbose = not args.brief
     use_coupled_solver = not args.uncoupled
 
@@ -155,11 +223,18 @@ def main() -> None:
         print_header()
         print("  Mode: UNCOUPLED (delegated to mars_uav_sizing.run_analysis)")
         print()
-        run_uncoupled(verbose=verbose)
-        return
+        return run_uncoupled(verbose=verbose)
+
+    if args.mode != "coupled":
+        from mars_uav_sizing_coupled import engine
+
+        print_header()
+        results = engine.run_engine(args.mode)
+        engine.print_analysis(results)
+        return results
 
     if args.analysis == "all":
-        run_all_analyses(verbose=verbose, use_coupled_solver=use_coupled_solver)
+        return run_all_analyses(verbose=verbose, use_coupled_solver=use_coupled_solver)
     elif args.analysis == "rotorcraft":
         rotorcraft.print_analysis()
     elif args.analysis == "fixed_wing":
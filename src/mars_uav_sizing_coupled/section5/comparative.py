@@ -8,6 +8,8 @@ Compares all three configurations using coupled sizing outputs.
 from typing import Dict, Any, List
 from datetime import datetime
 
+from mars_uav_sizing.instrumentation import traced
+
 from . import rotorcraft
 from . import fixed_wing
 from . import hybrid_vtol
@@ -139,8 +141,12 @@ def elimination_rationale(results: Dict[str, Dict[str, Any]] = None) -> Dict[str
     return rationale
 
 
-def comparative_summary() -> Dict[str, Any]:
-    results = run_all_analyses()
+@traced("comparative")
+def comparative_summary(results: Dict[str, Dict[str, Any]] = None) -> Dict[str, Any]:
+    if results is None:
+        results = run_all_analyses()
+    else:
+        results = {name: results[name] for name in ("rotorcraft", "fixed_wing", "hybrid_vtol")}
     comparison = create_comparison_table(results)
     ranking = configuration_ranking(results)
     rationale = elimination_rationale(results)
@@ -9,37 +9,54 @@ initialize and guide the solution.
 
 from __future__ import annotations
 
-import math
 from typing import Any, Dict, List
 
 from scipy.optimize import fsolve
 
 from ..config import (
     get_param,
+    scenario_hash,
     get_initial_guess,
     get_solver_options,
     get_mars_gravity,
     get_density,
     get_propulsion_efficiencies,
+    get_disk_loading,
     get_battery_params,
     get_mission_params,
     get_aerodynamic_params,
 )
+from mars_uav_sizing import instrumentation
+from mars_uav_sizing.core.dual import sqrt
 
+from .. import solution_cache
+
+from mars_uav_sizing.section5.flight_envelope import critical_load_factor, gust_wing_loading_limit
 from mars_uav_sizing.section5.rotorcraft import hover_power_loading
+from mars_uav_sizing.section7.mass_closure import (
+    battery_masses,
+    closure_parameters,
+    propulsion_masses,
+    structure_masses,
+)
 from mars_uav_sizing.section5.fixed_wing import (
     cruise_lift_coefficient,
     lift_to_drag,
     cruise_power_loading,
     stall_wing_loading_limit,
 )
+from mars_uav_sizing.section5.transition import transition_energy_wh as simulated_transition_energy_wh
 
 
 def smooth_max(a: float, b: float, eps: float) -> float:
-    return 0.5 * (a + b + math.sqrt((a - b) ** 2 + eps ** 2))
+    return 0.5 * (a + b + sqrt((a - b) ** 2 + eps ** 2))
+
 
+def transition_energy_wh(mtow_kg: float, wing_loading: float | None = None) -> float:
+    if get_param("mission.transition.simulation.use_in_sizing", False):
+        # Point-mass transition simulation (mars_uav_sizing.section5.transition)
+        return simulated_transition_energy_wh(mtow_kg, wing_loading)
 
-def transition_energy_wh(mtow_kg: float) -> float:
     n_transitions = get_param("mission.time.n_transitions")
     reference_energy_j = get_param("mission.transition.reference_energy_j")
     ref_mtow_kg = get_param("mission.transition.reference_mtow_kg")
@@ -54,18 +71,25 @@ def transition_energy_wh(mtow_kg: float) -> float:
     return total_transition_j / 3600.0
 
 
-def constraint_values(wing_loading: float) -> Dict[str, float]:
+def constraint_values(wing_loading: float, mtow_kg: float | None = None) -> Dict[str, float]:
     rho = get_density()
     mission = get_mission_params()
-    aero = get_aerodynamic_params()
+    # CD0 at the current MTOW and W/S (drag buildup, if enabled)
+    aero = get_aerodynamic_params(mtow_kg, wing_loading)
 
     cl = cruise_lift_coefficient(wing_loading, rho, mission["v_cruise"])
-    ld_pure = lift_to_drag(cl)
+    ld_pure = lift_to_drag(cl, aero["cd0"])
     ld_penalty = get_param("aerodynamic.quadplane.ld_penalty_factor")
     ld_qp = ld_pure * ld_penalty
-    pw_cruise = cruise_power_loading(mission["v_cruise"], ld_qp)
+    # Efficiencies and disk loading at the current MTOW (BEMT design point)
+    prop = get_propulsion_efficiencies(mtow_kg)
+    pw_cruise = cruise_power_loading(
+        mission["v_cruise"], ld_qp, prop["eta_prop"], prop["eta_motor"], prop["eta_esc"]
+    )
 
-    pw_hover = hover_power_loading()
+    pw_hover = hover_power_loading(
+        get_disk_loading(mtow_kg), rho, prop["figure_of_merit"], prop["eta_motor"], prop["eta_esc"]
+    )
 
     v_min = mission["v_stall"] * get_param("mission.velocity.v_min_factor")
     ws_stall = stall_wing_loading_limit(rho, v_min, aero["cl_max"])
@@ -79,8 +103,15 @@ def constraint_values(wing_loading: float) -> Dict[str, float]:
     }
 
 
-def power_loading_target(wing_loading: float, constraint_mode: str, eps: float) -> float:
-    values = constraint_values(wing_loading)
+def power_loading_target(
+    wing_loading: float,
+    constraint_mode: str,
+    eps: float,
+    mtow_kg: float | None = None,
+    values: Dict[str, float] | None = None,
+) -> float:
+    if values is None:
+        values = constraint_values(wing_loading, mtow_kg)
     pw_hover = values["pw_hover"]
     pw_cruise = values["pw_cruise"]
 
@@ -111,7 +142,7 @@ def build_initial_guess() -> List[float]:
         options = get_solver_options()
         mode = options.get("power_constraint", "smooth_max")
         eps = float(options.get("smooth_max_epsilon", 1.0e-3))
-        power_loading = power_loading_target(wing_loading, mode, eps)
+        power_loading = power_loading_target(wing_loading, mode, eps, mtow_kg)
 
     if "battery_mass_kg" in guess:
         battery_mass = float(guess["battery_mass_kg"])
@@ -125,30 +156,49 @@ def build_initial_guess() -> List[float]:
 def residuals(x: List[float]) -> List[float]:
     mtow_kg, wing_loading, power_loading, battery_mass = x
 
+    if instrumentation.ACTIVE:
+        instrumentation.increment("coupled_solver.residual_evaluations")
+
     if mtow_kg <= 0 or wing_loading <= 0 or power_loading <= 0 or battery_mass <= 0:
         return [1.0e6, 1.0e6, 1.0e6, 1.0e6]
 
     g_mars = get_mars_gravity()
     weight_n = mtow_kg * g_mars
 
-    # Mass balance
-    payload_kg = get_param("mission.mass.payload_kg")
-    f_empty = get_param("mission.mass_fractions.f_empty")
-    f_prop = get_param("mission.mass_fractions.f_propulsion")
-    f_av = get_param("mission.mass_fractions.f_avionics")
-    eq_mass = mtow_kg * (1.0 - f_empty - f_prop - f_av) - payload_kg - battery_mass
-
     # Stall constraint (active)
-    values = constraint_values(wing_loading)
+    values = constraint_values(wing_loading, mtow_kg)
     eq_stall = wing_loading - values["ws_stall"]
 
     # Power constraint (active selector)
     options = get_solver_options()
     mode = options.get("power_constraint", "smooth_max")
     eps = float(options.get("smooth_max_epsilon", 1.0e-3))
-    pw_target = power_loading_target(wing_loading, mode, eps)
+    pw_target = power_loading_target(wing_loading, mode, eps, mtow_kg, values)
     eq_power = power_loading - pw_target
 
+    payload_kg = get_param("mission.mass.payload_kg")
+    if get_param("mission.mass_estimation.use_in_sizing", False):
+        # Mass and energy balance from the component-based closure model
+        # (mars_uav_sizing.section7.mass_closure), so both packages close on
+        # the same MTOW
+        params = closure_parameters()
+        params["wing_loading"] = wing_loading
+        if get_param("mission.transition.simulation.use_in_sizing", False):
+            params["transition_wh_per_kg"] = transition_energy_wh(mtow_kg, wing_loading) / mtow_kg
+        structure = structure_masses(mtow_kg, params)["total_kg"]
+        propulsion = propulsion_masses(mtow_kg, params)["total_kg"]
+        eq_mass = float(
+            mtow_kg - structure - propulsion - params["avionics_kg"] - payload_kg - battery_mass
+        )
+        eq_energy = float(battery_mass - battery_masses(mtow_kg, params)["total_kg"])
+        return [eq_mass, eq_stall, eq_power, eq_energy]
+
+    # Mass balance
+    f_empty = get_param("mission.mass_fractions.f_empty")
+    f_prop = get_param("mission.mass_fractions.f_propulsion")
+    f_av = get_param("mission.mass_fractions.f_avionics")
+    eq_mass = mtow_kg * (1.0 - f_empty - f_prop - f_av) - payload_kg - battery_mass
+
     # Energy balance
     batt = get_battery_params()
     mission = get_mission_params()
@@ -171,7 +221,7 @@ def residuals(x: List[float]) -> List[float]:
 
     e_hover_wh = p_hover_w * (t_hover_s / 3600.0)
     e_cruise_wh = p_cruise_w * (t_cruise_min / 60.0)
-    e_transition_wh = transition_energy_wh(mtow_kg)
+    e_transition_wh = transition_energy_wh(mtow_kg, wing_loading)
 
     mission_energy_wh = e_hover_wh + e_transition_wh + e_cruise_wh
     eq_energy = energy_available_wh - mission_energy_wh
@@ -179,7 +229,38 @@ def residuals(x: List[float]) -> List[float]:
     return [eq_mass, eq_stall, eq_power, eq_energy]
 
 
-def solve_coupled_design(initial_guess: List[float] | None = None) -> Dict[str, Any]:
+@instrumentation.traced()
+def solve_coupled_design(
+    initial_guess: List[float] | None = None,
+    use_cache: bool | None = None,
+    refresh: bool = False,
+) -> Dict[str, Any]:
+    """
+    Solve the coupled sizing problem, reusing persisted results.
+
+    Results are looked up in the persistent solution cache by the hash of
+    the active configuration, the initial guess and the package sources
+    (solution_cache.py); use_cache overrides solver.cache.enabled, refresh
+    re-solves and overwrites the cached entry. Fresh and cached results
+    have the same (JSON) types.
+    """
+    if use_cache is None:
+        use_cache = solution_cache.settings()["enabled"]
+    if not use_cache:
+        return solution_cache.normalize(_solve(initial_guess))
+
+    key = solution_cache.solution_key(initial_guess)
+    result = None if refresh else solution_cache.get(key)
+    if result is not None:
+        if instrumentation.ACTIVE:
+            instrumentation.increment("coupled_solver.cache_hits")
+        return result
+    result = solution_cache.normalize(_solve(initial_guess))
+    solution_cache.put(key, result)
+    return result
+
+
+def _solve(initial_guess: List[float] | None = None) -> Dict[str, Any]:
     options = get_solver_options()
     max_iter = int(options.get("max_iter", 500))
     tol = float(options.get("tol", 1.0e-9))
@@ -194,9 +275,15 @@ def solve_coupled_design(initial_guess: List[float] | None = None) -> Dict[str,
         full_output=True,
     )
 
+    if instrumentation.ACTIVE:
+        instrumentation.record_counter(
+            "coupled_solver",
+            {"solves": 1, "nfev": info.get("nfev", 0), "converged": int(ier == 1)},
+        )
+
     mtow_kg, wing_loading, power_loading, battery_mass = solution
 
-    values = constraint_values(wing_loading)
+    values = constraint_values(wing_loading, mtow_kg)
     g_mars = get_mars_gravity()
     weight_n = mtow_kg * g_mars
 
@@ -219,7 +306,7 @@ def solve_coupled_design(initial_guess: List[float] | None = None) -> Dict[str,
 
     e_hover_wh = pw_hover * weight_n * (t_hover_s / 3600.0)
     e_cruise_wh = pw_cruise * weight_n * (t_cruise_min / 60.0)
-    e_transition_wh = transition_energy_wh(mtow_kg)
+    e_transition_wh = transition_energy_wh(mtow_kg, wing_loading)
     mission_energy_wh = e_hover_wh + e_transition_wh + e_cruise_wh
 
     f_payload = get_param("mission.mass.payload_kg") / mtow_kg if mtow_kg > 0 else 0.0
@@ -245,6 +332,8 @@ def solve_coupled_design(initial_guess: List[float] | None = None) -> Dict[str,
             "ws_stall": values["ws_stall"],
             "ld_qp": values["ld_qp"],
             "cl_cruise": values["cl_cruise"],
+            "ws_gust": float(gust_wing_loading_limit(mtow_kg)),
+            "n_critical": float(critical_load_factor(wing_loading, mtow_kg)["n_critical"]),
         },
         "energy": {
             "battery_energy_wh": battery_energy_wh,
@@ -257,11 +346,21 @@ def solve_coupled_design(initial_guess: List[float] | None = None) -> Dict[str,
     }
 
 
-_solution_cache: Dict[str, Any] | None = None
+# Solutions keyed by the scenario hash of the configuration they were solved
+# for, so threads and tasks evaluating different parameter contexts never
+# see each other's solution
+_solution_cache: Dict[str, Dict[str, Any]] = {}
+_SOLUTION_CACHE_SIZE = 256
 
 
 def get_coupled_solution(reload: bool = False) -> Dict[str, Any]:
-    global _solution_cache
-    if _solution_cache is None or reload:
-        _solution_cache = solve_coupled_design()
-    return _solution_cache
+    key = scenario_hash()
+    solution = None if reload else _solution_cache.get(key)
+    if solution is None:
+        # reload also bypasses (and overwrites) the persistent cache
+        solution = solve_coupled_design(refresh=reload)
+        if len(_solution_cache) >= _SOLUTION_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            _solution_cache.pop(next(iter(_solution_cache)), None)
+        _solution_cache[key] = solution
+    return solution
@@ -19,6 +19,7 @@ from ..config import (
     get_aerodynamic_params,
     get_param,
 )
+from mars_uav_sizing.instrumentation import traced
 
 from .coupled_solver import get_coupled_solution
 
@@ -41,6 +42,7 @@ from mars_uav_sizing.section5.fixed_wing import (
 # FEASIBILITY ANALYSIS (Section 5.2)
 # =============================================================================
 
+@traced("fixed_wing")
 def fixed_wing_feasibility_analysis() -> Dict[str, Any]:
     """
     Complete fixed-wing feasibility analysis with coupled sizing inputs.
@@ -50,10 +52,10 @@ def fixed_wing_feasibility_analysis() -> Dict[str, Any]:
 
     g_mars = get_mars_gravity()
     rho = get_density()
-    prop = get_propulsion_efficiencies()
+    prop = get_propulsion_efficiencies(solution["mtow_kg"])
     batt = get_battery_params()
     mission = get_mission_params()
-    aero = get_aerodynamic_params()
+    aero = get_aerodynamic_params(solution["mtow_kg"], solution["wing_loading_n_m2"])
     endurance_req = get_param("mission.requirements.endurance_min")
 
     mtow_kg = solution["mtow_kg"]
@@ -63,7 +65,7 @@ def fixed_wing_feasibility_analysis() -> Dict[str, Any]:
     v_cruise = mission["v_cruise"]
 
     # Aerodynamic calculations
-    ld_max, cl_opt = maximum_ld()
+    ld_max, cl_opt = maximum_ld(aero["cd0"])
     k = induced_drag_factor()
 
     # Wing loading at stall limit
@@ -72,7 +74,7 @@ def fixed_wing_feasibility_analysis() -> Dict[str, Any]:
 
     # C_L at cruise
     cl_cruise = cruise_lift_coefficient(ws_max, rho, v_cruise)
-    ld_cruise = lift_to_drag(cl_cruise)
+    ld_cruise = lift_to_drag(cl_cruise, aero["cd0"])
 
     # Cruise power
     eta_cruise = prop["eta_prop"] * prop["eta_motor"] * prop["eta_esc"]
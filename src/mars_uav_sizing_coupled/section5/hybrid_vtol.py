@@ -13,16 +13,19 @@ from ..config import (
     get_mars_gravity,
     get_density,
     get_propulsion_efficiencies,
+    get_disk_loading,
     get_battery_params,
     get_mission_params,
     get_aerodynamic_params,
     get_param,
 )
+from mars_uav_sizing.instrumentation import traced
 
 from .coupled_solver import get_coupled_solution
 
 from mars_uav_sizing.section5.rotorcraft import electric_hover_power, induced_velocity_from_disk_loading
 from mars_uav_sizing.section5.fixed_wing import maximum_ld, cruise_power
+from mars_uav_sizing.section5.transition import transition_performance
 
 
 def _get_coupled_state() -> Dict[str, Any]:
@@ -36,6 +39,7 @@ def _get_coupled_state() -> Dict[str, Any]:
         "mtow_kg": mtow_kg,
         "battery_mass_kg": battery_mass_kg,
         "weight_n": weight_n,
+        "cd0": get_aerodynamic_params(mtow_kg, solution["wing_loading_n_m2"])["cd0"],
     }
 
 
@@ -44,7 +48,7 @@ def _get_coupled_state() -> Dict[str, Any]:
 # =============================================================================
 
 def get_quadplane_ld() -> float:
-    ld_max, _ = maximum_ld()
+    ld_max, _ = maximum_ld(_get_coupled_state()["cd0"])
     penalty = get_param("aerodynamic.quadplane.ld_penalty_factor")
     return ld_max * penalty
 
@@ -57,8 +61,8 @@ def quadplane_hover_power() -> float:
     state = _get_coupled_state()
     weight_n = state["weight_n"]
     rho = get_density()
-    prop = get_propulsion_efficiencies()
-    disk_loading = get_param("geometry.rotor.disk_loading_N_m2")
+    prop = get_propulsion_efficiencies(state["mtow_kg"])
+    disk_loading = get_disk_loading(state["mtow_kg"])
     disk_area_m2 = weight_n / disk_loading
 
     return electric_hover_power(
@@ -106,16 +110,27 @@ def transition_energy_estimate() -> Dict[str, float]:
     mars_scaling = get_param("mission.transition.mars_scaling_factor")
 
     ref_mtow_kg = get_param("mission.transition.reference_mtow_kg")
-    actual_mtow_kg = _get_coupled_state()["mtow_kg"]
-
-    if ref_mtow_kg <= 0:
-        mass_ratio = 0.0
+    state = _get_coupled_state()
+    actual_mtow_kg = state["mtow_kg"]
+
+    simulated = {}
+    if get_param("mission.transition.simulation.use_in_sizing", False):
+        # Point-mass simulation at the coupled MTOW and W/S
+        perf = transition_performance(
+            actual_mtow_kg, state["solver"]["solution"]["wing_loading_n_m2"]
+        )
+        total_transition_j = perf["total_energy_j"]
+        scaled_energy_j = total_transition_j / n_transitions
+        simulated = {"peak_power_w": perf["peak_power_w"], "duration_s": perf["duration_s"]}
     else:
-        mass_ratio = actual_mtow_kg / ref_mtow_kg
+        if ref_mtow_kg <= 0:
+            mass_ratio = 0.0
+        else:
+            mass_ratio = actual_mtow_kg / ref_mtow_kg
 
-    scaled_energy_j = reference_energy_j * mass_ratio * mars_scaling
+        scaled_energy_j = reference_energy_j * mass_ratio * mars_scaling
 
-    total_transition_j = scaled_energy_j * n_transitions
+        total_transition_j = scaled_energy_j * n_transitions
     total_transition_wh = total_transition_j / 3600.0
 
     per_transition_j = scaled_energy_j
@@ -123,12 +138,14 @@ def transition_energy_estimate() -> Dict[str, float]:
 
     return {
         "n_transitions": n_transitions,
+        "method": "simulation" if simulated else "linear_scaling",
         "reference_energy_j": reference_energy_j,
         "mars_scaling_factor": mars_scaling,
         "per_transition_j": per_transition_j,
         "per_transition_wh": per_transition_wh,
         "total_transition_j": total_transition_j,
         "total_transition_wh": total_transition_wh,
+        **simulated,
     }
 
 
@@ -157,6 +174,7 @@ def transition_energy_impact(hover_energy_wh: float, mission_energy_wh: float) -
 # ENERGY BUDGET (Section 5.3.3)
 # =============================================================================
 
+@traced()
 def energy_budget() -> Dict[str, float]:
     e_hover = quadplane_hover_energy()
     e_cruise = quadplane_cruise_energy()
@@ -212,17 +230,18 @@ def energy_margin() -> Dict[str, float]:
 # FEASIBILITY ANALYSIS (Section 5.3.4)
 # =============================================================================
 
+@traced("hybrid_vtol")
 def hybrid_vtol_feasibility_analysis() -> Dict[str, Any]:
     state = _get_coupled_state()
     solver = state["solver"]
 
     g_mars = get_mars_gravity()
     rho = get_density()
-    prop = get_propulsion_efficiencies()
+    prop = get_propulsion_efficiencies(state["mtow_kg"])
     batt = get_battery_params()
     mission = get_mission_params()
     endurance_req = get_param("mission.requirements.endurance_min")
-    disk_loading = get_param("geometry.rotor.disk_loading_N_m2")
+    disk_loading = get_disk_loading(state["mtow_kg"])
     ld_penalty = get_param("aerodynamic.quadplane.ld_penalty_factor")
 
     mtow_kg = state["mtow_kg"]
@@ -234,7 +253,7 @@ def hybrid_vtol_feasibility_analysis() -> Dict[str, Any]:
     t_hover_s = mission["t_hover_s"]
     t_cruise_min = mission["t_cruise_min"]
 
-    ld_max, _ = maximum_ld()
+    ld_max, _ = maximum_ld(state["cd0"])
     ld_quadplane = ld_max * ld_penalty
 
     p_hover = quadplane_hover_power()
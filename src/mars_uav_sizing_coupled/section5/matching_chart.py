@@ -20,10 +20,13 @@ from ..config import (
     get_density,
     get_mtow,
     get_propulsion_efficiencies,
+    get_disk_loading,
     get_aerodynamic_params,
     get_mission_params,
     get_param,
 )
+from mars_uav_sizing.instrumentation import traced
+from mars_uav_sizing.section5.flight_envelope import critical_load_factor, gust_wing_loading_limit
 
 from .rotorcraft import hover_power_loading, induced_velocity_from_disk_loading
 from .fixed_wing import (
@@ -35,8 +38,8 @@ from .fixed_wing import (
 )
 
 
-def hover_constraint() -> float:
-    return hover_power_loading()
+def hover_constraint(mtow_kg: float | None = None) -> float:
+    return hover_power_loading(mtow_kg=mtow_kg)
 
 
 def stall_constraint() -> float:
@@ -48,20 +51,24 @@ def stall_constraint() -> float:
     return stall_wing_loading_limit(rho, v_min, cl_max)
 
 
-def cruise_constraint(wing_loading: float) -> float:
+def gust_constraint(mtow_kg: float | None = None) -> float:
+    return float(gust_wing_loading_limit(mtow_kg))
+
+
+def cruise_constraint(wing_loading: float, mtow_kg: float | None = None) -> float:
     rho = get_density()
     v_cruise = get_mission_params()["v_cruise"]
 
     cl = cruise_lift_coefficient(wing_loading, rho, v_cruise)
     ld_penalty = get_param("aerodynamic.quadplane.ld_penalty_factor")
-    ld_pure = lift_to_drag(cl)
+    ld_pure = lift_to_drag(cl, get_aerodynamic_params(mtow_kg, wing_loading)["cd0"])
     ld = ld_pure * ld_penalty
 
     return cruise_power_loading(v_cruise, ld)
 
 
-def cruise_constraint_curve(ws_range: np.ndarray) -> np.ndarray:
-    return np.array([cruise_constraint(ws) for ws in ws_range])
+def cruise_constraint_curve(ws_range: np.ndarray, mtow_kg: float | None = None) -> np.ndarray:
+    return np.array([cruise_constraint(ws, mtow_kg) for ws in ws_range])
 
 
 def find_design_point(use_coupled_solver: bool = True) -> Dict[str, Any]:
@@ -74,8 +81,9 @@ def find_design_point(use_coupled_solver: bool = True) -> Dict[str, Any]:
         power_loading = sol["power_loading_w_n"]
 
         pw_hover = hover_constraint()
-        pw_cruise = cruise_constraint(wing_loading)
+        pw_cruise = cruise_constraint(wing_loading, sol["mtow_kg"])
         active_constraint = "hover" if pw_hover >= pw_cruise else "cruise"
+        ws_gust = solver["constraints"]["ws_gust"]
 
         return {
             "wing_loading": wing_loading,
@@ -83,6 +91,9 @@ def find_design_point(use_coupled_solver: bool = True) -> Dict[str, Any]:
             "hover_pw": pw_hover,
             "cruise_pw_at_stall": pw_cruise,
             "stall_ws": stall_constraint(),
+            "gust_ws": ws_gust,
+            "gust_feasible": wing_loading >= ws_gust,
+            "n_critical": solver["constraints"]["n_critical"],
             "active_constraint": active_constraint,
             "solver": solver,
         }
@@ -94,6 +105,7 @@ def find_design_point(use_coupled_solver: bool = True) -> Dict[str, Any]:
     ws_design = ws_stall
     pw_design = max(pw_hover, pw_cruise_at_stall)
     active_constraint = "hover" if pw_hover > pw_cruise_at_stall else "cruise"
+    ws_gust = gust_constraint()
 
     return {
         "wing_loading": ws_design,
@@ -101,6 +113,9 @@ def find_design_point(use_coupled_solver: bool = True) -> Dict[str, Any]:
         "hover_pw": pw_hover,
         "cruise_pw_at_stall": pw_cruise_at_stall,
         "stall_ws": ws_stall,
+        "gust_ws": ws_gust,
+        "gust_feasible": ws_design >= ws_gust,
+        "n_critical": float(critical_load_factor(ws_design)["n_critical"]),
         "active_constraint": active_constraint,
         "solver": None,
     }
@@ -128,7 +143,7 @@ def derive_geometry(design_point: Dict[str, Any] | None = None) -> Dict[str, flo
 
     installed_power = pw * weight_n
 
-    disk_loading = get_param("geometry.rotor.disk_loading_N_m2")
+    disk_loading = get_disk_loading(mtow_kg)
     disk_area = weight_n / disk_loading
 
     return {
@@ -140,28 +155,29 @@ def derive_geometry(design_point: Dict[str, Any] | None = None) -> Dict[str, flo
     }
 
 
+@traced("matching_chart")
 def matching_chart_analysis(use_coupled_solver: bool = True) -> Dict[str, Any]:
     g_mars = get_mars_gravity()
     rho = get_density()
     mtow_kg = get_mtow()
-    prop = get_propulsion_efficiencies()
     aero = get_aerodynamic_params()
     mission = get_mission_params()
-    disk_loading = get_param("geometry.rotor.disk_loading_N_m2")
-
-    pw_hover = hover_constraint()
-    ws_stall = stall_constraint()
 
     design_point = find_design_point(use_coupled_solver=use_coupled_solver)
     solver = design_point.get("solver")
     if solver and "solution" in solver:
         mtow_kg = solver["solution"]["mtow_kg"]
 
+    prop = get_propulsion_efficiencies(mtow_kg)
+    disk_loading = get_disk_loading(mtow_kg)
+    pw_hover = hover_constraint(mtow_kg)
+    ws_stall = stall_constraint()
+
     weight_n = mtow_kg * g_mars
 
     geometry = derive_geometry(design_point)
 
-    ld_max, _ = maximum_ld()
+    ld_max, _ = maximum_ld(get_aerodynamic_params(mtow_kg, design_point["wing_loading"])["cd0"])
     ld_penalty = get_param("aerodynamic.quadplane.ld_penalty_factor")
     ld_quadplane = ld_max * ld_penalty
 
@@ -171,7 +187,7 @@ def matching_chart_analysis(use_coupled_solver: bool = True) -> Dict[str, Any]:
     eta_cruise = prop["eta_prop"] * prop["eta_motor"] * prop["eta_esc"]
 
     ws_range = np.linspace(2.0, 15.0, 50)
-    pw_cruise_curve = cruise_constraint_curve(ws_range)
+    pw_cruise_curve = cruise_constraint_curve(ws_range, mtow_kg)
     pw_hover_line = np.full_like(ws_range, pw_hover)
 
     return {
@@ -188,6 +204,7 @@ def matching_chart_analysis(use_coupled_solver: bool = True) -> Dict[str, Any]:
         "cl_max": aero["cl_max"],
         "hover_pw": pw_hover,
         "stall_ws": ws_stall,
+        "gust_ws": design_point["gust_ws"],
         "induced_velocity_m_s": v_i,
         "design_point": design_point,
         "geometry": geometry,
@@ -226,6 +243,7 @@ def print_analysis(results: Dict[str, Any] | None = None, use_coupled_solver: bo
     print("-" * 50)
     print(f"  Hover P/W:          {results['hover_pw']:.2f} W/N (horizontal line)")
     print(f"  Stall W/S limit:    {results['stall_ws']:.2f} N/m^2 (vertical line)")
+    print(f"  Gust W/S minimum:   {results['gust_ws']:.2f} N/m^2 (vertical line, n <= n_limit)")
     print()
 
     print("DESIGN POINT")
@@ -233,6 +251,8 @@ def print_analysis(results: Dict[str, Any] | None = None, use_coupled_solver: bo
     print(f"  Wing loading:       {dp['wing_loading']:.2f} N/m^2")
     print(f"  Power loading:      {dp['power_loading']:.2f} W/N")
     print(f"  Active constraint:  {dp['active_constraint'].upper()}")
+    gust_note = "" if dp["gust_feasible"] else " (GUST above n_limit)"
+    print(f"  Critical limit n:   {dp['n_critical']:.2f}{gust_note}")
     print()
 
     solver = dp.get("solver")
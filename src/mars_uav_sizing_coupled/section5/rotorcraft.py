@@ -14,11 +14,13 @@ from ..config import (
     get_mars_gravity,
     get_density,
     get_propulsion_efficiencies,
+    get_disk_loading,
     get_battery_params,
     get_mission_params,
     get_aerodynamic_params,
     get_param,
 )
+from mars_uav_sizing.instrumentation import traced
 
 from .coupled_solver import get_coupled_solution
 
@@ -39,6 +41,7 @@ from mars_uav_sizing.section5.rotorcraft import (
 # FEASIBILITY ANALYSIS (Section 5.1)
 # =============================================================================
 
+@traced("rotorcraft")
 def rotorcraft_feasibility_analysis() -> Dict[str, Any]:
     """
     Complete rotorcraft feasibility analysis with coupled sizing inputs.
@@ -48,14 +51,14 @@ def rotorcraft_feasibility_analysis() -> Dict[str, Any]:
 
     g_mars = get_mars_gravity()
     rho = get_density()
-    prop = get_propulsion_efficiencies()
+    mtow_kg = solution["mtow_kg"]
+    prop = get_propulsion_efficiencies(mtow_kg)
     batt = get_battery_params()
     mission = get_mission_params()
     aero = get_aerodynamic_params()
-    disk_loading = get_param("geometry.rotor.disk_loading_N_m2")
+    disk_loading = get_disk_loading(mtow_kg)
     endurance_req = get_param("mission.requirements.endurance_min")
 
-    mtow_kg = solution["mtow_kg"]
     battery_mass_kg = solution["battery_mass_kg"]
 
     weight_n = mtow_kg * g_mars
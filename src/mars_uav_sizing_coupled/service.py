@@ -0,0 +1,409 @@
+﻿"""
+Local Design-Evaluation Service
+===============================
+
+Long-lived asyncio HTTP/JSON server for design tools that would otherwise
+shell out to run_analysis and parse its text output. Standard library only.
+
+Endpoints:
+    POST /evaluate   {"overrides": {dot.path: value}, "scenario": [names]}
+                     or a JSON list of such objects
+                     -> feasibility, energy budget and coupled solution
+    GET  /health     -> status and baseline configuration hash
+    GET  /stats      -> request/batch counters and latency percentiles
+
+Concurrent requests are queued and gathered into micro-batches (up to
+max_batch requests or max_wait_ms after the first one). Each batch is
+de-duplicated and split across the worker pool, where every request is
+evaluated in its own parameter context (mars_uav_sizing.config.parameters).
+Configuration, airfoil data and the baseline solution are loaded once per
+worker at startup.
+
+Usage:
+    python -m mars_uav_sizing_coupled.service --port 8765 --workers 4
+
+    curl -s localhost:8765/evaluate \\
+        -d '{"overrides": {"battery.specifications.specific_energy_Wh_kg": 300}}'
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .config import load_config, load_scenario, parameters, scenario_hash
+from .section5.hybrid_vtol import hybrid_vtol_feasibility_analysis
+
+# Energy-budget entries of the §5.3 analysis returned to clients
+ENERGY_KEYS: Tuple[str, ...] = (
+    "hover_energy_wh", "transition_energy_wh", "cruise_energy_wh",
+    "mission_energy_wh", "reserve_energy_wh", "required_energy_wh",
+    "total_energy_wh", "usable_energy_wh", "margin_wh", "margin_percent",
+)
+
+MAX_BODY_BYTES = 4 * 1024 * 1024
+
+
+# =============================================================================
+# EVALUATION (runs in the worker pool)
+# =============================================================================
+
+def _jsonable(value: Any) -> Any:
+    """Convert numpy values and non-finite floats (-> null) for JSON."""
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def evaluate_design(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Evaluate one design request in its own parameter context.
+
+    Parameters
+    ----------
+    request : dict
+        'overrides' (dot-path -> value) and optional 'scenario' (list of
+        scenario file names, stacked in order)
+
+    Returns
+    -------
+    dict
+        'feasible', 'converged', 'solution', 'constraints', 'energy' (§5.3
+        budget), 'endurance_min' and 'scenario_hash'; or 'error'
+    """
+    try:
+        scenario = load_scenario(*request.get("scenario", []) or [])
+        with parameters(request.get("overrides") or {}, scenario=scenario) as active:
+            try:
+                hybrid = hybrid_vtol_feasibility_analysis()
+            except (ValueError, ZeroDivisionError, OverflowError) as exc:
+                return {"error": f"evaluation failed: {exc}", "converged": False,
+                        "scenario_hash": active.hash}
+            solver = hybrid["solver"]
+            return _jsonable({
+                "feasible": hybrid["feasible"] and solver["converged"],
+                "converged": solver["converged"],
+                "solution": solver["solution"],
+                "constraints": solver["constraints"],
+                "energy": {key: hybrid[key] for key in ENERGY_KEYS},
+                "endurance_min": hybrid["endurance_min"],
+                "range_km": hybrid["range_km"],
+                "scenario_hash": active.hash,
+            })
+    except (KeyError, FileNotFoundError, TypeError, ValueError) as exc:
+        return {"error": str(exc).strip("'\"")}
+
+
+def evaluate_many(requests: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Evaluate a chunk of requests (one pool task)."""
+    return [evaluate_design(request) for request in requests]
+
+
+def warm_up() -> None:
+    """Load configuration, airfoil data and the baseline solution once."""
+    load_config()
+    from mars_uav_sizing.section6.bemt import _airfoil_polars
+    _airfoil_polars()
+    evaluate_design({})
+
+
+# =============================================================================
+# MICRO-BATCHING
+# =============================================================================
+
+class MicroBatcher:
+    """
+    Gather concurrent requests into batches evaluated on a worker pool.
+
+    Parameters
+    ----------
+    executor : Executor
+        Pool running evaluate_many
+    n_workers : int
+        Pool size (chunks per batch and concurrently running batches)
+    max_batch : int
+        Maximum requests per batch
+    max_wait_ms : float
+        Longest wait for more requests after the first one of a batch
+    """
+
+    def __init__(self, executor: Executor, n_workers: int, max_batch: int = 64,
+                 max_wait_ms: float = 2.0):
+        self.executor = executor
+        self.n_workers = n_workers
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.slots = asyncio.Semaphore(n_workers)
+        self.batches = 0
+        self.batched_requests = 0
+        self.unique_requests = 0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    async def submit(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((request, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self.slots.acquire()
+            loop.create_task(self._dispatch(batch))
+
+    async def _dispatch(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            # Identical requests in a batch are evaluated once
+            groups: Dict[str, List[asyncio.Future]] = {}
+            requests: Dict[str, Dict[str, Any]] = {}
+            for request, future in batch:
+                key = json.dumps(request, sort_keys=True, default=str)
+                groups.setdefault(key, []).append(future)
+                requests[key] = request
+            keys = list(requests)
+            self.batches += 1
+            self.batched_requests += len(batch)
+            self.unique_requests += len(keys)
+
+            n_chunks = min(self.n_workers, len(keys))
+            chunks = [keys[i::n_chunks] for i in range(n_chunks)]
+            parts = await asyncio.gather(*[
+                loop.run_in_executor(self.executor, evaluate_many, [requests[k] for k in chunk])
+                for chunk in chunks
+            ], return_exceptions=True)
+
+            for chunk, part in zip(chunks, parts):
+                for i, key in enumerate(chunk):
+                    result = ({"error": f"worker failed: {part!r}"}
+                              if isinstance(part, BaseException) else part[i])
+                    for future in groups[key]:
+                        if not future.done():
+                            future.set_result(result)
+        finally:
+            self.slots.release()
+
+
+# =============================================================================
+# HTTP SERVER
+# =============================================================================
+
+class DesignService:
+    """
+    Minimal HTTP/1.1 (keep-alive) JSON server around a MicroBatcher.
+
+    Parameters
+    ----------
+    host, port : str, int
+        Listening address (local by default)
+    n_workers : int
+        Worker processes (1 = one in-process worker thread)
+    max_batch, max_wait_ms : int, float
+        Micro-batching limits (see MicroBatcher)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, n_workers: int = 1,
+                 max_batch: int = 64, max_wait_ms: float = 2.0):
+        self.host = host
+        self.port = port
+        self.n_workers = max(1, n_workers)
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self.latencies: deque = deque(maxlen=10000)
+        self.requests = 0
+        self.started = time.time()
+        self.executor: Executor | None = None
+        self.batcher: MicroBatcher | None = None
+        self.server: asyncio.base_events.Server | None = None
+
+    async def start(self) -> None:
+        warm_up()
+        if self.n_workers == 1:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            self.executor = ProcessPoolExecutor(max_workers=self.n_workers, initializer=warm_up)
+            # Start every worker now rather than on the first requests
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*[loop.run_in_executor(self.executor, evaluate_many, [])
+                                   for _ in range(self.n_workers)])
+        self.batcher = MicroBatcher(self.executor, self.n_workers, self.max_batch, self.max_wait_ms)
+        self.batcher.start()
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.batcher is not None:
+            await self.batcher.stop()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        print(f"Design service on http://{self.host}:{self.port} "
+              f"({self.n_workers} worker(s), batch <= {self.max_batch}, "
+              f"wait <= {self.max_wait_ms:g} ms)")
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        latencies = np.array(self.latencies) if self.latencies else np.zeros(1)
+        b = self.batcher
+        return {
+            "uptime_s": time.time() - self.started,
+            "requests": self.requests,
+            "evaluations": b.batched_requests,
+            "batches": b.batches,
+            "mean_batch_size": b.batched_requests / b.batches if b.batches else 0.0,
+            "unique_per_batch": b.unique_requests / b.batches if b.batches else 0.0,
+            "latency_ms": {
+                "p50": float(np.percentile(latencies, 50)) * 1e3,
+                "p90": float(np.percentile(latencies, 90)) * 1e3,
+                "p99": float(np.percentile(latencies, 99)) * 1e3,
+            },
+            "workers": self.n_workers,
+        }
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        if path == "/health":
+            return HTTPStatus.OK, {"status": "ok", "baseline_hash": scenario_hash()}
+        if path == "/stats":
+            return HTTPStatus.OK, self.stats()
+        if path != "/evaluate":
+            return HTTPStatus.NOT_FOUND, {"error": f"unknown path {path}"}
+        if method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "use POST"}
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError as exc:
+            return HTTPStatus.BAD_REQUEST, {"error": f"invalid JSON: {exc}"}
+
+        items = payload if isinstance(payload, list) else [payload]
+        if not all(isinstance(item, dict) for item in items):
+            return HTTPStatus.BAD_REQUEST, {"error": "expected an object or a list of objects"}
+        results = await asyncio.gather(*[self.batcher.submit(item) for item in items])
+        if isinstance(payload, list):
+            return HTTPStatus.OK, results
+        status = HTTPStatus.UNPROCESSABLE_ENTITY if "error" in results[0] else HTTPStatus.OK
+        return status, results[0]
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                start = time.perf_counter()
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, {"error": "bad request line"}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0) or 0)
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                        {"error": "body too large"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                keep_alive = (headers.get("connection", "").lower() != "close"
+                              and version.upper() == "HTTP/1.1")
+                status, result = await self._route(method.upper(), target.split("?")[0], body)
+                await self._respond(writer, status, result, keep_alive)
+                self.requests += 1
+                self.latencies.append(time.perf_counter() - start)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, result: Any, keep_alive: bool) -> None:
+        body = json.dumps(_jsonable(result), separators=(",", ":")).encode("utf-8")
+        status = HTTPStatus(status)
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        ).encode("latin-1")
+        writer.write(head + body)
+        await writer.drain()
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Mars UAV design-evaluation service (local HTTP/JSON)")
+    parser.add_argument("--host", default="127.0.0.1", help="Listening address")
+    parser.add_argument("--port", type=int, default=8765, help="Listening port (0 = any free port)")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                        help="Worker processes (1 = in-process worker thread)")
+    parser.add_argument("--max-batch", type=int, default=64, help="Maximum requests per micro-batch")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0,
+                        help="Maximum wait for more requests after the first of a batch")
+    args = parser.parse_args()
+
+    service = DesignService(args.host, args.port, args.workers, args.max_batch, args.max_wait_ms)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+﻿"""
+Persistent Solution Cache
+=========================
+
+SQLite store for coupled-solver results, shared by every process that runs
+the coupled package (CLI invocations, report builds, sweep workers). Entries
+map a key built from the scenario hash of the active configuration
+(mars_uav_sizing.config.scenario_hash), the initial guess, CACHE_VERSION and
+the source fingerprint of both packages (run_archive.code_version) to the
+full solve_coupled_design() result, so any code edit invalidates the store.
+
+Results are stored as JSON: numpy scalars come back as Python floats and
+bools. normalize() applies the same round trip to fresh results, so a cache
+hit and a miss return identical types.
+
+Concurrency: the database runs in WAL mode, so readers never block the
+single writer; each process and thread opens its own connection, and writes
+are short INSERT OR REPLACE transactions retried by SQLite's busy timeout.
+
+Eviction: least recently used entries are deleted once the store exceeds
+solver.cache.max_entries or solver.cache.max_mb.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Sequence
+
+import numpy as np
+
+from .config import get_param, scenario_hash
+
+# Default database location (git-ignored)
+CACHE_DIR = Path(__file__).resolve().parent / "cache"
+DEFAULT_PATH = CACHE_DIR / "solutions.sqlite"
+
+# Bump when the stored format changes (code edits are covered by the source
+# fingerprint in the key)
+CACHE_VERSION = 2
+
+# Packages whose sources enter the key
+CODE_PACKAGES = ("mars_uav_sizing", "mars_uav_sizing_coupled")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS solutions (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS solutions_accessed ON solutions (accessed);
+"""
+
+# One connection per (process, thread, database)
+_local = threading.local()
+
+
+# =============================================================================
+# SERIALIZATION
+# =============================================================================
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return {"__ndarray__": value.tolist()}
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+def _decode(node: Dict[str, Any]) -> Any:
+    if "__ndarray__" in node:
+        return np.asarray(node["__ndarray__"], dtype=float)
+    return node
+
+
+def dumps(result: Dict[str, Any]) -> str:
+    return json.dumps(result, default=_encode, separators=(",", ":"))
+
+
+def loads(text: str) -> Dict[str, Any]:
+    return json.loads(text, object_hook=_decode)
+
+
+def normalize(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Result with the types a cache hit returns (JSON round trip)."""
+    try:
+        return loads(dumps(result))
+    except (TypeError, ValueError):
+        return result
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+def settings() -> Dict[str, Any]:
+    """Cache settings from solver.cache (defaults: enabled, 20000 entries, 256 MB)."""
+    options = get_param("solver.cache", default={}) or {}
+    path = options.get("path")
+    return {
+        "enabled": bool(options.get("enabled", True)),
+        "path": Path(path) if path else DEFAULT_PATH,
+        "max_entries": int(options.get("max_entries", 20000)),
+        "max_bytes": int(float(options.get("max_mb", 256)) * 1024 * 1024),
+    }
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    connections = getattr(_local, "connections", None)
+    if connections is None or _local.pid != os.getpid():
+        # Never reuse a connection inherited across fork
+        connections = _local.connections = {}
+        _local.pid = os.getpid()
+    connection = connections.get(path)
+    if connection is None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(path), timeout=30.0, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(_SCHEMA)
+        connections[path] = connection
+    return connection
+
+
+def solution_key(initial_guess: Sequence[float] | None = None) -> str:
+    """Cache key of the current configuration and initial guess."""
+    from mars_uav_sizing.run_archive import code_version
+
+    guess = None if initial_guess is None else [float(x) for x in initial_guess]
+    payload = json.dumps([CACHE_VERSION, code_version(CODE_PACKAGES), scenario_hash(), guess])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get(key: str, path: Path | None = None) -> Dict[str, Any] | None:
+    """Cached result for key, or None; refreshes its LRU timestamp."""
+    path = path or settings()["path"]
+    try:
+        connection = _connect(path)
+        row = connection.execute("SELECT value FROM solutions WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        connection.execute("UPDATE solutions SET accessed = ? WHERE key = ?", (time.time(), key))
+        return loads(row[0])
+    except (sqlite3.Error, ValueError):
+        # A locked or corrupt store must never break a solve
+        return None
+
+
+def put(key: str, result: Dict[str, Any], path: Path | None = None) -> bool:
+    """Store result under key and evict LRU entries over the limits."""
+    options = settings()
+    path = path or options["path"]
+    try:
+        value = dumps(result)
+    except TypeError:
+        return False
+    now = time.time()
+    try:
+        connection = _connect(path)
+        connection.execute(
+            "INSERT OR REPLACE INTO solutions (key, value, size, created, accessed) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, value, len(value), now, now),
+        )
+        _evict(connection, options["max_entries"], options["max_bytes"])
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def _evict(connection: sqlite3.Connection, max_entries: int, max_bytes: int) -> None:
+    count, total = connection.execute(
+        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM solutions"
+    ).fetchone()
+    if count <= max_entries and total <= max_bytes:
+        return
+    # Drop the least recently used entries beyond the limits, plus a tenth of
+    # max_entries so that eviction does not run on every insert
+    excess = max(count - max_entries, 0)
+    if total > max_bytes and count:
+        excess = max(excess, int(count * (1.0 - max_bytes / total)) + 1)
+    excess = min(count, excess + max(1, max_entries // 10))
+    connection.execute(
+        "DELETE FROM solutions WHERE key IN "
+        "(SELECT key FROM solutions ORDER BY accessed LIMIT ?)",
+        (excess,),
+    )
+
+
+def clear(path: Path | None = None) -> int:
+    """Delete every cached result; returns the number of entries removed."""
+    path = path or settings()["path"]
+    if not path.exists():
+        return 0
+    connection = _connect(path)
+    return connection.execute("DELETE FROM solutions").rowcount
+
+
+def stats(path: Path | None = None) -> Dict[str, Any]:
+    """Entry count and stored bytes."""
+    path = path or settings()["path"]
+    if not path.exists():
+        return {"path": str(path), "entries": 0, "bytes": 0}
+    count, total = _connect(path).execute(
+        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM solutions"
+    ).fetchone()
+    return {"path": str(path), "entries": count, "bytes": total}
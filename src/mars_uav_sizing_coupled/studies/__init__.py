@@ -0,0 +1,30 @@
+﻿"""
+Design Studies (Coupled)
+========================
+
+Batch studies built on top of the coupled sizing solver.
+
+Modules:
+    - continuation: Pseudo-arclength parameter sweeps with boundary detection
+    - doe: Lazily chunked designs (factorial, Latin hypercube, Sobol/Halton, adaptive)
+    - evaluation: Parameter overrides and (process-parallel) batch evaluation
+    - gradients: Exact parameter gradients (dual numbers, implicit function theorem)
+    - sensitivity: Morris screening and Sobol indices over YAML parameters
+    - surrogate: Trained response surface with trust-region fallback
+"""
+
+from . import continuation
+from . import doe
+from . import evaluation
+from . import gradients
+from . import sensitivity
+from . import surrogate
+
+__all__ = [
+    "continuation",
+    "doe",
+    "evaluation",
+    "gradients",
+    "sensitivity",
+    "surrogate",
+]
@@ -0,0 +1,621 @@
+﻿"""
+Design of Experiments (Coupled)
+===============================
+
+Samplers for the batch studies. Parameter bounds are declared against YAML
+dot-paths, e.g. {"battery.specifications.specific_energy_Wh_kg": (200, 300)}
+(see evaluation.discover_parameters for defaults), and checked against the
+loaded configuration.
+
+Every design is generated lazily: chunks(chunk_size) yields (n, d) arrays
+that depend only on the point indices, never on the chunk size, so designs
+with 10^7 points are streamed through evaluate_batch without materializing.
+
+Designs:
+    - FullFactorial: all level combinations (evenly spaced or explicit values)
+    - LatinHypercube: one point per stratum and dimension; counter-based
+      (Feistel permutation + hashed jitter) so any block is generated on
+      demand; optional maximin optimization (Morris-Mitchell phi_p) for
+      designs up to MAXIMIN_MAX_POINTS
+    - Sobol, Halton: scrambled low-discrepancy sequences (scipy.stats.qmc)
+    - refine / adaptive_sampling: sequential points where the response
+      varies fastest or the model fails, away from existing samples
+
+write_design streams an evaluated design to a columnar sweep directory
+(mars_uav_sizing.visualization.sweep_store) for the binned plots.
+
+Reference:
+    Morris, M.D., Mitchell, T.J. (1995). J. Stat. Plan. Inference 43, 381-402.
+    McKay, M.D. et al. (1979). Technometrics 21(2), 239-245.
+
+Usage:
+    design = LatinHypercube(bounds, 10_000_000, seed=1)
+    for samples, y in evaluate_design(design, chunk_size=65536):
+        ...
+"""
+
+from __future__ import annotations
+
+import math
+import warnings
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+from scipy.stats import qmc
+
+from ..config import get_param
+from .evaluation import DEFAULT_OUTPUTS, evaluate_batch
+
+# Points per chunk when none is given
+DEFAULT_CHUNK_SIZE = 65536
+
+# Largest Latin hypercube optimized for maximin distance (the optimizer keeps
+# the n x n distance matrix in memory)
+MAXIMIN_MAX_POINTS = 2000
+
+_MASK64 = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+# =============================================================================
+# BOUNDS
+# =============================================================================
+
+def unit_bounds(n_dims: int) -> Dict[str, Tuple[float, float]]:
+    """Bounds of the unit hypercube with placeholder names x0, x1, ..."""
+    return {f"x{i}": (0.0, 1.0) for i in range(n_dims)}
+
+
+def check_bounds(
+    bounds: Dict[str, Tuple[float, float]],
+    validate_paths: bool = True,
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Validate parameter bounds declared against YAML dot-paths.
+
+    Parameters
+    ----------
+    bounds : dict
+        Mapping of dot-path -> (lower, upper)
+    validate_paths : bool
+        Require every path to exist in the loaded configuration
+
+    Returns
+    -------
+    dict
+        Bounds as float pairs
+
+    Raises
+    ------
+    KeyError
+        If a path does not exist
+    ValueError
+        If a lower bound exceeds its upper bound or a bound is not finite
+    """
+    checked: Dict[str, Tuple[float, float]] = {}
+    for name, (lo, hi) in bounds.items():
+        lo, hi = float(lo), float(hi)
+        if not (math.isfinite(lo) and math.isfinite(hi)) or lo > hi:
+            raise ValueError(f"Invalid bounds for {name}: ({lo}, {hi})")
+        if validate_paths:
+            get_param(name)
+        checked[name] = (lo, hi)
+    return checked
+
+
+# =============================================================================
+# COUNTER-BASED RANDOMNESS
+# =============================================================================
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer (uint64 arrays; wraps modulo 2^64)."""
+    x = (x + np.uint64(0x9E3779B97F4A7C15)) & _MASK64
+    x = ((x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)) & _MASK64
+    x = ((x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)) & _MASK64
+    return x ^ (x >> np.uint64(31))
+
+
+def _uniform(index: np.ndarray, key: int) -> np.ndarray:
+    """Uniform [0, 1) values as a pure function of (index, key)."""
+    salt = _mix64(np.array([key], dtype=np.uint64))[0]
+    bits = _mix64(index.astype(np.uint64) ^ salt)
+    return (bits >> np.uint64(11)).astype(float) * 2.0 ** -53
+
+
+def _permute(index: np.ndarray, n: int, key: int, rounds: int = 3) -> np.ndarray:
+    """
+    Pseudo-random permutation of range(n) evaluated at index.
+
+    Unbalanced Feistel network over the smallest power of two >= n (each
+    round rewrites one half with a keyed hash of the other), with cycle
+    walking back into range(n).
+    """
+    bits = max(2, (max(n, 2) - 1).bit_length())
+    lo_bits = bits // 2
+    lo_mask = np.uint64((1 << lo_bits) - 1)
+    hi_mask = np.uint64((1 << (bits - lo_bits)) - 1)
+    shift = np.uint64(lo_bits)
+    keys = _mix64(np.arange(rounds, dtype=np.uint64) + np.uint64(key) * np.uint64(rounds))
+    multiplier = np.uint64(0xD6E8FEB86659FD93)
+    out_shift = np.uint64(32)
+
+    def feistel(x: np.ndarray) -> np.ndarray:
+        hi, lo = x >> shift, x & lo_mask
+        for r, k in enumerate(keys):
+            if r % 2 == 0:
+                hi = hi ^ ((((lo ^ k) * multiplier) >> out_shift) & hi_mask)
+            else:
+                lo = lo ^ ((((hi ^ k) * multiplier) >> out_shift) & lo_mask)
+        return (hi << shift) | lo
+
+    out = feistel(index.astype(np.uint64))
+    pending = np.flatnonzero(out >= np.uint64(n))
+    while len(pending):
+        out[pending] = feistel(out[pending])
+        pending = pending[out[pending] >= np.uint64(n)]
+    return out.astype(np.int64)
+
+
+# =============================================================================
+# DESIGNS
+# =============================================================================
+
+class Design:
+    """
+    Lazily generated sample of a parameter box.
+
+    Parameters
+    ----------
+    bounds : dict or int
+        Mapping of YAML dot-path -> (lower, upper), or a number of unit
+        dimensions (see unit_bounds)
+    n_samples : int
+        Number of points
+    validate_paths : bool
+        Check that the dot-paths exist in the configuration
+    """
+
+    def __init__(self, bounds: Dict[str, Tuple[float, float]] | int, n_samples: int,
+                 validate_paths: bool = True):
+        if isinstance(bounds, int):
+            bounds, validate_paths = unit_bounds(bounds), False
+        self.bounds = check_bounds(bounds, validate_paths)
+        self.names: List[str] = list(self.bounds)
+        self.n_samples = int(n_samples)
+        self._lo = np.array([b[0] for b in self.bounds.values()])
+        self._span = np.array([b[1] - b[0] for b in self.bounds.values()])
+
+    @property
+    def n_dims(self) -> int:
+        return len(self.names)
+
+    def __len__(self) -> int:
+        return self.n_samples
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.n_dims} parameters, {self.n_samples} points)"
+
+    def _unit_block(self, start: int, stop: int) -> np.ndarray:
+        raise NotImplementedError
+
+    def _block(self, start: int, stop: int) -> np.ndarray:
+        return self._lo + self._unit_block(start, stop) * self._span
+
+    def _ranges(self, chunk_size: int | None) -> Iterator[Tuple[int, int]]:
+        step = max(1, int(chunk_size or DEFAULT_CHUNK_SIZE))
+        for start in range(0, self.n_samples, step):
+            yield start, min(start + step, self.n_samples)
+
+    def unit_chunks(self, chunk_size: int | None = None) -> Iterator[np.ndarray]:
+        """Yield the design in the unit hypercube, chunk_size points at a time."""
+        for start, stop in self._ranges(chunk_size):
+            yield self._unit_block(start, stop)
+
+    def chunks(self, chunk_size: int | None = None) -> Iterator[np.ndarray]:
+        """Yield the design in parameter units, chunk_size points at a time."""
+        for start, stop in self._ranges(chunk_size):
+            yield self._block(start, stop)
+
+    def unit_sample(self) -> np.ndarray:
+        """Whole design in the unit hypercube, shape (n_samples, n_dims)."""
+        return self._unit_block(0, self.n_samples)
+
+    def sample(self) -> np.ndarray:
+        """Whole design in parameter units, shape (n_samples, n_dims)."""
+        return self._block(0, self.n_samples)
+
+
+class FullFactorial(Design):
+    """
+    Full factorial design.
+
+    Parameters
+    ----------
+    levels : dict
+        Mapping of dot-path -> number of evenly spaced levels between the
+        bounds (int) or explicit level values (sequence)
+    bounds : dict, optional
+        Bounds for the paths given as level counts
+    validate_paths : bool
+        Check that the dot-paths exist in the configuration
+
+    Notes
+    -----
+    The last parameter varies fastest. A single evenly spaced level sits at
+    the middle of the bounds.
+    """
+
+    def __init__(self, levels: Dict[str, int | Sequence[float]],
+                 bounds: Dict[str, Tuple[float, float]] | None = None,
+                 validate_paths: bool = True):
+        bounds = dict(bounds or {})
+        self.levels: List[np.ndarray] = []
+        for name, spec in levels.items():
+            if np.ndim(spec) == 0:
+                if name not in bounds:
+                    raise ValueError(f"Bounds required for {name} ({spec} evenly spaced levels)")
+                lo, hi = bounds[name]
+                count = int(spec)
+                values = np.linspace(lo, hi, count) if count > 1 else np.array([0.5 * (lo + hi)])
+            else:
+                values = np.asarray(spec, dtype=float)
+                bounds.setdefault(name, (float(values.min()), float(values.max())))
+            if len(values) == 0:
+                raise ValueError(f"No levels for {name}")
+            self.levels.append(values)
+        self.shape = tuple(len(values) for values in self.levels)
+        super().__init__({name: bounds[name] for name in levels}, math.prod(self.shape),
+                         validate_paths)
+
+    def _block(self, start: int, stop: int) -> np.ndarray:
+        index = np.unravel_index(np.arange(start, stop), self.shape)
+        return np.column_stack([values[i] for values, i in zip(self.levels, index)])
+
+    def _unit_block(self, start: int, stop: int) -> np.ndarray:
+        span = np.where(self._span > 0, self._span, 1.0)
+        return (self._block(start, stop) - self._lo) / span
+
+
+class LatinHypercube(Design):
+    """
+    Latin hypercube design.
+
+    Parameters
+    ----------
+    bounds : dict or int
+        Parameter bounds (see Design)
+    n_samples : int
+        Number of points (= strata per dimension)
+    seed : int
+        Design seed
+    maximin : bool
+        Optimize the point spread (Morris-Mitchell phi_p criterion, column
+        swaps that keep the Latin property); n_samples <= MAXIMIN_MAX_POINTS
+    iterations : int
+        Swap attempts of the maximin optimizer
+    centered : bool
+        Points at stratum centres instead of random positions within them
+    """
+
+    def __init__(self, bounds: Dict[str, Tuple[float, float]] | int, n_samples: int,
+                 seed: int = 0, maximin: bool = False, iterations: int = 2000,
+                 centered: bool = False, validate_paths: bool = True):
+        super().__init__(bounds, n_samples, validate_paths)
+        self.seed = int(seed)
+        self.centered = centered
+        self.maximin = maximin
+        self._optimized: np.ndarray | None = None
+        if maximin:
+            if self.n_samples > MAXIMIN_MAX_POINTS:
+                raise ValueError(
+                    f"Maximin optimization is limited to {MAXIMIN_MAX_POINTS} points "
+                    f"(requested {self.n_samples}); use a plain Latin hypercube or Sobol"
+                )
+            self._optimized = self._optimize(self._lattice_block(0, self.n_samples), iterations)
+
+    def _lattice_block(self, start: int, stop: int) -> np.ndarray:
+        index = np.arange(start, stop, dtype=np.int64)
+        columns = []
+        for j in range(self.n_dims):
+            strata = _permute(index, self.n_samples, (self.seed << 16) + 2 * j)
+            if self.centered:
+                jitter = 0.5
+            else:
+                jitter = _uniform(index * self.n_dims + j, (self.seed << 16) + 2 * j + 1)
+            columns.append((strata + jitter) / self.n_samples)
+        return np.column_stack(columns) if columns else np.empty((len(index), 0))
+
+    def _optimize(self, x: np.ndarray, iterations: int, p: float = 15.0) -> np.ndarray:
+        n = len(x)
+        if n < 3 or self.n_dims == 0:
+            return x
+        x = x.copy()
+        rng = np.random.default_rng(self.seed)
+        d2 = ((x[:, None, :] - x[None, :, :]) ** 2).sum(axis=-1)
+        np.fill_diagonal(d2, np.inf)
+        # Pairwise terms d^-p, scaled by the smallest distance for range safety
+        scale = math.sqrt(d2.min())
+        terms = (np.sqrt(d2) / scale) ** -p
+
+        for _ in range(iterations):
+            a, b = rng.choice(n, size=2, replace=False)
+            j = rng.integers(self.n_dims)
+            x[[a, b], j] = x[[b, a], j]
+            rows = ((x[[a, b], None, :] - x[None, :, :]) ** 2).sum(axis=-1)
+            rows[0, a] = rows[1, b] = np.inf
+            new_terms = (np.sqrt(rows) / scale) ** -p
+            # Rows a and b and the (a, b) pair change; phi_p^p = sum of terms
+            delta = (new_terms.sum() - new_terms[0, b]) - (terms[[a, b]].sum() - terms[a, b])
+            if delta < 0:
+                terms[[a, b], :] = new_terms
+                terms[:, [a, b]] = new_terms.T
+                d2[[a, b], :] = rows
+                d2[:, [a, b]] = rows.T
+            else:
+                x[[a, b], j] = x[[b, a], j]
+        return x
+
+    def _unit_block(self, start: int, stop: int) -> np.ndarray:
+        if self._optimized is not None:
+            return self._optimized[start:stop]
+        return self._lattice_block(start, stop)
+
+    def min_distance(self) -> float:
+        """Smallest pairwise distance in the unit hypercube (materializes the design)."""
+        tree = cKDTree(self.unit_sample())
+        d, _ = tree.query(tree.data, k=2)
+        return float(d[:, 1].min())
+
+
+class _SequenceDesign(Design):
+    """Low-discrepancy sequence; blocks fast-forward a scipy qmc engine."""
+
+    engine_class: Any = None
+
+    def __init__(self, bounds: Dict[str, Tuple[float, float]] | int, n_samples: int,
+                 seed: int | None = 0, scramble: bool = True, validate_paths: bool = True):
+        super().__init__(bounds, n_samples, validate_paths)
+        self.seed = seed
+        self.scramble = scramble
+        self._engine = self.engine_class(d=max(self.n_dims, 1), scramble=scramble, seed=seed)
+
+    def _unit_block(self, start: int, stop: int) -> np.ndarray:
+        if self._engine.num_generated != start:
+            self._engine.reset()
+            if start:
+                self._engine.fast_forward(start)
+        return self._engine.random(stop - start)[:, :self.n_dims]
+
+
+class Sobol(_SequenceDesign):
+    """
+    Scrambled Sobol sequence.
+
+    Balance properties hold for powers of two: chunk sizes are rounded down
+    to one, and n_samples should be one.
+    """
+
+    engine_class = qmc.Sobol
+
+    def _ranges(self, chunk_size: int | None) -> Iterator[Tuple[int, int]]:
+        step = max(1, int(chunk_size or DEFAULT_CHUNK_SIZE))
+        return super()._ranges(1 << (step.bit_length() - 1))
+
+    def _unit_block(self, start: int, stop: int) -> np.ndarray:
+        if stop - start == self.n_samples:
+            return super()._unit_block(start, stop)
+        with warnings.catch_warnings():
+            # Chunks of a design need not be powers of two themselves
+            warnings.filterwarnings("ignore", message=".*balance properties.*")
+            return super()._unit_block(start, stop)
+
+
+class Halton(_SequenceDesign):
+    """Scrambled Halton sequence (any number of points)."""
+
+    engine_class = qmc.Halton
+
+
+# =============================================================================
+# ADAPTIVE REFINEMENT
+# =============================================================================
+
+def refine(
+    x_unit: np.ndarray,
+    y: np.ndarray,
+    n_new: int,
+    seed: int | None = 0,
+    n_candidates: int | None = None,
+    exploration: float = 0.1,
+) -> np.ndarray:
+    """
+    Propose new points where the response changes fastest.
+
+    Candidates (Sobol) are scored by their distance to the nearest existing
+    point times the local variation of the outputs among the nearest
+    neighbours; neighbourhoods mixing failed (NaN) and converged points
+    count as maximal variation, so the boundary of the converged region is
+    refined. Points are picked greedily,
+    each pick shortening the distances of the remaining candidates.
+
+    Parameters
+    ----------
+    x_unit : np.ndarray
+        Evaluated points in the unit hypercube, shape (n, d)
+    y : np.ndarray
+        Outputs, shape (n,) or (n, n_outputs); NaN for failures
+    n_new : int
+        Number of points to propose
+    seed : int, optional
+        Candidate sequence seed
+    n_candidates : int, optional
+        Candidate count (default: max(1024, 64 * n_new))
+    exploration : float
+        Variation floor relative to the largest variation; > 0 keeps
+        filling empty regions
+
+    Returns
+    -------
+    np.ndarray
+        New points in the unit hypercube, shape (n_new, d)
+    """
+    x_unit = np.atleast_2d(np.asarray(x_unit, dtype=float))
+    y = np.asarray(y, dtype=float).reshape(len(x_unit), -1)
+    n, d = x_unit.shape
+    if n_new <= 0:
+        return np.empty((0, d))
+
+    n_candidates = n_candidates or max(1024, 64 * n_new)
+    candidates = Sobol(d, n_candidates, seed=seed).unit_sample()
+    tree = cKDTree(x_unit)
+    k = min(n, d + 2)
+    dist, neighbours = tree.query(candidates, k=k)
+    dist = np.atleast_2d(dist.T).T
+    neighbours = np.atleast_2d(neighbours.T).T
+
+    # Local output variation (each output normalized by its spread)
+    y_ok = y[~np.isnan(y).any(axis=1)]
+    spread = np.ptp(y_ok, axis=0) if len(y_ok) else np.ones(y.shape[1])
+    y_norm = y / np.where(spread > 0, spread, 1.0)
+    failed = np.isnan(y_norm).any(axis=1)[neighbours]
+    boundary = failed.any(axis=1) & ~failed.all(axis=1)
+    local = np.nan_to_num(y_norm)[neighbours]        # (n_candidates, k, n_outputs)
+    variation = (local.max(axis=1) - local.min(axis=1)).max(axis=-1)
+    variation[failed.any(axis=1)] = 0.0
+    top = max(float(variation.max()), 1.0e-12)
+    variation = np.where(boundary, top, variation)
+    weight = np.maximum(variation, exploration * top)
+
+    nearest = dist[:, 0].copy()
+    chosen = []
+    for _ in range(min(n_new, n_candidates)):
+        i = int(np.argmax(nearest * weight))
+        chosen.append(i)
+        nearest = np.minimum(nearest, np.sqrt(((candidates - candidates[i]) ** 2).sum(axis=1)))
+        nearest[i] = 0.0
+    return candidates[chosen]
+
+
+def adaptive_sampling(
+    bounds: Dict[str, Tuple[float, float]],
+    evaluate: Callable[[np.ndarray], np.ndarray] | None = None,
+    n_initial: int = 64,
+    n_rounds: int = 4,
+    n_per_round: int = 32,
+    outputs: Sequence[str] = DEFAULT_OUTPUTS,
+    seed: int | None = 0,
+    n_workers: int | None = None,
+) -> Dict[str, Any]:
+    """
+    Space-filling start followed by rounds of refine().
+
+    Parameters
+    ----------
+    bounds : dict
+        Mapping of dot-path -> (lower, upper)
+    evaluate : callable, optional
+        samples (n, d) -> outputs (n, m); default: evaluation.evaluate_batch
+        of the given outputs
+    n_initial, n_rounds, n_per_round : int
+        Initial Sobol points, refinement rounds and points per round
+    seed : int, optional
+        Sampling seed
+
+    Returns
+    -------
+    dict
+        'names', 'samples', 'unit', 'outputs' (values) and 'round' (index
+        of the round each point was added in, 0 = initial design)
+    """
+    design = Sobol(bounds, n_initial, seed=seed)
+    names = design.names
+    if evaluate is None:
+        def evaluate(samples: np.ndarray) -> np.ndarray:
+            return evaluate_batch(names, samples, outputs, n_workers)
+
+    def scale(unit: np.ndarray) -> np.ndarray:
+        return design._lo + unit * design._span
+
+    x_unit = design.unit_sample()
+    y = np.asarray(evaluate(scale(x_unit)), dtype=float).reshape(len(x_unit), -1)
+    rounds = np.zeros(len(x_unit), dtype=int)
+    for r in range(1, n_rounds + 1):
+        new = refine(x_unit, y, n_per_round, seed=None if seed is None else seed + r)
+        y_new = np.asarray(evaluate(scale(new)), dtype=float).reshape(len(new), -1)
+        x_unit = np.vstack([x_unit, new])
+        y = np.vstack([y, y_new])
+        rounds = np.concatenate([rounds, np.full(len(new), r)])
+
+    return {"names": names, "samples": scale(x_unit), "unit": x_unit,
+            "outputs": y, "round": rounds}
+
+
+# =============================================================================
+# STREAMING EVALUATION
+# =============================================================================
+
+def evaluate_design(
+    design: Design,
+    outputs: Sequence[str] = DEFAULT_OUTPUTS,
+    chunk_size: int | None = None,
+    n_workers: int | None = None,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Evaluate a design chunk by chunk (evaluation.evaluate_batch).
+
+    Yields
+    ------
+    tuple
+        (samples, outputs) of each chunk, shapes (n, d) and (n, len(outputs))
+    """
+    for samples in design.chunks(chunk_size):
+        yield samples, evaluate_batch(design.names, samples, outputs, n_workers)
+
+
+def write_design(
+    design: Design,
+    path: str | Path,
+    outputs: Sequence[str] = DEFAULT_OUTPUTS,
+    chunk_size: int | None = None,
+    n_workers: int | None = None,
+    compress: bool = True,
+) -> Dict[str, Any]:
+    """
+    Evaluate a design and stream it to a columnar sweep directory.
+
+    One part file is written per chunk, with a column per parameter
+    (YAML dot-path) and per output, so sweeps of any size can be binned
+    and plotted afterwards (mars_uav_sizing.visualization.binned) without
+    loading them whole.
+
+    Parameters
+    ----------
+    design : Design
+        Design to evaluate
+    path : str or Path
+        Sweep directory (replaced if it exists)
+    outputs : sequence of str
+        Output names from evaluation.OUTPUT_NAMES
+    chunk_size, n_workers : int, optional
+        See evaluate_design
+    compress : bool
+        Compress the part files
+
+    Returns
+    -------
+    dict
+        Sweep manifest ('columns', 'parts', 'n_rows')
+    """
+    from mars_uav_sizing.visualization.sweep_store import SweepWriter, read_manifest
+
+    outputs = tuple(outputs)
+    duplicate = set(design.names) & set(outputs)
+    if duplicate:
+        raise ValueError(f"Parameter and output columns collide: {sorted(duplicate)}")
+    with SweepWriter(path, design.names + list(outputs), compress, overwrite=True) as writer:
+        for samples, y in evaluate_design(design, outputs, chunk_size, n_workers):
+            chunk = {name: samples[:, j] for j, name in enumerate(design.names)}
+            chunk.update({name: y[:, j] for j, name in enumerate(outputs)})
+            writer.write(chunk)
+    return read_manifest(path)
@@ -0,0 +1,314 @@
+﻿"""
+Batch Design Evaluation (Coupled)
+=================================
+
+Evaluates the coupled sizing solver and the Section 5 hybrid VTOL analysis
+for many parameter sets. Parameters are addressed by their YAML dot-paths
+(e.g. "battery.specifications.specific_energy_Wh_kg") and applied as
+temporary scenario overlays (mars_uav_sizing.config.scenarios) on the
+baseline configuration; neither the files on disk nor the loaded baseline
+are modified.
+
+Batches are split into chunks and evaluated in worker processes or threads.
+Each sample is still one scalar solve: the coupled solver and the Section 5
+models read their inputs through get_param, so a sample cannot be stacked
+into an array without rewriting every model. The speed-up is the process
+parallelism across samples, not vectorized residuals.
+
+Overrides are scoped to the evaluating thread or task (contextvars), so they
+never leak between concurrent evaluations; the caller's active scenario is
+passed to every worker.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+from typing import Any, Dict, Iterator, Sequence, Tuple
+
+import numpy as np
+
+from ..config import BASELINE, Scenario, active_scenario, load_config, parameters
+from ..section5.coupled_solver import solve_coupled_design
+
+from mars_uav_sizing.section5.hybrid_vtol import hybrid_vtol_feasibility_analysis
+
+
+# Model outputs available to batch studies
+OUTPUT_NAMES: Tuple[str, ...] = (
+    "mtow_kg",             # Coupled solver: closed MTOW
+    "battery_mass_kg",     # Coupled solver: battery mass
+    "wing_loading_n_m2",   # Coupled solver: design point W/S
+    "power_loading_w_n",   # Coupled solver: design point P/W
+    "energy_margin_pct",   # §5.3 hybrid VTOL at baseline MTOW: energy margin
+    "endurance_min",       # §5.3 hybrid VTOL at baseline MTOW: endurance
+    "feasible",            # 1.0 if the solver converged and the §5.3 analysis is feasible
+)
+
+DEFAULT_OUTPUTS: Tuple[str, ...] = ("mtow_kg", "energy_margin_pct", "endurance_min")
+
+# Subtrees never perturbed by default (solver settings, universal constants)
+EXCLUDED_PREFIXES: Tuple[str, ...] = ("solver.", "physical.")
+
+# Path segments (fnmatch patterns) never perturbed by default, wherever they
+# appear: numerical settings of nested solvers, site coordinates and
+# benchmark statistics that no model reads
+EXCLUDED_KEYS: Tuple[str, ...] = (
+    "solver", "*_iter*", "*iterations*", "tol*", "top_k",
+    "latitude_deg", "longitude_deg", "fuselage_benchmark",
+)
+
+# Integer keys that are counts, not continuous parameters
+_COUNT_KEYS = ("quantity", "motors_per_arm", "cycle_life")
+
+# Key fragments marking dimensionless quantities that cannot exceed 1
+_FRACTION_HINTS = ("eta", "efficiency", "fraction", "figure_of_merit", "f_", "factor",
+                   "depth_of_discharge")
+
+
+# =============================================================================
+# PARAMETER OVERRIDES
+# =============================================================================
+
+@contextmanager
+def parameter_overrides(overrides: Dict[str, Any]) -> Iterator[None]:
+    """
+    Temporarily apply configuration overrides as a scenario overlay.
+
+    Parameters
+    ----------
+    overrides : dict
+        Mapping of YAML dot-path -> value. Every path must already exist.
+
+    Notes
+    -----
+    Overrides stack on the active scenario of the current thread or task
+    (see mars_uav_sizing.config.parameters), and both get_param
+    implementations read the same overlaid tree. The baseline configuration
+    is not modified.
+    """
+    with parameters(overrides):
+        yield
+
+
+def _iter_leaves(node: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    for key, value in node.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict):
+            yield from _iter_leaves(value, path)
+        else:
+            yield path, value
+
+
+def _iter_numeric_leaves(node: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, float]]:
+    for path, value in _iter_leaves(node, prefix):
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield path, value
+
+
+def config_hash(exclude: Sequence[str] = ()) -> str:
+    """
+    Stable hash of the loaded configuration (base YAML files and solver options).
+
+    Parameters
+    ----------
+    exclude : sequence of str
+        Dot-paths left out of the hash, e.g. parameters a study sets itself
+
+    Returns
+    -------
+    str
+        16-character hex digest
+    """
+    leaves = {path: value for path, value in _iter_leaves(load_config())
+              if path not in set(exclude)}
+    payload = json.dumps(leaves, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def discover_parameters(
+    prefixes: Sequence[str] | None = None,
+    rel_range: float = 0.2,
+    exclude: Sequence[str] = EXCLUDED_PREFIXES,
+    exclude_keys: Sequence[str] = EXCLUDED_KEYS,
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Build default bounds for all continuous numeric YAML parameters.
+
+    Parameters
+    ----------
+    prefixes : sequence of str, optional
+        Only include paths starting with one of these prefixes
+    rel_range : float
+        Relative half-width of the bounds (value * (1 -/+ rel_range))
+    exclude : sequence of str
+        Path prefixes to skip
+    exclude_keys : sequence of str
+        fnmatch patterns; paths with any matching segment are skipped
+
+    Returns
+    -------
+    dict
+        Mapping of dot-path -> (lower, upper). Zero-valued entries and
+        integer counts are skipped; efficiencies and fractions are capped at 1.
+    """
+    bounds: Dict[str, Tuple[float, float]] = {}
+    for path, value in _iter_numeric_leaves(load_config()):
+        if prefixes is not None and not path.startswith(tuple(prefixes)):
+            continue
+        if path.startswith(tuple(exclude)) or value == 0:
+            continue
+        segments = path.split(".")
+        if any(fnmatch.fnmatchcase(segment, pattern)
+               for segment in segments for pattern in exclude_keys):
+            continue
+        key = segments[-1]
+        if isinstance(value, int) and (key.startswith("n_") or key in _COUNT_KEYS):
+            continue
+        lo, hi = sorted((value * (1.0 - rel_range), value * (1.0 + rel_range)))
+        if 0.0 < value <= 1.0 and any(hint in key for hint in _FRACTION_HINTS):
+            hi = min(hi, 1.0)
+        bounds[path] = (float(lo), float(hi))
+    return bounds
+
+
+def scale_samples(unit_samples: np.ndarray, bounds: Dict[str, Tuple[float, float]]) -> np.ndarray:
+    """Map samples from the unit hypercube to the parameter bounds."""
+    lo = np.array([b[0] for b in bounds.values()])
+    hi = np.array([b[1] for b in bounds.values()])
+    return lo + np.asarray(unit_samples) * (hi - lo)
+
+
+# =============================================================================
+# EVALUATION
+# =============================================================================
+
+def evaluate_point(
+    overrides: Dict[str, Any] | None = None,
+    outputs: Sequence[str] = DEFAULT_OUTPUTS,
+) -> Dict[str, float]:
+    """
+    Evaluate the model outputs for one parameter set.
+
+    Parameters
+    ----------
+    overrides : dict, optional
+        Mapping of YAML dot-path -> value
+    outputs : sequence of str
+        Output names from OUTPUT_NAMES
+
+    Returns
+    -------
+    dict
+        Output values; NaN where the coupled solver did not converge
+    """
+    unknown = set(outputs) - set(OUTPUT_NAMES)
+    if unknown:
+        raise ValueError(f"Unknown outputs: {sorted(unknown)} (available: {OUTPUT_NAMES})")
+
+    values: Dict[str, float] = {}
+    with parameter_overrides(overrides or {}):
+        if {"mtow_kg", "battery_mass_kg", "wing_loading_n_m2", "power_loading_w_n",
+                "feasible"} & set(outputs):
+            try:
+                coupled = solve_coupled_design()
+            except (ValueError, ZeroDivisionError, OverflowError):
+                coupled = {"converged": False}
+            ok = coupled["converged"] and coupled["solution"]["mtow_kg"] > 0
+            for name in ("mtow_kg", "battery_mass_kg", "wing_loading_n_m2", "power_loading_w_n"):
+                values[name] = coupled["solution"][name] if ok else math.nan
+
+        if {"energy_margin_pct", "endurance_min", "feasible"} & set(outputs):
+            try:
+                hybrid = hybrid_vtol_feasibility_analysis()
+                values["energy_margin_pct"] = hybrid["margin_percent"]
+                values["endurance_min"] = hybrid["endurance_min"]
+                if "feasible" in outputs:
+                    values["feasible"] = float(bool(hybrid["feasible"]) and ok)
+            except (ValueError, ZeroDivisionError, OverflowError):
+                values["energy_margin_pct"] = math.nan
+                values["endurance_min"] = math.nan
+                values["feasible"] = 0.0
+
+    return {name: float(values[name]) for name in outputs}
+
+
+def _evaluate_chunk(
+    names: Sequence[str],
+    rows: np.ndarray,
+    outputs: Sequence[str],
+    scenario: Scenario = BASELINE,
+) -> np.ndarray:
+    result = np.empty((len(rows), len(outputs)))
+    with scenario.applied():
+        for i, row in enumerate(rows):
+            point = evaluate_point(dict(zip(names, row.tolist())), outputs)
+            result[i] = [point[name] for name in outputs]
+    return result
+
+
+def evaluate_batch(
+    names: Sequence[str],
+    samples: np.ndarray,
+    outputs: Sequence[str] = DEFAULT_OUTPUTS,
+    n_workers: int | None = None,
+    chunk_size: int | None = None,
+    executor: str = "process",
+) -> np.ndarray:
+    """
+    Evaluate a batch of parameter sets, optionally in worker processes or threads.
+
+    Parameters
+    ----------
+    names : sequence of str
+        YAML dot-paths, one per sample column
+    samples : np.ndarray
+        Parameter values, shape (n_samples, len(names))
+    outputs : sequence of str
+        Output names from OUTPUT_NAMES
+    n_workers : int, optional
+        Worker processes (default: CPU count; 1 = evaluate in-process)
+    chunk_size : int, optional
+        Samples per task (default: balanced over ~4 tasks per worker)
+    executor : str
+        'process' or 'thread'. Every worker evaluates on top of the
+        caller's active scenario.
+
+    Returns
+    -------
+    np.ndarray
+        Output values, shape (n_samples, len(outputs))
+    """
+    samples = np.atleast_2d(np.asarray(samples, dtype=float))
+    if samples.shape[1] != len(names):
+        raise ValueError(
+            f"samples has {samples.shape[1]} columns but {len(names)} parameter names given"
+        )
+    if executor not in ("process", "thread"):
+        raise ValueError(f"Unknown executor: {executor!r} (use 'process' or 'thread')")
+    outputs = tuple(outputs)
+    scenario = active_scenario() or BASELINE
+    n_samples = len(samples)
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = max(1, min(n_workers, n_samples))
+
+    if n_workers == 1:
+        return _evaluate_chunk(names, samples, outputs, scenario)
+
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(n_samples / (4 * n_workers)))
+    chunks = [samples[i:i + chunk_size] for i in range(0, n_samples, chunk_size)]
+
+    pool = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    with pool(max_workers=n_workers) as workers:
+        parts = list(workers.map(
+            _evaluate_chunk, repeat(tuple(names)), chunks, repeat(outputs), repeat(scenario)
+        ))
+    return np.vstack(parts)
@@ -0,0 +1,485 @@
+﻿"""
+Global Sensitivity Analysis (Coupled)
+=====================================
+
+Ranks YAML parameters by their influence on the coupled MTOW and on the
+§5.3 hybrid VTOL energy margin and endurance.
+
+Two-stage workflow:
+    1. Morris elementary-effects screening over all candidate parameters
+       (r trajectories, r * (k + 1) evaluations)
+    2. Sobol first-order (S1) and total (ST) indices on the shortlist,
+       Saltelli sampling with shared base matrices A and B
+       (N * (k + 2) evaluations, reused for every output)
+
+Equations:
+    EE_i = [f(x + Δ e_i) - f(x)] / Δ,   μ*_i = mean|EE_i|,  σ_i = std(EE_i)
+    S_i  = mean[f_B (f_ABi - f_A)] / Var(Y)             (Saltelli 2010)
+    ST_i = mean[(f_A - f_ABi)^2] / (2 Var(Y))           (Jansen 1999)
+
+Reference:
+    Morris, M.D. (1991). Technometrics 33(2), 161-174.
+    Saltelli, A. et al. (2010). Comput. Phys. Commun. 181(2), 259-270.
+
+Usage:
+    python -m mars_uav_sizing_coupled.studies.sensitivity
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .doe import Sobol
+from .evaluation import (
+    DEFAULT_OUTPUTS,
+    discover_parameters,
+    evaluate_batch,
+    scale_samples,
+)
+
+
+# =============================================================================
+# MORRIS SCREENING
+# =============================================================================
+
+def morris_trajectories(
+    n_params: int,
+    n_trajectories: int = 10,
+    n_levels: int = 4,
+    seed: int | None = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate one-at-a-time Morris trajectories in the unit hypercube.
+
+    Parameters
+    ----------
+    n_params : int
+        Number of parameters k
+    n_trajectories : int
+        Number of trajectories r
+    n_levels : int
+        Grid levels p (even)
+    seed : int, optional
+        Random seed
+
+    Returns
+    -------
+    tuple
+        (points, steps): points has shape (r, k + 1, k); steps has shape
+        (r, k) and holds the parameter index changed at each step.
+    """
+    rng = np.random.default_rng(seed)
+    delta = n_levels / (2.0 * (n_levels - 1))
+    base_levels = np.arange(n_levels // 2) / (n_levels - 1)
+
+    points = np.empty((n_trajectories, n_params + 1, n_params))
+    points[:, 0, :] = rng.choice(base_levels, size=(n_trajectories, n_params))
+    steps = np.argsort(rng.random((n_trajectories, n_params)), axis=1)
+    signs = rng.choice([-1.0, 1.0], size=(n_trajectories, n_params))
+
+    rows = np.arange(n_trajectories)
+    for j in range(n_params):
+        current = points[:, j, :].copy()
+        idx = steps[:, j]
+        moved = current[rows, idx] + signs[rows, idx] * delta
+        # Reflect moves that would leave the unit interval
+        outside = (moved < 0.0) | (moved > 1.0)
+        moved = np.where(outside, current[rows, idx] - signs[rows, idx] * delta, moved)
+        current[rows, idx] = moved
+        points[:, j + 1, :] = current
+
+    return points, steps
+
+
+def morris_screening(
+    bounds: Dict[str, Tuple[float, float]] | None = None,
+    outputs: Sequence[str] = DEFAULT_OUTPUTS,
+    n_trajectories: int = 10,
+    n_levels: int = 4,
+    seed: int | None = None,
+    n_workers: int | None = None,
+) -> Dict[str, Any]:
+    """
+    Morris elementary-effects screening.
+
+    Elementary effects are expressed per unit of normalized parameter range,
+    so μ* values are comparable across parameters of different units.
+
+    Parameters
+    ----------
+    bounds : dict, optional
+        Mapping of dot-path -> (lower, upper) (default: discover_parameters())
+    outputs : sequence of str
+        Output names
+    n_trajectories : int
+        Number of trajectories r
+    n_levels : int
+        Grid levels p
+    seed : int, optional
+        Random seed
+    n_workers : int, optional
+        Worker processes for batch evaluation
+
+    Returns
+    -------
+    dict
+        mu_star, mu, sigma per output and parameter, ranking per output,
+        and n_evaluations
+    """
+    if bounds is None:
+        bounds = discover_parameters()
+    names = list(bounds)
+    k = len(names)
+
+    unit_points, steps = morris_trajectories(k, n_trajectories, n_levels, seed)
+    flat = unit_points.reshape(-1, k)
+    y = evaluate_batch(names, scale_samples(flat, bounds), outputs, n_workers)
+    y = y.reshape(n_trajectories, k + 1, len(outputs))
+
+    # Elementary effects, scattered back to parameter order: (r, k, n_out)
+    dy = np.diff(y, axis=1)
+    dx = np.diff(unit_points, axis=1)[np.arange(n_trajectories)[:, None], np.arange(k), steps]
+    ee_steps = dy / dx[:, :, None]
+    ee = np.empty_like(ee_steps)
+    ee[np.arange(n_trajectories)[:, None], steps, :] = ee_steps
+
+    with np.errstate(invalid="ignore"):
+        mu = np.nanmean(ee, axis=0)
+        mu_star = np.nanmean(np.abs(ee), axis=0)
+        sigma = np.nanstd(ee, axis=0)
+
+    results: Dict[str, Any] = {
+        "method": "morris",
+        "parameters": names,
+        "outputs": list(outputs),
+        "mu": {},
+        "mu_star": {},
+        "sigma": {},
+        "ranking": {},
+        "n_evaluations": int(flat.shape[0]),
+        "n_failed": int(np.isnan(y).any(axis=2).sum()),
+    }
+    for j, out in enumerate(outputs):
+        results["mu"][out] = dict(zip(names, mu[:, j].tolist()))
+        results["mu_star"][out] = dict(zip(names, mu_star[:, j].tolist()))
+        results["sigma"][out] = dict(zip(names, sigma[:, j].tolist()))
+        order = np.argsort(-np.nan_to_num(mu_star[:, j], nan=-np.inf))
+        results["ranking"][out] = [names[i] for i in order]
+    return results
+
+
+def shortlist_parameters(
+    morris: Dict[str, Any],
+    threshold: float = 0.05,
+    max_params: int | None = None,
+) -> List[str]:
+    """
+    Select influential parameters from a Morris screening.
+
+    A parameter is kept if, for any output, its μ* is at least ``threshold``
+    times the largest μ* of that output.
+
+    Parameters
+    ----------
+    morris : dict
+        Result of morris_screening()
+    threshold : float
+        Relative μ* cut-off
+    max_params : int, optional
+        Keep at most this many parameters (highest normalized μ* first)
+
+    Returns
+    -------
+    list of str
+        Selected dot-paths
+    """
+    names = morris["parameters"]
+    score = np.zeros(len(names))
+    for out in morris["outputs"]:
+        values = np.nan_to_num(np.array([morris["mu_star"][out][n] for n in names]))
+        peak = values.max()
+        if peak > 0:
+            score = np.maximum(score, values / peak)
+
+    order = [i for i in np.argsort(-score) if score[i] >= threshold]
+    if max_params is not None:
+        order = order[:max_params]
+    return [names[i] for i in order]
+
+
+# =============================================================================
+# SOBOL INDICES (SALTELLI SAMPLING)
+# =============================================================================
+
+def saltelli_samples(
+    n_params: int,
+    n_base: int = 256,
+    seed: int | None = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build Saltelli base matrices A, B and the k cross matrices AB_i.
+
+    Parameters
+    ----------
+    n_params : int
+        Number of parameters k
+    n_base : int
+        Base sample size N (rounded up to a power of two)
+    seed : int, optional
+        Scrambling seed
+
+    Returns
+    -------
+    tuple
+        (A, B, AB) with shapes (N, k), (N, k), (k, N, k); AB[i] is A with
+        column i taken from B.
+    """
+    n_base = 1 << max(0, math.ceil(math.log2(max(n_base, 1))))
+    base = Sobol(2 * n_params, n_base, seed=seed).unit_sample()
+    a, b = base[:, :n_params], base[:, n_params:]
+
+    ab = np.repeat(a[None, :, :], n_params, axis=0)
+    idx = np.arange(n_params)
+    ab[idx, :, idx] = b[:, idx].T
+    return a, b, ab
+
+
+def sobol_from_evaluations(
+    f_a: np.ndarray,
+    f_b: np.ndarray,
+    f_ab: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Saltelli/Jansen estimators of first-order and total indices.
+
+    Parameters
+    ----------
+    f_a, f_b : np.ndarray
+        Outputs at A and B, shape (N, n_out)
+    f_ab : np.ndarray
+        Outputs at AB_i, shape (k, N, n_out)
+
+    Returns
+    -------
+    tuple
+        (S1, ST), each of shape (k, n_out). Samples with any NaN among
+        f_A, f_B, f_ABi are dropped per parameter.
+    """
+    valid = ~(np.isnan(f_a) | np.isnan(f_b))[None, :, :] & ~np.isnan(f_ab)
+    count = valid.sum(axis=1)
+
+    fa = np.where(valid, f_a[None], 0.0)
+    fb = np.where(valid, f_b[None], 0.0)
+    fab = np.where(valid, f_ab, 0.0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        both = np.concatenate([f_a, f_b], axis=0)
+        variance = np.nanvar(both, axis=0)
+        s1 = (fb * (fab - fa)).sum(axis=1) / count / variance
+        st = 0.5 * ((fa - fab) ** 2).sum(axis=1) / count / variance
+    return s1, st
+
+
+def sobol_indices(
+    bounds: Dict[str, Tuple[float, float]],
+    outputs: Sequence[str] = DEFAULT_OUTPUTS,
+    n_base: int = 256,
+    n_bootstrap: int = 100,
+    seed: int | None = None,
+    n_workers: int | None = None,
+) -> Dict[str, Any]:
+    """
+    Sobol first-order and total indices by Saltelli sampling.
+
+    All N * (k + 2) model runs are evaluated in one batch and shared by
+    every output; bootstrap confidence intervals reuse the same runs.
+
+    Parameters
+    ----------
+    bounds : dict
+        Mapping of dot-path -> (lower, upper)
+    outputs : sequence of str
+        Output names
+    n_base : int
+        Base sample size N (rounded up to a power of two)
+    n_bootstrap : int
+        Bootstrap resamples for 95% confidence intervals (0 to skip)
+    seed : int, optional
+        Random seed
+    n_workers : int, optional
+        Worker processes for batch evaluation
+
+    Returns
+    -------
+    dict
+        S1, ST (and S1_conf, ST_conf) per output and parameter, ranking by
+        ST per output, and n_evaluations
+    """
+    names = list(bounds)
+    k = len(names)
+    a, b, ab = saltelli_samples(k, n_base, seed)
+    n = a.shape[0]
+
+    unit = np.vstack([a, b, ab.reshape(-1, k)])
+    y = evaluate_batch(names, scale_samples(unit, bounds), outputs, n_workers)
+    f_a, f_b, f_ab = y[:n], y[n:2 * n], y[2 * n:].reshape(k, n, len(outputs))
+
+    s1, st = sobol_from_evaluations(f_a, f_b, f_ab)
+
+    s1_conf = np.full_like(s1, np.nan)
+    st_conf = np.full_like(st, np.nan)
+    if n_bootstrap > 0:
+        rng = np.random.default_rng(seed)
+        draws = rng.integers(0, n, size=(n_bootstrap, n))
+        boot = [sobol_from_evaluations(f_a[d], f_b[d], f_ab[:, d]) for d in draws]
+        s1_conf = 1.96 * np.nanstd([s for s, _ in boot], axis=0)
+        st_conf = 1.96 * np.nanstd([t for _, t in boot], axis=0)
+
+    results: Dict[str, Any] = {
+        "method": "sobol",
+        "parameters": names,
+        "outputs": list(outputs),
+        "S1": {},
+        "ST": {},
+        "S1_conf": {},
+        "ST_conf": {},
+        "ranking": {},
+        "n_base": n,
+        "n_evaluations": int(unit.shape[0]),
+        "n_failed": int(np.isnan(y).any(axis=1).sum()),
+    }
+    for j, out in enumerate(outputs):
+        results["S1"][out] = dict(zip(names, s1[:, j].tolist()))
+        results["ST"][out] = dict(zip(names, st[:, j].tolist()))
+        results["S1_conf"][out] = dict(zip(names, s1_conf[:, j].tolist()))
+        results["ST_conf"][out] = dict(zip(names, st_conf[:, j].tolist()))
+        order = np.argsort(-np.nan_to_num(st[:, j], nan=-np.inf))
+        results["ranking"][out] = [names[i] for i in order]
+    return results
+
+
+# =============================================================================
+# TWO-STAGE ANALYSIS
+# =============================================================================
+
+def sensitivity_analysis(
+    bounds: Dict[str, Tuple[float, float]] | None = None,
+    outputs: Sequence[str] = DEFAULT_OUTPUTS,
+    n_trajectories: int = 10,
+    threshold: float = 0.05,
+    max_params: int | None = 12,
+    n_base: int = 256,
+    n_bootstrap: int = 100,
+    seed: int | None = 0,
+    n_workers: int | None = None,
+) -> Dict[str, Any]:
+    """
+    Morris screening of all parameters followed by Sobol indices on the
+    shortlist (non-selected parameters held at their baseline values).
+
+    Parameters
+    ----------
+    bounds : dict, optional
+        Mapping of dot-path -> (lower, upper) (default: discover_parameters())
+    outputs : sequence of str
+        Output names
+    n_trajectories : int
+        Morris trajectories
+    threshold : float
+        Relative μ* cut-off for the shortlist
+    max_params : int, optional
+        Maximum shortlist size
+    n_base : int
+        Sobol base sample size
+    n_bootstrap : int
+        Bootstrap resamples for Sobol confidence intervals
+    seed : int, optional
+        Random seed
+    n_workers : int, optional
+        Worker processes for batch evaluation
+
+    Returns
+    -------
+    dict
+        {'morris': ..., 'shortlist': [...], 'sobol': ..., 'n_evaluations': int}
+    """
+    if bounds is None:
+        bounds = discover_parameters()
+
+    morris = morris_screening(bounds, outputs, n_trajectories, seed=seed, n_workers=n_workers)
+    shortlist = shortlist_parameters(morris, threshold, max_params)
+
+    sobol: Dict[str, Any] | None = None
+    if shortlist:
+        sobol = sobol_indices(
+            {name: bounds[name] for name in shortlist},
+            outputs,
+            n_base=n_base,
+            n_bootstrap=n_bootstrap,
+            seed=seed,
+            n_workers=n_workers,
+        )
+
+    return {
+        "morris": morris,
+        "shortlist": shortlist,
+        "sobol": sobol,
+        "n_evaluations": morris["n_evaluations"] + (sobol["n_evaluations"] if sobol else 0),
+    }
+
+
+def print_analysis(results: Dict[str, Any] | None = None, top: int = 10) -> None:
+    if results is None:
+        results = sensitivity_analysis()
+
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    morris = results["morris"]
+    sobol = results["sobol"]
+
+    print("=" * 80)
+    print("GLOBAL SENSITIVITY ANALYSIS (Morris screening + Sobol indices)")
+    print("=" * 80)
+    print(f"Computed: {timestamp}")
+    print("Config:   All values loaded from config/ YAML files")
+    print()
+
+    print("MORRIS SCREENING")
+    print("-" * 50)
+    print(f"  Parameters screened: {len(morris['parameters'])}")
+    print(f"  Model evaluations:   {morris['n_evaluations']} ({morris['n_failed']} failed)")
+    print(f"  Shortlist:           {len(results['shortlist'])} parameters")
+    print()
+
+    for out in morris["outputs"]:
+        print(f"  {out}: top parameters by mu*")
+        for name in morris["ranking"][out][:top]:
+            mu_star = morris["mu_star"][out][name]
+            sigma = morris["sigma"][out][name]
+            print(f"    {name:<55} mu*={mu_star:10.4g}  sigma={sigma:10.4g}")
+        print()
+
+    if sobol:
+        print("SOBOL INDICES (shortlist)")
+        print("-" * 50)
+        print(f"  Base samples N:      {sobol['n_base']}")
+        print(f"  Model evaluations:   {sobol['n_evaluations']} ({sobol['n_failed']} failed)")
+        print()
+        for out in sobol["outputs"]:
+            print(f"  {out}: ranked by total index ST")
+            for name in sobol["ranking"][out][:top]:
+                s1 = sobol["S1"][out][name]
+                st = sobol["ST"][out][name]
+                st_conf = sobol["ST_conf"][out][name]
+                print(f"    {name:<55} S1={s1:6.3f}  ST={st:6.3f} +/-{st_conf:5.3f}")
+            print()
+
+    print(f"TOTAL MODEL EVALUATIONS: {results['n_evaluations']}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    print_analysis()
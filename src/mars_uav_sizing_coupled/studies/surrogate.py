@@ -0,0 +1,446 @@
+﻿"""
+Surrogate Model of the Coupled Sizing Solver
+============================================
+
+Response-surface approximation of the batch evaluation outputs (coupled
+MTOW, §5.3 energy margin and endurance) over a declared parameter box,
+for interactive trade-space queries.
+
+Workflow:
+    1. Sample the box (scrambled Sobol), evaluate the true model in batch
+    2. Fit a radial-basis-function or polynomial response surface in
+       normalized coordinates, holding out a validation set
+    3. predict(): batched evaluation with a local error estimate; queries
+       outside the trust region fall back to the true model
+
+Error estimate:
+    err(x) = RMSE_val * max(1, d_nn(x) / h)
+
+    where d_nn is the distance to the nearest training sample and h the
+    median nearest-neighbour spacing of the training set (unit cube).
+
+Usage:
+    model = SurrogateModel(bounds)
+    model.fit(n_samples=512)
+    model.save("surrogate.npz")
+    result = SurrogateModel.load("surrogate.npz").predict(samples)
+"""
+
+from __future__ import annotations
+
+import json
+import warnings
+from datetime import datetime
+from itertools import combinations_with_replacement
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+from scipy.interpolate import RBFInterpolator
+from scipy.spatial import cKDTree
+
+from .doe import Sobol
+from .evaluation import DEFAULT_OUTPUTS, config_hash, evaluate_batch, scale_samples
+
+
+SURROGATE_KINDS = ("rbf", "polynomial")
+
+
+def _polynomial_exponents(n_dims: int, degree: int) -> np.ndarray:
+    """Exponent matrix of all monomials up to total ``degree``."""
+    rows = [np.zeros(n_dims, dtype=int)]
+    for d in range(1, degree + 1):
+        for combo in combinations_with_replacement(range(n_dims), d):
+            row = np.zeros(n_dims, dtype=int)
+            for i in combo:
+                row[i] += 1
+            rows.append(row)
+    return np.array(rows)
+
+
+def _polynomial_basis(x: np.ndarray, exponents: np.ndarray) -> np.ndarray:
+    """Evaluate monomials on centred coordinates, shape (n, n_terms)."""
+    z = 2.0 * x - 1.0
+    return np.prod(z[:, None, :] ** exponents[None, :, :], axis=2)
+
+
+class SurrogateModel:
+    """
+    Response surface of the coupled sizing outputs over a parameter box.
+
+    Parameters
+    ----------
+    bounds : dict
+        Mapping of YAML dot-path -> (lower, upper)
+    outputs : sequence of str
+        Output names (see evaluation.OUTPUT_NAMES)
+    kind : str
+        'rbf' (thin-plate spline with linear tail) or 'polynomial'
+    degree : int
+        Polynomial degree (kind='polynomial')
+    smoothing : float
+        RBF smoothing parameter (0 = interpolating)
+    trust_factor : float
+        Trust radius as a multiple of the training spacing h
+    """
+
+    def __init__(
+        self,
+        bounds: Dict[str, Tuple[float, float]],
+        outputs: Sequence[str] = DEFAULT_OUTPUTS,
+        kind: str = "rbf",
+        degree: int = 2,
+        smoothing: float = 0.0,
+        trust_factor: float = 2.0,
+    ) -> None:
+        if kind not in SURROGATE_KINDS:
+            raise ValueError(f"Unknown surrogate kind: {kind!r} (use one of {SURROGATE_KINDS})")
+        self.bounds = {name: (float(lo), float(hi)) for name, (lo, hi) in bounds.items()}
+        self.names: List[str] = list(self.bounds)
+        self.outputs: Tuple[str, ...] = tuple(outputs)
+        self.kind = kind
+        self.degree = int(degree)
+        self.smoothing = float(smoothing)
+        self.trust_factor = float(trust_factor)
+
+        self._lo = np.array([b[0] for b in self.bounds.values()])
+        self._hi = np.array([b[1] for b in self.bounds.values()])
+
+        self.x_train: np.ndarray | None = None      # unit coordinates
+        self.y_train: np.ndarray | None = None
+        self.x_failed: np.ndarray = np.empty((0, len(self.names)))
+        self.y_mean: np.ndarray | None = None
+        self.y_std: np.ndarray | None = None
+        self.coefficients: np.ndarray | None = None
+        self.spacing: float = 0.0
+        self.validation: Dict[str, Any] = {}
+        # Baseline configuration the model was fitted on (box parameters excluded)
+        self.config_hash: str | None = None
+        self.config_mismatch = False
+
+        self._rbf: RBFInterpolator | None = None
+        self._exponents: np.ndarray | None = None
+        self._tree: cKDTree | None = None
+        self._failed_tree: cKDTree | None = None
+
+    # -------------------------------------------------------------------------
+    # Fitting
+    # -------------------------------------------------------------------------
+
+    def _to_unit(self, samples: np.ndarray) -> np.ndarray:
+        return (np.atleast_2d(samples) - self._lo) / (self._hi - self._lo)
+
+    def _build(self) -> None:
+        """Construct interpolants and search trees from the stored training data."""
+        y_norm = (self.y_train - self.y_mean) / self.y_std
+        if self.kind == "rbf":
+            self._rbf = RBFInterpolator(
+                self.x_train, y_norm, kernel="thin_plate_spline",
+                degree=1, smoothing=self.smoothing,
+            )
+        else:
+            self._exponents = _polynomial_exponents(len(self.names), self.degree)
+            if self.coefficients is None:
+                basis = _polynomial_basis(self.x_train, self._exponents)
+                self.coefficients, *_ = np.linalg.lstsq(basis, y_norm, rcond=None)
+
+        self._tree = cKDTree(self.x_train)
+        self._failed_tree = cKDTree(self.x_failed) if len(self.x_failed) else None
+        if len(self.x_train) > 1:
+            d_nn, _ = self._tree.query(self.x_train, k=2)
+            self.spacing = float(np.median(d_nn[:, 1]))
+
+    def _predict_unit(self, x_unit: np.ndarray) -> np.ndarray:
+        if self.kind == "rbf":
+            y_norm = self._rbf(x_unit)
+        else:
+            y_norm = _polynomial_basis(x_unit, self._exponents) @ self.coefficients
+        return y_norm * self.y_std + self.y_mean
+
+    def fit(
+        self,
+        n_samples: int = 256,
+        validation_fraction: float = 0.2,
+        seed: int | None = 0,
+        n_workers: int | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Sample the parameter box, evaluate the true model and fit.
+
+        Parameters
+        ----------
+        n_samples : int
+            Total true-model evaluations (training + validation)
+        validation_fraction : float
+            Fraction held out to measure prediction error
+        seed : int, optional
+            Sampling seed
+        n_workers : int, optional
+            Worker processes for batch evaluation
+
+        Returns
+        -------
+        dict
+            Validation metrics per output (rmse, max_abs, r2) and counts
+        """
+        self.config_hash = config_hash(self.names)
+        self.config_mismatch = False
+        x_unit = Sobol(self.bounds, n_samples, seed=seed).unit_sample()
+        y = evaluate_batch(self.names, scale_samples(x_unit, self.bounds), self.outputs, n_workers)
+
+        ok = ~np.isnan(y).any(axis=1)
+        self.x_failed = x_unit[~ok]
+        x_unit, y = x_unit[ok], y[ok]
+
+        rng = np.random.default_rng(seed)
+        order = rng.permutation(len(x_unit))
+        n_val = int(round(validation_fraction * len(x_unit)))
+        val, train = order[:n_val], order[n_val:]
+        if len(train) < len(self.names) + 2:
+            raise ValueError(
+                f"Only {len(train)} converged training samples for {len(self.names)} "
+                "parameters; increase n_samples or narrow the bounds"
+            )
+
+        self._fit_arrays(x_unit[train], y[train])
+
+        metrics: Dict[str, Any] = {}
+        if n_val:
+            y_hat = self._predict_unit(x_unit[val])
+            err = y_hat - y[val]
+            ss_tot = ((y[val] - y[val].mean(axis=0)) ** 2).sum(axis=0)
+            for j, out in enumerate(self.outputs):
+                metrics[out] = {
+                    "rmse": float(np.sqrt(np.mean(err[:, j] ** 2))),
+                    "max_abs": float(np.max(np.abs(err[:, j]))),
+                    "r2": float(1.0 - (err[:, j] ** 2).sum() / ss_tot[j]) if ss_tot[j] > 0 else 1.0,
+                }
+
+            # Refit on all converged samples; validation error kept as estimate
+            self._fit_arrays(x_unit, y)
+
+        self.validation = {
+            "metrics": metrics,
+            "n_train": int(len(self.x_train)),
+            "n_validation": int(n_val),
+            "n_failed": int(len(self.x_failed)),
+            "fitted": datetime.now().isoformat(timespec="seconds"),
+        }
+        return self.validation
+
+    def _fit_arrays(
+        self,
+        x_unit: np.ndarray,
+        y: np.ndarray,
+        coefficients: np.ndarray | None = None,
+    ) -> None:
+        self.x_train = x_unit
+        self.y_train = y
+        self.y_mean = y.mean(axis=0)
+        self.y_std = np.where(y.std(axis=0) > 0, y.std(axis=0), 1.0)
+        self.coefficients = coefficients
+        self._build()
+
+    # -------------------------------------------------------------------------
+    # Prediction
+    # -------------------------------------------------------------------------
+
+    def _validation_rmse(self) -> np.ndarray:
+        metrics = self.validation.get("metrics", {})
+        return np.array([metrics.get(out, {}).get("rmse", np.nan) for out in self.outputs])
+
+    def predict(
+        self,
+        samples: np.ndarray,
+        fallback: bool = True,
+        n_workers: int | None = 1,
+    ) -> Dict[str, Any]:
+        """
+        Batched surrogate prediction.
+
+        Parameters
+        ----------
+        samples : np.ndarray
+            Parameter values, shape (n, k) in the order of ``names``
+        fallback : bool
+            Evaluate the true model for queries outside the trust region
+            (outside the box, too far from training data, or closer to a
+            failed sample than to a converged one)
+        n_workers : int, optional
+            Worker processes for fallback evaluations
+
+        Returns
+        -------
+        dict
+            values (n, n_out), error (n, n_out), in_trust_region (n,),
+            n_fallback, outputs
+        """
+        if self.x_train is None:
+            raise RuntimeError("Surrogate is not fitted; call fit() or load() first")
+
+        samples = np.atleast_2d(np.asarray(samples, dtype=float))
+        x_unit = self._to_unit(samples)
+        values = self._predict_unit(x_unit)
+
+        d_nn, _ = self._tree.query(x_unit)
+        h = self.spacing if self.spacing > 0 else 1.0
+        error = self._validation_rmse()[None, :] * np.maximum(1.0, d_nn / h)[:, None]
+
+        inside = np.all((x_unit >= -1e-9) & (x_unit <= 1.0 + 1e-9), axis=1)
+        trusted = inside & (d_nn <= self.trust_factor * h)
+        if self._failed_tree is not None:
+            d_fail, _ = self._failed_tree.query(x_unit)
+            trusted &= d_nn < d_fail
+
+        n_fallback = 0
+        if fallback and not trusted.all():
+            untrusted = np.flatnonzero(~trusted)
+            values[untrusted] = evaluate_batch(
+                self.names, samples[untrusted], self.outputs, n_workers
+            )
+            error[untrusted] = 0.0
+            n_fallback = len(untrusted)
+
+        return {
+            "outputs": self.outputs,
+            "values": values,
+            "error": error,
+            "in_trust_region": trusted,
+            "n_fallback": n_fallback,
+        }
+
+    def predict_point(self, overrides: Dict[str, float], fallback: bool = True) -> Dict[str, float]:
+        """
+        Predict outputs for one parameter set given as dot-path overrides.
+
+        Parameters not given are taken at the centre of their bounds.
+        """
+        row = [overrides.get(n, 0.5 * (lo + hi)) for n, (lo, hi) in self.bounds.items()]
+        result = self.predict(np.array([row]), fallback=fallback)
+        return dict(zip(self.outputs, result["values"][0].tolist()))
+
+    # -------------------------------------------------------------------------
+    # Serialization
+    # -------------------------------------------------------------------------
+
+    def save(self, path) -> Path:
+        """
+        Save the fitted surrogate to a compressed .npz file.
+
+        The RBF interpolant is rebuilt from the stored training data on load.
+        The hash of the baseline configuration used for fitting is stored so
+        that load() can detect a changed configuration.
+        """
+        if self.x_train is None:
+            raise RuntimeError("Surrogate is not fitted; nothing to save")
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "bounds": self.bounds,
+            "outputs": list(self.outputs),
+            "kind": self.kind,
+            "degree": self.degree,
+            "smoothing": self.smoothing,
+            "trust_factor": self.trust_factor,
+            "validation": self.validation,
+            "config_hash": self.config_hash,
+        }
+        arrays = {
+            "x_train": self.x_train,
+            "y_train": self.y_train,
+            "x_failed": self.x_failed,
+            "meta": np.array(json.dumps(meta)),
+        }
+        if self.coefficients is not None:
+            arrays["coefficients"] = self.coefficients
+        with open(path, "wb") as handle:
+            np.savez_compressed(handle, **arrays)
+        return path
+
+    @classmethod
+    def load(cls, path, on_mismatch: str = "error") -> "SurrogateModel":
+        """
+        Load a surrogate saved with save().
+
+        Parameters
+        ----------
+        path : str or Path
+            File written by save()
+        on_mismatch : str
+            What to do when the current baseline configuration (outside the
+            parameter box) differs from the one the model was fitted on:
+            'error' raises ValueError, 'warn' warns and sets
+            ``config_mismatch``, 'ignore' only sets ``config_mismatch``
+        """
+        if on_mismatch not in ("error", "warn", "ignore"):
+            raise ValueError(f"Unknown on_mismatch: {on_mismatch!r} (use 'error', 'warn' or 'ignore')")
+        with np.load(Path(path), allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            model = cls(
+                {name: tuple(b) for name, b in meta["bounds"].items()},
+                outputs=meta["outputs"],
+                kind=meta["kind"],
+                degree=meta["degree"],
+                smoothing=meta["smoothing"],
+                trust_factor=meta["trust_factor"],
+            )
+            model.x_failed = data["x_failed"]
+            coefficients = data["coefficients"] if "coefficients" in data else None
+            model._fit_arrays(data["x_train"], data["y_train"], coefficients)
+        model.validation = meta["validation"]
+        model.config_hash = meta.get("config_hash")
+
+        current = config_hash(model.names)
+        if model.config_hash != current:
+            model.config_mismatch = True
+            message = (f"Surrogate {path} was fitted on configuration {model.config_hash}, "
+                       f"current configuration is {current}; predictions may be stale")
+            if on_mismatch == "error":
+                raise ValueError(message + " (refit, or load with on_mismatch='warn')")
+            if on_mismatch == "warn":
+                warnings.warn(message, RuntimeWarning, stacklevel=2)
+        return model
+
+
+def print_analysis(model: SurrogateModel | None = None) -> None:
+    if model is None:
+        from .evaluation import discover_parameters
+
+        bounds = discover_parameters(
+            prefixes=(
+                "mission.mass.payload_kg",
+                "battery.specifications.specific_energy_Wh_kg",
+                "propulsion.rotor.figure_of_merit",
+                "aerodynamic.drag_polar.cd0",
+            ),
+            rel_range=0.15,
+        )
+        model = SurrogateModel(bounds)
+        model.fit(n_samples=256)
+
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    print("=" * 80)
+    print(f"SURROGATE MODEL OF THE COUPLED SOLVER ({model.kind.upper()})")
+    print("=" * 80)
+    print(f"Computed: {timestamp}")
+    print("Config:   All values loaded from config/ YAML files")
+    print()
+
+    print("PARAMETER BOX")
+    print("-" * 50)
+    for name, (lo, hi) in model.bounds.items():
+        print(f"  {name:<50} [{lo:.4g}, {hi:.4g}]")
+    print()
+
+    print("VALIDATION")
+    print("-" * 50)
+    print(f"  Training samples:   {model.validation['n_train']}")
+    print(f"  Validation samples: {model.validation['n_validation']}")
+    print(f"  Failed samples:     {model.validation['n_failed']}")
+    for out, m in model.validation["metrics"].items():
+        print(f"  {out:<20} RMSE={m['rmse']:.4g}  max|err|={m['max_abs']:.4g}  R2={m['r2']:.4f}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    print_analysis()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Bind computed values into the manuscript sections.
+
+- Evaluates the value registry of the sizing package once (all analyses).
+- Resolves every {{v:key|fmt}} placeholder of each language's section files
+  in one pass, with the language's number format, into `resolved_dir`
+  (config.yaml), which join_sections.py then reads.
+- Rewrites only the files whose resolved text changed.
+
+See src/mars_uav_sizing/verification/value_registry.py for the placeholder
+syntax and the registry keys.
+"""
+
+import argparse
+import pathlib
+import sys
+import yaml
+from typing import Any, Dict
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from mars_uav_sizing.config import load_scenario  # noqa: E402
+from mars_uav_sizing.verification import value_registry  # noqa: E402
+
+
+def load_config(config_path: pathlib.Path) -> Dict[str, Any]:
+    """Load configuration from YAML file."""
+    if not config_path.exists():
+        return {}
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+
+    return config
+
+
+def print_report(lang: str, report: Dict[str, Any], check: bool) -> None:
+    verb = "would rewrite" if check else "rewrote"
+    print(
+        f"[{lang.upper()}] {report['files']} files, {report['n_values']} values bound, "
+        f"{verb} {len(report['written'])}"
+    )
+    for name in report["written"]:
+        changed = report["changed_values"].get(name, {})
+        if changed:
+            print(f"  {name} ({len(changed)} values changed)")
+        for placeholder, (old, new) in changed.items():
+            print(f"    {placeholder}: {old} -> {new}")
+    for name in report["removed"]:
+        print(f"  removed {name}")
+    for name, keys in report["missing"].items():
+        print(f"  ERROR {name}: unknown keys {', '.join(keys)}")
+
+
+def main() -> None:
+    config_path = PROJECT_ROOT / "config.yaml"
+    config = load_config(config_path)
+    languages = config.get("languages", {})
+    available_langs = list(languages.keys())
+
+    parser = argparse.ArgumentParser(description="Resolve value placeholders in the manuscript sections.")
+    parser.add_argument(
+        "-l",
+        "--lang",
+        default="all",
+        help=f"Language to process ({', '.join(available_langs)}). Use 'all' for all languages.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Write nothing; exit with status 1 if any resolved section is out of date.",
+    )
+    parser.add_argument(
+        "--scenario",
+        nargs="+",
+        default=[],
+        help="Evaluate the values on top of these scenario(s).",
+    )
+    # reconstruct.bat passes its own arguments through; ignore the join-only ones
+    args, _ = parser.parse_known_args()
+
+    langs_to_process = available_langs if args.lang == "all" else [args.lang]
+    with load_scenario(*args.scenario).applied():
+        registry = value_registry.build_registry()
+
+    stale = False
+    failed = False
+    for lang in langs_to_process:
+        if lang not in languages:
+            print(f"Warning: Language '{lang}' not found in config. Skipping.")
+            continue
+
+        lang_config = languages[lang]
+        sections_dir = PROJECT_ROOT / lang_config.get("sections_dir", f"sections_{lang}")
+        output_dir = PROJECT_ROOT / lang_config.get("resolved_dir", f"build/sections_{lang}")
+        if not sections_dir.exists():
+            print(f"Warning: Sections directory '{sections_dir}' not found for language '{lang}'. Skipping.")
+            continue
+
+        locale = value_registry.get_locale(lang, lang_config.get("number_format"))
+        report = value_registry.bind_sections(
+            sections_dir, output_dir, registry, locale, check=args.check
+        )
+        print_report(lang, report, args.check)
+        stale = stale or bool(report["written"] or report["removed"])
+        failed = failed or bool(report["missing"])
+
+    if failed or (args.check and stale):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
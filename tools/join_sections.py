@@ -5,6 +5,9 @@ Reassemble a markdown document from split section files.
 - Reads front matter from a separate YAML file (configurable, default: `sections/front_matter.yaml`).
 - Rebuilds each level-1 section once, combining its base content and level-2 subsections.
 - Strips helper lines (added during splitting) such as duplicate H1s and the injected authors line.
+- Reads a language's `resolved_dir` (sections with computed values bound by
+  `tools/bind_values.py`) instead of `sections_dir` when it is configured, and
+  fails when the resolved copy is missing or older than its sections.
 """
 
 import argparse
@@ -147,6 +150,24 @@ def join_sections(md_files: List[pathlib.Path]) -> str:
     return "\n\n".join(blocks).strip("\n")
 
 
+def stale_resolved_files(sections_dir: pathlib.Path, resolved_dir: pathlib.Path) -> List[str]:
+    """
+    Names of the section files whose resolved copy is missing, older than the
+    template, or no longer has a template. Empty when the resolved copy is current.
+    """
+    if not resolved_dir.exists():
+        return sorted(p.name for p in sections_dir.iterdir() if p.is_file())
+    stale = []
+    for source in sorted(p for p in sections_dir.iterdir() if p.is_file()):
+        target = resolved_dir / source.name
+        if not target.exists() or target.stat().st_mtime < source.stat().st_mtime:
+            stale.append(source.name)
+    stale.extend(
+        p.name for p in sorted(resolved_dir.glob("*.md")) if not (sections_dir / p.name).exists()
+    )
+    return stale
+
+
 def reconstruct_document(sections_dir: pathlib.Path, output_path: pathlib.Path, front_matter_filename: str) -> None:
     """Reconstruct a single document from its sections."""
     if not sections_dir.exists():
@@ -232,6 +253,20 @@ def main() -> None:
                 print(f"Warning: Sections directory '{sections_dir}' not found for language '{lang}'. Skipping.")
                 continue
 
+            # Join the sections with values bound by tools/bind_values.py; the
+            # templates still hold the {{v:...}} placeholders
+            resolved_dir = lang_config.get("resolved_dir")
+            if resolved_dir:
+                stale = stale_resolved_files(sections_dir, project_root / resolved_dir)
+                if stale:
+                    print(
+                        f"Error: '{resolved_dir}' is missing or older than '{sections_dir.name}' "
+                        f"({', '.join(stale[:3])}{', ...' if len(stale) > 3 else ''}). "
+                        f"Run: python tools/bind_values.py --lang {lang}"
+                    )
+                    raise SystemExit(1)
+                sections_dir = project_root / resolved_dir
+
             print(f"[{lang.upper()}] Reconstructing {output_path.name}...")
             reconstruct_document(sections_dir, output_path, front_matter_filename)
             print(f"[{lang.upper()}] Wrote manuscript to {output_path.resolve()}")